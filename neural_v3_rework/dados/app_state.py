@@ -35,13 +35,26 @@ Usage:
 
     # Unsubscribe
     state.unsubscribe("weapons_changed", my_callback)
+
+    # Many writes at once (one save + one notification per channel)
+    with state.batch():
+        state.record_fight_result(...)
+        state.update_tournament(...)
+
+    # Long runs: coalesce disk writes, flush on demand / at exit
+    state.enable_write_behind(interval=2.0)
+    state.flush_if_due()   # from idle points: there is no background timer
+    state.flush()
 """
 
 import json
 import os
 import sys
+import atexit
 import logging
 import threading
+import time
+from contextlib import contextmanager
 from copy import deepcopy
 from typing import Callable, Any
 
@@ -114,8 +127,10 @@ class AppState:
 
     @classmethod
     def reset(cls):
-        """Force re-creation (useful for tests)."""
+        """Force re-creation (useful for tests). Pending writes are flushed first."""
         with cls._lock:
+            if cls._instance is not None:
+                cls._instance.flush()
             cls._instance = None
 
     # â”€â”€ Private init â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
@@ -138,6 +153,25 @@ class AppState:
         # event_name â†’ list[callback]
         self._subscribers: dict[str, list[Callable]] = {}
 
+        # Persistencia: arquivos sujos ("weapons", "characters", ...) sao
+        # gravados por flush(). Sem write-behind e fora de batch() o flush e
+        # imediato (comportamento original).
+        self._dirty:                 set[str]             = set()
+        self._io_lock                                      = threading.RLock()
+        self._write_behind_interval: "float | None"       = None
+        self._flush_deadline:        float                = 0.0
+        self._batch_depth:           int                  = 0
+        self._pending_events:        dict[str, Any]       = {}
+        self._pending_fights:        list                 = []  # FightResult de batch()
+
+        # Indices O(1) mantidos por todas as mutacoes (add/update/delete/set).
+        # Nome duplicado resolve para a primeira ocorrencia, como o scan antigo.
+        self._weapon_index:    dict[str, Arma]                    = {}
+        self._weapon_names:    list[str]                          = []
+        self._character_index: dict[str, Personagem]              = {}
+        self._character_names: list[str]                          = []
+        self._god_index:       dict["str | None", list[Personagem]] = {}
+
         self._load_all()
 
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
@@ -171,22 +205,28 @@ class AppState:
     # â”€â”€ Convenience lookups â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def get_character(self, name: str) -> "Personagem | None":
-        return next((p for p in self._characters if p.nome == name), None)
+        return self._character_index.get(name)
 
     def get_weapon(self, name: str) -> "Arma | None":
-        return next((a for a in self._weapons if a.nome == name), None)
+        return self._weapon_index.get(name)
+
+    def has_character(self, name: str) -> bool:
+        return name in self._character_index
+
+    def has_weapon(self, name: str) -> bool:
+        return name in self._weapon_index
 
     def get_weapon_for_character(self, char: "Personagem") -> "Arma | None":
         return self.get_weapon(char.nome_arma) if char.nome_arma else None
 
     def get_characters_by_god(self, god_id: str) -> list[Personagem]:
-        return [p for p in self._characters if p.god_id == god_id]
+        return list(self._god_index.get(god_id, ()))
 
     def character_names(self) -> list[str]:
-        return [p.nome for p in self._characters]
+        return list(self._character_names)
 
     def weapon_names(self) -> list[str]:
-        return [a.nome for a in self._weapons]
+        return list(self._weapon_names)
 
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
     # PUBLIC â€” Mutations (write â†’ auto-save â†’ notify)
@@ -197,67 +237,88 @@ class AppState:
     def set_weapons(self, weapons: list[Arma]):
         """Replace the full weapons list."""
         self._weapons = list(weapons)
+        self._reindex_weapons()
         self._save_weapons()
         self._notify("weapons_changed", self._weapons)
 
     def add_weapon(self, weapon: Arma):
         self._weapons.append(weapon)
+        self._weapon_names.append(weapon.nome)
+        self._weapon_index.setdefault(weapon.nome, weapon)
         self._save_weapons()
         self._notify("weapons_changed", self._weapons)
 
     def update_weapon(self, index: int, weapon: Arma):
         if 0 <= index < len(self._weapons):
+            old_name = self._weapon_names[index]
             self._weapons[index] = weapon
+            self._weapon_names[index] = weapon.nome
+            self._resolve_weapon_name(old_name)
+            self._resolve_weapon_name(weapon.nome)
             self._save_weapons()
             self._notify("weapons_changed", self._weapons)
 
     def delete_weapon(self, index: int):
         if 0 <= index < len(self._weapons):
+            old_name = self._weapon_names.pop(index)
             del self._weapons[index]
+            self._resolve_weapon_name(old_name)
             self._save_weapons()
             self._notify("weapons_changed", self._weapons)
 
     def delete_weapon_by_name(self, name: str):
-        idx = next((i for i, a in enumerate(self._weapons) if a.nome == name), None)
-        if idx is not None:
-            self.delete_weapon(idx)
+        if name in self._weapon_index:
+            self.delete_weapon(self._weapon_names.index(name))
 
     # â”€â”€ Characters â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def set_characters(self, characters: list[Personagem]):
         """Replace the full characters list."""
         self._characters = list(characters)
+        self._reindex_characters()
         self._save_characters()
         self._notify("characters_changed", self._characters)
 
     def add_character(self, character: Personagem):
         self._characters.append(character)
+        self._character_names.append(character.nome)
+        self._character_index.setdefault(character.nome, character)
+        self._god_index.setdefault(character.god_id, []).append(character)
         self._save_characters()
         self._notify("characters_changed", self._characters)
 
     def update_character(self, index: int, character: Personagem):
         if 0 <= index < len(self._characters):
+            old = self._characters[index]
+            old_name = self._character_names[index]
             self._characters[index] = character
+            self._character_names[index] = character.nome
+            self._resolve_character_name(old_name)
+            self._resolve_character_name(character.nome)
+            self._replace_in_god_index(old, character)
             self._save_characters()
             self._notify("characters_changed", self._characters)
 
     def delete_character(self, index: int):
         if 0 <= index < len(self._characters):
-            del self._characters[index]
+            old = self._characters.pop(index)
+            old_name = self._character_names.pop(index)
+            self._resolve_character_name(old_name)
+            self._replace_in_god_index(old, None)
             self._save_characters()
             self._notify("characters_changed", self._characters)
 
     def delete_character_by_name(self, name: str):
-        idx = next((i for i, p in enumerate(self._characters) if p.nome == name), None)
-        if idx is not None:
-            self.delete_character(idx)
+        if name in self._character_index:
+            self.delete_character(self._character_names.index(name))
 
     def set_character_god(self, char_name: str, god_id: "str | None"):
         """Assign or remove a god allegiance from a character."""
-        for p in self._characters:
-            if p.nome == char_name:
-                p.god_id = god_id
-                break
+        p = self._character_index.get(char_name)
+        if p is not None and p.god_id != god_id:
+            self._remove_from_god_index(p)
+            p.god_id = god_id
+            self._god_index.setdefault(god_id, []).append(p)
         self._save_characters()
         self._notify("characters_changed", self._characters)
         self._notify("gods_changed", self._gods)
@@ -291,8 +352,17 @@ class AppState:
         self._notify("tournament_changed", self._tournament)
 
     def record_fight_result(self, winner: str, loser: str, duration: float, ko: bool,
-                           arena: str = "", tournament_id: str = None):
-        """Append a fight result to tournament stats, session log, AND SQLite."""
+                           arena: str = "", tournament_id: str = None,
+                           stats_collector=None):
+        """
+        Append a fight result to tournament stats, session log, AND SQLite.
+        The SQLite side (ELO, match row, stats, events of `stats_collector`)
+        is a single BattleDB.commit_fight transaction.
+
+        Inside batch() the fight is queued and every queued fight is written
+        by one BattleDB.commit_fights transaction when the outermost block
+        exits; the match id is not known yet, so this returns None.
+        """
         self._session["total_fights"] += 1
         if ko:
             self._session["total_kos"] += 1
@@ -316,75 +386,40 @@ class AppState:
         self._notify("tournament_changed", self._tournament)
         self._notify("session_stats_changed", self._session)
 
-        # â”€â”€ [v14.0] Persist to SQLite + ELO update â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+        # â”€â”€ [v14.0] Persist to SQLite + ELO update (uma transacao) â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
         try:
-            from dados.battle_db import BattleDB
-            from nucleo.elo_system import calculate_elo, get_tier
+            from dados.battle_db import BattleDB, FightResult
             db = BattleDB.get()
 
             # Resolve character metadata
             w_char = self.get_character(winner)
             l_char = self.get_character(loser)
 
-            # Get current ELO from DB (or default 1600)
-            w_stats = db.get_character_stats(winner)
-            l_stats = db.get_character_stats(loser)
-            w_elo = w_stats["elo"] if w_stats else 1600.0
-            l_elo = l_stats["elo"] if l_stats else 1600.0
-            w_matches = w_stats["matches_played"] if w_stats else 0
-            l_matches = l_stats["matches_played"] if l_stats else 0
-
-            # Calculate ELO deltas
-            delta_w, delta_l = calculate_elo(
-                winner_elo=w_elo, loser_elo=l_elo,
-                winner_matches=w_matches, loser_matches=l_matches,
-                ko=ko, duration=duration or 0.0,
-            )
-
-            # Insert match with ELO snapshots
-            match_id = db.insert_match(
-                p1=winner, p2=loser, winner=winner, loser=loser,
-                duration=duration,
-                ko_type="KO" if ko else "TIMEOUT",
-                arena=arena,
-                p1_class=w_char.classe if w_char else "",
-                p2_class=l_char.classe if l_char else "",
-                p1_weapon=w_char.nome_arma if w_char else "",
-                p2_weapon=l_char.nome_arma if l_char else "",
-                p1_elo_before=w_elo, p2_elo_before=l_elo,
-                p1_elo_after=w_elo + delta_w,
-                p2_elo_after=max(0, l_elo + delta_l),
+            # B01: stats enfileirados (flush antes de record) entram na mesma transacao
+            collector = stats_collector or self.pending_stats_collector
+            self.pending_stats_collector = None
+
+            result = FightResult(
+                winner=winner, loser=loser,
+                duration=duration, ko=ko, arena=arena,
+                winner_class=w_char.classe if w_char else "",
+                loser_class=l_char.classe if l_char else "",
+                winner_weapon=w_char.nome_arma if w_char else "",
+                loser_weapon=l_char.nome_arma if l_char else "",
                 tournament_id=tournament_id,
+                events=collector.event_rows() if collector is not None else [],
             )
-
-            # Update character stats + ELO
-            db.update_character_stats(winner, won=True, elo_delta=delta_w,
-                                      tier=get_tier(w_elo + delta_w))
-            db.update_character_stats(loser, won=False, elo_delta=delta_l,
-                                      tier=get_tier(max(0, l_elo + delta_l)))
+            if self._batch_depth:
+                self._pending_fights.append(result)
+                return None
+            match_id = db.commit_fight(result)
             # B01: guardar o match_id para que _flush_match_stats() possa usÃ¡-lo
             self._last_match_id = match_id
-            # B01: se havia stats enfileirados (flush antes de record), persistir agora
-            self._flush_pending_stats(match_id)
             return match_id
         except Exception as e:
             _log.error("[AppState] BattleDB/ELO write failed (non-fatal): %s", e)
         return None
 
-    def _flush_pending_stats(self, match_id: int) -> None:
-        """
-        B01: Se havia um stats_collector enfileirado (flush antes de record_fight_result),
-        persiste agora que temos o match_id definitivo.
-        """
-        if self.pending_stats_collector is not None:
-            try:
-                self.pending_stats_collector.flush_to_db(match_id=match_id)
-                _log.debug("Pending match stats persistidos para match_id=%s", match_id)
-            except Exception as e:
-                _log.warning("_flush_pending_stats falhou: %s", e)
-            finally:
-                self.pending_stats_collector = None
-
     # â”€â”€ Gods / World State (Neural Fights Lore) â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def register_god(self, god_id: str, name: str, nature: str,
@@ -427,10 +462,30 @@ class AppState:
         self._save_gods()
         self._notify("gods_changed", self._gods)
 
+    # â”€â”€ In-memory roster overlay â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+
+    def replace_roster_in_memory(self, characters: "list[Personagem] | None" = None,
+                                 weapons: "list[Arma] | None" = None,
+                                 match_config: "dict | None" = None):
+        """
+        Swap characters/weapons/match config without saving or notifying.
+        For temporary overlays (recorders, harnesses) that restore the
+        previous roster afterwards; keeps the lookup indexes in sync.
+        """
+        if weapons is not None:
+            self._weapons = list(weapons)
+            self._reindex_weapons()
+        if characters is not None:
+            self._characters = list(characters)
+            self._reindex_characters()
+        if match_config is not None:
+            self._match = normalize_match_config({**DEFAULT_MATCH_CONFIG, **match_config})
+
     # â”€â”€ Force full reload from disk â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def reload_all(self):
         """Re-read all JSON files from disk. Notifies all channels."""
+        self.flush()
         self._load_all()
         self._notify("weapons_changed",       self._weapons)
         self._notify("characters_changed",    self._characters)
@@ -438,6 +493,85 @@ class AppState:
         self._notify("tournament_changed",    self._tournament)
         self._notify("gods_changed",          self._gods)
 
+    # â”€â”€ Write-behind / batching â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+
+    def enable_write_behind(self, interval: float = 2.0):
+        """
+        Coalesce disk writes: mutations only mark files dirty, and dirty
+        files are written at most once per `interval` seconds (on the next
+        mutation past the deadline), on flush(), or at interpreter exit.
+
+        There is no background timer: after the last mutation, dirty files
+        stay in memory until someone calls flush_if_due() (idle points of a
+        long loop), flush(), disable_write_behind() or the process exits.
+        """
+        self._write_behind_interval = max(0.0, float(interval))
+        self._flush_deadline = time.monotonic() + self._write_behind_interval
+
+    def disable_write_behind(self):
+        """Back to write-through; flushes whatever is pending."""
+        self._write_behind_interval = None
+        self.flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer saves and notifications until the outermost block exits.
+        Repeated events are coalesced (last payload wins) and fights from
+        record_fight_result() go to SQLite in a single transaction, e.g.:
+
+            with state.batch():
+                for r in results:
+                    state.record_fight_result(**r)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._commit_pending_fights()
+                self.flush_if_due()
+                pending, self._pending_events = self._pending_events, {}
+                for event, data in pending.items():
+                    self._notify(event, data)
+
+    def _commit_pending_fights(self):
+        """Write the fights queued by batch() in one BattleDB transaction."""
+        pending, self._pending_fights = self._pending_fights, []
+        if not pending:
+            return
+        try:
+            from dados.battle_db import BattleDB
+            match_ids = BattleDB.get().commit_fights(pending)
+            # B01: mesmo contrato de record_fight_result fora de batch()
+            self._last_match_id = match_ids[-1]
+        except Exception as e:
+            _log.error("[AppState] BattleDB/ELO write failed (non-fatal): %s", e)
+
+    def flush(self):
+        """Write every dirty file to disk now."""
+        with self._io_lock:
+            dirty, self._dirty = self._dirty, set()
+            for key in ("weapons", "characters", "match", "tournament", "gods"):
+                if key in dirty:
+                    self._write_store(key)
+            if self._write_behind_interval is not None:
+                self._flush_deadline = time.monotonic() + self._write_behind_interval
+
+    def flush_if_due(self):
+        """Write dirty files if the write-behind deadline has passed (or write-through)."""
+        with self._io_lock:
+            if not self._dirty:
+                return
+            if self._write_behind_interval is None or time.monotonic() >= self._flush_deadline:
+                self.flush()
+
+    @property
+    def has_pending_writes(self) -> bool:
+        with self._io_lock:
+            return bool(self._dirty)
+
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
     # PUBLIC â€” Event Bus
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
@@ -474,10 +608,64 @@ class AppState:
         # Alterar esta ordem farÃ¡ com que todos os personagens tenham peso_arma = 0.
         self._weapons    = self._load_weapons()
         self._characters = self._load_characters()
+        self._reindex_weapons()
+        self._reindex_characters()
         self._match      = normalize_match_config(self._load_json(FILE_MATCH, DEFAULT_MATCH_CONFIG))
         self._tournament = self._load_json(FILE_TOURNAMENT, DEFAULT_TOURNAMENT_STATE)
         self._gods       = self._load_json(FILE_GODS,       DEFAULT_GODS_STATE)
 
+    # â”€â”€ Indexes â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+
+    def _reindex_weapons(self):
+        self._weapon_names = [a.nome for a in self._weapons]
+        self._weapon_index = {}
+        for a in self._weapons:
+            self._weapon_index.setdefault(a.nome, a)
+
+    def _reindex_characters(self):
+        self._character_names = [p.nome for p in self._characters]
+        self._character_index = {}
+        self._god_index = {}
+        for p in self._characters:
+            self._character_index.setdefault(p.nome, p)
+            self._god_index.setdefault(p.god_id, []).append(p)
+
+    def _resolve_weapon_name(self, name: str):
+        """Re-point name to its first remaining weapon (or drop it)."""
+        try:
+            self._weapon_index[name] = self._weapons[self._weapon_names.index(name)]
+        except ValueError:
+            self._weapon_index.pop(name, None)
+
+    def _resolve_character_name(self, name: str):
+        """Re-point name to its first remaining character (or drop it)."""
+        try:
+            self._character_index[name] = self._characters[self._character_names.index(name)]
+        except ValueError:
+            self._character_index.pop(name, None)
+
+    def _remove_from_god_index(self, character: Personagem):
+        bucket = self._god_index.get(character.god_id)
+        if bucket is None:
+            return
+        for i, p in enumerate(bucket):
+            if p is character:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._god_index[character.god_id]
+
+    def _replace_in_god_index(self, old: Personagem, new: "Personagem | None"):
+        bucket = self._god_index.get(old.god_id)
+        if new is not None and bucket is not None and new.god_id == old.god_id:
+            for i, p in enumerate(bucket):
+                if p is old:
+                    bucket[i] = new
+                    return
+        self._remove_from_god_index(old)
+        if new is not None:
+            self._god_index.setdefault(new.god_id, []).append(new)
+
     # â”€â”€ Loaders â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     @staticmethod
@@ -556,26 +744,49 @@ class AppState:
     # â”€â”€ Savers â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def _save_weapons(self):
-        self._write_json(FILE_WEAPONS, [a.to_dict() for a in self._weapons])
+        self._mark_dirty("weapons")
 
     def _save_characters(self):
-        self._write_json(FILE_CHARS, [p.to_dict() for p in self._characters])
+        self._mark_dirty("characters")
 
     def _save_match(self):
-        self._write_json(FILE_MATCH, self._match)
+        self._mark_dirty("match")
 
     def _save_tournament(self):
-        self._write_json(FILE_TOURNAMENT, self._tournament)
+        self._mark_dirty("tournament")
 
     def _save_gods(self):
-        self._write_json(FILE_GODS, self._gods)
+        self._mark_dirty("gods")
+
+    def _mark_dirty(self, key: str):
+        # Mesmo lock do flush(): a marca nao cai no set que esta sendo gravado
+        with self._io_lock:
+            self._dirty.add(key)
+            if self._batch_depth == 0:
+                self.flush_if_due()
+
+    def _write_store(self, key: str):
+        if key == "weapons":
+            self._write_json(FILE_WEAPONS, [a.to_dict() for a in self._weapons])
+        elif key == "characters":
+            self._write_json(FILE_CHARS, [p.to_dict() for p in self._characters])
+        elif key == "match":
+            self._write_json(FILE_MATCH, self._match)
+        elif key == "tournament":
+            # Arquivos so de maquina: JSON compacto (reescritos a cada luta)
+            self._write_json(FILE_TOURNAMENT, self._tournament, compact=True)
+        elif key == "gods":
+            self._write_json(FILE_GODS, self._gods, compact=True)
 
     @staticmethod
-    def _write_json(path: str, data):
+    def _write_json(path: str, data, compact: bool = False):
         try:
             tmp = path + ".tmp"
             with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+                if compact:
+                    json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+                else:
+                    json.dump(data, f, indent=4, ensure_ascii=False)
             os.replace(tmp, path)          # atomic rename â€” no corrupt files
         except Exception as e:
             _log.error("Erro ao salvar %s: %s", path, e)
@@ -583,6 +794,10 @@ class AppState:
     # â”€â”€ Internal notify â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def _notify(self, event: str, data: Any = None):
+        if self._batch_depth:
+            # Dentro de batch(): entrega uma vez, na saida do bloco
+            self._pending_events[event] = data
+            return
         # Specific subscribers
         for cb in list(self._subscribers.get(event, [])):
             try:
@@ -606,3 +821,13 @@ class AppState:
             f"  match={self._match.get('p1_nome')} vs {self._match.get('p2_nome')}>"
         )
 
+
+
+def _flush_on_exit():
+    # Write-behind: garante que nada sujo se perca ao encerrar o processo
+    inst = AppState._instance
+    if inst is not None:
+        inst.flush()
+
+
+atexit.register(_flush_on_exit)
@@ -24,6 +24,10 @@ Usage:
     # Query
     history = db.get_match_history(limit=50)
     stats   = db.get_character_stats("Caleb")
+
+    # Full fight result (ELO + match + stats + events) in one transaction
+    match_id  = db.commit_fight(FightResult("Caleb", "Bjorn", duration=23.5))
+    match_ids = db.commit_fights([FightResult(...), FightResult(...)])
 """
 
 import json
@@ -33,7 +37,8 @@ import os
 import sqlite3
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 _log = logging.getLogger("battle_db")
 
@@ -42,10 +47,65 @@ _HERE = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(_HERE, "battle_log.db")
 DB_SHADOW_DIR = os.path.join(_HERE, "_db_shadow")
 
+# â”€â”€ Prepared statements (SQL fixo = cache de statements do sqlite3) â”€â”€â”€â”€â”€â”€
+_SQL_INSERT_MATCH = """
+    INSERT INTO matches
+        (p1, p2, winner, loser, duration, ko_type, arena,
+         p1_class, p2_class, p1_weapon, p2_weapon,
+         p1_elo_before, p2_elo_before, p1_elo_after, p2_elo_after,
+         tournament_id)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+_SQL_INSERT_EVENT = """
+    INSERT INTO match_events (match_id, frame, event_type, data_json)
+    VALUES (?,?,?,?)
+"""
+_SQL_ENSURE_CHARACTER = "INSERT OR IGNORE INTO character_stats (name) VALUES (?)"
+_SQL_SELECT_ELO = "SELECT elo, matches_played FROM character_stats WHERE name = ?"
+_SQL_STATS_WIN = """
+    UPDATE character_stats SET
+        wins = wins + 1,
+        matches_played = matches_played + 1,
+        elo = elo + ?,
+        peak_elo = MAX(peak_elo, elo + ?),
+        total_damage = total_damage + ?,
+        total_kills = total_kills + 1,
+        tier = COALESCE(?, tier),
+        last_updated = datetime('now','localtime')
+    WHERE name = ?
+"""
+_SQL_STATS_LOSS = """
+    UPDATE character_stats SET
+        losses = losses + 1,
+        matches_played = matches_played + 1,
+        elo = MAX(0, elo + ?),
+        total_damage = total_damage + ?,
+        tier = COALESCE(?, tier),
+        last_updated = datetime('now','localtime')
+    WHERE name = ?
+"""
+
 # â”€â”€ Schema version â€” bump when tables change â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 SCHEMA_VERSION = 1
 
 
+@dataclass
+class FightResult:
+    """One finished fight, as consumed by BattleDB.commit_fight(s)."""
+    winner: str
+    loser: str
+    duration: float = 0.0
+    ko: bool = True
+    arena: str = ""
+    winner_class: str = ""
+    loser_class: str = ""
+    winner_weapon: str = ""
+    loser_weapon: str = ""
+    tournament_id: Optional[str] = None
+    # [(frame, event_type, data), ...] â€” ver MatchStatsCollector.event_rows()
+    events: List[Tuple[int, str, Dict]] = field(default_factory=list)
+
+
 class BattleDB:
     """Thread-safe SQLite wrapper for battle persistence."""
 
@@ -221,17 +281,12 @@ class BattleDB:
                      tournament_id: str = None) -> int:
         """Insert a completed match. Returns the match ID."""
         with self._cursor() as cur:
-            cur.execute("""
-                INSERT INTO matches
-                    (p1, p2, winner, loser, duration, ko_type, arena,
-                     p1_class, p2_class, p1_weapon, p2_weapon,
-                     p1_elo_before, p2_elo_before, p1_elo_after, p2_elo_after,
-                     tournament_id)
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """, (p1, p2, winner, loser, duration, ko_type, arena,
-                  p1_class, p2_class, p1_weapon, p2_weapon,
-                  p1_elo_before, p2_elo_before, p1_elo_after, p2_elo_after,
-                  tournament_id))
+            cur.execute(_SQL_INSERT_MATCH, (
+                p1, p2, winner, loser, duration, ko_type, arena,
+                p1_class, p2_class, p1_weapon, p2_weapon,
+                p1_elo_before, p2_elo_before, p1_elo_after, p2_elo_after,
+                tournament_id,
+            ))
             return cur.lastrowid
 
     def get_match(self, match_id: int) -> Optional[Dict]:
@@ -274,19 +329,13 @@ class BattleDB:
         """Insert a single combat event within a match."""
         json_str = json.dumps(data or {}, ensure_ascii=False)
         with self._cursor() as cur:
-            cur.execute("""
-                INSERT INTO match_events (match_id, frame, event_type, data_json)
-                VALUES (?,?,?,?)
-            """, (match_id, frame, event_type, json_str))
+            cur.execute(_SQL_INSERT_EVENT, (match_id, frame, event_type, json_str))
             return cur.lastrowid
 
     def insert_events_batch(self, events: List[Tuple[int, int, str, Dict]]):
         """Batch insert events: [(match_id, frame, event_type, data), ...]."""
         with self._cursor() as cur:
-            cur.executemany("""
-                INSERT INTO match_events (match_id, frame, event_type, data_json)
-                VALUES (?,?,?,?)
-            """, [
+            cur.executemany(_SQL_INSERT_EVENT, [
                 (mid, frame, etype, json.dumps(data or {}, ensure_ascii=False))
                 for mid, frame, etype, data in events
             ])
@@ -320,9 +369,7 @@ class BattleDB:
     def ensure_character(self, name: str):
         """Create a character_stats row if it doesn't exist."""
         with self._cursor() as cur:
-            cur.execute("""
-                INSERT OR IGNORE INTO character_stats (name) VALUES (?)
-            """, (name,))
+            cur.execute(_SQL_ENSURE_CHARACTER, (name,))
 
     def update_character_stats(self, name: str, won: bool,
                                elo_delta: float = 0.0, damage: float = 0.0,
@@ -331,29 +378,9 @@ class BattleDB:
         self.ensure_character(name)
         with self._cursor() as cur:
             if won:
-                cur.execute("""
-                    UPDATE character_stats SET
-                        wins = wins + 1,
-                        matches_played = matches_played + 1,
-                        elo = elo + ?,
-                        peak_elo = MAX(peak_elo, elo + ?),
-                        total_damage = total_damage + ?,
-                        total_kills = total_kills + 1,
-                        tier = COALESCE(?, tier),
-                        last_updated = datetime('now','localtime')
-                    WHERE name = ?
-                """, (elo_delta, elo_delta, damage, tier, name))
+                cur.execute(_SQL_STATS_WIN, (elo_delta, elo_delta, damage, tier, name))
             else:
-                cur.execute("""
-                    UPDATE character_stats SET
-                        losses = losses + 1,
-                        matches_played = matches_played + 1,
-                        elo = MAX(0, elo + ?),
-                        total_damage = total_damage + ?,
-                        tier = COALESCE(?, tier),
-                        last_updated = datetime('now','localtime')
-                    WHERE name = ?
-                """, (elo_delta, damage, tier, name))
+                cur.execute(_SQL_STATS_LOSS, (elo_delta, damage, tier, name))
 
     def get_character_stats(self, name: str) -> Optional[Dict]:
         """Get stats for a single character."""
@@ -386,6 +413,61 @@ class BattleDB:
             return 0.0
         return stats["wins"] / stats["matches_played"]
 
+    # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
+    # FIGHT RESULTS (transacional)
+    # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
+
+    def commit_fight(self, result: FightResult) -> int:
+        """
+        Persist a whole fight in one transaction: reads both ELOs, inserts
+        the match, upserts both character_stats rows and bulk-inserts the
+        events. Returns the match ID.
+        """
+        with self._cursor() as cur:
+            return self._commit_fight_in(cur, result)
+
+    def commit_fights(self, results: Iterable[FightResult]) -> List[int]:
+        """
+        Bulk variant for batch runners: every fight in one transaction (one
+        fsync). ELOs are applied in order, so later fights see earlier ones.
+        """
+        with self._cursor() as cur:
+            return [self._commit_fight_in(cur, r) for r in results]
+
+    def _commit_fight_in(self, cur: sqlite3.Cursor, r: FightResult) -> int:
+        from nucleo.elo_system import calculate_elo, get_tier
+
+        cur.executemany(_SQL_ENSURE_CHARACTER, ((r.winner,), (r.loser,)))
+        w_row = cur.execute(_SQL_SELECT_ELO, (r.winner,)).fetchone()
+        l_row = cur.execute(_SQL_SELECT_ELO, (r.loser,)).fetchone()
+        w_elo, l_elo = w_row[0], l_row[0]
+
+        delta_w, delta_l = calculate_elo(
+            winner_elo=w_elo, loser_elo=l_elo,
+            winner_matches=w_row[1], loser_matches=l_row[1],
+            ko=r.ko, duration=r.duration or 0.0,
+        )
+        w_after = w_elo + delta_w
+        l_after = max(0, l_elo + delta_l)
+
+        cur.execute(_SQL_INSERT_MATCH, (
+            r.winner, r.loser, r.winner, r.loser, r.duration,
+            "KO" if r.ko else "TIMEOUT", r.arena,
+            r.winner_class, r.loser_class, r.winner_weapon, r.loser_weapon,
+            w_elo, l_elo, w_after, l_after, r.tournament_id,
+        ))
+        match_id = cur.lastrowid
+
+        cur.execute(_SQL_STATS_WIN, (delta_w, delta_w, 0.0, get_tier(w_after), r.winner))
+        cur.execute(_SQL_STATS_LOSS, (delta_l, 0.0, get_tier(l_after), r.loser))
+
+        if r.events:
+            cur.executemany(_SQL_INSERT_EVENT, [
+                (match_id, frame, etype, json.dumps(data or {}, ensure_ascii=False))
+                for frame, etype, data in r.events
+            ])
+        return match_id
+
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
     # AGGREGATION QUERIES
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
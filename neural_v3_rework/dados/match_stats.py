@@ -200,17 +200,17 @@ class MatchStatsCollector:
 
     # â”€â”€ Persistence â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
+    def event_rows(self) -> List[tuple]:
+        """Events as (frame, event_type, data) rows for BattleDB."""
+        return [(e["frame"], e["type"], e) for e in self._events]
+
     def flush_to_db(self, match_id: int):
         """Write all events to BattleDB for the given match_id."""
         try:
             from dados.battle_db import BattleDB
             db = BattleDB.get()
             if self._events:
-                batch = [
-                    (match_id, e["frame"], e["type"], e)
-                    for e in self._events
-                ]
-                db.insert_events_batch(batch)
+                db.insert_events_batch([(match_id, *row) for row in self.event_rows()])
             _log.debug("Flushed %d events for match %d", len(self._events), match_id)
         except Exception as e:
             _log.debug("Failed to flush stats: %s", e)
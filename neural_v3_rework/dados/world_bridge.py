@@ -18,6 +18,7 @@ TambÃ©m expÃµe leitura do estado do mapa para a UI Tkinter:
 
 import json
 import os
+import socket
 import sys
 import threading
 from dataclasses import dataclass, field
@@ -118,6 +119,94 @@ def _save_json_safe(path: str, data) -> bool:
         return False
 
 
+def _save_text_safe(path: str, text: str) -> bool:
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        return True
+    except Exception as e:
+        _log.error("Erro ao salvar %s: %s", path, e)
+        return False
+
+
+# -- Journal do World Map -----------------------------------------------------
+# Cada mudanca vira uma linha JSON em world_journal.jsonl:
+#     {"seq": N, "ts": "...", "ops": [{"op": "zone_claim", ...}, ...]}
+# O mapa (world_map_pygame/live_sync.py) le so as linhas novas e aplica o
+# delta. A cada JOURNAL_COMPACT_EVERY entradas o journal e dobrado de volta
+# em world_state.json / gods.json ("_meta.journal_seq" marca o ultimo seq
+# incluido em cada arquivo) e trocado por um arquivo vazio.
+JOURNAL_FILE = "world_journal.jsonl"
+SYNC_PORT_FILE = "live_sync.port"
+JOURNAL_COMPACT_EVERY = 64
+MAX_WORLD_EVENTS = 100
+
+
+def _snapshot_seq(data: dict) -> int:
+    return data.get("_meta", {}).get("journal_seq", 0)
+
+
+def _apply_journal_ops(ws: Optional[dict], gds: Optional[dict], ops: list) -> None:
+    """Aplica ops do journal (in-place); None pula o arquivo que ja as contem."""
+    for op in ops:
+        kind = op.get("op")
+        if ws is not None:
+            if kind == "zone_claim":
+                ws.setdefault("zone_ownership", {})[op["zone_id"]] = op["god_id"]
+            elif kind == "event":
+                events = ws.setdefault("world_events", [])
+                events.append(op["event"])
+                del events[:-MAX_WORLD_EVENTS]
+        if gds is not None:
+            gods = gds.setdefault("gods", [])
+            if kind == "god_add":
+                if all(g.get("god_id") != op["god"]["god_id"] for g in gods):
+                    gods.append(deepcopy(op["god"]))
+            elif kind == "god_update":
+                for i, g in enumerate(gods):
+                    if g.get("god_id") == op["god"]["god_id"]:
+                        gods[i] = deepcopy(op["god"])
+                        break
+            elif kind == "follower":
+                for g in gods:
+                    if g.get("god_id") == op["god_id"]:
+                        g["follower_count"] = g.get("follower_count", 0) + op.get("delta", 1)
+                        break
+
+
+def _read_journal(path: str) -> list:
+    """Entradas completas do journal (linha final incompleta e ignorada)."""
+    entries = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    _log.warning("Linha invalida no journal ignorada.")
+    except OSError:
+        pass
+    return entries
+
+
+def _notify_map() -> None:
+    """Acorda o LiveSync do mapa com um datagrama UDP local (se estiver aberto)."""
+    try:
+        with open(_wm_path(SYNC_PORT_FILE), "r", encoding="utf-8") as f:
+            port = int(f.read().strip())
+    except (OSError, ValueError):
+        return  # mapa fechado: le o journal quando abrir
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b"journal", ("127.0.0.1", port))
+    except OSError:
+        pass
+
+
 # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
 class WorldBridge:
     """
@@ -139,6 +228,12 @@ class WorldBridge:
 
     def _init(self):
         self._lock_io = threading.Lock()
+        # Estado atual = snapshots + journal; recarregado se os arquivos mudarem
+        self._ws: dict = {}
+        self._gds: dict = {}
+        self._seq = 0
+        self._snap_seq = 0
+        self._files_sig = None
         if WORLDMAP_AVAILABLE:
             _log.info("World Map detectado â€” ponte ativa.")
         else:
@@ -176,17 +271,22 @@ class WorldBridge:
                     _log.warning("%s nÃ£o tem god_id â€” sem conquista de territÃ³rio.", winner_name)
                     return BridgeResult(ok=True, zone_id=None, reason=f"{winner_name} sem god_id")
 
+                ops = []
                 # Garante que o deus existe no gods.json do worldmap
-                self._ensure_god_in_worldmap(winner_god_id)
+                new_god = self._ensure_god_in_worldmap(winner_god_id)
+                if new_god:
+                    ops.append({"op": "god_add", "god": new_god})
 
                 # Conquista uma zona neutra
                 conquered = self._claim_territory(winner_god_id)
+                if conquered:
+                    ops.append({"op": "zone_claim", "zone_id": conquered, "god_id": winner_god_id})
 
                 # Atualiza follower_count
-                self._add_follower(winner_god_id)
+                ops.append({"op": "follower", "god_id": winner_god_id, "delta": 1})
 
                 # Registra evento no world_state
-                self._log_world_event({
+                ops.append({"op": "event", "event": {
                     "type": "territory_conquered",
                     "god_id": winner_god_id,
                     "champion": winner_name,
@@ -195,7 +295,10 @@ class WorldBridge:
                     "duration": round(duration, 2),
                     "ko_type": ko_type,
                     "timestamp": datetime.utcnow().isoformat(),
-                })
+                }})
+
+                # Uma linha no journal em vez de reescrever os dois JSONs
+                self._append_journal(ops)
 
                 # TambÃ©m notifica AppState para quem escuta
                 self._notify_app_state(winner_god_id, conquered)
@@ -223,10 +326,10 @@ class WorldBridge:
         if not WORLDMAP_AVAILABLE:
             return []
 
-        ws  = _load_json_safe(_wm_path("world_state.json"),  {})
-        gds = _load_json_safe(_wm_path("gods.json"),         {"gods": []})
-
-        ownership = ws.get("zone_ownership", {})
+        with self._lock_io:
+            ws, gds = self._current_state()
+            ownership = dict(ws.get("zone_ownership", {}))
+            gods = deepcopy(gds.get("gods", []))
 
         # Conta territÃ³rios por deus
         territory_count: dict[str, int] = {}
@@ -235,7 +338,7 @@ class WorldBridge:
                 territory_count[god_id] = territory_count.get(god_id, 0) + 1
 
         standings = []
-        for g in gds.get("gods", []):
+        for g in gods:
             gid = g["god_id"]
             standings.append({
                 "god_id":       gid,
@@ -252,23 +355,26 @@ class WorldBridge:
     def get_territory_count(self, god_id: str) -> int:
         if not WORLDMAP_AVAILABLE:
             return 0
-        ws = _load_json_safe(_wm_path("world_state.json"), {})
-        ownership = ws.get("zone_ownership", {})
-        return sum(1 for v in ownership.values() if v == god_id)
+        with self._lock_io:
+            ws, _ = self._current_state()
+            ownership = ws.get("zone_ownership", {})
+            return sum(1 for v in ownership.values() if v == god_id)
 
     def get_total_zones(self) -> int:
         if not WORLDMAP_AVAILABLE:
             return 0
-        ws = _load_json_safe(_wm_path("world_state.json"), {})
-        return len(ws.get("zone_ownership", {}))
+        with self._lock_io:
+            ws, _ = self._current_state()
+            return len(ws.get("zone_ownership", {}))
 
     def get_recent_events(self, limit: int = 8) -> list:
         """Retorna os eventos mais recentes registrados no world_state."""
         if not WORLDMAP_AVAILABLE:
             return []
-        ws = _load_json_safe(_wm_path("world_state.json"), {})
-        events = ws.get("world_events", [])
-        return list(reversed(events[-limit:]))
+        with self._lock_io:
+            ws, _ = self._current_state()
+            events = ws.get("world_events", [])
+            return deepcopy(list(reversed(events[-limit:])))
 
     def get_all_gods(self) -> List[GodEntry]:
         """
@@ -277,8 +383,9 @@ class WorldBridge:
         """
         if not WORLDMAP_AVAILABLE:
             return []
-        gds = _load_json_safe(_wm_path("gods.json"), {"gods": []})
-        return [GodEntry(g) for g in gds.get("gods", [])]
+        with self._lock_io:
+            _, gds = self._current_state()
+            return [GodEntry(g) for g in gds.get("gods", [])]
 
     def get_god(self, god_id: str) -> Optional[GodEntry]:
         """
@@ -287,10 +394,11 @@ class WorldBridge:
         """
         if not WORLDMAP_AVAILABLE or not god_id:
             return None
-        gds = _load_json_safe(_wm_path("gods.json"), {"gods": []})
-        for g in gds.get("gods", []):
-            if g.get("god_id") == god_id:
-                return GodEntry(g)
+        with self._lock_io:
+            _, gds = self._current_state()
+            for g in gds.get("gods", []):
+                if g.get("god_id") == god_id:
+                    return GodEntry(g)
         return None
 
     def create_god(self, god_name: str, nature: str, nature_element: str,
@@ -302,44 +410,42 @@ class WorldBridge:
         import re
         # Gera god_id a partir do nome (snake_case sem acentos)
         god_id = re.sub(r'\W+', '_', god_name.lower()).strip('_') or "deus_desconhecido"
-        # Garante unicidade
-        gds = _load_json_safe(_wm_path("gods.json"), {"gods": []})
-        existing = {g["god_id"] for g in gds.get("gods", [])}
-        base_id, n = god_id, 2
-        while god_id in existing:
-            god_id = f"{base_id}_{n}"
-            n += 1
-
-        entry_data = {
-            "god_id":           god_id,
-            "god_name":         god_name,
-            "nature":           nature,
-            "nature_element":   nature_element,
-            "color_primary":    "#00d9ff",
-            "follower_count":   0,
-            "owned_zones":      [],
-            "lore_description": "",
-            "source":           source,
-            "registered_at":    datetime.utcnow().isoformat(),
-        }
-        gds.setdefault("gods", []).append(entry_data)
-        _save_json_safe(_wm_path("gods.json"), gds)
-        _log.info("Deus '%s' (%s) criado via UI.", god_name, god_id)
+        with self._lock_io:
+            # Garante unicidade
+            _, gds = self._current_state()
+            existing = {g["god_id"] for g in gds.get("gods", [])}
+            base_id, n = god_id, 2
+            while god_id in existing:
+                god_id = f"{base_id}_{n}"
+                n += 1
+
+            entry_data = {
+                "god_id":           god_id,
+                "god_name":         god_name,
+                "nature":           nature,
+                "nature_element":   nature_element,
+                "color_primary":    "#00d9ff",
+                "follower_count":   0,
+                "owned_zones":      [],
+                "lore_description": "",
+                "source":           source,
+                "registered_at":    datetime.utcnow().isoformat(),
+            }
+            self._append_journal([{"op": "god_add", "god": entry_data}])
+            _log.info("Deus '%s' (%s) criado via UI.", god_name, god_id)
         return GodEntry(entry_data)
 
     def save_all(self):
         """
-        Persiste alteraÃ§Ãµes feitas em GodEntry de volta ao gods.json.
-        view_chars.py chama este mÃ©todo apÃ³s editar follower_count e lore_description.
-
-        Nota: como GodEntry Ã© uma cÃ³pia em memÃ³ria, este mÃ©todo precisa da lista
-        completa. Por isso view_chars.py deve usar o padrÃ£o:
-            god = sync.create_god(...)
-            god.follower_count = N
-            sync.update_god(god)   â† usar update_god ao invÃ©s de save_all
-        save_all() Ã© mantido como no-op para nÃ£o quebrar cÃ³digo existente.
+        No-op mantido para nao quebrar codigo existente (view_chars.py).
+
+        Cada operacao (create_god, update_god, on_fight_result...) ja vai
+        para o journal na hora; os snapshots world_state.json/gods.json so
+        recebem essas operacoes na compactacao. Quem le os snapshots (o mapa)
+        re-aplica as entradas do journal posteriores a _meta.journal_seq.
+        Para editar um GodEntry use update_god(god), nao save_all().
         """
-        pass  # WorldBridge salva atomicamente em cada operaÃ§Ã£o â€” save_all Ã© no-op
+        pass
 
     def update_god(self, entry: GodEntry):
         """
@@ -348,12 +454,8 @@ class WorldBridge:
         """
         if not WORLDMAP_AVAILABLE:
             return
-        gds = _load_json_safe(_wm_path("gods.json"), {"gods": []})
-        for i, g in enumerate(gds.get("gods", [])):
-            if g.get("god_id") == entry.god_id:
-                gds["gods"][i] = entry.to_dict()
-                break
-        _save_json_safe(_wm_path("gods.json"), gds)
+        with self._lock_io:
+            self._append_journal([{"op": "god_update", "god": entry.to_dict()}])
 
     # â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•â•
     # PRIVADOS
@@ -375,7 +477,7 @@ class WorldBridge:
         Escolhe e reivindica uma zona neutra para o deus.
         Prioriza zonas vizinhas a territÃ³rios jÃ¡ controlados.
         """
-        ws = _load_json_safe(_wm_path("world_state.json"), {"zone_ownership": {}})
+        ws, _ = self._current_state()
         ownership = ws.get("zone_ownership", {})
 
         already_owned = [z for z, g in ownership.items() if g == god_id]
@@ -408,24 +510,20 @@ class WorldBridge:
             import random
             target_zone = random.choice(neutral_zones)
 
-        # Aplica a conquista
-        ownership[target_zone] = god_id
-        ws["zone_ownership"] = ownership
-        ws.setdefault("_meta", {})["last_updated"] = datetime.utcnow().isoformat()
-        _save_json_safe(_wm_path("world_state.json"), ws)
-
+        # A conquista e aplicada pelo op "zone_claim" do journal
         return target_zone
 
     def _ensure_god_in_worldmap(self, god_id: str):
         """
         Garante que o deus existe em world_map_pygame/dados/gods.json.
-        Se nÃ£o existir, cria entrada a partir do gods.json do game.
+        Se nÃ£o existir, monta a entrada a partir do gods.json do game e a
+        retorna (para o op "god_add"); se ja existir, retorna None.
         """
-        gds = _load_json_safe(_wm_path("gods.json"), {"gods": [], "ancient_gods": []})
+        _, gds = self._current_state()
         existing_ids = {g["god_id"] for g in gds.get("gods", [])}
 
         if god_id in existing_ids:
-            return
+            return None
 
         # Busca no gods.json do game
         game_gods_path = os.path.join(_HERE, "gods.json")
@@ -472,26 +570,90 @@ class WorldBridge:
                 "registered_at": datetime.utcnow().isoformat(),
             }
 
-        gds.setdefault("gods", []).append(new_entry)
-        _save_json_safe(_wm_path("gods.json"), gds)
         _log.info("Deus '%s' adicionado ao world map.", god_id)
+        return new_entry
+
+    def _stat_files(self) -> tuple:
+        sig = []
+        for name in ("world_state.json", "gods.json", JOURNAL_FILE):
+            try:
+                st = os.stat(_wm_path(name))
+                sig.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _current_state(self) -> tuple:
+        """
+        (world_state, gods) atuais: snapshots + entradas do journal ainda
+        nao compactadas. So relê os arquivos se algum deles mudou.
+        Chamar com _lock_io.
+        """
+        sig = self._stat_files()
+        if sig != self._files_sig:
+            ws = _load_json_safe(_wm_path("world_state.json"), {"zone_ownership": {}})
+            gds = _load_json_safe(_wm_path("gods.json"), {"gods": []})
+            ws_seq, gds_seq = _snapshot_seq(ws), _snapshot_seq(gds)
+            seq = min(ws_seq, gds_seq)
+            for entry in _read_journal(_wm_path(JOURNAL_FILE)):
+                eseq = entry.get("seq", 0)
+                if eseq <= seq:
+                    continue
+                _apply_journal_ops(ws if eseq > ws_seq else None,
+                                   gds if eseq > gds_seq else None,
+                                   entry.get("ops", []))
+                seq = eseq
+            self._ws, self._gds = ws, gds
+            self._seq = max(seq, ws_seq, gds_seq)
+            self._snap_seq = min(ws_seq, gds_seq)
+            self._files_sig = sig
+        return self._ws, self._gds
+
+    def _append_journal(self, ops: list) -> bool:
+        """Grava ops como uma entrada do journal e acorda o mapa. Chamar com _lock_io."""
+        self._current_state()
+        entry = {"seq": self._seq + 1, "ts": datetime.utcnow().isoformat(), "ops": ops}
+        try:
+            with open(_wm_path(JOURNAL_FILE), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            _log.error("Erro ao gravar journal: %s", e)
+            return False
+        _apply_journal_ops(self._ws, self._gds, ops)
+        self._seq = entry["seq"]
+        self._files_sig = self._stat_files()
+        if self._seq - self._snap_seq >= JOURNAL_COMPACT_EVERY:
+            self._compact_locked()
+        _notify_map()
+        return True
 
-    def _add_follower(self, god_id: str):
-        """Incrementa follower_count do deus no worldmap gods.json."""
-        gds = _load_json_safe(_wm_path("gods.json"), {"gods": []})
-        for g in gds.get("gods", []):
-            if g["god_id"] == god_id:
-                g["follower_count"] = g.get("follower_count", 0) + 1
-                break
-        _save_json_safe(_wm_path("gods.json"), gds)
-
-    def _log_world_event(self, event: dict):
-        """Adiciona evento ao histÃ³rico no world_state.json."""
-        ws = _load_json_safe(_wm_path("world_state.json"), {})
-        ws.setdefault("world_events", []).append(event)
-        # MantÃ©m apenas os Ãºltimos 100 eventos
-        ws["world_events"] = ws["world_events"][-100:]
-        _save_json_safe(_wm_path("world_state.json"), ws)
+    def compact(self) -> bool:
+        """Dobra o journal em world_state.json / gods.json e o esvazia."""
+        if not WORLDMAP_AVAILABLE:
+            return False
+        with self._lock_io:
+            return self._compact_locked()
+
+    def _compact_locked(self) -> bool:
+        self._current_state()
+        if self._seq == self._snap_seq:
+            return True
+        now = datetime.utcnow().isoformat()
+        for data in (self._ws, self._gds):
+            meta = data.setdefault("_meta", {})
+            meta["journal_seq"] = self._seq
+            meta["last_updated"] = now
+        ok = (_save_json_safe(_wm_path("world_state.json"), self._ws)
+              and _save_json_safe(_wm_path("gods.json"), self._gds))
+        if ok:
+            # Os dois snapshots ja cobrem ate seq: troca por um journal vazio
+            # (inode novo, para o leitor recomecar do inicio)
+            ok = _save_text_safe(_wm_path(JOURNAL_FILE), "")
+        if ok:
+            self._snap_seq = self._seq
+        self._files_sig = self._stat_files()
+        _notify_map()
+        return ok
 
     def _notify_app_state(self, god_id: str, zone_id: Optional[str]):
         """Notifica AppState sobre a conquista de territÃ³rio."""
@@ -6,6 +6,7 @@ Sistema de efeitos visuais, partÃ­culas e cÃ¢mera.
 # PartÃ­culas
 from .particles import (
     Particula,
+    ParticleSystem,
     HitSpark,
     Shockwave,
     EncantamentoEffect,
@@ -21,7 +22,7 @@ from .impact import (
 )
 
 # Camera
-from .camera import Camera
+from .camera import Camera, CameraHeadless
 
 # Visual/UI
 from .visual import (
@@ -93,6 +94,7 @@ from .magic_vfx import (
 __all__ = [
     # PartÃ­culas
     'Particula',
+    'ParticleSystem',
     'HitSpark',
     'Shockwave',
     'EncantamentoEffect',
@@ -104,6 +106,7 @@ __all__ = [
     'DashTrail',
     # Camera
     'Camera',
+    'CameraHeadless',
     # Visual
     'FloatingText',
     'Decal',
@@ -21,10 +21,10 @@ O impacto visual deve SEMPRE corresponder ao "peso" do ataque.
 
 import pygame
 import math
-import random
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict
 from enum import Enum, auto
+from utilitarios.rng import rng_vfx
 
 
 # =============================================================================
@@ -135,14 +135,14 @@ class CraterMark:
         # Gera rachaduras radiais
         num_cracks = int(4 + self.intensidade * 3)
         for i in range(num_cracks):
-            ang = (i / num_cracks) * math.pi * 2 + random.uniform(-0.3, 0.3)
-            comp = self.raio * random.uniform(0.8, 1.5) * self.intensidade
-            largura = random.uniform(1, 3)
+            ang = (i / num_cracks) * math.pi * 2 + rng_vfx.uniform(-0.3, 0.3)
+            comp = self.raio * rng_vfx.uniform(0.8, 1.5) * self.intensidade
+            largura = rng_vfx.uniform(1, 3)
             self.cracks.append({
                 'angulo': ang,
                 'comprimento': comp,
                 'largura': largura,
-                'deslocamento': random.uniform(0, 0.3)
+                'deslocamento': rng_vfx.uniform(0, 0.3)
             })
     
     def update(self, dt: float):
@@ -197,11 +197,11 @@ class GroundCrack:
         # Ramificações (mais com mais força)
         num_ramos = int(2 + self.forca / 5)
         for _ in range(num_ramos):
-            ang_offset = random.uniform(-0.8, 0.8)
-            pos_inicio = random.uniform(0.2, 0.7)
+            ang_offset = rng_vfx.uniform(-0.8, 0.8)
+            pos_inicio = rng_vfx.uniform(0.2, 0.7)
             self.segmentos.append({
                 'angulo': self.direcao + ang_offset,
-                'comp': self.comp_max * random.uniform(0.3, 0.6),
+                'comp': self.comp_max * rng_vfx.uniform(0.3, 0.6),
                 'largura': 2 + self.forca * 0.1,
                 'offset': pos_inicio,
                 'filhos': []
@@ -387,7 +387,7 @@ class ImpactShockwave:
         
         # Cor
         if cor is None:
-            cor = random.choice(IMPACT_COLORS["physical"])
+            cor = rng_vfx.choice(IMPACT_COLORS["physical"])
         self.cor = cor
         
         # Múltiplas ondas para impactos fortes
@@ -496,20 +496,20 @@ class ImpactSparks:
         # Gera faíscas
         for _ in range(qtd):
             # Direção com spread
-            ang = direcao + random.uniform(-0.8, 0.8)
-            vel = random.uniform(100, 300) * (1.0 + forca / 20)
+            ang = direcao + rng_vfx.uniform(-0.8, 0.8)
+            vel = rng_vfx.uniform(100, 300) * (1.0 + forca / 20)
             
-            vida = random.uniform(0.2, 0.5)
+            vida = rng_vfx.uniform(0.2, 0.5)
             
             self.sparks.append(Spark(
-                x=x + random.uniform(-5, 5),
-                y=y + random.uniform(-5, 5),
+                x=x + rng_vfx.uniform(-5, 5),
+                y=y + rng_vfx.uniform(-5, 5),
                 vx=math.cos(ang) * vel,
-                vy=math.sin(ang) * vel - random.uniform(50, 150),
+                vy=math.sin(ang) * vel - rng_vfx.uniform(50, 150),
                 vida=vida,
                 max_vida=vida,
-                cor=random.choice(cores),
-                tamanho=random.uniform(2, 5) * (1.0 + forca / 30)
+                cor=rng_vfx.choice(cores),
+                tamanho=rng_vfx.uniform(2, 5) * (1.0 + forca / 30)
             ))
     
     def update(self, dt: float):
@@ -603,9 +603,9 @@ class AttackAnticipation:
         num_linhas = int(4 + forca / 5)
         for _ in range(num_linhas):
             self.linhas.append({
-                'angulo': random.uniform(0, math.pi * 2),
-                'dist_inicial': random.uniform(40, 80),
-                'velocidade': random.uniform(150, 300),
+                'angulo': rng_vfx.uniform(0, math.pi * 2),
+                'dist_inicial': rng_vfx.uniform(40, 80),
+                'velocidade': rng_vfx.uniform(150, 300),
             })
     
     def update(self, dt: float):
@@ -737,17 +737,17 @@ class AttackAnimationManager:
         # === SHOCKWAVE ===
         if len(self.shockwaves) < self.MAX_SHOCKWAVES:
             cores = IMPACT_COLORS.get(tipo_dano, IMPACT_COLORS["physical"])
-            wave = ImpactShockwave(px, py, forca * crit_mult, random.choice(cores))
+            wave = ImpactShockwave(px, py, forca * crit_mult, rng_vfx.choice(cores))
             self.shockwaves.append(wave)
         
         # === SCREEN FLASH (só para ataques fortes) ===
         if tier['screen_flash'] and (is_critico or forca >= 18):
             cores = IMPACT_COLORS.get(tipo_dano, IMPACT_COLORS["physical"])
-            flash = ScreenFlash(forca * crit_mult, random.choice(cores))
+            flash = ScreenFlash(forca * crit_mult, rng_vfx.choice(cores))
             self.screen_flashes.append(flash)
         
         # === CRATER / GROUND CRACK ===
-        if random.random() < tier['crater_chance'] * crit_mult:
+        if rng_vfx.random() < tier['crater_chance'] * crit_mult:
             if len(self.crater_marks) < self.MAX_CRATERS:
                 raio = 15 + forca * 0.8
                 crater = CraterMark(
@@ -6,10 +6,10 @@ Suporta configuração via UI (view_sons.py).
 
 import pygame
 import os
-import random
 import json
 from typing import Dict, List, Optional
 import logging
+from utilitarios.rng import rng_vfx
 _log = logging.getLogger("audio")
 
 
@@ -203,6 +203,28 @@ class AudioManager:
         if cls._instance:
             cls._instance.stop_all()
         cls._instance = None
+
+    @classmethod
+    def install_silent(cls):
+        """
+        Instala um singleton mudo: não inicializa pygame.mixer nem gera sons.
+        Todas as chamadas play_* viram no-op (enabled=False). Usado pelo
+        Simulador headless, onde Lutador/Simulador ainda chamam get_instance().
+        """
+        cls.reset()
+        silent = cls.__new__(cls)
+        silent.enabled = False
+        silent.debug = False
+        silent.master_volume = 0.0
+        silent.sfx_volume = 0.0
+        silent.music_volume = 0.0
+        silent.category_volumes = {}
+        silent.sounds = {}
+        silent.sound_groups = {}
+        silent.sound_dir = ""
+        silent.sound_config = {}
+        cls._instance = silent
+        return silent
     
     def _setup_sounds(self):
         """Configura biblioteca de sons"""
@@ -386,7 +408,7 @@ class AudioManager:
         actual_name = sound_name
         if sound_name in self.sound_groups:
             sounds = self.sound_groups[sound_name]
-            sound = random.choice(sounds)
+            sound = rng_vfx.choice(sounds)
             if self.debug: print(f"[AUDIO] Playing from group: {sound_name}")
         elif sound_name in self.sounds:
             sound = self.sounds[sound_name]
@@ -10,9 +10,9 @@ Como funciona:
 4. Centro sempre exatamente entre os lutadores
 """
 
-import random
 import math
 from utilitarios.config import LARGURA, ALTURA, PPM
+from utilitarios.rng import rng_vfx
 
 
 class Camera:
@@ -255,8 +255,8 @@ class Camera:
             # Shake mÃ­nimo: ignora valores muito pequenos
             if shake_atual < 0.5:
                 shake_atual = 0
-            self.offset_x = random.uniform(-shake_atual, shake_atual)
-            self.offset_y = random.uniform(-shake_atual, shake_atual)
+            self.offset_x = rng_vfx.uniform(-shake_atual, shake_atual)
+            self.offset_y = rng_vfx.uniform(-shake_atual, shake_atual)
         else:
             self.offset_x *= 0.6  # Retorno mais rÃ¡pido ao centro
             self.offset_y *= 0.6
@@ -400,3 +400,20 @@ class Camera:
         return min_x, min_y, max_x, max_y
 
 
+class CameraHeadless(Camera):
+    """
+    Camera de simulacao headless (Simulador.headless).
+
+    Mantem a mesma interface e os limites da arena (listener_x do audio,
+    CameraFeel do game feel), mas nao acompanha lutadores nem aplica shake
+    ou zoom: nada disso afeta a resolucao do combate.
+    """
+
+    def atualizar(self, dt, p1, p2, fighters=None):
+        return None
+
+    def aplicar_shake(self, forca, duracao=0.2):
+        return None
+
+    def zoom_punch(self, intensidade=0.1, duracao=0.1):
+        return None
@@ -4,8 +4,8 @@ Flashes, colisões mágicas, bloqueios e trails
 """
 
 import pygame
-import random
 import math
+from utilitarios.rng import rng_vfx
 
 
 class ImpactFlash:
@@ -23,18 +23,18 @@ class ImpactFlash:
         
         if tipo == "magic":
             for i in range(10):
-                ang = random.uniform(0, math.pi * 2)
-                comp = random.uniform(25, 55) * tamanho
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                comp = rng_vfx.uniform(25, 55) * tamanho
                 self.raios.append((ang, comp))
         elif tipo == "clash":
             for i in range(14):
-                ang = i * (math.pi * 2 / 14) + random.uniform(-0.15, 0.15)
-                comp = random.uniform(35, 70) * tamanho
+                ang = i * (math.pi * 2 / 14) + rng_vfx.uniform(-0.15, 0.15)
+                comp = rng_vfx.uniform(35, 70) * tamanho
                 self.raios.append((ang, comp))
         elif tipo == "normal":
             for i in range(6):
-                ang = random.uniform(0, math.pi * 2)
-                comp = random.uniform(15, 35) * tamanho
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                comp = rng_vfx.uniform(15, 35) * tamanho
                 self.raios.append((ang, comp))
     
     def update(self, dt):
@@ -111,16 +111,16 @@ class MagicClash:
         self.ondas = []
         
         for _ in range(25):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(100, 300) * tamanho
-            cor = random.choice([cor1, cor2])
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(100, 300) * tamanho
+            cor = rng_vfx.choice([cor1, cor2])
             self.particulas.append({
                 'x': x, 'y': y,
                 'vx': math.cos(ang) * vel,
                 'vy': math.sin(ang) * vel,
                 'cor': cor,
-                'tam': random.uniform(3, 8) * tamanho,
-                'vida': random.uniform(0.3, 0.5)
+                'tam': rng_vfx.uniform(3, 8) * tamanho,
+                'vida': rng_vfx.uniform(0.3, 0.5)
             })
         
         for i in range(3):
@@ -195,13 +195,13 @@ class BlockEffect:
         self.faiscas = []
         
         for _ in range(15):
-            ang = angulo + random.uniform(-0.5, 0.5)
-            vel = random.uniform(50, 150)
+            ang = angulo + rng_vfx.uniform(-0.5, 0.5)
+            vel = rng_vfx.uniform(50, 150)
             self.faiscas.append({
                 'x': x, 'y': y,
                 'vx': math.cos(ang) * vel,
                 'vy': math.sin(ang) * vel,
-                'vida': random.uniform(0.15, 0.3)
+                'vida': rng_vfx.uniform(0.15, 0.3)
             })
     
     def update(self, dt):
@@ -17,11 +17,11 @@ Cada elemento tem geometria, ritmo e personalidade Ãºnicos:
 """
 
 import pygame
-import random
 import math
 from typing import List, Tuple, Optional, Dict
 from utilitarios.config import PPM
 import logging
+from utilitarios.rng import rng_vfx
 _log = logging.getLogger("magic_vfx")
 
 
@@ -176,8 +176,8 @@ def _draw_lightning_bolt(tela, x1, y1, x2, y2, color, width=2, detail=5):
     pts = [(x1, y1)]
     for i in range(1, segs):
         t = i / segs
-        bx = x1 + dx * t + px * random.uniform(-detail * (1 - abs(t - 0.5) * 2), detail * (1 - abs(t - 0.5) * 2))
-        by = y1 + dy * t + py * random.uniform(-detail * (1 - abs(t - 0.5) * 2), detail * (1 - abs(t - 0.5) * 2))
+        bx = x1 + dx * t + px * rng_vfx.uniform(-detail * (1 - abs(t - 0.5) * 2), detail * (1 - abs(t - 0.5) * 2))
+        by = y1 + dy * t + py * rng_vfx.uniform(-detail * (1 - abs(t - 0.5) * 2), detail * (1 - abs(t - 0.5) * 2))
         pts.append((bx, by))
     pts.append((x2, y2))
     if len(pts) < 2:
@@ -233,8 +233,8 @@ class MagicParticle:
         self.vida = self.vida_max = vida
         self.gravidade = gravidade
         self.arrasto = arrasto
-        self.rotacao = random.uniform(0, math.pi * 2)
-        self.rot_vel = random.uniform(-7, 7)
+        self.rotacao = rng_vfx.uniform(0, math.pi * 2)
+        self.rot_vel = rng_vfx.uniform(-7, 7)
         self.shape = shape
         self.glow = glow
 
@@ -379,119 +379,119 @@ class DramaticProjectileTrail:
         el = self.elemento
         pal = self.palette
         if el == "FOGO":
-            cor = random.choice(pal["mid"] + pal["outer"])
+            cor = rng_vfx.choice(pal["mid"] + pal["outer"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-3, 3), y + random.uniform(-3, 3),
-                cor, random.uniform(-25, 25), random.uniform(-90, -30),
-                random.uniform(4, 9), random.uniform(0.22, 0.45),
+                x + rng_vfx.uniform(-3, 3), y + rng_vfx.uniform(-3, 3),
+                cor, rng_vfx.uniform(-25, 25), rng_vfx.uniform(-90, -30),
+                rng_vfx.uniform(4, 9), rng_vfx.uniform(0.22, 0.45),
                 gravidade=-40, arrasto=0.95, shape="ember"))
             # FaÃ­sca extra
-            if random.random() < 0.4:
+            if rng_vfx.random() < 0.4:
                 self.particulas.append(MagicParticle(
                     x, y, pal["spark"],
-                    random.uniform(-50, 50), random.uniform(-60, 10),
-                    random.uniform(1.5, 3), random.uniform(0.08, 0.18),
+                    rng_vfx.uniform(-50, 50), rng_vfx.uniform(-60, 10),
+                    rng_vfx.uniform(1.5, 3), rng_vfx.uniform(0.08, 0.18),
                     gravidade=50, arrasto=0.90))
         elif el == "GELO":
-            cor = random.choice(pal["mid"])
+            cor = rng_vfx.choice(pal["mid"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-5, 5), y + random.uniform(-5, 5),
-                cor, random.uniform(-45, 45), random.uniform(-45, 45),
-                random.uniform(2.5, 6), random.uniform(0.28, 0.55),
+                x + rng_vfx.uniform(-5, 5), y + rng_vfx.uniform(-5, 5),
+                cor, rng_vfx.uniform(-45, 45), rng_vfx.uniform(-45, 45),
+                rng_vfx.uniform(2.5, 6), rng_vfx.uniform(0.28, 0.55),
                 arrasto=0.90, shape="shard"))
         elif el == "RAIO":
             self.particulas.append(MagicParticle(
-                x + random.uniform(-9, 9), y + random.uniform(-9, 9),
-                pal["spark"], random.uniform(-70, 70), random.uniform(-70, 70),
-                random.uniform(1.5, 3.5), random.uniform(0.04, 0.12),
+                x + rng_vfx.uniform(-9, 9), y + rng_vfx.uniform(-9, 9),
+                pal["spark"], rng_vfx.uniform(-70, 70), rng_vfx.uniform(-70, 70),
+                rng_vfx.uniform(1.5, 3.5), rng_vfx.uniform(0.04, 0.12),
                 arrasto=0.82, glow=True))
         elif el == "TREVAS":
-            cor = random.choice(pal["mid"])
+            cor = rng_vfx.choice(pal["mid"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-7, 7), y + random.uniform(-7, 7),
-                cor, random.uniform(-18, 18), random.uniform(-18, 18),
-                random.uniform(5, 11), random.uniform(0.35, 0.65),
+                x + rng_vfx.uniform(-7, 7), y + rng_vfx.uniform(-7, 7),
+                cor, rng_vfx.uniform(-18, 18), rng_vfx.uniform(-18, 18),
+                rng_vfx.uniform(5, 11), rng_vfx.uniform(0.35, 0.65),
                 gravidade=12, arrasto=0.985, shape="wisp"))
         elif el == "ARCANO":
-            cor = random.choice(pal["mid"])
-            shape = random.choice(["rune", "star", "circle"])
+            cor = rng_vfx.choice(pal["mid"])
+            shape = rng_vfx.choice(["rune", "star", "circle"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-6, 6), y + random.uniform(-6, 6),
-                cor, random.uniform(-30, 30), random.uniform(-30, 30),
-                random.uniform(3, 7), random.uniform(0.20, 0.40),
+                x + rng_vfx.uniform(-6, 6), y + rng_vfx.uniform(-6, 6),
+                cor, rng_vfx.uniform(-30, 30), rng_vfx.uniform(-30, 30),
+                rng_vfx.uniform(3, 7), rng_vfx.uniform(0.20, 0.40),
                 arrasto=0.93, shape=shape, glow=True))
         elif el == "NATUREZA":
-            cor = random.choice(pal["mid"])
-            shape = random.choice(["thorn", "circle"])
+            cor = rng_vfx.choice(pal["mid"])
+            shape = rng_vfx.choice(["thorn", "circle"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-5, 5), y + random.uniform(-5, 5),
-                cor, random.uniform(-20, 20), random.uniform(-50, -10),
-                random.uniform(3, 7), random.uniform(0.25, 0.50),
+                x + rng_vfx.uniform(-5, 5), y + rng_vfx.uniform(-5, 5),
+                cor, rng_vfx.uniform(-20, 20), rng_vfx.uniform(-50, -10),
+                rng_vfx.uniform(3, 7), rng_vfx.uniform(0.25, 0.50),
                 gravidade=-20, arrasto=0.94, shape=shape))
         elif el == "SANGUE":
-            cor = random.choice(pal["mid"])
+            cor = rng_vfx.choice(pal["mid"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-3, 3), y + random.uniform(-3, 3),
-                cor, random.uniform(-22, 22), random.uniform(-15, 35),
-                random.uniform(3, 7), random.uniform(0.18, 0.38),
+                x + rng_vfx.uniform(-3, 3), y + rng_vfx.uniform(-3, 3),
+                cor, rng_vfx.uniform(-22, 22), rng_vfx.uniform(-15, 35),
+                rng_vfx.uniform(3, 7), rng_vfx.uniform(0.18, 0.38),
                 gravidade=90, arrasto=0.93, shape="drop"))
         elif el == "TEMPO":
             # v14.0: Trail temporal â€” partÃ­culas que "congelam" no ar e desvanecem
-            cor = random.choice(pal["mid"])
+            cor = rng_vfx.choice(pal["mid"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-4, 4), y + random.uniform(-4, 4),
-                cor, random.uniform(-8, 8), random.uniform(-8, 8),
-                random.uniform(3, 7), random.uniform(0.5, 1.0),
+                x + rng_vfx.uniform(-4, 4), y + rng_vfx.uniform(-4, 4),
+                cor, rng_vfx.uniform(-8, 8), rng_vfx.uniform(-8, 8),
+                rng_vfx.uniform(3, 7), rng_vfx.uniform(0.5, 1.0),
                 arrasto=0.99, shape="star", glow=True))
             # Eco temporal (partÃ­cula ghost atrasada)
-            if random.random() < 0.3:
+            if rng_vfx.random() < 0.3:
                 self.particulas.append(MagicParticle(
-                    x + random.uniform(-10, 10), y + random.uniform(-10, 10),
+                    x + rng_vfx.uniform(-10, 10), y + rng_vfx.uniform(-10, 10),
                     pal["spark"], 0, 0,
-                    random.uniform(4, 8), random.uniform(0.3, 0.5),
+                    rng_vfx.uniform(4, 8), rng_vfx.uniform(0.3, 0.5),
                     arrasto=1.0, shape="rune", glow=True))
         elif el == "GRAVITACAO":
             # v14.0: Trail gravitacional â€” partÃ­culas que orbitam o projÃ©til
-            cor = random.choice(pal["mid"])
-            ang = random.uniform(0, math.pi * 2)
-            orbit_r = random.uniform(8, 18)
+            cor = rng_vfx.choice(pal["mid"])
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            orbit_r = rng_vfx.uniform(8, 18)
             self.particulas.append(MagicParticle(
                 x + math.cos(ang) * orbit_r, y + math.sin(ang) * orbit_r,
                 cor, -math.cos(ang) * 40, -math.sin(ang) * 40,
-                random.uniform(3, 6), random.uniform(0.25, 0.45),
+                rng_vfx.uniform(3, 6), rng_vfx.uniform(0.25, 0.45),
                 arrasto=0.92, shape="circle", glow=True))
             # DistorÃ§Ã£o central
-            if random.random() < 0.3:
+            if rng_vfx.random() < 0.3:
                 self.particulas.append(MagicParticle(
                     x, y, pal["core"],
-                    random.uniform(-5, 5), random.uniform(-5, 5),
-                    random.uniform(5, 10), random.uniform(0.15, 0.25),
+                    rng_vfx.uniform(-5, 5), rng_vfx.uniform(-5, 5),
+                    rng_vfx.uniform(5, 10), rng_vfx.uniform(0.15, 0.25),
                     arrasto=0.96, shape="wisp"))
         elif el == "CAOS":
             # v14.0: Trail caÃ³tico â€” formas e cores aleatÃ³rias
-            cor = (random.randint(80, 255), random.randint(80, 255), random.randint(80, 255))
-            shape = random.choice(["circle", "star", "shard", "ember", "rune"])
+            cor = (rng_vfx.randint(80, 255), rng_vfx.randint(80, 255), rng_vfx.randint(80, 255))
+            shape = rng_vfx.choice(["circle", "star", "shard", "ember", "rune"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-8, 8), y + random.uniform(-8, 8),
-                cor, random.uniform(-60, 60), random.uniform(-60, 60),
-                random.uniform(3, 9), random.uniform(0.15, 0.40),
-                gravidade=random.uniform(-50, 80), arrasto=random.uniform(0.88, 0.96), shape=shape))
+                x + rng_vfx.uniform(-8, 8), y + rng_vfx.uniform(-8, 8),
+                cor, rng_vfx.uniform(-60, 60), rng_vfx.uniform(-60, 60),
+                rng_vfx.uniform(3, 9), rng_vfx.uniform(0.15, 0.40),
+                gravidade=rng_vfx.uniform(-50, 80), arrasto=rng_vfx.uniform(0.88, 0.96), shape=shape))
         elif el == "VOID":
             # v14.0: Trail void â€” partÃ­culas que implosionam para o centro
-            cor = random.choice(pal["mid"])
-            ang = random.uniform(0, math.pi * 2)
-            dist = random.uniform(12, 25)
+            cor = rng_vfx.choice(pal["mid"])
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            dist = rng_vfx.uniform(12, 25)
             self.particulas.append(MagicParticle(
                 x + math.cos(ang) * dist, y + math.sin(ang) * dist,
                 cor, -math.cos(ang) * 50, -math.sin(ang) * 50,
-                random.uniform(4, 9), random.uniform(0.20, 0.40),
+                rng_vfx.uniform(4, 9), rng_vfx.uniform(0.20, 0.40),
                 arrasto=0.90, shape="wisp"))
         else:
-            cor = random.choice(pal["mid"])
+            cor = rng_vfx.choice(pal["mid"])
             self.particulas.append(MagicParticle(
-                x + random.uniform(-6, 6), y + random.uniform(-6, 6),
-                cor, random.uniform(-35, 35), random.uniform(-35, 35),
-                random.uniform(3, 7), random.uniform(0.20, 0.42),
+                x + rng_vfx.uniform(-6, 6), y + rng_vfx.uniform(-6, 6),
+                cor, rng_vfx.uniform(-35, 35), rng_vfx.uniform(-35, 35),
+                rng_vfx.uniform(3, 7), rng_vfx.uniform(0.20, 0.42),
                 arrasto=0.93))
 
     def draw(self, tela, cam):
@@ -540,30 +540,30 @@ class DramaticExplosion:
             self.flash_raio = 30 * tam
             # Bola de fogo principal
             for _ in range(n):
-                ang = random.uniform(-math.pi * 0.8, -math.pi * 0.2) + random.uniform(-0.8, 0.8)
-                vel = random.uniform(90, 280) * tam
-                cor = random.choice(pal["mid"] + [pal["core"]])
+                ang = rng_vfx.uniform(-math.pi * 0.8, -math.pi * 0.2) + rng_vfx.uniform(-0.8, 0.8)
+                vel = rng_vfx.uniform(90, 280) * tam
+                cor = rng_vfx.choice(pal["mid"] + [pal["core"]])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(6, 14) * tam, random.uniform(0.4, 0.8),
+                    rng_vfx.uniform(6, 14) * tam, rng_vfx.uniform(0.4, 0.8),
                     gravidade=45, arrasto=0.94, shape="ember"))
             # FaÃ­scas radiais
             for _ in range(int(n * 0.7)):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(120, 360) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(120, 360) * tam
                 self.particulas.append(MagicParticle(self.x, self.y, pal["spark"],
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(2, 5), random.uniform(0.15, 0.35),
+                    rng_vfx.uniform(2, 5), rng_vfx.uniform(0.15, 0.35),
                     gravidade=120, arrasto=0.91, shape="ember"))
             # Pilares de chama (3)
             for i in range(3):
-                ang = (i / 3) * math.pi * 2 + random.uniform(-0.3, 0.3)
+                ang = (i / 3) * math.pi * 2 + rng_vfx.uniform(-0.3, 0.3)
                 self.pillars.append({
                     "x": self.x + math.cos(ang) * 20 * tam,
                     "y": self.y + math.sin(ang) * 20 * tam,
-                    "ang": -math.pi / 2, "length": random.uniform(55, 90) * tam,
+                    "ang": -math.pi / 2, "length": rng_vfx.uniform(55, 90) * tam,
                     "vida": 0.9, "vida_max": 0.9,
-                    "cor": random.choice(pal["mid"]), "largura": 8,
+                    "cor": rng_vfx.choice(pal["mid"]), "largura": 8,
                     "tem_offset": True,
                 })
 
@@ -571,24 +571,24 @@ class DramaticExplosion:
             self.vida = self.vida_max = 1.4
             # Fragmentos de cristal
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(70, 210) * tam
-                cor = random.choice(pal["mid"])
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(70, 210) * tam
+                cor = rng_vfx.choice(pal["mid"])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 11) * tam, random.uniform(0.35, 0.65),
+                    rng_vfx.uniform(4, 11) * tam, rng_vfx.uniform(0.35, 0.65),
                     gravidade=90, arrasto=0.92, shape="shard"))
             # Cristais que ficam no chÃ£o (8 direÃ§Ãµes)
             for i in range(8):
-                ang = i * (math.pi * 2 / 8) + random.uniform(-0.15, 0.15)
-                dist = random.uniform(22, 55) * tam
+                ang = i * (math.pi * 2 / 8) + rng_vfx.uniform(-0.15, 0.15)
+                dist = rng_vfx.uniform(22, 55) * tam
                 self.crystals.append({
                     "x": self.x + math.cos(ang) * dist,
                     "y": self.y + math.sin(ang) * dist,
-                    "ang": ang, "size": random.uniform(9, 20) * tam,
+                    "ang": ang, "size": rng_vfx.uniform(9, 20) * tam,
                     "vida": 0.9, "vida_max": 0.9,
-                    "cor": random.choice(pal["mid"]),
-                    "grow_speed": random.uniform(80, 140),
+                    "cor": rng_vfx.choice(pal["mid"]),
+                    "grow_speed": rng_vfx.uniform(80, 140),
                     "current_size": 0,
                 })
             # Coluna de gelo no centro
@@ -605,31 +605,31 @@ class DramaticExplosion:
             self.flash_alpha = 255
             # PartÃ­culas elÃ©tricas rÃ¡pidas
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(140, 450) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(140, 450) * tam
                 self.particulas.append(MagicParticle(self.x, self.y, pal["spark"],
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(2, 5), random.uniform(0.08, 0.22),
+                    rng_vfx.uniform(2, 5), rng_vfx.uniform(0.08, 0.22),
                     arrasto=0.86, glow=True))
             # Raios em galho (6 direÃ§Ãµes)
             for i in range(6):
-                ang = i * (math.pi / 3) + random.uniform(-0.2, 0.2)
-                length = random.uniform(50, 110) * tam
+                ang = i * (math.pi / 3) + rng_vfx.uniform(-0.2, 0.2)
+                length = rng_vfx.uniform(50, 110) * tam
                 ex = self.x + math.cos(ang) * length
                 ey = self.y + math.sin(ang) * length
                 self.lightning_bolts.append({
                     "x1": self.x, "y1": self.y, "x2": ex, "y2": ey,
                     "vida": 0.35, "vida_max": 0.35,
-                    "cor": random.choice(pal["mid"] + [pal["spark"]]),
-                    "width": random.randint(2, 4),
+                    "cor": rng_vfx.choice(pal["mid"] + [pal["spark"]]),
+                    "width": rng_vfx.randint(2, 4),
                     "branches": [],
                 })
                 # Sub-raios (branching)
-                mid_x = (self.x + ex) / 2 + random.uniform(-20, 20)
-                mid_y = (self.y + ey) / 2 + random.uniform(-20, 20)
+                mid_x = (self.x + ex) / 2 + rng_vfx.uniform(-20, 20)
+                mid_y = (self.y + ey) / 2 + rng_vfx.uniform(-20, 20)
                 for _ in range(2):
-                    ba = ang + random.uniform(-0.8, 0.8)
-                    bl = random.uniform(20, 50) * tam
+                    ba = ang + rng_vfx.uniform(-0.8, 0.8)
+                    bl = rng_vfx.uniform(20, 50) * tam
                     self.lightning_bolts[-1]["branches"].append({
                         "x1": mid_x, "y1": mid_y,
                         "x2": mid_x + math.cos(ba) * bl,
@@ -641,19 +641,19 @@ class DramaticExplosion:
             self.flash_alpha = 120
             # Wisps sombrios
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(55, 175) * tam
-                cor = random.choice(pal["mid"])
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(55, 175) * tam
+                cor = rng_vfx.choice(pal["mid"])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(7, 16) * tam, random.uniform(0.55, 1.1),
+                    rng_vfx.uniform(7, 16) * tam, rng_vfx.uniform(0.55, 1.1),
                     arrasto=0.975, shape="wisp"))
             # VÃ³rtex espirais
             for i in range(3):
                 self.vortex_rings.append({
                     "raio": (8 + i * 18) * tam, "raio_max": (40 + i * 30) * tam,
-                    "rot": random.uniform(0, math.pi * 2),
-                    "vel_rot": random.choice([-1, 1]) * random.uniform(3, 6),
+                    "rot": rng_vfx.uniform(0, math.pi * 2),
+                    "vel_rot": rng_vfx.choice([-1, 1]) * rng_vfx.uniform(3, 6),
                     "vida": 1.2, "vida_max": 1.2,
                     "cor": pal["mid"][0],
                     "num_dots": 8 + i * 4,
@@ -666,39 +666,39 @@ class DramaticExplosion:
             # Raios divinos (12 direÃ§Ãµes)
             num_rays = int(12 * tam)
             for i in range(num_rays):
-                ang = i * (math.pi * 2 / num_rays) + random.uniform(-0.05, 0.05)
+                ang = i * (math.pi * 2 / num_rays) + rng_vfx.uniform(-0.05, 0.05)
                 self.pillars.append({
                     "x": self.x, "y": self.y, "ang": ang,
-                    "length": random.uniform(50, 100) * tam,
+                    "length": rng_vfx.uniform(50, 100) * tam,
                     "vida": 0.8, "vida_max": 0.8,
-                    "cor": random.choice(pal["mid"]), "largura": 5,
+                    "cor": rng_vfx.choice(pal["mid"]), "largura": 5,
                 })
             # Estrelas partÃ­culas
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(110, 320) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(110, 320) * tam
                 self.particulas.append(MagicParticle(self.x, self.y, pal["spark"],
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(2, 5), random.uniform(0.18, 0.38),
+                    rng_vfx.uniform(2, 5), rng_vfx.uniform(0.18, 0.38),
                     arrasto=0.93, shape="star"))
 
         elif el == "NATUREZA":
             self.vida = self.vida_max = 1.5
             # Esporos que sobem
             for _ in range(n):
-                ang = random.uniform(-math.pi, -math.pi * 0.1)
-                vel = random.uniform(60, 200) * tam
-                cor = random.choice(pal["mid"])
+                ang = rng_vfx.uniform(-math.pi, -math.pi * 0.1)
+                vel = rng_vfx.uniform(60, 200) * tam
+                cor = rng_vfx.choice(pal["mid"])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 9) * tam, random.uniform(0.40, 0.80),
+                    rng_vfx.uniform(4, 9) * tam, rng_vfx.uniform(0.40, 0.80),
                     gravidade=-20, arrasto=0.96, shape="circle"))
             # Espinhos radiais
             for i in range(10):
-                ang = i * (math.pi * 2 / 10) + random.uniform(-0.2, 0.2)
+                ang = i * (math.pi * 2 / 10) + rng_vfx.uniform(-0.2, 0.2)
                 self.pillars.append({
                     "x": self.x, "y": self.y, "ang": ang,
-                    "length": random.uniform(30, 65) * tam,
+                    "length": rng_vfx.uniform(30, 65) * tam,
                     "vida": 1.2, "vida_max": 1.2,
                     "cor": pal["outer"][0], "largura": 4,
                 })
@@ -708,13 +708,13 @@ class DramaticExplosion:
             self.flash_raio = 35 * tam
             # Fragmentos de runa
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(80, 250) * tam
-                cor = random.choice(pal["mid"])
-                shape = random.choice(["rune", "star"])
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(80, 250) * tam
+                cor = rng_vfx.choice(pal["mid"])
+                shape = rng_vfx.choice(["rune", "star"])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 10) * tam, random.uniform(0.3, 0.6),
+                    rng_vfx.uniform(4, 10) * tam, rng_vfx.uniform(0.3, 0.6),
                     arrasto=0.93, shape=shape, glow=True))
             # Anel de runas orbitando
             for i in range(6):
@@ -735,12 +735,12 @@ class DramaticExplosion:
             self.flash_alpha = 200
             # Gotas de sangue que caem
             for _ in range(n):
-                ang = random.uniform(-math.pi, 0) + random.uniform(-0.5, 0.5)
-                vel = random.uniform(90, 270) * tam
+                ang = rng_vfx.uniform(-math.pi, 0) + rng_vfx.uniform(-0.5, 0.5)
+                vel = rng_vfx.uniform(90, 270) * tam
                 self.particulas.append(MagicParticle(self.x, self.y,
-                    random.choice(pal["mid"]),
+                    rng_vfx.choice(pal["mid"]),
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 10) * tam, random.uniform(0.3, 0.6),
+                    rng_vfx.uniform(4, 10) * tam, rng_vfx.uniform(0.3, 0.6),
                     gravidade=230, arrasto=0.93, shape="drop"))
             # CÃ­rculo ritual no chÃ£o
             for i in range(8):
@@ -760,15 +760,15 @@ class DramaticExplosion:
             self.flash_alpha = 80
             # Wisps negros que puxam para dentro
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                dist = random.uniform(60, 120) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                dist = rng_vfx.uniform(60, 120) * tam
                 px = self.x + math.cos(ang) * dist
                 py = self.y + math.sin(ang) * dist
-                vel = random.uniform(80, 200) * tam
-                cor = random.choice(pal["mid"])
+                vel = rng_vfx.uniform(80, 200) * tam
+                cor = rng_vfx.choice(pal["mid"])
                 self.particulas.append(MagicParticle(px, py, cor,
                     -math.cos(ang) * vel, -math.sin(ang) * vel,
-                    random.uniform(6, 14) * tam, random.uniform(0.45, 0.9),
+                    rng_vfx.uniform(6, 14) * tam, rng_vfx.uniform(0.45, 0.9),
                     arrasto=0.96, shape="wisp"))
             # VÃ³rtex singulares
             for i in range(2):
@@ -776,20 +776,20 @@ class DramaticExplosion:
                     "raio": (15 + i * 20) * tam,
                     "raio_max": (15 + i * 20) * tam,
                     "rot": 0,
-                    "vel_rot": (3 + i * 2) * random.choice([-1, 1]),
+                    "vel_rot": (3 + i * 2) * rng_vfx.choice([-1, 1]),
                     "vida": 1.5, "vida_max": 1.5,
                     "cor": pal["spark"],
                     "num_dots": 12,
                 })
             # v14.0: Buraco negro central sugando partÃ­culas
             for _ in range(int(n * 0.5)):
-                ang = random.uniform(0, math.pi * 2)
-                dist_spawn = random.uniform(80, 160) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                dist_spawn = rng_vfx.uniform(80, 160) * tam
                 px = self.x + math.cos(ang) * dist_spawn
                 py = self.y + math.sin(ang) * dist_spawn
                 self.particulas.append(MagicParticle(px, py, pal["core"],
                     -math.cos(ang) * 180 * tam, -math.sin(ang) * 180 * tam,
-                    random.uniform(2, 5), random.uniform(0.3, 0.6),
+                    rng_vfx.uniform(2, 5), rng_vfx.uniform(0.3, 0.6),
                     arrasto=0.92, glow=True))
             # DistorÃ§Ã£o visual â€” anel externo escuro
             self.shockwaves.append({
@@ -804,12 +804,12 @@ class DramaticExplosion:
             self.flash_alpha = 200
             # PartÃ­culas temporais que se movem em espiral
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(60, 200) * tam
-                cor = random.choice(pal["mid"])
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(60, 200) * tam
+                cor = rng_vfx.choice(pal["mid"])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(3, 8) * tam, random.uniform(0.5, 1.0),
+                    rng_vfx.uniform(3, 8) * tam, rng_vfx.uniform(0.5, 1.0),
                     arrasto=0.98, shape="star", glow=True))
             # Ecos temporais â€” anÃ©is que CONTRAEM (tempo revertendo)
             for i in range(5):
@@ -846,31 +846,31 @@ class DramaticExplosion:
             self.flash_alpha = 180
             # Fase 1: PartÃ­culas puxadas para dentro
             for _ in range(int(n * 0.6)):
-                ang = random.uniform(0, math.pi * 2)
-                dist_spawn = random.uniform(80, 150) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                dist_spawn = rng_vfx.uniform(80, 150) * tam
                 px = self.x + math.cos(ang) * dist_spawn
                 py = self.y + math.sin(ang) * dist_spawn
-                vel = random.uniform(120, 280) * tam
-                cor = random.choice(pal["mid"])
+                vel = rng_vfx.uniform(120, 280) * tam
+                cor = rng_vfx.choice(pal["mid"])
                 self.particulas.append(MagicParticle(px, py, cor,
                     -math.cos(ang) * vel, -math.sin(ang) * vel,
-                    random.uniform(4, 10) * tam, random.uniform(0.3, 0.5),
+                    rng_vfx.uniform(4, 10) * tam, rng_vfx.uniform(0.3, 0.5),
                     arrasto=0.88, shape="circle", glow=True))
             # Fase 2: PartÃ­culas que explodem para fora (depois de colapsar)
             for _ in range(int(n * 0.4)):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(150, 350) * tam
-                cor = random.choice(pal["mid"] + [pal["core"]])
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(150, 350) * tam
+                cor = rng_vfx.choice(pal["mid"] + [pal["core"]])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(5, 12) * tam, random.uniform(0.5, 0.9),
+                    rng_vfx.uniform(5, 12) * tam, rng_vfx.uniform(0.5, 0.9),
                     gravidade=80, arrasto=0.95, shape="circle"))
             # VÃ³rtex gravitacional â€” espiral achatada
             for i in range(3):
                 self.vortex_rings.append({
                     "raio": (20 + i * 25) * tam,
                     "raio_max": (50 + i * 30) * tam,
-                    "rot": i * 0.7, "vel_rot": (4 + i) * random.choice([-1, 1]),
+                    "rot": i * 0.7, "vel_rot": (4 + i) * rng_vfx.choice([-1, 1]),
                     "vida": 1.3, "vida_max": 1.3,
                     "cor": pal["mid"][i % len(pal["mid"])],
                     "num_dots": 10 + i * 4,
@@ -893,58 +893,58 @@ class DramaticExplosion:
             self.flash_alpha = 255
             # PartÃ­culas multicoloridas com comportamento errÃ¡tico
             for _ in range(int(n * 1.3)):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(100, 400) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(100, 400) * tam
                 # Cores totalmente aleatÃ³rias
-                cor = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
-                shape = random.choice(["circle", "star", "shard", "rune", "ember", "drop"])
-                grav = random.uniform(-100, 150)
+                cor = (rng_vfx.randint(50, 255), rng_vfx.randint(50, 255), rng_vfx.randint(50, 255))
+                shape = rng_vfx.choice(["circle", "star", "shard", "rune", "ember", "drop"])
+                grav = rng_vfx.uniform(-100, 150)
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(3, 12) * tam, random.uniform(0.2, 0.7),
-                    gravidade=grav, arrasto=random.uniform(0.85, 0.98), shape=shape, glow=random.random() < 0.3))
+                    rng_vfx.uniform(3, 12) * tam, rng_vfx.uniform(0.2, 0.7),
+                    gravidade=grav, arrasto=rng_vfx.uniform(0.85, 0.98), shape=shape, glow=rng_vfx.random() < 0.3))
             # Raios caÃ³ticos em direÃ§Ãµes aleatÃ³rias
             for i in range(4):
-                ang = random.uniform(0, math.pi * 2)
-                length = random.uniform(40, 100) * tam
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                length = rng_vfx.uniform(40, 100) * tam
                 ex = self.x + math.cos(ang) * length
                 ey = self.y + math.sin(ang) * length
-                cor_raio = (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
+                cor_raio = (rng_vfx.randint(100, 255), rng_vfx.randint(100, 255), rng_vfx.randint(100, 255))
                 self.lightning_bolts.append({
                     "x1": self.x, "y1": self.y, "x2": ex, "y2": ey,
                     "vida": 0.4, "vida_max": 0.4,
-                    "cor": cor_raio, "width": random.randint(2, 5), "branches": [],
+                    "cor": cor_raio, "width": rng_vfx.randint(2, 5), "branches": [],
                 })
             # Ondas de choque com cores diferentes
             for i in range(3):
-                cor_sw = random.choice(pal["mid"] + pal["outer"])
+                cor_sw = rng_vfx.choice(pal["mid"] + pal["outer"])
                 self.shockwaves.append({
                     "raio": 0, "raio_max": (60 + i * 40) * tam,
-                    "delay": i * 0.1, "cor": cor_sw, "largura": random.randint(2, 6),
+                    "delay": i * 0.1, "cor": cor_sw, "largura": rng_vfx.randint(2, 6),
                     "alpha_max": 220 - i * 40,
                 })
             # Cristais de caos â€” fragmentos de realidade
             for i in range(6):
-                ang = random.uniform(0, math.pi * 2)
-                dist = random.uniform(20, 60) * tam
-                cor_c = (random.randint(100, 255), random.randint(50, 200), random.randint(100, 255))
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                dist = rng_vfx.uniform(20, 60) * tam
+                cor_c = (rng_vfx.randint(100, 255), rng_vfx.randint(50, 200), rng_vfx.randint(100, 255))
                 self.crystals.append({
                     "x": self.x + math.cos(ang) * dist,
                     "y": self.y + math.sin(ang) * dist,
-                    "ang": random.uniform(0, math.pi * 2),
-                    "size": random.uniform(6, 15) * tam,
+                    "ang": rng_vfx.uniform(0, math.pi * 2),
+                    "size": rng_vfx.uniform(6, 15) * tam,
                     "vida": 0.8, "vida_max": 0.8,
                     "cor": cor_c, "grow_speed": 150, "current_size": 0,
                 })
 
         else:  # DEFAULT
             for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(80, 290) * tam
-                cor = random.choice(pal["mid"] + pal["outer"])
+                ang = rng_vfx.uniform(0, math.pi * 2)
+                vel = rng_vfx.uniform(80, 290) * tam
+                cor = rng_vfx.choice(pal["mid"] + pal["outer"])
                 self.particulas.append(MagicParticle(self.x, self.y, cor,
                     math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 11) * tam, random.uniform(0.3, 0.65),
+                    rng_vfx.uniform(4, 11) * tam, rng_vfx.uniform(0.3, 0.65),
                     gravidade=40, arrasto=0.94))
 
     def update(self, dt):
@@ -1101,8 +1101,8 @@ class DramaticBeam:
         for i in range(1, n):
             t = i / n
             jitter = 14 * math.sin(t * math.pi)
-            bx = self.x1 + dx * t + px * random.uniform(-jitter, jitter)
-            by = self.y1 + dy * t + py * random.uniform(-jitter, jitter)
+            bx = self.x1 + dx * t + px * rng_vfx.uniform(-jitter, jitter)
+            by = self.y1 + dy * t + py * rng_vfx.uniform(-jitter, jitter)
             segs.append((bx, by))
         segs.append((self.x2, self.y2))
         return segs
@@ -1114,14 +1114,14 @@ class DramaticBeam:
         pal = self.palette
         n = max(4, int(dist / 22))
         for _ in range(n):
-            t = random.random()
-            px = self.x1 + dx * t + random.uniform(-6, 6)
-            py = self.y1 + dy * t + random.uniform(-6, 6)
-            cor = random.choice(pal["mid"])
+            t = rng_vfx.random()
+            px = self.x1 + dx * t + rng_vfx.uniform(-6, 6)
+            py = self.y1 + dy * t + rng_vfx.uniform(-6, 6)
+            cor = rng_vfx.choice(pal["mid"])
             shape = "ember" if el == "FOGO" else "shard" if el == "GELO" else "rune" if el == "ARCANO" else "circle"
             self.particulas.append(MagicParticle(px, py, cor,
-                random.uniform(-30, 30), random.uniform(-30, 30),
-                random.uniform(3, 7), random.uniform(0.12, 0.30),
+                rng_vfx.uniform(-30, 30), rng_vfx.uniform(-30, 30),
+                rng_vfx.uniform(3, 7), rng_vfx.uniform(0.12, 0.30),
                 arrasto=0.90, shape=shape))
 
     def update(self, dt):
@@ -1129,7 +1129,7 @@ class DramaticBeam:
         if self.vida <= 0:
             return False
         self.pulse_timer += dt * 18
-        if random.random() < dt * 18:
+        if rng_vfx.random() < dt * 18:
             self._spawn_particles()
         self.particulas = [p for p in self.particulas if p.update(dt)]
         return True
@@ -1152,7 +1152,7 @@ class DramaticBeam:
             gw = max(3, int((self.largura + 12) * pulse))
             try:
                 pygame.draw.lines(s, (*self.palette["outer"][0], int(70 * ratio)), False, local, gw)
-                pygame.draw.lines(s, (*random.choice(self.palette["mid"]), int(210 * ratio)),
+                pygame.draw.lines(s, (*rng_vfx.choice(self.palette["mid"]), int(210 * ratio)),
                                   False, local, max(2, int(self.largura * pulse)))
                 pygame.draw.lines(s, (255, 255, 255, int(245 * ratio)), False, local,
                                   max(1, int(self.largura * 0.28)))
@@ -1177,17 +1177,17 @@ class DramaticAura:
         self.timer = 0.0
         self.intensidade = intensidade
         self.aneis = [
-            {"raio": raio * (0.45 + i * 0.32), "fase": random.uniform(0, math.pi * 2),
-             "vel": random.uniform(1.8, 4.0), "cor": random.choice(self.palette["mid"])}
+            {"raio": raio * (0.45 + i * 0.32), "fase": rng_vfx.uniform(0, math.pi * 2),
+             "vel": rng_vfx.uniform(1.8, 4.0), "cor": rng_vfx.choice(self.palette["mid"])}
             for i in range(3)
         ]
         self.orbitantes = [
-            {"ang": random.uniform(0, math.pi * 2),
-             "dist": random.uniform(raio * 0.45, raio * 1.25),
-             "vel": random.uniform(1.2, 3.2) * random.choice([-1, 1]),
-             "cor": random.choice(self.palette["mid"]),
-             "tam": random.uniform(3.5, 7.0) * intensidade,
-             "shape": random.choice(["circle", "star", "rune"])}
+            {"ang": rng_vfx.uniform(0, math.pi * 2),
+             "dist": rng_vfx.uniform(raio * 0.45, raio * 1.25),
+             "vel": rng_vfx.uniform(1.2, 3.2) * rng_vfx.choice([-1, 1]),
+             "cor": rng_vfx.choice(self.palette["mid"]),
+             "tam": rng_vfx.uniform(3.5, 7.0) * intensidade,
+             "shape": rng_vfx.choice(["circle", "star", "rune"])}
             for _ in range(int(12 * intensidade))
         ]
         # Raios de energia periÃ³dicos (RAIO / LUZ)
@@ -1210,8 +1210,8 @@ class DramaticAura:
             self.energy_timer += dt
             if self.energy_timer > 0.15:
                 self.energy_timer = 0.0
-                if random.random() < 0.5:
-                    ang = random.uniform(0, math.pi * 2)
+                if rng_vfx.random() < 0.5:
+                    ang = rng_vfx.uniform(0, math.pi * 2)
                     self.energy_lines.append({
                         "ang": ang, "length": self.raio * 0.8,
                         "vida": 0.1, "vida_max": 0.1,
@@ -1285,9 +1285,9 @@ class MagicCastChargeup:
         for i in range(3):
             self.rings.append({
                 "raio": (70 + i * 25) * intensidade,
-                "fase": random.uniform(0, math.pi * 2),
-                "vel": (2.5 + i * 1.2) * random.choice([-1, 1]),
-                "cor": random.choice(self.palette["mid"]),
+                "fase": rng_vfx.uniform(0, math.pi * 2),
+                "vel": (2.5 + i * 1.2) * rng_vfx.choice([-1, 1]),
+                "cor": rng_vfx.choice(self.palette["mid"]),
             })
 
     def update(self, dt, x=None, y=None):
@@ -1314,26 +1314,26 @@ class MagicCastChargeup:
 
     def _spawn_particle(self, prog):
         spread = 90 * self.intensidade * (1 - prog * 0.6)
-        ang = random.uniform(0, math.pi * 2)
-        dist = random.uniform(20, spread)
+        ang = rng_vfx.uniform(0, math.pi * 2)
+        dist = rng_vfx.uniform(20, spread)
         px = self.x + math.cos(ang) * dist
         py = self.y + math.sin(ang) * dist
         # PartÃ­cula voa em direÃ§Ã£o ao centro com velocidade normalizada
         dx = self.x - px
         dy = self.y - py
         d = math.hypot(dx, dy)
-        spd = random.uniform(120, 240) * self.intensidade * (0.5 + prog)
+        spd = rng_vfx.uniform(120, 240) * self.intensidade * (0.5 + prog)
         if d > 0:
             vx = (dx / d) * spd
             vy = (dy / d) * spd
         else:
             vx, vy = 0.0, 0.0
-        cor = random.choice(self.palette["mid"])
+        cor = rng_vfx.choice(self.palette["mid"])
         el = self.elemento
         shape = "ember" if el == "FOGO" else "shard" if el == "GELO" else "rune" if el == "ARCANO" else "circle"
         self.particulas.append(MagicParticle(px, py, cor, vx, vy,
-            random.uniform(2.5, 6) * self.intensidade,
-            random.uniform(0.08, 0.25), arrasto=0.94, shape=shape, glow=(el in ("RAIO", "LUZ"))))
+            rng_vfx.uniform(2.5, 6) * self.intensidade,
+            rng_vfx.uniform(0.08, 0.25), arrasto=0.94, shape=shape, glow=(el in ("RAIO", "LUZ"))))
 
     def draw(self, tela, cam):
         sx, sy = cam.converter(self.x, self.y)
@@ -1376,18 +1376,18 @@ class ElementalImpactBurst:
         n = int(18 * i)
         shape = "shard" if el == "GELO" else "ember" if el == "FOGO" else "star" if el == "LUZ" else "circle"
         for _ in range(n):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(110, 320) * i
-            cor = random.choice(pal["mid"])
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(110, 320) * i
+            cor = rng_vfx.choice(pal["mid"])
             self.particulas.append(MagicParticle(self.x, self.y, cor,
                 math.cos(ang) * vel, math.sin(ang) * vel,
-                random.uniform(3, 9) * i, random.uniform(0.14, 0.35),
+                rng_vfx.uniform(3, 9) * i, rng_vfx.uniform(0.14, 0.35),
                 gravidade=60 if el == "SANGUE" else 0, arrasto=0.91, shape=shape))
         for ri in range(3):
             self.rings.append({
                 "raio": 0, "raio_max": (28 + ri * 22) * i,
                 "delay": ri * 0.025,
-                "cor": random.choice(pal["mid"]),
+                "cor": rng_vfx.choice(pal["mid"]),
                 "alpha_max": 200 - ri * 30,
             })
 
@@ -1438,9 +1438,9 @@ class DramaticSummon:
         self.rot = 0.0
         self.particulas: List[MagicParticle] = []
         self.pilares = [
-            {"ang": i * (math.pi / 3), "altura": 0, "max": random.uniform(65, 110),
-             "delay": i * 0.09, "cor": random.choice(self.palette["mid"]),
-             "largura": random.randint(5, 10)}
+            {"ang": i * (math.pi / 3), "altura": 0, "max": rng_vfx.uniform(65, 110),
+             "delay": i * 0.09, "cor": rng_vfx.choice(self.palette["mid"]),
+             "largura": rng_vfx.randint(5, 10)}
             for i in range(6)
         ]
         self.lightning_spawns = []
@@ -1459,15 +1459,15 @@ class DramaticSummon:
                 p["delay"] -= dt
             elif prog < 0.75:
                 p["altura"] = min(p["max"], p["altura"] + 190 * dt)
-        if random.random() < dt * 30:
-            ang = random.uniform(0, math.pi * 2)
-            dist = random.uniform(8, self.circulo_raio)
-            cor = random.choice(self.palette["mid"])
+        if rng_vfx.random() < dt * 30:
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            dist = rng_vfx.uniform(8, self.circulo_raio)
+            cor = rng_vfx.choice(self.palette["mid"])
             self.particulas.append(MagicParticle(
                 self.x + math.cos(ang) * dist,
                 self.y + math.sin(ang) * dist,
-                cor, random.uniform(-10, 10), random.uniform(-90, -45),
-                random.uniform(2, 6), 0.5, arrasto=0.97, glow=True))
+                cor, rng_vfx.uniform(-10, 10), rng_vfx.uniform(-90, -45),
+                rng_vfx.uniform(2, 6), 0.5, arrasto=0.97, glow=True))
         self.particulas = [p for p in self.particulas if p.update(dt)]
         return True
 
@@ -1513,6 +1513,7 @@ class DramaticSummon:
 
 class MagicVFXManager:
     _instance = None
+    _desativado = False
 
     def __init__(self):
         self.explosions: List[DramaticExplosion] = []
@@ -1525,6 +1526,8 @@ class MagicVFXManager:
 
     @classmethod
     def get_instance(cls):
+        if cls._desativado:
+            return None
         if cls._instance is None:
             cls._instance = MagicVFXManager()
         return cls._instance
@@ -1532,6 +1535,13 @@ class MagicVFXManager:
     @classmethod
     def reset(cls):
         cls._instance = None
+        cls._desativado = False
+
+    @classmethod
+    def desativar(cls):
+        """Modo headless: get_instance() retorna None ate o proximo reset()."""
+        cls._instance = None
+        cls._desativado = True
 
     def spawn_explosion(self, x, y, elemento="DEFAULT", tamanho=1.0, dano=0):
         self.explosions.append(DramaticExplosion(x, y, elemento, tamanho, dano))
@@ -16,11 +16,11 @@ Filosofia de Design:
 """
 
 import pygame
-import random
 import math
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Callable
 from enum import Enum, auto
+from utilitarios.rng import rng_vfx
 
 
 # =============================================================================
@@ -313,17 +313,17 @@ class DustCloud:
         intensidade = min(2.0, intensidade)  # Limita intensidade
         qtd = min(20, int(10 * intensidade))  # Max 20 partículas
         for _ in range(qtd):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(30, 80) * intensidade
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(30, 80) * intensidade
             self.particles.append(DustParticle(
-                x=self.x + random.uniform(-5, 5),
-                y=self.y + random.uniform(-2, 2),
+                x=self.x + rng_vfx.uniform(-5, 5),
+                y=self.y + rng_vfx.uniform(-2, 2),
                 vx=math.cos(ang) * vel,
-                vy=math.sin(ang) * vel * 0.3 - random.uniform(20, 50),  # Mais pra cima
-                size=random.uniform(4, 10) * intensidade,
-                cor=random.choice(DUST_COLORS),
-                vida=random.uniform(0.3, 0.6),
-                rotation_speed=random.uniform(-180, 180)
+                vy=math.sin(ang) * vel * 0.3 - rng_vfx.uniform(20, 50),  # Mais pra cima
+                size=rng_vfx.uniform(4, 10) * intensidade,
+                cor=rng_vfx.choice(DUST_COLORS),
+                vida=rng_vfx.uniform(0.3, 0.6),
+                rotation_speed=rng_vfx.uniform(-180, 180)
             ))
     
     def _spawn_dash_dust(self, intensidade: float, direcao: float):
@@ -332,16 +332,16 @@ class DustCloud:
         qtd = min(15, int(8 * intensidade))  # Max 15 partículas
         for _ in range(qtd):
             # Partículas vão na direção oposta ao dash
-            ang = direcao + math.pi + random.uniform(-0.5, 0.5)
-            vel = random.uniform(20, 60) * intensidade
+            ang = direcao + math.pi + rng_vfx.uniform(-0.5, 0.5)
+            vel = rng_vfx.uniform(20, 60) * intensidade
             self.particles.append(DustParticle(
-                x=self.x + random.uniform(-10, 10),
-                y=self.y + random.uniform(-3, 3),
+                x=self.x + rng_vfx.uniform(-10, 10),
+                y=self.y + rng_vfx.uniform(-3, 3),
                 vx=math.cos(ang) * vel,
-                vy=-random.uniform(10, 30),  # Sobe um pouco
-                size=random.uniform(3, 7) * intensidade,
-                cor=random.choice(DUST_COLORS),
-                vida=random.uniform(0.2, 0.4),
+                vy=-rng_vfx.uniform(10, 30),  # Sobe um pouco
+                size=rng_vfx.uniform(3, 7) * intensidade,
+                cor=rng_vfx.choice(DUST_COLORS),
+                vida=rng_vfx.uniform(0.2, 0.4),
             ))
     
     def _spawn_skid_dust(self, intensidade: float, direcao: float):
@@ -354,11 +354,11 @@ class DustCloud:
             self.particles.append(DustParticle(
                 x=self.x - math.cos(direcao) * offset,
                 y=self.y - math.sin(direcao) * offset * 0.3,
-                vx=random.uniform(-10, 10),
-                vy=-random.uniform(5, 15),
-                size=random.uniform(2, 5) * intensidade,
-                cor=random.choice(DUST_COLORS),
-                vida=random.uniform(0.15, 0.3),
+                vx=rng_vfx.uniform(-10, 10),
+                vy=-rng_vfx.uniform(5, 15),
+                size=rng_vfx.uniform(2, 5) * intensidade,
+                cor=rng_vfx.choice(DUST_COLORS),
+                vida=rng_vfx.uniform(0.15, 0.3),
             ))
     
     def _spawn_impact_dust(self, intensidade: float):
@@ -366,17 +366,17 @@ class DustCloud:
         intensidade = min(2.0, intensidade)  # Limita intensidade
         qtd = min(25, int(12 * intensidade))  # Max 25 partículas
         for _ in range(qtd):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(50, 150) * intensidade
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(50, 150) * intensidade
             self.particles.append(DustParticle(
                 x=self.x,
                 y=self.y,
                 vx=math.cos(ang) * vel,
-                vy=math.sin(ang) * vel - random.uniform(30, 80),
-                size=random.uniform(5, 12) * intensidade,
-                cor=random.choice(IMPACT_COLORS),
-                vida=random.uniform(0.2, 0.5),
-                rotation_speed=random.uniform(-360, 360)
+                vy=math.sin(ang) * vel - rng_vfx.uniform(30, 80),
+                size=rng_vfx.uniform(5, 12) * intensidade,
+                cor=rng_vfx.choice(IMPACT_COLORS),
+                vida=rng_vfx.uniform(0.2, 0.5),
+                rotation_speed=rng_vfx.uniform(-360, 360)
             ))
     
     def update(self, dt: float):
@@ -454,7 +454,7 @@ class SpeedLinesEffect:
         self.lines: List[SpeedLine] = []
         self.vida = 0.3
         
-        cor = cor or random.choice(SPEED_COLORS)
+        cor = cor or rng_vfx.choice(SPEED_COLORS)
         
         if tipo == "dash":
             self._spawn_dash_lines(intensidade, cor)
@@ -468,8 +468,8 @@ class SpeedLinesEffect:
         qtd = int(8 * intensidade)
         for i in range(qtd):
             # Linhas atrás do personagem
-            offset_lateral = random.uniform(-30, 30)
-            offset_dist = random.uniform(20, 60)
+            offset_lateral = rng_vfx.uniform(-30, 30)
+            offset_dist = rng_vfx.uniform(20, 60)
             
             # Posição relativa
             perp = self.direcao + math.pi / 2
@@ -478,11 +478,11 @@ class SpeedLinesEffect:
             
             self.lines.append(SpeedLine(
                 x=lx, y=ly,
-                angulo=self.direcao + random.uniform(-0.1, 0.1),
-                comprimento=random.uniform(20, 50) * intensidade,
-                largura=random.uniform(2, 4),
+                angulo=self.direcao + rng_vfx.uniform(-0.1, 0.1),
+                comprimento=rng_vfx.uniform(20, 50) * intensidade,
+                largura=rng_vfx.uniform(2, 4),
                 cor=cor,
-                vida=random.uniform(0.1, 0.25),
+                vida=rng_vfx.uniform(0.1, 0.25),
                 offset=offset_dist
             ))
     
@@ -490,30 +490,30 @@ class SpeedLinesEffect:
         """Linhas radiando do ponto de impacto"""
         qtd = int(12 * intensidade)
         for i in range(qtd):
-            ang = self.direcao + random.uniform(-0.8, 0.8)
+            ang = self.direcao + rng_vfx.uniform(-0.8, 0.8)
             self.lines.append(SpeedLine(
-                x=self.x + random.uniform(-10, 10),
-                y=self.y + random.uniform(-5, 5),
+                x=self.x + rng_vfx.uniform(-10, 10),
+                y=self.y + rng_vfx.uniform(-5, 5),
                 angulo=ang,
-                comprimento=random.uniform(30, 70) * intensidade,
-                largura=random.uniform(2, 5),
+                comprimento=rng_vfx.uniform(30, 70) * intensidade,
+                largura=rng_vfx.uniform(2, 5),
                 cor=cor,
-                vida=random.uniform(0.15, 0.3)
+                vida=rng_vfx.uniform(0.15, 0.3)
             ))
     
     def _spawn_sprint_lines(self, intensidade: float, cor: tuple):
         """Linhas mais sutis para corrida"""
         qtd = int(5 * intensidade)
         for i in range(qtd):
-            offset_lateral = random.uniform(-20, 20)
+            offset_lateral = rng_vfx.uniform(-20, 20)
             self.lines.append(SpeedLine(
-                x=self.x + random.uniform(-30, -10),
+                x=self.x + rng_vfx.uniform(-30, -10),
                 y=self.y + offset_lateral,
                 angulo=self.direcao,
-                comprimento=random.uniform(15, 30) * intensidade,
-                largura=random.uniform(1, 2),
+                comprimento=rng_vfx.uniform(15, 30) * intensidade,
+                largura=rng_vfx.uniform(1, 2),
                 cor=cor,
-                vida=random.uniform(0.1, 0.15)
+                vida=rng_vfx.uniform(0.1, 0.15)
             ))
     
     def update(self, dt: float):
@@ -744,8 +744,8 @@ class RecoveryFlash:
             ang = i * (math.pi * 2 / 6)
             self.linhas.append({
                 'angulo': ang,
-                'comprimento': random.uniform(30, 50) * intensidade,
-                'largura': random.uniform(2, 4)
+                'comprimento': rng_vfx.uniform(30, 50) * intensidade,
+                'largura': rng_vfx.uniform(2, 4)
             })
     
     def update(self, dt: float):
@@ -4,9 +4,10 @@ PartÃ­culas, faÃ­scas e efeitos de encantamento
 """
 
 import pygame
-import random
 import math
+import numpy as np
 from utilitarios.config import PPM
+from utilitarios.rng import rng_vfx
 
 
 # Cores dos encantamentos para partÃ­culas
@@ -28,6 +29,8 @@ CORES_ENCANTAMENTOS = {
 
 class Particula:
     """PartÃ­cula bÃ¡sica para efeitos visuais"""
+    __slots__ = ["x", "y", "cor", "vel_x", "vel_y", "tamanho", "vida"]
+
     def __init__(self, x, y, cor, vel_x, vel_y, tamanho, vida_util=1.0):
         self.x, self.y = x, y
         self.cor = cor
@@ -42,8 +45,213 @@ class Particula:
         self.tamanho *= 0.92
 
 
+class ParticleSystem:
+    """
+    Particulas basicas em arrays NumPy de capacidade fixa.
+
+    Substitui a lista de Particula do Simulador: update e draw sao
+    vetorizados e os slots mortos voltam para uma free-list. Com o pool
+    cheio, a particula mais antiga e reciclada (mesmo efeito do antigo
+    corte em particulas[-600:]). append(Particula) continua aceito.
+    """
+
+    # Sprites pre-desenhados por (cor, tamanho em px, alpha quantizado)
+    MAX_SPRITES = 4096
+    _ALPHA_PASSO = 16
+
+    def __init__(self, capacidade=600, decaimento=0.92):
+        self.capacidade = int(capacidade)
+        self.decaimento = decaimento
+        n = self.capacidade
+        self.x = np.zeros(n, dtype=np.float64)
+        self.y = np.zeros(n, dtype=np.float64)
+        self.vel_x = np.zeros(n, dtype=np.float64)
+        self.vel_y = np.zeros(n, dtype=np.float64)
+        self.gravidade = np.zeros(n, dtype=np.float64)
+        self.vida = np.zeros(n, dtype=np.float64)
+        self.tamanho = np.zeros(n, dtype=np.float64)
+        self.cor_idx = np.zeros(n, dtype=np.int32)
+        self.vivo = np.zeros(n, dtype=bool)
+        self._ordem = np.zeros(n, dtype=np.int64)   # contador de emissao (recicla o mais antigo)
+        self._proxima_ordem = 0
+        self._livres = list(range(n - 1, -1, -1))
+        self._qtd = 0
+        self.cores = []
+        self._cor_index = {}
+        self._sprites = {}
+
+    # -- cores ---------------------------------------------------------------
+    def indice_cor(self, cor):
+        cor = tuple(int(c) for c in cor[:3])
+        idx = self._cor_index.get(cor)
+        if idx is None:
+            idx = len(self.cores)
+            self.cores.append(cor)
+            self._cor_index[cor] = idx
+        return idx
+
+    # -- emissao -------------------------------------------------------------
+    def _slots(self, k):
+        livres = self._livres
+        if k <= len(livres):
+            slots = [livres.pop() for _ in range(k)]
+        else:
+            slots = [livres.pop() for _ in range(len(livres))]
+            faltam = min(k - len(slots), self.capacidade)
+            ocupados = np.flatnonzero(self.vivo)
+            ordem = self._ordem[ocupados]
+            if faltam < len(ocupados):
+                mais_antigos = ocupados[np.argpartition(ordem, faltam - 1)[:faltam]]
+            else:
+                mais_antigos = ocupados
+            self._qtd -= len(mais_antigos)
+            slots.extend(int(i) for i in mais_antigos)
+        return slots
+
+    def emit(self, x, y, cor, vel_x, vel_y, tamanho, vida=1.0, gravidade=0.0):
+        i = self._slots(1)[0]
+        self.x[i] = x
+        self.y[i] = y
+        self.vel_x[i] = vel_x
+        self.vel_y[i] = vel_y
+        self.tamanho[i] = tamanho
+        self.vida[i] = vida
+        self.gravidade[i] = gravidade
+        self.cor_idx[i] = self.indice_cor(cor)
+        self.vivo[i] = True
+        self._ordem[i] = self._proxima_ordem
+        self._proxima_ordem += 1
+        self._qtd += 1
+
+    def emit_many(self, x, y, cor, vel_x, vel_y, tamanho, vida=1.0, gravidade=0.0):
+        """Emite N particulas de uma cor; argumentos escalares ou arrays de tamanho N."""
+        n = int(np.broadcast(np.asarray(x), np.asarray(y), np.asarray(vel_x),
+                             np.asarray(vel_y), np.asarray(tamanho), np.asarray(vida)).size)
+        if n <= 0:
+            return
+        if n > self.capacidade:
+            # So as ultimas cabem no pool
+            corte = slice(n - self.capacidade, n)
+            x, y, vel_x, vel_y, tamanho, vida = (
+                np.broadcast_to(np.asarray(v, dtype=np.float64), (n,))[corte]
+                for v in (x, y, vel_x, vel_y, tamanho, vida))
+            n = self.capacidade
+        idx = np.array(self._slots(n), dtype=np.intp)
+        self.x[idx] = x
+        self.y[idx] = y
+        self.vel_x[idx] = vel_x
+        self.vel_y[idx] = vel_y
+        self.tamanho[idx] = tamanho
+        self.vida[idx] = vida
+        self.gravidade[idx] = gravidade
+        self.cor_idx[idx] = self.indice_cor(cor)
+        self.vivo[idx] = True
+        self._ordem[idx] = np.arange(self._proxima_ordem, self._proxima_ordem + n)
+        self._proxima_ordem += n
+        self._qtd += n
+
+    def append(self, particula):
+        """Compatibilidade com o codigo que ainda cria Particula(...)."""
+        self.emit(particula.x, particula.y, particula.cor, particula.vel_x, particula.vel_y,
+                  particula.tamanho, particula.vida)
+
+    # -- estado --------------------------------------------------------------
+    def __len__(self):
+        return self._qtd
+
+    def __iter__(self):
+        """Copias Particula das particulas vivas (para debug/ferramentas)."""
+        for i in np.flatnonzero(self.vivo):
+            yield Particula(float(self.x[i]), float(self.y[i]), self.cores[self.cor_idx[i]],
+                            float(self.vel_x[i]), float(self.vel_y[i]),
+                            float(self.tamanho[i]), float(self.vida[i]))
+
+    def clear(self):
+        self.vivo[:] = False
+        self._livres = list(range(self.capacidade - 1, -1, -1))
+        self._qtd = 0
+
+    # -- update --------------------------------------------------------------
+    def update(self, dt):
+        """
+        Avanca todas as particulas vivas (mesma ordem de Particula.atualizar)
+        e libera as que morreram. Retorna os indices liberados neste passo;
+        x/y/tamanho/cor_idx desses slots valem ate a proxima emissao.
+        """
+        if self._qtd == 0:
+            return np.empty(0, dtype=np.intp)
+        v = self.vivo
+        self.x[v] += self.vel_x[v] * dt
+        self.y[v] += self.vel_y[v] * dt
+        self.vel_y[v] += self.gravidade[v] * dt
+        self.vida[v] -= dt
+        self.tamanho[v] *= self.decaimento
+        mortas = np.flatnonzero(v & (self.vida <= 0))
+        if len(mortas):
+            self.vivo[mortas] = False
+            self._livres.extend(int(i) for i in mortas[::-1])
+            self._qtd -= len(mortas)
+        return mortas
+
+    # -- draw ----------------------------------------------------------------
+    def _sprite(self, cor_idx, tam, alpha):
+        key = (cor_idx, tam, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            return sprite
+        if len(self._sprites) >= self.MAX_SPRITES:
+            self._sprites.clear()
+        cor = self.cores[cor_idx]
+        if tam > 3:
+            surf_size = int(tam * 3) + 6
+            sprite = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+            c = surf_size // 2
+            # Glow externo suave, core colorido e hotspot branco
+            pygame.draw.circle(sprite, (*cor, alpha // 4), (c, c), min(c - 1, int(tam * 1.5)))
+            pygame.draw.circle(sprite, (*cor, alpha), (c, c), max(1, int(tam * 0.7)))
+            pygame.draw.circle(sprite, (255, 255, 255, int(alpha * 0.6)), (c, c), max(1, int(tam * 0.3)))
+        elif tam > 1:
+            sprite = pygame.Surface((6, 6), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*cor, alpha), (3, 3), max(1, int(tam)))
+        else:
+            sprite = pygame.Surface((1, 1))
+            sprite.fill(cor)
+        self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, tela, cam):
+        """Desenha tudo com um unico tela.blits() de sprites cacheados."""
+        idx = np.flatnonzero(self.vivo)
+        if not len(idx):
+            return
+        zoom = getattr(cam, "zoom", None)
+        if zoom is None:
+            pontos = [cam.converter(self.x[i], self.y[i]) for i in idx]
+            sx = np.array([p[0] for p in pontos], dtype=np.int64)
+            sy = np.array([p[1] for p in pontos], dtype=np.int64)
+            tam = np.array([cam.converter_tam(self.tamanho[i]) for i in idx], dtype=np.int64)
+        else:
+            # Camera.converter / converter_tam vetorizados
+            sx = ((self.x[idx] - cam.x) * zoom + cam.screen_width / 2 + cam.offset_x).astype(np.int64)
+            sy = ((self.y[idx] - cam.y) * zoom + cam.screen_height / 2 + cam.offset_y).astype(np.int64)
+            tam = (self.tamanho[idx] * zoom).astype(np.int64)
+        alpha = np.clip((255 * np.maximum(0.0, self.vida[idx])).astype(np.int64), 0, 255)
+        alpha = np.minimum(255, alpha // self._ALPHA_PASSO * self._ALPHA_PASSO + self._ALPHA_PASSO // 2)
+        meio = np.where(tam > 3, ((tam * 3) + 6) // 2, np.where(tam > 1, 3, 0))
+        cores = self.cor_idx[idx]
+        sprite = self._sprite
+        tela.blits([
+            (sprite(c, t, a), (x - m, y - m))
+            for c, t, a, x, y, m in zip(cores.tolist(), tam.tolist(), alpha.tolist(),
+                                        sx.tolist(), sy.tolist(), meio.tolist())
+        ], doreturn=False)
+
+
 class HitSpark:
     """FaÃ­scas estilizadas de impacto â€” v15.0 POLISHED com glow"""
+    __slots__ = ["x", "y", "cor", "vida", "max_vida", "intensidade",
+                 "sx", "sy", "vx", "vy", "comprimento", "svida", "smax_vida", "largura"]
+
     def __init__(self, x, y, cor, direcao, intensidade=1.0):
         self.x = x
         self.y = y
@@ -51,73 +259,89 @@ class HitSpark:
         self.vida = 0.25
         self.max_vida = 0.25
         self.intensidade = intensidade
-        self.sparks = []
-        
-        # Mais faÃ­scas com variaÃ§Ã£o maior
+
+        # Uma coluna NumPy por atributo em vez de um dict por faisca
         num_sparks = int(15 * intensidade)
-        for _ in range(num_sparks):
-            ang = direcao + random.uniform(-0.9, 0.9)
-            vel = random.uniform(90, 250) * intensidade
-            vida = random.uniform(0.1, 0.25)
-            self.sparks.append({
-                'x': x, 'y': y,
-                'vx': math.cos(ang) * vel,
-                'vy': math.sin(ang) * vel,
-                'comprimento': random.uniform(10, 25) * intensidade,
-                'vida': vida,
-                'max_vida': vida,
-                'largura': random.uniform(1.5, 3.5),
-            })
-    
+        ang = np.empty(num_sparks)
+        vel = np.empty(num_sparks)
+        vida = np.empty(num_sparks)
+        comprimento = np.empty(num_sparks)
+        largura = np.empty(num_sparks)
+        for k in range(num_sparks):
+            # Mesma sequencia de rng_vfx.uniform da versao com dicts
+            ang[k] = direcao + rng_vfx.uniform(-0.9, 0.9)
+            vel[k] = rng_vfx.uniform(90, 250) * intensidade
+            vida[k] = rng_vfx.uniform(0.1, 0.25)
+            comprimento[k] = rng_vfx.uniform(10, 25) * intensidade
+            largura[k] = rng_vfx.uniform(1.5, 3.5)
+        self.sx = np.full(num_sparks, float(x))
+        self.sy = np.full(num_sparks, float(y))
+        self.vx = np.cos(ang) * vel
+        self.vy = np.sin(ang) * vel
+        self.comprimento = comprimento
+        self.svida = vida
+        self.smax_vida = vida.copy()
+        self.largura = largura
+
     def update(self, dt):
         self.vida -= dt
-        for s in self.sparks:
-            s['x'] += s['vx'] * dt
-            s['y'] += s['vy'] * dt
-            s['vy'] += 100 * dt  # Gravidade sutil
-            s['vida'] -= dt
-            s['comprimento'] *= 0.92
-        self.sparks = [s for s in self.sparks if s['vida'] > 0]
-    
+        self.sx += self.vx * dt
+        self.sy += self.vy * dt
+        self.vy += 100 * dt  # Gravidade sutil
+        self.svida -= dt
+        self.comprimento *= 0.92
+        vivas = self.svida > 0
+        if not vivas.all():
+            for nome in ('sx', 'sy', 'vx', 'vy', 'comprimento', 'svida', 'smax_vida', 'largura'):
+                setattr(self, nome, getattr(self, nome)[vivas])
+
     def draw(self, tela, cam):
-        for s in self.sparks:
-            if s['vida'] <= 0:
+        n = len(self.sx)
+        if not n:
+            return
+        pontos = [cam.converter(self.sx[i], self.sy[i]) for i in range(n)]
+        sx = np.array([p[0] for p in pontos], dtype=np.int64)
+        sy = np.array([p[1] for p in pontos], dtype=np.int64)
+        life_pct = self.svida / self.smax_vida
+        alpha = (255 * life_pct).astype(np.int64)
+        ang = np.arctan2(self.vy, self.vx)
+        comp = np.array([cam.converter_tam(c) for c in self.comprimento], dtype=np.float64)
+        ex = (sx + np.cos(ang) * comp).astype(np.int64)
+        ey = (sy + np.sin(ang) * comp).astype(np.int64)
+
+        # Surface com glow por faisca: draw.* sobrescreve o RGBA em vez de
+        # misturar, entao numa surface unica o glow de uma faisca apagaria o
+        # core das que ja foram desenhadas no mesmo ponto de impacto
+        area = tela.get_rect()
+        cor = self.cor[:3]
+        for i in range(n):
+            x1, y1, x2, y2 = int(sx[i]), int(sy[i]), int(ex[i]), int(ey[i])
+            min_x = min(x1, x2) - 6
+            min_y = min(y1, y2) - 6
+            caixa = pygame.Rect(min_x, min_y,
+                                max(8, max(x1, x2) + 6 - min_x),
+                                max(8, max(y1, y2) + 6 - min_y)).clip(area)
+            if not caixa.w or not caixa.h:
                 continue
-            sx, sy = cam.converter(s['x'], s['y'])
-            life_pct = s['vida'] / s['max_vida']
-            alpha = int(255 * life_pct)
-            
-            ang = math.atan2(s['vy'], s['vx'])
-            comp = cam.converter_tam(s['comprimento'])
-            ex = sx + math.cos(ang) * comp
-            ey = sy + math.sin(ang) * comp
-            
-            # Surface com glow
-            min_x = min(sx, int(ex)) - 6
-            min_y = min(sy, int(ey)) - 6
-            max_x = max(sx, int(ex)) + 6
-            max_y = max(sy, int(ey)) + 6
-            w = max(8, max_x - min_x)
-            h = max(8, max_y - min_y)
-            
-            surf = pygame.Surface((w, h), pygame.SRCALPHA)
-            lp1 = (sx - min_x, sy - min_y)
-            lp2 = (int(ex) - min_x, int(ey) - min_y)
-            
+            surf = pygame.Surface(caixa.size, pygame.SRCALPHA)
+            lp1 = (x1 - caixa.x, y1 - caixa.y)
+            lp2 = (x2 - caixa.x, y2 - caixa.y)
+            a = int(alpha[i])
+
             # Glow externo colorido
-            glow_alpha = max(0, min(255, alpha // 3))
-            larg_glow = max(3, int(s['largura'] + 3))
-            pygame.draw.line(surf, (*self.cor[:3], glow_alpha), lp1, lp2, larg_glow)
-            
+            glow_alpha = max(0, min(255, a // 3))
+            larg_glow = max(3, int(self.largura[i] + 3))
+            pygame.draw.line(surf, (*cor, glow_alpha), lp1, lp2, larg_glow)
+
             # Core brilhante branco
-            core_alpha = max(0, min(255, int(alpha * 0.9)))
-            pygame.draw.line(surf, (255, 255, 255, core_alpha), lp1, lp2, max(1, int(s['largura'])))
-            
+            core_alpha = max(0, min(255, int(a * 0.9)))
+            pygame.draw.line(surf, (255, 255, 255, core_alpha), lp1, lp2, max(1, int(self.largura[i])))
+
             # Ponta brilhante
-            tip_r = max(1, int(2 * life_pct))
+            tip_r = max(1, int(2 * life_pct[i]))
             pygame.draw.circle(surf, (255, 255, 200, core_alpha), lp2, tip_r)
-            
-            tela.blit(surf, (min_x, min_y))
+
+            tela.blit(surf, caixa.topleft)
 
 
 class Shockwave:
@@ -195,52 +419,52 @@ class EncantamentoEffect:
             pos = self.pos_func()
             if pos:
                 x, y = pos
-                cor = random.choice(self.cores)
+                cor = rng_vfx.choice(self.cores)
                 
                 # PadrÃµes de velocidade por elemento
                 if self.encantamento == "Chamas":
-                    vel_x = random.uniform(-40, 40)
-                    vel_y = random.uniform(-100, -40)
-                    tam = random.uniform(3, 6)
-                    vida = random.uniform(0.3, 0.6)
+                    vel_x = rng_vfx.uniform(-40, 40)
+                    vel_y = rng_vfx.uniform(-100, -40)
+                    tam = rng_vfx.uniform(3, 6)
+                    vida = rng_vfx.uniform(0.3, 0.6)
                 elif self.encantamento == "Gelo":
-                    vel_x = random.uniform(-20, 20)
-                    vel_y = random.uniform(5, 30)
-                    tam = random.uniform(2, 5)
-                    vida = random.uniform(0.4, 0.7)
+                    vel_x = rng_vfx.uniform(-20, 20)
+                    vel_y = rng_vfx.uniform(5, 30)
+                    tam = rng_vfx.uniform(2, 5)
+                    vida = rng_vfx.uniform(0.4, 0.7)
                 elif self.encantamento == "RelÃ¢mpago":
-                    vel_x = random.uniform(-120, 120)
-                    vel_y = random.uniform(-120, 120)
-                    tam = random.uniform(2, 4)
-                    vida = random.uniform(0.1, 0.25)
+                    vel_x = rng_vfx.uniform(-120, 120)
+                    vel_y = rng_vfx.uniform(-120, 120)
+                    tam = rng_vfx.uniform(2, 4)
+                    vida = rng_vfx.uniform(0.1, 0.25)
                 elif self.encantamento == "Trevas":
-                    ang = random.uniform(0, math.pi * 2)
-                    dist = random.uniform(5, 15)
+                    ang = rng_vfx.uniform(0, math.pi * 2)
+                    dist = rng_vfx.uniform(5, 15)
                     vel_x = math.cos(ang) * dist
                     vel_y = math.sin(ang) * dist
-                    tam = random.uniform(3, 6)
-                    vida = random.uniform(0.5, 0.8)
+                    tam = rng_vfx.uniform(3, 6)
+                    vida = rng_vfx.uniform(0.5, 0.8)
                 elif self.encantamento == "Sagrado":
-                    ang = random.uniform(0, math.pi * 2)
-                    dist = random.uniform(20, 50)
+                    ang = rng_vfx.uniform(0, math.pi * 2)
+                    dist = rng_vfx.uniform(20, 50)
                     vel_x = math.cos(ang) * dist
                     vel_y = math.sin(ang) * dist - 20
-                    tam = random.uniform(2, 4)
-                    vida = random.uniform(0.4, 0.7)
+                    tam = rng_vfx.uniform(2, 4)
+                    vida = rng_vfx.uniform(0.4, 0.7)
                 elif self.encantamento == "Vampirismo":
-                    vel_x = random.uniform(-15, 15)
-                    vel_y = random.uniform(-50, -20)
-                    tam = random.uniform(2, 5)
-                    vida = random.uniform(0.3, 0.5)
+                    vel_x = rng_vfx.uniform(-15, 15)
+                    vel_y = rng_vfx.uniform(-50, -20)
+                    tam = rng_vfx.uniform(2, 5)
+                    vida = rng_vfx.uniform(0.3, 0.5)
                 else:
-                    vel_x = random.uniform(-30, 30)
-                    vel_y = random.uniform(-30, 30)
-                    tam = random.uniform(2, 4)
-                    vida = random.uniform(0.3, 0.5)
+                    vel_x = rng_vfx.uniform(-30, 30)
+                    vel_y = rng_vfx.uniform(-30, 30)
+                    tam = rng_vfx.uniform(2, 4)
+                    vida = rng_vfx.uniform(0.3, 0.5)
                 
                 # Offset de spawn aleatÃ³rio
-                x += random.uniform(-5, 5)
-                y += random.uniform(-5, 5)
+                x += rng_vfx.uniform(-5, 5)
+                y += rng_vfx.uniform(-5, 5)
                     
                 self.particulas.append(Particula(x, y, cor, vel_x, vel_y, tam, vida))
         
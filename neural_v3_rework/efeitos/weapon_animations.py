@@ -14,12 +14,12 @@ CHANGELOG v2.0:
 import math
 import logging
 import pygame
-import random
 from dataclasses import dataclass, field
 
 _log = logging.getLogger("weapon_animations")
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
+from utilitarios.rng import rng_vfx
 
 
 # ============================================================================
@@ -948,7 +948,7 @@ class WeaponAnimator:
             state.scale = profile.impact_scale
             if profile.shake_on_impact:
                 shake = profile.shake_intensity * (1 - phase_progress)
-                state.shake_offset = (random.uniform(-shake, shake), random.uniform(-shake, shake))
+                state.shake_offset = (rng_vfx.uniform(-shake, shake), rng_vfx.uniform(-shake, shake))
             if profile.spark_on_impact and phase_progress < 0.1:
                 self._spawn_sparks(state, profile)
         elif current_phase == AttackPhase.FOLLOW_THROUGH:
@@ -1027,8 +1027,8 @@ class WeaponAnimator:
                 shake_h = profile.shake_intensity * shake_decay * 2.2
                 shake_v = profile.shake_intensity * shake_decay * 1.4
                 state.shake_offset = (
-                    random.uniform(-shake_h, shake_h),
-                    random.uniform(-shake_v, shake_v) + shake_v * 0.5  # tendência para baixo
+                    rng_vfx.uniform(-shake_h, shake_h),
+                    rng_vfx.uniform(-shake_v, shake_v) + shake_v * 0.5  # tendência para baixo
                 )
             
             # Sparks e poeira no frame do impacto
@@ -1037,15 +1037,14 @@ class WeaponAnimator:
                 # Segundo burst de sparks um pouco depois (ricochete)
             elif 0.25 < phase_progress < 0.32:
                 for _ in range(profile.spark_count // 4):
-                    import random as _r
-                    angle = _r.uniform(0, math.pi * 2)
-                    speed = _r.uniform(30, 80)  # bounce mais lento
+                    angle = rng_vfx.uniform(0, math.pi * 2)
+                    speed = rng_vfx.uniform(30, 80)  # bounce mais lento
                     state.spark_list.append({
                         "vx": math.cos(angle) * speed,
                         "vy": math.sin(angle) * speed,
-                        "life": _r.uniform(0.12, 0.22),
+                        "life": rng_vfx.uniform(0.12, 0.22),
                         "timer": 0.0,
-                        "size": _r.uniform(1.5, 3.5),
+                        "size": rng_vfx.uniform(1.5, 3.5),
                         "color": profile.spark_color,
                     })
 
@@ -1060,8 +1059,8 @@ class WeaponAnimator:
             if profile.shake_on_impact and phase_progress < 0.4:
                 residual = profile.shake_intensity * 0.25 * (1.0 - phase_progress / 0.4)
                 state.shake_offset = (
-                    random.uniform(-residual, residual),
-                    random.uniform(-residual, residual)
+                    rng_vfx.uniform(-residual, residual),
+                    rng_vfx.uniform(-residual, residual)
                 )
             else:
                 state.shake_offset = (0, 0)
@@ -1111,7 +1110,7 @@ class WeaponAnimator:
                 state.scale = 0.92
                 if profile.shake_on_impact:
                     shake = profile.shake_intensity * (1 - phase_progress) * 0.7
-                    state.shake_offset = (random.uniform(-shake, shake), random.uniform(-shake, shake))
+                    state.shake_offset = (rng_vfx.uniform(-shake, shake), rng_vfx.uniform(-shake, shake))
                 if phase_progress < 0.1:
                     self._spawn_sparks(state, profile)
             elif current_phase == AttackPhase.FOLLOW_THROUGH:
@@ -1141,7 +1140,7 @@ class WeaponAnimator:
                 state.scale = 0.85
                 if profile.shake_on_impact:
                     shake = profile.shake_intensity * 1.5 * (1 - phase_progress)
-                    state.shake_offset = (random.uniform(-shake, shake), random.uniform(-shake, shake))
+                    state.shake_offset = (rng_vfx.uniform(-shake, shake), rng_vfx.uniform(-shake, shake))
                 if phase_progress < 0.08:
                     self._spawn_sparks(state, profile)
             elif current_phase == AttackPhase.FOLLOW_THROUGH:
@@ -1184,7 +1183,7 @@ class WeaponAnimator:
             state.angle_offset = 192 * direction
             state.scale = 0.80  # Snap â€” contração
             shake = profile.shake_intensity * (1 - phase_progress) * 1.2
-            state.shake_offset = (random.uniform(-shake, shake), random.uniform(-shake*0.5, shake*0.5))
+            state.shake_offset = (rng_vfx.uniform(-shake, shake), rng_vfx.uniform(-shake*0.5, shake*0.5))
             if phase_progress < 0.08:
                 self._spawn_sparks(state, profile)
         elif current_phase == AttackPhase.FOLLOW_THROUGH:
@@ -1228,7 +1227,7 @@ class WeaponAnimator:
             state.angle_offset = spin_rate
             state.scale = 0.85
             shake = profile.shake_intensity * 0.5 * (1 - phase_progress)
-            state.shake_offset = (random.uniform(-shake, shake), random.uniform(-shake, shake))
+            state.shake_offset = (rng_vfx.uniform(-shake, shake), rng_vfx.uniform(-shake, shake))
             if phase_progress < 0.1:
                 self._spawn_sparks(state, profile)
         elif current_phase == AttackPhase.FOLLOW_THROUGH:
@@ -1277,8 +1276,8 @@ class WeaponAnimator:
                 shake = profile.shake_intensity * shake_decay * 1.5
                 # Shake mais vertical (peso caindo)
                 state.shake_offset = (
-                    random.uniform(-shake * 0.5, shake * 0.5),
-                    random.uniform(-shake, shake) + shake * 0.3
+                    rng_vfx.uniform(-shake * 0.5, shake * 0.5),
+                    rng_vfx.uniform(-shake, shake) + shake * 0.3
                 )
             if phase_progress < 0.06:
                 self._spawn_sparks(state, profile)
@@ -1291,7 +1290,7 @@ class WeaponAnimator:
             state.scale = 0.80 + (1.0 - 0.80) * Easing.ease_out_bounce(phase_progress)
             if phase_progress < 0.3:
                 residual = profile.shake_intensity * 0.2 * (1 - phase_progress / 0.3)
-                state.shake_offset = (random.uniform(-residual, residual), random.uniform(-residual, residual))
+                state.shake_offset = (rng_vfx.uniform(-residual, residual), rng_vfx.uniform(-residual, residual))
             else:
                 state.shake_offset = (0, 0)
         elif current_phase == AttackPhase.RECOVERY:
@@ -1359,8 +1358,8 @@ class WeaponAnimator:
             shake_mult = 1.5 if cross_mode else 1.0
             if profile.shake_on_impact:
                 shake = profile.shake_intensity * impact_decay * shake_mult
-                state.shake_offset = (random.uniform(-shake, shake),
-                                      random.uniform(-shake, shake))
+                state.shake_offset = (rng_vfx.uniform(-shake, shake),
+                                      rng_vfx.uniform(-shake, shake))
             if phase_progress < 0.12:
                 self._spawn_sparks(state, profile)
 
@@ -1393,14 +1392,14 @@ class WeaponAnimator:
 
     def _spawn_sparks(self, state, profile):
         for _ in range(profile.spark_count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(50, 150)
+            angle = rng_vfx.uniform(0, math.pi * 2)
+            speed = rng_vfx.uniform(50, 150)
             state.spark_list.append({
                 "vx": math.cos(angle) * speed,
                 "vy": math.sin(angle) * speed,
-                "life": random.uniform(0.1, 0.25),
+                "life": rng_vfx.uniform(0.1, 0.25),
                 "timer": 0.0,
-                "size": random.uniform(2, 5),
+                "size": rng_vfx.uniform(2, 5),
                 "color": profile.spark_color,
             })
 
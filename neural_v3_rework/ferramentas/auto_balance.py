@@ -9,6 +9,7 @@ Uso:
     python ferramentas/auto_balance.py --fights 200     # 200 lutas por matchup
     python ferramentas/auto_balance.py --top 20         # mostrar top 20
     python ferramentas/auto_balance.py --sample 8       # 8 personagens aleatÃ³rios
+    python ferramentas/auto_balance.py --workers 0      # um processo por CPU
 
 Fluxo:
     1. Carrega personagens do AppState.
@@ -25,7 +26,6 @@ import random
 import argparse
 import logging
 from collections import defaultdict
-from typing import Optional
 
 # â”€â”€ Headless pygame â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -41,90 +41,14 @@ logging.basicConfig(
 )
 _log = logging.getLogger("auto_balance")
 
+from ferramentas.batch_fight_engine import BatchFightEngine, MatchupStats
+
 # â”€â”€ Constantes â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 MAX_FRAMES_PER_FIGHT = 60 * 90   # 90s timeout
 DEFAULT_FIGHTS       = 50        # lutas por matchup
 DEFAULT_TOP          = 20
 DEFAULT_SAMPLE       = 0         # 0 = usar todos os personagens
-
-
-# =============================================================================
-# CORE: rodar uma luta headless
-# =============================================================================
-
-def _run_fight(state, p1_nome: str, p2_nome: str, cenario: str = "Arena") -> Optional[str]:
-    """
-    Roda uma luta headless entre p1 e p2.
-    Retorna nome do vencedor, ou None em caso de empate/timeout.
-    """
-    from simulacao.simulacao import Simulador
-
-    state.update_match_config(
-        p1_nome=p1_nome,
-        p2_nome=p2_nome,
-        cenario=cenario,
-    )
-
-    try:
-        sim = Simulador()
-    except Exception as e:
-        _log.warning("Falha ao criar Simulador(%s vs %s): %s", p1_nome, p2_nome, e)
-        return None
-
-    if not sim.p1 or not sim.p2:
-        return None
-
-    dt = 1.0 / 60.0
-    for _ in range(MAX_FRAMES_PER_FIGHT):
-        sim.update(dt)
-        if sim.p1.morto or sim.p2.morto:
-            break
-
-    if sim.p1.morto and not sim.p2.morto:
-        return p2_nome
-    if sim.p2.morto and not sim.p1.morto:
-        return p1_nome
-    # Timeout ou double KO: vence quem tem mais HP restante
-    if sim.p1.hp > sim.p2.hp:
-        return p1_nome
-    if sim.p2.hp > sim.p1.hp:
-        return p2_nome
-    return None  # empate real
-
-
-# =============================================================================
-# AGREGAÃ‡ÃƒO
-# =============================================================================
-
-class MatchupStats:
-    """Agrega resultados de um matchup A vs B."""
-
-    def __init__(self, a: str, b: str):
-        self.a = a
-        self.b = b
-        self.wins_a = 0
-        self.wins_b = 0
-        self.draws  = 0
-
-    @property
-    def total(self) -> int:
-        return self.wins_a + self.wins_b + self.draws
-
-    @property
-    def wr_a(self) -> float:
-        return self.wins_a / max(1, self.total)
-
-    @property
-    def wr_b(self) -> float:
-        return self.wins_b / max(1, self.total)
-
-    def record(self, winner: Optional[str]) -> None:
-        if winner == self.a:
-            self.wins_a += 1
-        elif winner == self.b:
-            self.wins_b += 1
-        else:
-            self.draws += 1
+DEFAULT_WORKERS      = 1         # 1 = serial no processo atual
 
 
 # =============================================================================
@@ -206,7 +130,13 @@ def _print_report(
 # MAIN
 # =============================================================================
 
-def run(fights: int = DEFAULT_FIGHTS, top: int = DEFAULT_TOP, sample: int = DEFAULT_SAMPLE) -> None:
+def run(
+    fights: int = DEFAULT_FIGHTS,
+    top: int = DEFAULT_TOP,
+    sample: int = DEFAULT_SAMPLE,
+    workers: int = DEFAULT_WORKERS,
+    seed: int = 0,
+) -> None:
     from dados.app_state import AppState
 
     state = AppState.get()
@@ -217,9 +147,10 @@ def run(fights: int = DEFAULT_FIGHTS, top: int = DEFAULT_TOP, sample: int = DEFA
         return
 
     if sample > 0 and sample < len(chars):
-        chars = random.sample(chars, sample)
+        # Mesma seed -> mesmo elenco sorteado
+        chars = random.Random(seed).sample(chars, sample)
 
-    print(f"â–¶  {len(chars)} personagens | {fights} luta(s)/matchup | headless")
+    print(f"â–¶  {len(chars)} personagens | {fights} luta(s)/matchup | headless | {workers} worker(s)")
 
     # Metadados para o relatÃ³rio
     char_meta = {
@@ -237,23 +168,15 @@ def run(fights: int = DEFAULT_FIGHTS, top: int = DEFAULT_TOP, sample: int = DEFA
 
     print(f"â–¶  {len(pairs)} matchups Ã— {fights} = {total} lutas totais\n")
 
-    matchups_stats = [MatchupStats(a, b) for a, b in pairs]
+    def _progress(done: int, total_jobs: int, ms: MatchupStats) -> None:
+        if done % fights and done != total_jobs:
+            return
+        pct = done / total_jobs * 100
+        print(f"\r  {done}/{total_jobs} ({pct:.0f}%)  {ms.a} vs {ms.b}        ", end="", flush=True)
+
+    engine = BatchFightEngine(workers=workers, seed_base=seed, max_frames=MAX_FRAMES_PER_FIGHT)
     t0 = time.time()
-    done = 0
-
-    for ms in matchups_stats:
-        for _ in range(fights):
-            # Alterna quem vai primeiro para neutralizar side-bias
-            if random.random() < 0.5:
-                winner = _run_fight(state, ms.a, ms.b)
-            else:
-                winner = _run_fight(state, ms.b, ms.a)
-            ms.record(winner)
-            done += 1
-
-        # Progress indicator
-        pct = done / total * 100
-        print(f"\r  {done}/{total} ({pct:.0f}%)  {ms.a} vs {ms.b}        ", end="", flush=True)
+    matchups_stats = engine.run_matchups(pairs, fights, on_progress=_progress)
 
     elapsed = time.time() - t0
     print()  # newline apÃ³s progress
@@ -281,6 +204,20 @@ if __name__ == "__main__":
         "--sample", type=int, default=DEFAULT_SAMPLE,
         help="Usar N personagens aleatÃ³rios (0 = todos)"
     )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help="Processos paralelos (0 = um por CPU, 1 = serial)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed base; cada luta deriva a sua de (seed, indice)"
+    )
     args = parser.parse_args()
-    run(fights=args.fights, top=args.top, sample=args.sample)
+    run(
+        fights=args.fights,
+        top=args.top,
+        sample=args.sample,
+        workers=args.workers or (os.cpu_count() or 1),
+        seed=args.seed,
+    )
 
@@ -0,0 +1,244 @@
+"""
+NEURAL FIGHTS - Batch Fight Engine
+==================================
+Distribui lutas headless entre processos (ProcessPoolExecutor) para
+auto_balance, stress tests e o batch de videos (pipeline_video.batch_runner).
+
+Cada worker e um processo isolado: tem seu proprio AppState e os
+singletons que ainda restam no Simulador (coreografia, game feel), entao
+nada se cruza entre lutas paralelas. Cada luta recebe uma seed
+derivada de (seed_base, indice), de modo que o resultado nao depende da
+quantidade de workers nem da ordem em que os processos terminam.
+
+Uso:
+    engine = BatchFightEngine(workers=8, seed_base=42)
+    stats = engine.run_matchups([("A", "B"), ("A", "C")], fights_per_matchup=50)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+MAX_FRAMES_PER_FIGHT = 60 * 90   # 90s timeout
+
+
+# =============================================================================
+# AGREGACAO
+# =============================================================================
+
+class MatchupStats:
+    """Agrega resultados de um matchup A vs B."""
+
+    def __init__(self, a: str, b: str):
+        self.a = a
+        self.b = b
+        self.wins_a = 0
+        self.wins_b = 0
+        self.draws  = 0
+
+    @property
+    def total(self) -> int:
+        return self.wins_a + self.wins_b + self.draws
+
+    @property
+    def wr_a(self) -> float:
+        return self.wins_a / max(1, self.total)
+
+    @property
+    def wr_b(self) -> float:
+        return self.wins_b / max(1, self.total)
+
+    def record(self, winner: Optional[str]) -> None:
+        if winner == self.a:
+            self.wins_a += 1
+        elif winner == self.b:
+            self.wins_b += 1
+        else:
+            self.draws += 1
+
+
+# =============================================================================
+# JOBS
+# =============================================================================
+
+@dataclass(frozen=True)
+class FightJob:
+    """Uma luta de duelo a ser executada por um worker."""
+    index: int
+    matchup_index: int
+    p1_nome: str
+    p2_nome: str
+    cenario: str
+    seed: int
+    max_frames: int = MAX_FRAMES_PER_FIGHT
+
+
+@dataclass(frozen=True)
+class FightOutcome:
+    index: int
+    matchup_index: int
+    winner: Optional[str]
+    frames: int
+
+
+def derive_fight_seed(seed_base: int, index: int) -> int:
+    """Seed estavel por luta (independe de PYTHONHASHSEED e de workers)."""
+    return random.Random(f"{seed_base}:{index}").getrandbits(32)
+
+
+def run_duel_headless(
+    p1_nome: str,
+    p2_nome: str,
+    cenario: str = "Arena",
+    max_frames: int = MAX_FRAMES_PER_FIGHT,
+    state=None,
+    seed: Optional[int] = None,
+) -> tuple[Optional[str], int]:
+    """
+    Roda um duelo via Simulador.headless().
+    Retorna (vencedor, frames); vencedor None em empate/falha.
+    Com seed, a luta e reproduzivel (mesma seed -> mesmo resultado).
+    """
+    import logging
+    from simulacao.simulacao import Simulador
+
+    if state is None:
+        from dados.app_state import AppState
+        state = AppState.get()
+
+    match_config = {
+        **state.match_config,
+        "p1_nome": p1_nome,
+        "p2_nome": p2_nome,
+        "cenario": cenario,
+        "teams": None,
+    }
+    if seed is not None:
+        match_config["seed"] = seed
+
+    try:
+        sim = Simulador.headless(match_config)
+    except Exception as e:
+        logging.getLogger("batch_fight_engine").warning(
+            "Falha ao criar Simulador(%s vs %s): %s", p1_nome, p2_nome, e
+        )
+        return None, 0
+
+    if not sim.p1 or not sim.p2:
+        return None, 0
+
+    dt = 1.0 / 60.0
+    frames = 0
+    for frames in range(1, max_frames + 1):
+        sim.update(dt)
+        if sim.p1.morto or sim.p2.morto:
+            break
+
+    if sim.p1.morto and not sim.p2.morto:
+        return p2_nome, frames
+    if sim.p2.morto and not sim.p1.morto:
+        return p1_nome, frames
+    # Timeout ou double KO: vence quem tem mais HP restante
+    if sim.p1.vida > sim.p2.vida:
+        return p1_nome, frames
+    if sim.p2.vida > sim.p1.vida:
+        return p2_nome, frames
+    return None, frames  # empate real
+
+
+def run_fight_job(job: FightJob) -> FightOutcome:
+    """Executa um FightJob no processo atual (worker ou modo serial)."""
+    winner, frames = run_duel_headless(job.p1_nome, job.p2_nome, job.cenario, job.max_frames, seed=job.seed)
+    return FightOutcome(job.index, job.matchup_index, winner, frames)
+
+
+def _init_worker() -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import logging
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class BatchFightEngine:
+    """
+    Executa lotes de lutas headless em N processos.
+
+    workers <= 1 roda tudo no processo atual, com as mesmas seeds: util
+    para debug e para conferir que o modo paralelo produz o mesmo resultado.
+    Os workers carregam o AppState do disco; personagens criados so em
+    memoria no processo pai nao sao vistos por eles.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        seed_base: int = 0,
+        max_frames: int = MAX_FRAMES_PER_FIGHT,
+        chunksize: int = 4,
+    ):
+        self.workers = max(1, int(workers if workers is not None else (os.cpu_count() or 1)))
+        self.seed_base = int(seed_base)
+        self.max_frames = int(max_frames)
+        self.chunksize = max(1, int(chunksize))
+
+    def build_matchup_jobs(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        fights_per_matchup: int,
+        cenario: str = "Arena",
+    ) -> list[FightJob]:
+        """Gera um FightJob por luta; o lado (p1/p2) alterna pela seed."""
+        jobs = []
+        index = 0
+        for matchup_index, (a, b) in enumerate(pairs):
+            for _ in range(fights_per_matchup):
+                seed = derive_fight_seed(self.seed_base, index)
+                # Alterna quem vai primeiro para neutralizar side-bias
+                p1, p2 = (a, b) if seed & 1 else (b, a)
+                jobs.append(FightJob(index, matchup_index, p1, p2, cenario, seed, self.max_frames))
+                index += 1
+        return jobs
+
+    def map(self, fn: Callable, jobs: list) -> Iterator:
+        """
+        Aplica fn (funcao de modulo, picklable) a cada job, devolvendo os
+        resultados na ordem dos jobs.
+        """
+        if self.workers <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                yield fn(job)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+            yield from pool.map(fn, jobs, chunksize=self.chunksize)
+
+    def run_matchups(
+        self,
+        pairs: list[tuple[str, str]],
+        fights_per_matchup: int,
+        cenario: str = "Arena",
+        on_progress: Optional[Callable[[int, int, MatchupStats], None]] = None,
+    ) -> list[MatchupStats]:
+        """Roda todos os matchups e agrega os resultados no processo pai."""
+        stats = [MatchupStats(a, b) for a, b in pairs]
+        jobs = self.build_matchup_jobs(pairs, fights_per_matchup, cenario)
+        total = len(jobs)
+        for done, outcome in enumerate(self.map(run_fight_job, jobs), 1):
+            ms = stats[outcome.matchup_index]
+            ms.record(outcome.winner)
+            if on_progress:
+                on_progress(done, total, ms)
+        return stats
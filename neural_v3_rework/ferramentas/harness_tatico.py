@@ -1015,18 +1015,19 @@ class OverlayState:
         self.extra_weapons = extra_weapons
         self.match_config = match_config
         self.old_match = deepcopy(state.match_config)
-        self.old_chars = list(state._characters)
-        self.old_weapons = list(state._weapons)
+        self.old_chars = list(state.characters)
+        self.old_weapons = list(state.weapons)
 
     def __enter__(self):
-        self.state._characters = self.old_chars + list(self.extra_chars)
-        self.state._weapons = self.old_weapons + list(self.extra_weapons)
+        self.state.replace_roster_in_memory(
+            characters=self.old_chars + list(self.extra_chars),
+            weapons=self.old_weapons + list(self.extra_weapons),
+        )
         self.state._match = {**self.old_match, **self.match_config}
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        self.state._characters = self.old_chars
-        self.state._weapons = self.old_weapons
+        self.state.replace_roster_in_memory(characters=self.old_chars, weapons=self.old_weapons)
         self.state._match = self.old_match
         return False
 
@@ -1086,8 +1087,8 @@ def executar_match_headless_real(
     horda_config: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     extra_slots = team_a if modo == "grupo_vs_horda" else (team_a + team_b)
-    extra_chars = [slot["personagem"] for slot in extra_slots if slot["personagem"].nome not in state.character_names()]
-    extra_weapons = [slot["arma"] for slot in extra_slots if slot["arma"].nome not in state.weapon_names()]
+    extra_chars = [slot["personagem"] for slot in extra_slots if not state.has_character(slot["personagem"].nome)]
+    extra_weapons = [slot["arma"] for slot in extra_slots if not state.has_weapon(slot["arma"].nome)]
     if modo == "grupo_vs_horda":
         match_config = build_horde_match_config(
             [
@@ -1118,7 +1119,7 @@ def executar_match_headless_real(
         )
 
     with OverlayState(state, extra_chars, extra_weapons, match_config):
-        sim = Simulador()
+        sim = Simulador.headless()
         sim.TEMPO_MAX_LUTA = float(duracao_max_seg)
         dt = 1.0 / 60.0
         start = time.perf_counter()
@@ -1135,13 +1136,6 @@ def executar_match_headless_real(
         )
         vencedor = str(sim.vencedor or "Sem vencedor")
         frames = int(getattr(getattr(sim, "stats_collector", None), "_frame", 0) or 0)
-        try:
-            import pygame
-            pygame.display.quit()
-            pygame.mixer.quit()
-            pygame.quit()
-        except Exception:
-            pass
         payload = {
             "vencedor": vencedor,
             "frames": frames,
@@ -536,8 +536,8 @@ def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     state = AppState.get()
-    original_weapons = list(state._weapons)
-    original_characters = list(state._characters)
+    original_weapons = list(state.weapons)
+    original_characters = list(state.characters)
     original_match = dict(state._match)
     started_at = time.time()
 
@@ -548,8 +548,7 @@ def main():
     errors = []
 
     try:
-        state._weapons = weapons
-        state._characters = fighters
+        state.replace_roster_in_memory(characters=fighters, weapons=weapons)
         for index, (_, p1_name, p2_name) in enumerate(schedule, start=1):
             try:
                 duel = run_duel(state, p1_name, p2_name, weapon_lookup)
@@ -559,8 +558,7 @@ def main():
             if index % 100 == 0 or index == len(schedule):
                 print(f"progress {index}/{len(schedule)} completed={len(results)} errors={len(errors)}")
     finally:
-        state._weapons = original_weapons
-        state._characters = original_characters
+        state.replace_roster_in_memory(characters=original_characters, weapons=original_weapons)
         state._match = original_match if original_match else dict(DEFAULT_MATCH_CONFIG)
 
     report = build_report(results, fighters, weapons, started_at, len(schedule))
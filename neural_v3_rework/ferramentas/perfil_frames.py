@@ -0,0 +1,76 @@
+"""
+NEURAL FIGHTS - Perfil de Frames Headless
+=========================================
+Roda um duelo headless com o FrameProfiler ligado, imprime p50/p95/max
+por fase e grava o trace (Chrome Trace JSON; abre no Perfetto/speedscope)
+e, opcionalmente, as pilhas no formato do flamegraph.pl.
+
+Uso:
+    python ferramentas/perfil_frames.py P1 P2 --frames 1800 --saida trace.json
+    python ferramentas/perfil_frames.py P1 P2 --folded pilhas.folded
+
+--seed vai em match_config["seed"] (RNGPartida): a mesma seed repete a
+luta, entao dois perfis comparam o mesmo trabalho por frame.
+"""
+
+import argparse
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+
+def perfilar_duelo(p1_nome, p2_nome, cenario="Arena", frames=1800, seed=0):
+    """Roda o duelo e devolve o FrameProfiler (com trace) da luta."""
+    from dados.app_state import AppState
+    from simulacao.simulacao import Simulador
+
+    sim = Simulador.headless({
+        **AppState.get().match_config,
+        "p1_nome": p1_nome,
+        "p2_nome": p2_nome,
+        "cenario": cenario,
+        "teams": None,
+        "seed": seed,
+    })
+    sim.profiler.ativar(trace=True)
+    dt = 1.0 / 60.0
+    for _ in range(frames):
+        sim.update(dt)
+        if sim.p1.morto or sim.p2.morto:
+            break
+    return sim.profiler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfil de frames de um duelo headless")
+    parser.add_argument("p1")
+    parser.add_argument("p2")
+    parser.add_argument("--cenario", default="Arena")
+    parser.add_argument("--frames", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed da partida (match_config['seed']); mesma seed, mesma luta")
+    parser.add_argument("--saida", default="trace_frames.json")
+    parser.add_argument("--folded", default=None)
+    args = parser.parse_args(argv)
+
+    profiler = perfilar_duelo(args.p1, args.p2, args.cenario, args.frames, args.seed)
+    stats = profiler.stats()
+    print(f"{'fase':32s} {'n':>6s} {'p50':>8s} {'p95':>8s} {'max':>8s}  (ms)")
+    for nome, s in sorted(stats.items(), key=lambda kv: -kv[1]["p95_ms"]):
+        print(f"{nome:32s} {s['n']:6d} {s['p50_ms']:8.3f} {s['p95_ms']:8.3f} {s['max_ms']:8.3f}")
+
+    profiler.salvar_trace(args.saida)
+    print(f"Trace: {args.saida}")
+    if args.folded:
+        profiler.salvar_folded(args.folded)
+        print(f"Pilhas: {args.folded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ import random
 import time
 from collections import defaultdict, Counter
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Headless pygame setup
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -20,6 +20,7 @@ if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
 from dados.app_state import AppState
+from ferramentas.batch_fight_engine import BatchFightEngine, derive_fight_seed
 from simulacao.simulacao import Simulador
 
 
@@ -58,25 +59,35 @@ def load_test_characters(chars_file: str) -> List[Dict]:
         return json.load(f)
 
 
-def simulate_battle(p1_data: Dict, p2_data: Dict, max_duration_frames: int = 2000) -> BattleResult:
+def simulate_battle(
+    p1_data: Dict,
+    p2_data: Dict,
+    max_duration_frames: int = 2000,
+    seed: Optional[int] = None,
+) -> BattleResult:
     """
     Simulate a single battle between two characters.
+    With a seed the battle is reproducible (match_config["seed"], as in
+    batch_fight_engine.run_duel_headless).
     """
     state = AppState.get()
     original_match = state.match_config
 
+    match_config = {
+        **original_match,
+        "p1_nome": p1_data["nome"],
+        "p2_nome": p2_data["nome"],
+        "p1_custom": p1_data,
+        "p2_custom": p2_data,
+        "cenario": original_match.get("cenario", "Arena"),
+        "teams": None,
+    }
+    if seed is not None:
+        match_config["seed"] = seed
+
     try:
-        # Set up match with generated characters
-        state.set_match_config({
-            **original_match,
-            "p1_nome": p1_data["nome"],
-            "p2_nome": p2_data["nome"],
-            "p1_custom": p1_data,
-            "p2_custom": p2_data,
-            "cenario": original_match.get("cenario", "Arena"),
-        })
-
-        sim = Simulador()
+        # Match config vai direto para o Simulador headless (AppState intacto)
+        sim = Simulador.headless(match_config)
         p1 = sim.p1
         p2 = sim.p2
 
@@ -100,8 +111,8 @@ def simulate_battle(p1_data: Dict, p2_data: Dict, max_duration_frames: int = 200
             sim.update(dt)
 
             # Track damage
-            p1_damage = p1.hp_original - p1.hp if p1.hp_original > 0 else 0
-            p2_damage = p2.hp_original - p2.hp if p2.hp_original > 0 else 0
+            p1_damage = p1.vida_max - p1.vida if p1.vida_max > 0 else 0
+            p2_damage = p2.vida_max - p2.vida if p2.vida_max > 0 else 0
 
             # Track P1 actions
             p1_acao = p1.brain.acao_atual if p1.brain else "NEUTRO"
@@ -157,23 +168,27 @@ def simulate_battle(p1_data: Dict, p2_data: Dict, max_duration_frames: int = 200
     except Exception as e:
         print(f"  Error in battle {p1_data['nome']} vs {p2_data['nome']}: {e}")
         return None
-    finally:
-        state.set_match_config(original_match)
-        try:
-            import pygame
-            pygame.display.quit()
-            pygame.mixer.quit()
-        except Exception as _e:  # E02 Sprint 12
-            import logging as _lg; _lg.getLogger('tools').debug('pygame cleanup: %s', _e)
+
+
+def _simulate_battle_job(job: Tuple[Dict, Dict, int]) -> BattleResult:
+    """Worker entry point: the job's seed makes each battle reproducible."""
+    p1_data, p2_data, seed = job
+    return simulate_battle(p1_data, p2_data, seed=seed)
 
 
 def run_stress_test(
     characters: List[Dict],
     num_battles: int = 500,
-    output_dir: str = "stress_test_data"
+    output_dir: str = "stress_test_data",
+    workers: int = 1,
+    seed: int = 0,
 ) -> List[BattleResult]:
     """
     Run multiple battles and collect results.
+
+    workers > 1 spreads battles over a BatchFightEngine process pool; each
+    battle gets a seed derived from (seed, index), so results match the
+    serial run.
     """
     os.makedirs(output_dir, exist_ok=True)
     
@@ -185,20 +200,25 @@ def run_stress_test(
     print(f"{'='*80}\n")
     
     start_time = time.time()
-    
+
+    # Pairings are drawn up front so the pool only receives self-contained jobs
+    picker = random.Random(seed)
+    jobs = []
     for i in range(num_battles):
         # Pick two random characters
-        p1_data = random.choice(characters)
-        p2_data = random.choice(characters)
+        p1_data = picker.choice(characters)
+        p2_data = picker.choice(characters)
         
         # Avoid same character
         while p2_data["nome"] == p1_data["nome"]:
-            p2_data = random.choice(characters)
-        
+            p2_data = picker.choice(characters)
+        jobs.append((p1_data, p2_data, derive_fight_seed(seed, i)))
+
+    engine = BatchFightEngine(workers=workers, seed_base=seed)
+    for i, result in enumerate(engine.map(_simulate_battle_job, jobs)):
+        p1_data, p2_data, _ = jobs[i]
         print(f"  [{i+1:4d}/{num_battles}] {p1_data['nome']:25s} vs {p2_data['nome']:25s}... ", end="", flush=True)
         
-        result = simulate_battle(p1_data, p2_data)
-        
         if result:
             results.append(result)
             winner_name = "P1" if result.winner == "p1" else ("P2" if result.winner == "p2" else "Draw")
@@ -245,7 +265,8 @@ if __name__ == "__main__":
     print(f"âœ“ Loaded {len(characters)} test characters\n")
     
     # Run stress test
-    results = run_stress_test(characters, num_battles=500)
+    workers = int(os.environ.get("NF_STRESS_WORKERS", "1")) or (os.cpu_count() or 1)
+    results = run_stress_test(characters, num_battles=500, workers=workers)
     
     if results:
         print(f"âœ“ Stress test completed with {len(results)} battles")
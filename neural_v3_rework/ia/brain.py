@@ -56,6 +56,7 @@ Total: CENTENAS DE MILHARES de personalidades Ãºnicas!
 =============================================================================
 """
 
+import bisect
 import random
 import math
 import re as _re_arquetipo
@@ -67,6 +68,7 @@ from utilitarios.config import PPM
 from utilitarios.config import (
     AI_HP_CRITICO, AI_HP_BAIXO, AI_HP_EXECUTE,
     AI_DIST_ATAQUE_IMINENTE, AI_DIST_PAREDE_CRITICA, AI_DIST_PAREDE_AVISO,
+    AI_RAIO_CONSCIENCIA_MULTI,
     AI_INTERVALO_ESPACIAL, AI_INTERVALO_ARMAS,
     AI_PREVISIBILIDADE_ALTA, AI_AGRESSIVIDADE_ALTA,
     AI_MOMENTUM_POSITIVO, AI_MOMENTUM_NEGATIVO, AI_PRESSAO_ALTA,
@@ -74,6 +76,7 @@ from utilitarios.config import (
     DEBUG_AI, DEBUG_AI_FIGHTER,         # F01 Sprint 9: modo debug da IA
 )
 from nucleo.physics import normalizar_angulo
+from nucleo.contexto import broadphase_do_contexto, rng_do_contexto
 from nucleo.skills import get_skill_data
 from modelos import get_class_data
 from ia.choreographer import CombatChoreographer
@@ -1136,7 +1139,9 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
             self._tempo_sem_decisao = 0.0
 
     def _prepare_processar_random_and_debug(self, distancia) -> None:
-        self._rand_pool = [random.random() for _ in range(AI_RAND_POOL_SIZE)]
+        # Stream "ia" da partida: o pool nao consome o stream de combate
+        rng = rng_do_contexto(getattr(self.parent, "contexto", None), "ia")
+        self._rand_pool = [rng.random() for _ in range(AI_RAND_POOL_SIZE)]
         self._rand_idx = 0
         self._emit_processar_debug_snapshot(distancia)
 
@@ -1308,6 +1313,32 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
 
     def _coletar_entidades_multi_awareness(self, todos_lutadores) -> None:
         p = self.parent
+        self._vivos_multi_awareness = None
+        raio = AI_RAIO_CONSCIENCIA_MULTI
+        # Sem corte configurado (padrao) todo lutador vivo da arena e contato
+        grade = broadphase_do_contexto(getattr(p, "contexto", None)) if raio is not None else None
+        if grade is not None:
+            # Broad-phase: so quem esta no raio de consciencia vira contato
+            # (ameaca/score por inimigo e o custo), mas as contagens de vivos
+            # continuam sendo da arena inteira.
+            todos_lutadores = grade.vizinhos(p.pos[0], p.pos[1], raio, excluir=p)
+            self._vivos_multi_awareness = (
+                grade.contar_vivos(excluir_time=p.team_id),
+                max(0, grade.contar_vivos(p.team_id) - (0 if p.morto else 1)),
+            )
+        elif raio is not None:
+            # Sem grade (testes, chamadores legados): mesmo raio e mesmas
+            # contagens, para a IA perceber igual com ou sem broad-phase
+            vivos = [f for f in todos_lutadores if f is not p and not f.morto]
+            self._vivos_multi_awareness = (
+                sum(1 for f in vivos if f.team_id != p.team_id),
+                sum(1 for f in vivos if f.team_id == p.team_id),
+            )
+            raio2 = raio * raio
+            todos_lutadores = [
+                f for f in vivos
+                if (f.pos[0] - p.pos[0]) ** 2 + (f.pos[1] - p.pos[1]) ** 2 <= raio2
+            ]
         for lutador in todos_lutadores:
             if lutador is p or lutador.morto:
                 continue
@@ -1337,8 +1368,12 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
 
     def _atualizar_resumo_multi_awareness(self) -> None:
         ma = self.multi_awareness
-        num_ini = len(ma["inimigos"])
-        num_ali = len(ma["aliados"])
+        vivos = getattr(self, "_vivos_multi_awareness", None)
+        if vivos is not None:
+            num_ini, num_ali = vivos
+        else:
+            num_ini = len(ma["inimigos"])
+            num_ali = len(ma["aliados"])
         ma["num_inimigos_vivos"] = max(num_ini, 1)
         ma["num_aliados_vivos"] = num_ali
         ma["modo_multialvo"] = num_ini > 1
@@ -1350,13 +1385,20 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
             ma["ameaca_flanqueio"] = 0.0
             return
         angulos = sorted(inimigo["angulo"] for inimigo in ma["inimigos"])
+        # Maior separacao angular entre dois inimigos: com os angulos
+        # ordenados, o parceiro ideal de cada um e o vizinho de a+180 ou
+        # de a-180 (O(n log n) em vez de todos os pares).
         max_spread = 0.0
-        for i in range(len(angulos)):
-            for j in range(i + 1, len(angulos)):
-                diff = abs(angulos[j] - angulos[i])
-                if diff > 180:
-                    diff = 360 - diff
-                max_spread = max(max_spread, diff)
+        n = len(angulos)
+        for a in angulos:
+            for alvo in (a + 180.0, a - 180.0):
+                k = bisect.bisect_left(angulos, alvo)
+                for j in (k - 1, k):
+                    if 0 <= j < n:
+                        diff = abs(angulos[j] - a)
+                        if diff > 180:
+                            diff = 360 - diff
+                        max_spread = max(max_spread, diff)
         ma["ameaca_flanqueio"] = min(1.0, max_spread / 180.0)
 
     def _calcular_concentracao_inimiga_multi_awareness(self) -> None:
@@ -1699,8 +1741,7 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
     
     def _broadcast_team_intent(self, inimigo):
         """Comunica a intenÃ§Ã£o atual ao TeamCoordinator."""
-        from ia.team_ai import TeamCoordinatorManager
-        coord = TeamCoordinatorManager.get().get_fighter_coordinator(self.parent)
+        coord = self._team_manager_runtime().get_fighter_coordinator(self.parent)
         if coord:
             skill_name = ""
             if hasattr(self.parent, 'skill_atual_nome'):
@@ -1715,8 +1756,7 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
     
     def _pedir_ajuda_time(self):
         """Pede ajuda ao time quando em perigo."""
-        from ia.team_ai import TeamCoordinatorManager
-        coord = TeamCoordinatorManager.get().get_fighter_coordinator(self.parent)
+        coord = self._team_manager_runtime().get_fighter_coordinator(self.parent)
         if coord:
             p = self.parent
             hp_pct = p.vida / p.vida_max if p.vida_max > 0 else 1
@@ -1725,8 +1765,7 @@ class AIBrain(PersonalityMixin, PerceptionMixin, EvasionMixin, CombatMixin, Skil
     
     def _marcar_alvo_time(self, alvo, reason="FOCUS"):
         """Marca um alvo para o time focar."""
-        from ia.team_ai import TeamCoordinatorManager
-        coord = TeamCoordinatorManager.get().get_fighter_coordinator(self.parent)
+        coord = self._team_manager_runtime().get_fighter_coordinator(self.parent)
         if coord:
             coord.callout_target(self.parent, alvo, reason)
 
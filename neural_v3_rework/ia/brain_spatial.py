@@ -52,6 +52,20 @@ from ia._brain_mixin_base import _AIBrainMixinBase
 class SpatialMixin(_AIBrainMixinBase):
     """Mixin de consciÃªncia espacial, paredes, obstÃ¡culos e tÃ¡ticas de posicionamento."""
 
+    def _arena_runtime(self):
+        """Arena da luta do lutador (ContextoSimulacao), ou a arena global."""
+        contexto = getattr(self.parent, "contexto", None)
+        if contexto is not None and contexto.arena is not None:
+            return contexto.arena
+        if _get_arena is None:
+            return None
+        return _get_arena()
+
+    def _team_manager_runtime(self):
+        """TeamCoordinatorManager da luta do lutador, ou o singleton global."""
+        from nucleo.contexto import team_manager_do_contexto
+        return team_manager_do_contexto(getattr(self.parent, "contexto", None))
+
     def _distancia_borda_arena(self, arena, x, y):
         """Retorna a distÃ¢ncia atÃ© a borda mais prÃ³xima respeitando o formato da arena."""
         if getattr(getattr(arena, "config", None), "formato", "retangular") == "circular" and getattr(arena, "raio", None) is not None:
@@ -123,13 +137,13 @@ class SpatialMixin(_AIBrainMixinBase):
         p = self.parent
         esp = self.consciencia_espacial
         
-        # Importa arena (QC-04: _get_arena jÃ¡ importado no mÃ³dulo)
+        # Arena da luta (contexto do Simulador) ou global
         try:
-            if _get_arena is None:
-                return
-            arena = _get_arena()
+            arena = self._arena_runtime()
         except Exception:
             return  # Se arena nÃ£o disponÃ­vel, ignora
+        if arena is None:
+            return
         
         # === DETECÃ‡ÃƒO DE PAREDES ===
         esp["parede_proxima"] = self._parede_dominante_arena(arena, p.pos[0], p.pos[1])
@@ -403,8 +417,7 @@ class SpatialMixin(_AIBrainMixinBase):
 
             # â”€â”€ RETREAT TO ALLY (quando HP baixo, recua para suporte/tank) â”€â”€
             if hp_pct < 0.35 and team_role not in ("VANGUARD",):
-                from ia.team_ai import TeamCoordinatorManager
-                coord = TeamCoordinatorManager.get().get_fighter_coordinator(p)
+                coord = self._team_manager_runtime().get_fighter_coordinator(p)
                 if coord:
                     retreat_pos = coord.should_retreat_to_ally(p)
                     if retreat_pos:
@@ -583,9 +596,9 @@ class SpatialMixin(_AIBrainMixinBase):
         
         # Verifica se a direÃ§Ã£o estÃ¡ bloqueada
         try:
-            if _get_arena is None:
+            arena = self._arena_runtime()
+            if arena is None:
                 raise ImportError("arena nÃ£o disponÃ­vel")
-            arena = _get_arena()  # QC-04: usa _get_arena de nÃ­vel de mÃ³dulo
             
             # Testa ponto Ã  frente
             test_dist = 1.5
@@ -953,11 +953,15 @@ class TeamCoordinator:
 
 
 # ═══════════════════════════════════════════════════════════════
-# TEAM COORDINATOR MANAGER (singleton global)
+# TEAM COORDINATOR MANAGER (um por luta, via ContextoSimulacao)
 # ═══════════════════════════════════════════════════════════════
 
 class TeamCoordinatorManager:
-    """Gerencia todos os TeamCoordinators. Singleton."""
+    """Gerencia todos os TeamCoordinators de uma luta.
+
+    O Simulador usa a instancia do seu ContextoSimulacao; get() segue como
+    singleton de fallback para quem roda o AIBrain fora de uma luta.
+    """
     _instance = None
 
     @classmethod
@@ -690,15 +690,14 @@ class TelaLuta(tk.Frame):
                     _log.debug("ELO before falhou: %s", exc)
 
                 try:
-                    match_id = AppState.get().record_fight_result(
+                    AppState.get().record_fight_result(
                         winner=sim.vencedor,
                         loser=loser,
                         duration=duration,
                         ko=ko,
                         arena=sim.cenario if hasattr(sim, "cenario") else "",
+                        stats_collector=getattr(sim, "stats_collector", None),
                     )
-                    if match_id and hasattr(sim, "stats_collector"):
-                        sim.stats_collector.flush_to_db(match_id)
                 except Exception as exc:
                     print(f"[view_luta] BattleDB/ELO write failed (non-fatal): {exc}")
 
@@ -36,6 +36,9 @@ from nucleo.hitbox import (
 # v10.0 - Arena movida para core
 from nucleo.arena import Arena
 
+# Estado por luta (hitbox, arena, coordenadores de time)
+from nucleo.contexto import ContextoSimulacao
+
 __all__ = [
     # Physics
     'normalizar_angulo',
@@ -66,5 +69,7 @@ __all__ = [
     'sistema_hitbox', 'verificar_hit', 'get_debug_visual', 'atualizar_debug',
     # Arena
     'Arena',
+    # Contexto
+    'ContextoSimulacao',
 ]
 
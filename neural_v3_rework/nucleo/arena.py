@@ -46,6 +46,29 @@ class ArenaConfig:
     efeitos_especiais: List[str] = field(default_factory=list)
 
 
+# Fundo estatico (chao, grid, obstaculos fixos, paredes) pre-renderizado
+# por bucket de zoom; so os obstaculos animados sao desenhados por frame.
+FUNDO_ZOOM_PASSO = 0.01        # Bucket em escala log: erro de escala <= 0.5%
+FUNDO_MARGEM = 0.5             # Fracao da tela renderizada alem de cada borda
+FUNDO_COLORKEY = (255, 0, 255)
+OBSTACULOS_ANIMADOS = frozenset({"lava", "fogo", "cristal", "nucleo"})
+
+
+class _CameraFundo:
+    """Camera fixa que desenha o mundo na surface do fundo em cache."""
+
+    def __init__(self, origem_x: float, origem_y: float, zoom: float):
+        self.origem_x = origem_x
+        self.origem_y = origem_y
+        self.zoom = zoom
+
+    def converter(self, x: float, y: float) -> Tuple[int, int]:
+        return int((x - self.origem_x) * self.zoom), int((y - self.origem_y) * self.zoom)
+
+    def converter_tam(self, tamanho: float) -> int:
+        return int(tamanho * self.zoom)
+
+
 # =============================================================================
 # MAPAS TEMÃTICOS DIVERSOS
 # =============================================================================
@@ -603,6 +626,10 @@ class Arena:
         
         # Efeitos especiais ativos
         self.efeitos_ativos = list(config.efeitos_especiais) if config.efeitos_especiais else []
+
+        # Cache do fundo estatico: (chave, surface, regiao em px do mundo)
+        self._fundo_cache = None
+        self._fundo_versao = 0
     
     def danificar_obstaculo(self, obs: "Obstaculo", dano: float) -> bool:
         """
@@ -612,6 +639,7 @@ class Arena:
         """
         if not obs.destrutivel or not obs.solido:
             return False
+        self.invalidar_fundo()
         obs.hp -= int(dano)
         if obs.hp <= 0:
             obs.hp = 0
@@ -979,18 +1007,102 @@ class Arena:
         """
         Desenha a arena na tela.
         """
-        # Desenha chÃ£o
-        self._desenhar_chao(surface, camera)
+        if not self._desenhar_fundo_cache(surface, camera):
+            # Camera sem posicao/zoom (stubs): desenho direto, camada a camada
+            self._desenhar_chao(surface, camera)
+            self._desenhar_obstaculos(surface, camera)
+            if self.config.tem_paredes:
+                self._desenhar_paredes(surface, camera)
         
-        # Desenha obstÃ¡culos
-        self._desenhar_obstaculos(surface, camera)
-        
-        # Desenha paredes
-        if self.config.tem_paredes:
-            self._desenhar_paredes(surface, camera)
-        
-        # Desenha efeitos de colisÃ£o com paredes
+        # Desenha efeitos de colisao com paredes
         self._desenhar_efeitos_colisao(surface, camera)
+
+    def invalidar_fundo(self):
+        """Forca o proximo desenhar() a refazer o fundo estatico."""
+        self._fundo_versao += 1
+        self._fundo_cache = None
+
+    def _limites_fundo_px(self) -> Tuple[float, float, float, float]:
+        """Retangulo (px do mundo) que contem paredes e obstaculos."""
+        esp = self.config.espessura_parede
+        x0, y0 = (self.min_x - esp) * PPM, (self.min_y - esp) * PPM
+        x1, y1 = (self.max_x + esp) * PPM, (self.max_y + esp) * PPM
+        for obs in self.obstaculos:
+            # Folga para copa de arvore, encosto do trono etc.
+            ext_x = obs.largura * PPM * 1.5
+            ext_y = obs.altura * PPM * 3.0
+            x0 = min(x0, obs.x * PPM - ext_x)
+            y0 = min(y0, obs.y * PPM - ext_y)
+            x1 = max(x1, obs.x * PPM + ext_x)
+            y1 = max(y1, obs.y * PPM + ext_y)
+        return x0, y0, x1, y1
+
+    def _desenhar_fundo_cache(self, surface: pygame.Surface, camera) -> bool:
+        """
+        Blita o fundo estatico com o offset da camera. A surface cobre a
+        parte visivel da arena mais FUNDO_MARGEM de tela em cada lado, no
+        zoom do bucket; e refeita quando o zoom troca de bucket, quando a
+        camera sai da regiao renderizada ou quando um obstaculo e danificado.
+        Retorna False se a camera nao expoe x/y/zoom.
+        """
+        zoom = getattr(camera, "zoom", None)
+        cam_x = getattr(camera, "x", None)
+        cam_y = getattr(camera, "y", None)
+        if zoom is None or cam_x is None or cam_y is None or zoom <= 0:
+            return False
+
+        tela_w = getattr(camera, "screen_width", surface.get_width())
+        tela_h = getattr(camera, "screen_height", surface.get_height())
+        zoom_b = math.exp(round(math.log(zoom) / FUNDO_ZOOM_PASSO) * FUNDO_ZOOM_PASSO)
+
+        # Parte da arena visivel agora (px do mundo)
+        lx0, ly0, lx1, ly1 = self._limites_fundo_px()
+        meia_w, meia_h = tela_w / 2 / zoom, tela_h / 2 / zoom
+        vx0, vx1 = max(lx0, cam_x - meia_w), min(lx1, cam_x + meia_w)
+        vy0, vy1 = max(ly0, cam_y - meia_h), min(ly1, cam_y + meia_h)
+        if vx0 >= vx1 or vy0 >= vy1:
+            return True  # Arena fora da tela
+
+        cache = self._fundo_cache
+        chave = (zoom_b, self._fundo_versao)
+        if (cache is None or cache[0] != chave
+                or vx0 < cache[2][0] or vy0 < cache[2][1]
+                or vx1 > cache[2][2] or vy1 > cache[2][3]):
+            margem_x = tela_w * FUNDO_MARGEM / zoom_b
+            margem_y = tela_h * FUNDO_MARGEM / zoom_b
+            regiao = (
+                max(lx0, vx0 - margem_x), max(ly0, vy0 - margem_y),
+                min(lx1, vx1 + margem_x), min(ly1, vy1 + margem_y),
+            )
+            cache = (chave, self._renderizar_fundo(regiao, zoom_b), regiao)
+            self._fundo_cache = cache
+
+        _, fundo, regiao = cache
+        # Alinha pelo centro da camera: dentro do bucket o erro de escala
+        # cresce para as bordas da tela, nunca no foco da luta
+        dest_x = tela_w / 2 + getattr(camera, "offset_x", 0) - (cam_x - regiao[0]) * zoom_b
+        dest_y = tela_h / 2 + getattr(camera, "offset_y", 0) - (cam_y - regiao[1]) * zoom_b
+        surface.blit(fundo, (int(round(dest_x)), int(round(dest_y))))
+
+        for obs in self.obstaculos:
+            if obs.tipo in OBSTACULOS_ANIMADOS:
+                self._desenhar_obstaculo(surface, camera, obs)
+        return True
+
+    def _renderizar_fundo(self, regiao, zoom: float) -> pygame.Surface:
+        """Chao, grid, obstaculos fixos e paredes numa surface com colorkey."""
+        x0, y0, x1, y1 = regiao
+        fundo = pygame.Surface((max(1, math.ceil((x1 - x0) * zoom)), max(1, math.ceil((y1 - y0) * zoom))))
+        fundo.fill(FUNDO_COLORKEY)
+        cam_fundo = _CameraFundo(x0, y0, zoom)
+        self._desenhar_chao(fundo, cam_fundo)
+        for obs in self.obstaculos:
+            if obs.tipo not in OBSTACULOS_ANIMADOS:
+                self._desenhar_obstaculo(fundo, cam_fundo, obs)
+        if self.config.tem_paredes:
+            self._desenhar_paredes(fundo, cam_fundo)
+        fundo.set_colorkey(FUNDO_COLORKEY, pygame.RLEACCEL)
+        return fundo
     
     def _desenhar_chao(self, surface: pygame.Surface, camera):
         """Desenha o chÃ£o da arena"""
@@ -1039,140 +1151,144 @@ class Arena:
             y += grid_size
     
     def _desenhar_obstaculos(self, surface: pygame.Surface, camera):
-        """Desenha os obstÃ¡culos da arena"""
+        """Desenha os obstaculos da arena"""
         for obs in self.obstaculos:
-            cx, cy = camera.converter(obs.x * PPM, obs.y * PPM)
-            cx, cy = int(cx), int(cy)  # Ensure integers
-            half_w = int(camera.converter_tam(obs.largura * PPM / 2))
-            half_h = int(camera.converter_tam(obs.altura * PPM / 2))
-            
-            if half_w < 1 or half_h < 1:
-                continue
-            
-            rect = pygame.Rect(cx - half_w, cy - half_h, half_w * 2, half_h * 2)
-            cor = obs.cor
-            
-            # Desenho especial baseado no tipo
-            if obs.tipo in ["pilar", "pilar_quebrado"]:
-                # Pilar cilÃ­ndrico
-                pygame.draw.ellipse(surface, cor, rect)
-                # Sombra superior
-                cor_clara = tuple(min(255, c + 30) for c in cor)
-                top_rect = pygame.Rect(int(cx - half_w * 0.8), int(cy - half_h * 0.9), int(half_w * 1.6), int(half_h * 0.6))
-                pygame.draw.ellipse(surface, cor_clara, top_rect)
-                # Se quebrado, adiciona rachadura
-                if obs.tipo == "pilar_quebrado":
-                    pygame.draw.line(surface, (40, 40, 40), (int(cx - half_w * 0.3), int(cy - half_h)), 
-                                   (int(cx + half_w * 0.2), int(cy + half_h * 0.5)), 2)
-            
-            elif obs.tipo in ["lava", "fogo"]:
-                # Efeito pulsante para fogo/lava
-                pulse = int(abs(math.sin(time.time() * 3)) * 50)
-                cor = (min(255, cor[0] + pulse), max(0, cor[1] - pulse//2), 0)
-                pygame.draw.rect(surface, cor, rect)
-                # Brilho interno
-                inner_rect = rect.inflate(-4, -4)
-                inner_cor = (255, min(255, cor[1] + 80), 50)
-                pygame.draw.rect(surface, inner_cor, inner_rect)
-            
-            elif obs.tipo == "cristal":
-                # Cristal com brilho
-                brilho = int(abs(math.sin(time.time() * 2 + obs.x)) * 40)
-                cor = tuple(min(255, c + brilho) for c in obs.cor)
-                # Desenha hexÃ¡gono aproximado
-                pontos = [
-                    (cx, cy - half_h),
-                    (cx + half_w * 0.8, cy - half_h * 0.5),
-                    (cx + half_w * 0.8, cy + half_h * 0.5),
-                    (cx, cy + half_h),
-                    (cx - half_w * 0.8, cy + half_h * 0.5),
-                    (cx - half_w * 0.8, cy - half_h * 0.5),
-                ]
-                pygame.draw.polygon(surface, cor, pontos)
-                pygame.draw.polygon(surface, (255, 255, 255), pontos, 2)
-            
-            elif obs.tipo in ["arvore", "palmeira"]:
-                # Tronco
-                tronco_rect = pygame.Rect(int(cx - half_w * 0.3), int(cy - half_h * 0.5), int(half_w * 0.6), int(half_h * 1.5))
-                pygame.draw.rect(surface, cor, tronco_rect)
-                # Copa
-                copa_cor = (30, 80, 30) if obs.tipo == "arvore" else (50, 120, 40)
-                pygame.draw.circle(surface, copa_cor, (cx, int(cy - half_h * 0.3)), int(half_w * 1.2))
-            
-            elif obs.tipo == "tapete":
-                # Tapete decorativo (nÃ£o sÃ³lido)
-                pygame.draw.rect(surface, cor, rect)
-                # Bordas douradas
-                pygame.draw.rect(surface, (180, 150, 50), rect, 3)
+            self._desenhar_obstaculo(surface, camera, obs)
+
+    def _desenhar_obstaculo(self, surface: pygame.Surface, camera, obs: Obstaculo):
+        """Desenha um obstaculo (formato depende do tipo)"""
+        cx, cy = camera.converter(obs.x * PPM, obs.y * PPM)
+        cx, cy = int(cx), int(cy)  # Ensure integers
+        half_w = int(camera.converter_tam(obs.largura * PPM / 2))
+        half_h = int(camera.converter_tam(obs.altura * PPM / 2))
+        
+        if half_w < 1 or half_h < 1:
+            return
+        
+        rect = pygame.Rect(cx - half_w, cy - half_h, half_w * 2, half_h * 2)
+        cor = obs.cor
+        
+        # Desenho especial baseado no tipo
+        if obs.tipo in ["pilar", "pilar_quebrado"]:
+            # Pilar cilÃ­ndrico
+            pygame.draw.ellipse(surface, cor, rect)
+            # Sombra superior
+            cor_clara = tuple(min(255, c + 30) for c in cor)
+            top_rect = pygame.Rect(int(cx - half_w * 0.8), int(cy - half_h * 0.9), int(half_w * 1.6), int(half_h * 0.6))
+            pygame.draw.ellipse(surface, cor_clara, top_rect)
+            # Se quebrado, adiciona rachadura
+            if obs.tipo == "pilar_quebrado":
+                pygame.draw.line(surface, (40, 40, 40), (int(cx - half_w * 0.3), int(cy - half_h)), 
+                               (int(cx + half_w * 0.2), int(cy + half_h * 0.5)), 2)
+        
+        elif obs.tipo in ["lava", "fogo"]:
+            # Efeito pulsante para fogo/lava
+            pulse = int(abs(math.sin(time.time() * 3)) * 50)
+            cor = (min(255, cor[0] + pulse), max(0, cor[1] - pulse//2), 0)
+            pygame.draw.rect(surface, cor, rect)
+            # Brilho interno
+            inner_rect = rect.inflate(-4, -4)
+            inner_cor = (255, min(255, cor[1] + 80), 50)
+            pygame.draw.rect(surface, inner_cor, inner_rect)
+        
+        elif obs.tipo == "cristal":
+            # Cristal com brilho
+            brilho = int(abs(math.sin(time.time() * 2 + obs.x)) * 40)
+            cor = tuple(min(255, c + brilho) for c in obs.cor)
+            # Desenha hexÃ¡gono aproximado
+            pontos = [
+                (cx, cy - half_h),
+                (cx + half_w * 0.8, cy - half_h * 0.5),
+                (cx + half_w * 0.8, cy + half_h * 0.5),
+                (cx, cy + half_h),
+                (cx - half_w * 0.8, cy + half_h * 0.5),
+                (cx - half_w * 0.8, cy - half_h * 0.5),
+            ]
+            pygame.draw.polygon(surface, cor, pontos)
+            pygame.draw.polygon(surface, (255, 255, 255), pontos, 2)
+        
+        elif obs.tipo in ["arvore", "palmeira"]:
+            # Tronco
+            tronco_rect = pygame.Rect(int(cx - half_w * 0.3), int(cy - half_h * 0.5), int(half_w * 0.6), int(half_h * 1.5))
+            pygame.draw.rect(surface, cor, tronco_rect)
+            # Copa
+            copa_cor = (30, 80, 30) if obs.tipo == "arvore" else (50, 120, 40)
+            pygame.draw.circle(surface, copa_cor, (cx, int(cy - half_h * 0.3)), int(half_w * 1.2))
+        
+        elif obs.tipo == "tapete":
+            # Tapete decorativo (nÃ£o sÃ³lido)
+            pygame.draw.rect(surface, cor, rect)
+            # Bordas douradas
+            pygame.draw.rect(surface, (180, 150, 50), rect, 3)
+        
+        elif obs.tipo == "trono":
+            # Trono especial - enhanced visibility
+            cor_ouro = (255, 215, 0)  # Gold
+            cor_veludo = (100, 20, 40)  # Dark red velvet
             
-            elif obs.tipo == "trono":
-                # Trono especial - enhanced visibility
-                cor_ouro = (255, 215, 0)  # Gold
-                cor_veludo = (100, 20, 40)  # Dark red velvet
-                
-                # Base do trono (assento)
-                pygame.draw.rect(surface, cor, rect)
-                # Borda do assento
-                pygame.draw.rect(surface, cor_ouro, rect, 3)
-                
-                # Encosto alto (backrest)
-                encosto_h = int(half_h * 1.8)
-                encosto_w = int(half_w * 1.4)
-                encosto_rect = pygame.Rect(cx - encosto_w // 2, cy - half_h - encosto_h, encosto_w, encosto_h)
-                pygame.draw.rect(surface, cor, encosto_rect)
-                pygame.draw.rect(surface, cor_ouro, encosto_rect, 3)
-                
-                # Almofada do assento (veludo)
-                almofada = pygame.Rect(cx - half_w + 4, cy - half_h + 4, half_w * 2 - 8, half_h * 2 - 8)
-                pygame.draw.rect(surface, cor_veludo, almofada)
-                
-                # Detalhes dourados no encosto
-                deco_y = cy - half_h - encosto_h // 2
-                pygame.draw.circle(surface, cor_ouro, (cx, int(deco_y)), max(4, int(half_w * 0.3)))
-                
-                # Apoios de braÃ§o
-                arm_w = int(half_w * 0.3)
-                arm_h = int(half_h * 0.6)
-                # Esquerdo
-                pygame.draw.rect(surface, cor, pygame.Rect(cx - half_w - arm_w, cy - arm_h // 2, arm_w, arm_h))
-                # Direito
-                pygame.draw.rect(surface, cor, pygame.Rect(cx + half_w, cy - arm_h // 2, arm_w, arm_h))
+            # Base do trono (assento)
+            pygame.draw.rect(surface, cor, rect)
+            # Borda do assento
+            pygame.draw.rect(surface, cor_ouro, rect, 3)
             
-            elif obs.tipo in ["gelo"]:
-                # Gelo semi-transparente
-                s = pygame.Surface((half_w * 2, half_h * 2), pygame.SRCALPHA)
-                pygame.draw.rect(s, (*cor, 180), (0, 0, half_w * 2, half_h * 2))
-                # Reflexos
-                pygame.draw.line(s, (255, 255, 255, 100), (5, 5), (half_w, half_h * 0.7), 2)
-                surface.blit(s, (cx - half_w, cy - half_h))
+            # Encosto alto (backrest)
+            encosto_h = int(half_h * 1.8)
+            encosto_w = int(half_w * 1.4)
+            encosto_rect = pygame.Rect(cx - encosto_w // 2, cy - half_h - encosto_h, encosto_w, encosto_h)
+            pygame.draw.rect(surface, cor, encosto_rect)
+            pygame.draw.rect(surface, cor_ouro, encosto_rect, 3)
             
-            elif obs.tipo == "lapide":
-                # LÃ¡pide
-                # Base
-                pygame.draw.rect(surface, cor, rect)
-                # Topo arredondado
-                pygame.draw.arc(surface, cor, 
-                              pygame.Rect(cx - half_w, cy - half_h * 1.5, half_w * 2, half_h),
-                              0, 3.14159, max(2, int(half_w * 0.5)))
+            # Almofada do assento (veludo)
+            almofada = pygame.Rect(cx - half_w + 4, cy - half_h + 4, half_w * 2 - 8, half_h * 2 - 8)
+            pygame.draw.rect(surface, cor_veludo, almofada)
             
-            elif obs.tipo == "nucleo":
-                # NÃºcleo energÃ©tico
-                pulse = abs(math.sin(time.time() * 4))
-                raio = int(half_w * (0.8 + pulse * 0.2))
-                # Aura externa
-                pygame.draw.circle(surface, (cor[0]//2, cor[1]//2, cor[2]//2), (cx, cy), int(half_w * 1.3))
-                # NÃºcleo
-                pygame.draw.circle(surface, cor, (cx, cy), raio)
-                # Centro brilhante
-                pygame.draw.circle(surface, (255, 255, 255), (cx, cy), max(3, raio // 3))
+            # Detalhes dourados no encosto
+            deco_y = cy - half_h - encosto_h // 2
+            pygame.draw.circle(surface, cor_ouro, (cx, int(deco_y)), max(4, int(half_w * 0.3)))
             
-            else:
-                # ObstÃ¡culo genÃ©rico
-                pygame.draw.rect(surface, cor, rect)
-                # Borda
-                cor_borda = tuple(max(0, c - 30) for c in cor)
-                pygame.draw.rect(surface, cor_borda, rect, 2)
-    
+            # Apoios de braÃ§o
+            arm_w = int(half_w * 0.3)
+            arm_h = int(half_h * 0.6)
+            # Esquerdo
+            pygame.draw.rect(surface, cor, pygame.Rect(cx - half_w - arm_w, cy - arm_h // 2, arm_w, arm_h))
+            # Direito
+            pygame.draw.rect(surface, cor, pygame.Rect(cx + half_w, cy - arm_h // 2, arm_w, arm_h))
+        
+        elif obs.tipo in ["gelo"]:
+            # Gelo semi-transparente
+            s = pygame.Surface((half_w * 2, half_h * 2), pygame.SRCALPHA)
+            pygame.draw.rect(s, (*cor, 180), (0, 0, half_w * 2, half_h * 2))
+            # Reflexos
+            pygame.draw.line(s, (255, 255, 255, 100), (5, 5), (half_w, half_h * 0.7), 2)
+            surface.blit(s, (cx - half_w, cy - half_h))
+        
+        elif obs.tipo == "lapide":
+            # LÃ¡pide
+            # Base
+            pygame.draw.rect(surface, cor, rect)
+            # Topo arredondado
+            pygame.draw.arc(surface, cor, 
+                          pygame.Rect(cx - half_w, cy - half_h * 1.5, half_w * 2, half_h),
+                          0, 3.14159, max(2, int(half_w * 0.5)))
+        
+        elif obs.tipo == "nucleo":
+            # NÃºcleo energÃ©tico
+            pulse = abs(math.sin(time.time() * 4))
+            raio = int(half_w * (0.8 + pulse * 0.2))
+            # Aura externa
+            pygame.draw.circle(surface, (cor[0]//2, cor[1]//2, cor[2]//2), (cx, cy), int(half_w * 1.3))
+            # NÃºcleo
+            pygame.draw.circle(surface, cor, (cx, cy), raio)
+            # Centro brilhante
+            pygame.draw.circle(surface, (255, 255, 255), (cx, cy), max(3, raio // 3))
+        
+        else:
+            # ObstÃ¡culo genÃ©rico
+            pygame.draw.rect(surface, cor, rect)
+            # Borda
+            cor_borda = tuple(max(0, c - 30) for c in cor)
+            pygame.draw.rect(surface, cor_borda, rect, 2)
+
     def _desenhar_paredes(self, surface: pygame.Surface, camera):
         """Desenha as paredes da arena"""
         esp = self.config.espessura_parede
@@ -1278,7 +1394,15 @@ class Arena:
                 surface.blit(s, (cx - raio, cy - raio))
 
 
-# InstÃ¢ncia global da arena (pode ser substituÃ­da)
+def criar_arena(config_nome: str = "Arena") -> Arena:
+    """Cria uma arena pelo nome sem tocar na arena global"""
+    if config_nome in ARENAS:
+        return Arena(ARENAS[config_nome])
+    return Arena()
+
+
+# InstÃ¢ncia global da arena (pode ser substituÃ­da; o Simulador usa a
+# arena do seu ContextoSimulacao)
 _arena_atual: Optional[Arena] = None
 
 def get_arena() -> Arena:
@@ -1291,9 +1415,6 @@ def get_arena() -> Arena:
 def set_arena(config_nome: str = "Arena") -> Arena:
     """Define a arena atual pelo nome"""
     global _arena_atual
-    if config_nome in ARENAS:
-        _arena_atual = Arena(ARENAS[config_nome])
-    else:
-        _arena_atual = Arena()
+    _arena_atual = criar_arena(config_nome)
     return _arena_atual
 
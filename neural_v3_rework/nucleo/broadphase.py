@@ -0,0 +1,265 @@
+"""
+NEURAL FIGHTS - Broad-phase Espacial
+====================================
+Grade uniforme (hash de celulas em metros) com os lutadores vivos de uma
+luta. O Simulador reconstroi a grade uma vez por frame e a publica em
+ContextoSimulacao.broadphase; alvo mais proximo (Simulador e Lutador),
+fisica de corpos, clashes/ataques, hits de projeteis/areas e a
+consciencia multi-combatente da IA consultam a grade em vez de varrer
+todos os lutadores.
+
+As consultas sempre medem a distancia com a posicao atual do lutador; a
+celula pode estar ate FOLGA metros desatualizada (movimento dentro do
+frame), entao cada busca varre essa margem a mais. Quem move um lutador
+depois da indexacao (Lutador.update com teleporte/dash/knockback, trap
+que empurra) chama mover(lutador), que troca a celula quando o
+deslocamento passa de FOLGA. Lutadores adicionados
+a lista depois da indexacao (hordas) entram em toda consulta ate a
+proxima reindexacao. Resultados saem na ordem da lista de lutadores, a
+mesma dos loops que a grade substitui.
+
+GradePontos faz o mesmo para objetos com x/y (projeteis, orbes) montados
+no momento da consulta: clash entre projeteis e projetil x trap.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+CELULA_PADRAO = 3.0      # metros
+CELULA_PROJETEIS = 2.0   # metros
+FOLGA = 1.0              # deslocamento tolerado antes de mover() trocar a celula
+
+
+def _indexar(celulas: Dict[Tuple[int, int], List[int]], idx: int, x: float, y: float, celula: float) -> None:
+    celulas.setdefault((math.floor(x / celula), math.floor(y / celula)), []).append(idx)
+
+
+def _limites(celulas: Dict[Tuple[int, int], List[int]]) -> Tuple[int, int, int, int]:
+    if not celulas:
+        return (0, 0, -1, -1)
+    xs = [c[0] for c in celulas]
+    ys = [c[1] for c in celulas]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _varrer(celulas, limites, celula: float, x: float, y: float, alcance: float) -> List[int]:
+    """Indices das celulas que tocam o quadrado (x, y) +- alcance."""
+    x0, y0 = math.floor((x - alcance) / celula), math.floor((y - alcance) / celula)
+    x1, y1 = math.floor((x + alcance) / celula), math.floor((y + alcance) / celula)
+    lx0, ly0, lx1, ly1 = limites
+    x0, y0, x1, y1 = max(x0, lx0), max(y0, ly0), min(x1, lx1), min(y1, ly1)
+    indices = []
+    for cx in range(x0, x1 + 1):
+        for cy in range(y0, y1 + 1):
+            bloco = celulas.get((cx, cy))
+            if bloco:
+                indices.extend(bloco)
+    return indices
+
+
+class GradeEspacial:
+    """Hash de celulas dos lutadores vivos, com consultas por raio/pares."""
+
+    def __init__(self, lutadores: List, celula: float = CELULA_PADRAO):
+        self.celula = float(celula)
+        self.lutadores = lutadores
+        self.reindexar()
+
+    def reindexar(self) -> None:
+        """Refaz as celulas com as posicoes atuais (mesma lista de lutadores)."""
+        celula = self.celula
+        self._celulas: Dict[Tuple[int, int], List[int]] = {}
+        self._indexados = len(self.lutadores)
+        # Posicao de cada indice na indexacao (id(lutador) -> indice)
+        self._indices: Dict[int, int] = {}
+        self._posicoes: Dict[int, Tuple[float, float]] = {}
+        self.vivos_por_time: Counter = Counter()
+        self.raio_max = 0.0
+        for idx, f in enumerate(self.lutadores):
+            if f.morto:
+                continue
+            _indexar(self._celulas, idx, f.pos[0], f.pos[1], celula)
+            self._indices[id(f)] = idx
+            self._posicoes[idx] = (f.pos[0], f.pos[1])
+            self.vivos_por_time[f.team_id] += 1
+            self.raio_max = max(self.raio_max, f.dados.tamanho / 2)
+        self._limites = _limites(self._celulas)
+
+    def mover(self, lutador) -> None:
+        """Troca a celula do lutador se ele andou mais que FOLGA desde a indexacao."""
+        idx = self._indices.get(id(lutador))
+        if idx is None:
+            return  # adicionado depois (entra em toda consulta) ou morto
+        x0, y0 = self._posicoes[idx]
+        x, y = lutador.pos[0], lutador.pos[1]
+        if (x - x0) * (x - x0) + (y - y0) * (y - y0) <= FOLGA * FOLGA:
+            return
+        celula = self.celula
+        antiga = (math.floor(x0 / celula), math.floor(y0 / celula))
+        nova = (math.floor(x / celula), math.floor(y / celula))
+        if nova != antiga:
+            bloco = self._celulas[antiga]
+            bloco.remove(idx)
+            if not bloco:
+                del self._celulas[antiga]
+            _indexar(self._celulas, idx, x, y, celula)
+            # Limites so crescem: celula vazia dentro deles nao muda resultado
+            lx0, ly0, lx1, ly1 = self._limites
+            self._limites = (min(lx0, nova[0]), min(ly0, nova[1]), max(lx1, nova[0]), max(ly1, nova[1]))
+        self._posicoes[idx] = (x, y)
+
+    def __len__(self) -> int:
+        return sum(self.vivos_por_time.values())
+
+    def _novos(self) -> range:
+        """Indices adicionados a lista depois de reindexar()."""
+        return range(self._indexados, len(self.lutadores))
+
+    def _indices_no_raio(self, x: float, y: float, raio: float) -> List[int]:
+        indices = _varrer(self._celulas, self._limites, self.celula, x, y, raio + FOLGA)
+        indices.extend(self._novos())
+        return indices
+
+    def vizinhos(self, x: float, y: float, raio: float, excluir=None) -> List:
+        """Lutadores vivos a ate raio metros de (x, y), na ordem da lista."""
+        lutadores = self.lutadores
+        raio2 = raio * raio
+        encontrados = []
+        for idx in sorted(self._indices_no_raio(x, y, raio)):
+            f = lutadores[idx]
+            if f is excluir or f.morto:
+                continue
+            dx = f.pos[0] - x
+            dy = f.pos[1] - y
+            if dx * dx + dy * dy <= raio2:
+                encontrados.append(f)
+        return encontrados
+
+    def mais_proximo(self, x: float, y: float, excluir=None, excluir_time=None) -> Optional[object]:
+        """
+        Lutador vivo mais proximo de (x, y), procurando em aneis de celulas
+        a partir da celula do ponto. excluir_time descarta um time inteiro.
+        Empate fica com o primeiro da lista, como no loop linear.
+        """
+        lutadores = self.lutadores
+        celula = self.celula
+        ccx, ccy = math.floor(x / celula), math.floor(y / celula)
+        lx0, ly0, lx1, ly1 = self._limites
+        anel_max = max(abs(ccx - lx0), abs(ccx - lx1), abs(ccy - ly0), abs(ccy - ly1))
+        melhor = None
+        melhor_chave = (float("inf"), 0)
+
+        def considerar(indices):
+            nonlocal melhor, melhor_chave
+            for idx in indices:
+                f = lutadores[idx]
+                if f is excluir or f.morto:
+                    continue
+                if excluir_time is not None and f.team_id == excluir_time:
+                    continue
+                chave = (math.hypot(f.pos[0] - x, f.pos[1] - y), idx)
+                if chave < melhor_chave:
+                    melhor_chave = chave
+                    melhor = f
+
+        considerar(self._novos())
+        if not self._celulas:
+            return melhor
+        for anel in range(anel_max + 1):
+            # Aneis ainda nao vistos estao a pelo menos (anel-1)*celula (menos a folga)
+            if melhor is not None and melhor_chave[0] <= (anel - 1) * celula - FOLGA:
+                break
+            for cx, cy in self._celulas_do_anel(ccx, ccy, anel):
+                bloco = self._celulas.get((cx, cy))
+                if bloco:
+                    considerar(bloco)
+        return melhor
+
+    def inimigo_mais_proximo(self, lutador) -> Optional[object]:
+        """Inimigo vivo (outro team_id) mais proximo do lutador."""
+        if not self._novos() and not self.contar_vivos(excluir_time=lutador.team_id):
+            return None
+        return self.mais_proximo(lutador.pos[0], lutador.pos[1], excluir=lutador, excluir_time=lutador.team_id)
+
+    @staticmethod
+    def _celulas_do_anel(cx: int, cy: int, anel: int):
+        if anel == 0:
+            yield cx, cy
+            return
+        for dx in range(-anel, anel + 1):
+            yield cx + dx, cy - anel
+            yield cx + dx, cy + anel
+        for dy in range(-anel + 1, anel):
+            yield cx - anel, cy + dy
+            yield cx + anel, cy + dy
+
+    def pares(self, raio: float) -> List[Tuple[object, object]]:
+        """
+        Pares (a, b) de lutadores vivos a ate raio metros, cada par uma
+        vez, na ordem do loop i < j sobre a lista.
+        """
+        lutadores = self.lutadores
+        raio2 = raio * raio
+        candidatos = set()
+        indexados = [i for bloco in self._celulas.values() for i in bloco]
+        for idx_a in indexados + list(self._novos()):
+            a = lutadores[idx_a]
+            for idx_b in self._indices_no_raio(a.pos[0], a.pos[1], raio):
+                if idx_b != idx_a:
+                    candidatos.add((min(idx_a, idx_b), max(idx_a, idx_b)))
+        pares = []
+        for idx_a, idx_b in sorted(candidatos):
+            a, b = lutadores[idx_a], lutadores[idx_b]
+            if a.morto or b.morto:
+                continue
+            dx = b.pos[0] - a.pos[0]
+            dy = b.pos[1] - a.pos[1]
+            if dx * dx + dy * dy <= raio2:
+                pares.append((a, b))
+        return pares
+
+    def contar_vivos(self, team_id=None, excluir_time=None) -> int:
+        """Vivos de um time, ou de todos os times exceto excluir_time."""
+        if team_id is not None:
+            return self.vivos_por_time.get(team_id, 0)
+        return sum(n for t, n in self.vivos_por_time.items() if t != excluir_time)
+
+
+class GradePontos:
+    """Hash de celulas de objetos com x/y (projeteis, orbes) de um instante."""
+
+    def __init__(self, itens: List, celula: float = CELULA_PROJETEIS):
+        self.celula = float(celula)
+        self.itens = itens
+        self._celulas: Dict[Tuple[int, int], List[int]] = {}
+        self.raio_max = 0.0
+        for idx, item in enumerate(itens):
+            _indexar(self._celulas, idx, item.x, item.y, self.celula)
+            self.raio_max = max(self.raio_max, getattr(item, 'raio', 0.2))
+        self._limites = _limites(self._celulas)
+
+    def proximos(self, x: float, y: float, raio: float) -> List[int]:
+        """Indices (crescentes) dos itens a ate raio metros de (x, y)."""
+        itens = self.itens
+        raio2 = raio * raio
+        encontrados = []
+        for idx in sorted(_varrer(self._celulas, self._limites, self.celula, x, y, raio)):
+            item = itens[idx]
+            dx = item.x - x
+            dy = item.y - y
+            if dx * dx + dy * dy <= raio2:
+                encontrados.append(idx)
+        return encontrados
+
+    def pares(self, raio: float) -> List[Tuple[int, int]]:
+        """Pares de indices (i < j) a ate raio metros, em ordem crescente."""
+        itens = self.itens
+        pares = []
+        for idx_a, a in enumerate(itens):
+            for idx_b in self.proximos(a.x, a.y, raio):
+                if idx_b > idx_a:
+                    pares.append((idx_a, idx_b))
+        return pares
@@ -0,0 +1,74 @@
+"""
+NEURAL FIGHTS - Contexto de Simulacao
+=====================================
+Estado mutavel que antes vivia em globais de modulo (sistema_hitbox,
+get_arena/set_arena, TeamCoordinatorManager.get()) e que agora pertence a
+uma unica luta.
+
+O Simulador cria um ContextoSimulacao por luta e o repassa aos Lutadores;
+o AIBrain le o contexto via parent.contexto. Assim varias lutas podem rodar
+intercaladas no mesmo processo/thread sem compartilhar hitbox, arena ou
+coordenadores de time. Quem nao recebe contexto (ferramentas, testes
+unitarios) continua caindo nas instancias globais.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+from nucleo.arena import Arena, criar_arena
+from nucleo.broadphase import GradeEspacial
+from nucleo.hitbox import SistemaHitbox
+
+
+class ContextoSimulacao:
+    """Hitbox, arena e coordenacao de times de uma luta."""
+
+    def __init__(self, cenario: Optional[str] = None):
+        # Import tardio: ia -> nucleo -> contexto -> ia fecharia um ciclo
+        from ia.team_ai import TeamCoordinatorManager
+
+        self.hitbox = SistemaHitbox()
+        self.team_manager = TeamCoordinatorManager()
+        self.arena: Optional[Arena] = criar_arena(cenario) if cenario else None
+        # FrameProfiler do Simulador dono da luta (mede AIBrain.processar)
+        self.profiler = None
+        # GradeEspacial dos lutadores, refeita pelo Simulador a cada frame
+        self.broadphase: Optional[GradeEspacial] = None
+        # RNGPartida da luta (utilitarios.rng): seed e streams ia/spawn
+        self.rng = None
+
+    def definir_arena(self, config_nome: str = "Arena") -> Arena:
+        """Cria a arena desta luta pelo nome e a retorna."""
+        self.arena = criar_arena(config_nome)
+        return self.arena
+
+
+def hitbox_do_contexto(contexto: Optional[ContextoSimulacao]) -> SistemaHitbox:
+    """SistemaHitbox do contexto, ou a instancia global se nao houver."""
+    if contexto is not None:
+        return contexto.hitbox
+    from nucleo.hitbox import sistema_hitbox
+    return sistema_hitbox
+
+
+def team_manager_do_contexto(contexto: Optional[ContextoSimulacao]):
+    """TeamCoordinatorManager do contexto, ou o singleton global."""
+    if contexto is not None:
+        return contexto.team_manager
+    from ia.team_ai import TeamCoordinatorManager
+    return TeamCoordinatorManager.get()
+
+
+def broadphase_do_contexto(contexto: Optional[ContextoSimulacao]) -> Optional[GradeEspacial]:
+    """GradeEspacial do frame atual, ou None (quem chama varre a lista)."""
+    return getattr(contexto, "broadphase", None)
+
+
+def rng_do_contexto(contexto: Optional[ContextoSimulacao], stream: str):
+    """Stream nomeado da luta, ou o modulo random se a luta nao tiver RNG."""
+    rng = getattr(contexto, "rng", None)
+    if rng is None:
+        return random
+    return rng.stream(stream)
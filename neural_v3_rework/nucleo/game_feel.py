@@ -23,6 +23,8 @@ from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Optional, Callable, List, Dict, Any
 
+from utilitarios.rng import rng_vfx
+
 
 # =============================================================================
 # CONSTANTES DE GAME FEEL
@@ -1026,8 +1028,8 @@ class CameraFeel:
             if self.camera and self.shake_acumulado > 0.3:
                 dir_factor = max(0, 1.0 - self.shake_acumulado / 10.0)
                 
-                shake_x = self.shake_acumulado * (random.uniform(-1, 1) * 0.4 + self.shake_dir_x * dir_factor)
-                shake_y = self.shake_acumulado * (random.uniform(-1, 1) * 0.4 + self.shake_dir_y * dir_factor)
+                shake_x = self.shake_acumulado * (rng_vfx.uniform(-1, 1) * 0.4 + self.shake_dir_x * dir_factor)
+                shake_y = self.shake_acumulado * (rng_vfx.uniform(-1, 1) * 0.4 + self.shake_dir_y * dir_factor)
                 
                 self.camera.offset_x = shake_x
                 self.camera.offset_y = shake_y
@@ -1162,21 +1162,22 @@ class SistemaHitbox:
         self.hits_registrados.clear()
 
 
-# InstÃ¢ncia global do sistema
+# InstÃ¢ncia global do sistema (fallback para ferramentas e testes; o
+# Simulador usa a instancia do seu ContextoSimulacao)
 sistema_hitbox = SistemaHitbox()
 
 
-def verificar_hit(atacante, defensor) -> Tuple[bool, str]:
+def verificar_hit(atacante, defensor, sistema: Optional[SistemaHitbox] = None) -> Tuple[bool, str]:
     """FunÃ§Ã£o de conveniÃªncia para verificar hit"""
-    return sistema_hitbox.verificar_colisao(atacante, defensor)
+    return (sistema or sistema_hitbox).verificar_colisao(atacante, defensor)
 
 
-def get_debug_visual():
+def get_debug_visual(sistema: Optional[SistemaHitbox] = None):
     """Retorna dados para debug visual"""
-    return sistema_hitbox.get_debug_info()
+    return (sistema or sistema_hitbox).get_debug_info()
 
 
-def atualizar_debug(dt: float):
+def atualizar_debug(dt: float, sistema: Optional[SistemaHitbox] = None):
     """Atualiza sistema de debug"""
-    sistema_hitbox.atualizar_debug_visual(dt)
+    (sistema or sistema_hitbox).atualizar_debug_visual(dt)
 
@@ -9,6 +9,7 @@ Estrutura:
     physics_mixin.pyâ€” PhysicsMixin: fÃ­sica, movimento, trail         (~220 L)
     combat_mixin.py â€” CombatMixin: dano, status, buffs, morte        (~430 L)
     weapons_mixin.pyâ€” WeaponsMixin: ataques, skills, projÃ©teis       (~560 L)
+    status_timers.py â€” tabela de timers de status + tick do update()
 
 CritÃ©rio de sucesso (plano D03):
     from nucleo.entities import Lutador   â† continua funcionando (shim)
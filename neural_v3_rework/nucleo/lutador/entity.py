@@ -5,7 +5,7 @@ Lutador: classe principal, herda todos os mixins.
 
 ContÃ©m apenas:
   - __init__ (inicializaÃ§Ã£o de todos os atributos)
-  - update() (loop central)
+  - update() (loop central; timers de status em status_timers.py)
 
 Nota: AIBrain Ã© importado dentro de __init__ (import inline intencional)
 para quebrar a dependÃªncia circular:
@@ -15,6 +15,7 @@ para quebrar a dependÃªncia circular:
 import math
 import random
 import logging
+from collections import deque
 
 from utilitarios.config import PPM, ALTURA_PADRAO
 from utilitarios.balance_config import (
@@ -30,9 +31,12 @@ from .physics_mixin import PhysicsMixin
 from .combat_mixin import CombatMixin
 from .weapons_mixin import WeaponsMixin
 from .combat_mixin import StatusSnapshot  # re-exporta para compatibilidade
+from .status_timers import tick_timers_status, tick_cooldowns_skills
 
 _log = logging.getLogger("entities")
 
+TAM_HISTORICO_POS = 15  # frames de posicao guardados (trilha de dash/desvio)
+
 
 class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
     """
@@ -49,8 +53,10 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
         WeaponsMixin  â€” ataques, skills, projÃ©teis       (~560 L)
     """
 
-    def __init__(self, dados_char, pos_x, pos_y, team_id=0):
+    def __init__(self, dados_char, pos_x, pos_y, team_id=0, contexto=None):
         self.dados = dados_char
+        # ContextoSimulacao da luta (hitbox/arena/times); None = globais legados
+        self.contexto = contexto
         self.pos = [pos_x, pos_y]
         self.vel = [0.0, 0.0]
         self.z = 0.0
@@ -265,7 +271,7 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
 
         # Dash evasivo v7.0
         self.dash_timer = 0.0
-        self.pos_historico = []
+        self.pos_historico = deque(maxlen=TAM_HISTORICO_POS)
 
         # EFF-2: timers de debuffs declarados no __init__
         self.enraizado_timer = 0.0
@@ -276,6 +282,9 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
         self.exausto_timer = 0.0
         self.fraco_timer = 0.0
         self.vulnerabilidade_timer = 0.0
+        self.congelado_timer = 0.0
+        self.exposto_timer = 0.0
+        self.bomba_relogio_timer = 0.0
         self.dano_reduzido = 1.0
         self.vulnerabilidade = 1.0
         self.cura_bloqueada = 0.0
@@ -326,78 +335,20 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
             inimigo: Inimigo principal (nearest enemy)
             todos_lutadores: Lista de TODOS os lutadores na arena (None = 1v1 legado)
         """
-        if self.invencivel_timer > 0:
-            self.invencivel_timer -= dt
-        if self.flash_timer > 0:
-            self.flash_timer -= dt
-        if self.stun_timer > 0:
-            self.stun_timer -= dt
-
-        congelado_t = getattr(self, 'congelado_timer', 0)
-        if congelado_t > 0:
-            self.congelado_timer = congelado_t - dt
-            if self.congelado_timer <= 0:
-                self.congelado = False
-
-        if self.cd_skill_arma > 0:
-            self.cd_skill_arma -= dt
-        if self.slow_timer > 0:
-            self.slow_timer -= dt
-            if self.slow_timer <= 0:
-                self.slow_fator = 1.0
-        if getattr(self, 'cura_bloqueada', 0) > 0:
-            self.cura_bloqueada -= dt
-
-        for attr in ['silenciado_timer', 'cego_timer', 'medo_timer', 'charme_timer', 'exposto_timer']:
-            val = getattr(self, attr, 0)
-            if val > 0:
-                setattr(self, attr, val - dt)
-
-        enraizado_val = getattr(self, 'enraizado_timer', 0)
-        if enraizado_val > 0:
-            self.enraizado_timer = enraizado_val - dt
-            if self.enraizado_timer <= 0 and self.slow_fator == 0.0:
-                self.slow_fator = 1.0
-
-        if getattr(self, 'fraco_timer', 0) > 0:
-            self.fraco_timer -= dt
-            if self.fraco_timer <= 0:
-                self.dano_reduzido = 1.0
-
-        if getattr(self, 'vulnerabilidade_timer', 0) > 0:
-            self.vulnerabilidade_timer -= dt
-            if self.vulnerabilidade_timer <= 0:
-                self.vulnerabilidade = 1.0
-
-        if getattr(self, 'exausto_timer', 0) > 0:
-            self.exausto_timer -= dt
-            if self.exausto_timer <= 0:
-                self.regen_mana_base = self.class_data.get("regen_mana", 3.0)
+        tick_timers_status(self, dt)
 
         if getattr(self, 'tempo_parado', False) and self.stun_timer <= 0:
             self.tempo_parado = False
             if self.slow_fator == 0.0:
                 self.slow_fator = 1.0
 
-        if getattr(self, 'bomba_relogio_timer', 0) > 0:
-            self.bomba_relogio_timer -= dt
-            if self.bomba_relogio_timer <= 0:
-                dano_bomba = getattr(self, 'bomba_relogio_dano', 80.0)
-                self.vida = max(0, self.vida - dano_bomba)
-                self.flash_timer = 0.3
-                self.flash_cor = (255, 100, 0)
-                if self.vida <= 0:
-                    self.morrer()
-
         if self.stun_timer <= 0:
             if getattr(self, 'em_vortex', False):
                 self.em_vortex = False
             if getattr(self, 'sendo_puxado', False):
                 self.sendo_puxado = False
 
-        for skill_nome in list(self.cd_skills.keys()):
-            if self.cd_skills[skill_nome] > 0:
-                self.cd_skills[skill_nome] -= dt
+        tick_cooldowns_skills(self.cd_skills, dt)
 
         self._atualizar_buffs(dt)
         self._atualizar_dots(dt)
@@ -408,8 +359,6 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
             self.dash_timer -= dt
 
         self.pos_historico.append((self.pos[0], self.pos[1]))
-        if len(self.pos_historico) > 15:
-            self.pos_historico.pop(0)
 
         self.aura_pulso += dt * 3
         if self.aura_pulso > math.pi * 2:
@@ -431,13 +380,19 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
 
         # v13.0: Multi-fighter targeting
         if todos_lutadores is not None:
-            inimigos_vivos = [
-                f for f in todos_lutadores
-                if f is not self and not f.morto and f.team_id != self.team_id
-            ]
-            if inimigos_vivos:
-                inimigo = min(inimigos_vivos, key=lambda f: math.hypot(
-                    f.pos[0] - self.pos[0], f.pos[1] - self.pos[1]))
+            # Grade espacial do frame (Simulador) ou varredura da lista
+            grade = getattr(self.contexto, "broadphase", None)
+            if grade is not None:
+                mais_proximo = grade.inimigo_mais_proximo(self)
+            else:
+                inimigos_vivos = [
+                    f for f in todos_lutadores
+                    if f is not self and not f.morto and f.team_id != self.team_id
+                ]
+                mais_proximo = min(inimigos_vivos, key=lambda f: math.hypot(
+                    f.pos[0] - self.pos[0], f.pos[1] - self.pos[1])) if inimigos_vivos else None
+            if mais_proximo is not None:
+                inimigo = mais_proximo
 
         if inimigo is None:
             self.aplicar_fisica(dt)
@@ -468,7 +423,14 @@ class Lutador(StatsMixin, PhysicsMixin, CombatMixin, WeaponsMixin):
 
         if self.stun_timer <= 0 and algum_inimigo_vivo:
             if self.brain is not None:
-                self.brain.processar(dt, distancia, inimigo, todos_lutadores=todos_lutadores)
+                profiler = getattr(self.contexto, "profiler", None)
+                if profiler is not None and profiler.ativo:
+                    profiler.medir(
+                        f"ia/{self.dados.nome}[{self.team_id}]", self.brain.processar,
+                        dt, distancia, inimigo, todos_lutadores=todos_lutadores,
+                    )
+                else:
+                    self.brain.processar(dt, distancia, inimigo, todos_lutadores=todos_lutadores)
                 self.executar_movimento(dt, distancia)
                 self._atualizar_chain_state(dt, distancia)
                 self.executar_ataques(dt, distancia, inimigo)
@@ -206,9 +206,10 @@ class PhysicsMixin:
 
     def _atualizar_dash_trail(self, dt):
         """Fade do trail de dash."""
-        for i, (x, y, alpha) in enumerate(self.dash_trail):
-            self.dash_trail[i] = (x, y, alpha - dt * 3)
-        self.dash_trail = [(x, y, a) for x, y, a in self.dash_trail if a > 0]
+        if not self.dash_trail:
+            return
+        fade = dt * 3
+        self.dash_trail = [(x, y, a - fade) for x, y, a in self.dash_trail if a - fade > 0]
 
     def _atualizar_orbes(self, dt):
         """Atualiza orbes mÃ¡gicos e remove os inativos."""
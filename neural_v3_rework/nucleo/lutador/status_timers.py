@@ -0,0 +1,100 @@
+"""
+NEURAL FIGHTS - nucleo/lutador/status_timers.py
+===============================================
+Tabela declarativa dos timers de status do Lutador.
+
+Cada entrada e (atributo, ao_expirar). tick_timers_status() percorre a
+tabela uma vez por frame direto no __dict__ do lutador: timer zerado custa
+uma leitura; timer ativo e decrementado, e ao_expirar(lutador) so roda no
+frame em que ele chega a zero. A ordem da tabela e a ordem em que o
+update() antigo decrementava os timers (bomba depois do flash, por
+exemplo, para o flash da explosao nao perder um frame).
+
+Os timers continuam sendo atributos comuns do lutador (skills e IA leem e
+escrevem alvo.stun_timer etc. diretamente).
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+
+def _fim_congelado(lutador) -> None:
+    lutador.congelado = False
+
+
+def _fim_slow(lutador) -> None:
+    lutador.slow_fator = 1.0
+
+
+def _fim_enraizado(lutador) -> None:
+    if lutador.slow_fator == 0.0:
+        lutador.slow_fator = 1.0
+
+
+def _fim_fraco(lutador) -> None:
+    lutador.dano_reduzido = 1.0
+
+
+def _fim_vulnerabilidade(lutador) -> None:
+    lutador.vulnerabilidade = 1.0
+
+
+def _fim_exausto(lutador) -> None:
+    lutador.regen_mana_base = lutador.class_data.get("regen_mana", 3.0)
+
+
+def _fim_bomba_relogio(lutador) -> None:
+    dano_bomba = getattr(lutador, 'bomba_relogio_dano', 80.0)
+    lutador.vida = max(0, lutador.vida - dano_bomba)
+    lutador.flash_timer = 0.3
+    lutador.flash_cor = (255, 100, 0)
+    if lutador.vida <= 0:
+        lutador.morrer()
+
+
+TIMERS_STATUS: List[Tuple[str, Optional[Callable]]] = [
+    ("invencivel_timer", None),
+    ("flash_timer", None),
+    ("stun_timer", None),
+    ("congelado_timer", _fim_congelado),
+    ("cd_skill_arma", None),
+    ("slow_timer", _fim_slow),
+    ("cura_bloqueada", None),
+    ("silenciado_timer", None),
+    ("cego_timer", None),
+    ("medo_timer", None),
+    ("charme_timer", None),
+    ("exposto_timer", None),
+    ("enraizado_timer", _fim_enraizado),
+    ("fraco_timer", _fim_fraco),
+    ("vulnerabilidade_timer", _fim_vulnerabilidade),
+    ("exausto_timer", _fim_exausto),
+    ("bomba_relogio_timer", _fim_bomba_relogio),
+]
+
+
+def registrar_timer_status(atributo: str, ao_expirar: Optional[Callable] = None) -> None:
+    """Adiciona um timer ao fim da tabela (ou troca o callback de um existente)."""
+    for i, (nome, _) in enumerate(TIMERS_STATUS):
+        if nome == atributo:
+            TIMERS_STATUS[i] = (atributo, ao_expirar)
+            return
+    TIMERS_STATUS.append((atributo, ao_expirar))
+
+
+def tick_timers_status(lutador, dt: float) -> None:
+    """Decrementa os timers ativos e dispara os callbacks dos que expiraram."""
+    estado = lutador.__dict__
+    for atributo, ao_expirar in TIMERS_STATUS:
+        valor = estado.get(atributo, 0)
+        if valor > 0:
+            valor -= dt
+            estado[atributo] = valor
+            if valor <= 0 and ao_expirar is not None:
+                ao_expirar(lutador)
+
+
+def tick_cooldowns_skills(cd_skills: dict, dt: float) -> None:
+    """Decrementa os cooldowns positivos sem copiar as chaves."""
+    for nome, cd in cd_skills.items():
+        if cd > 0:
+            cd_skills[nome] = cd - dt
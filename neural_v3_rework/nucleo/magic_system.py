@@ -194,7 +194,7 @@ REACOES_ELEMENTAIS = {
 # STATUS EFFECTS EXPANDIDOS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StatusEffect:
     """Classe base para todos os status effects"""
     nome: str
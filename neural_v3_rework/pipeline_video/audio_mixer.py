@@ -6,10 +6,12 @@ Abordagem:
   2. ApÃ³s gravaÃ§Ã£o, mixa os sons reais (.mp3/.wav) nas posiÃ§Ãµes certas
   3. Usa ffmpeg para juntar vÃ­deo silencioso + Ã¡udio â†’ vÃ­deo final
 """
-import io, math, os, subprocess, logging, warnings
+import os, subprocess, logging, threading, wave
 from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
+
 _log = logging.getLogger("audio_mixer")
 
 # ffmpeg bundled via imageio-ffmpeg
@@ -19,34 +21,26 @@ try:
 except ImportError:
     _ffmpeg_exe = "ffmpeg"
 
-# Define antes do import do pydub para evitar warning de ffmpeg ausente
-os.environ.setdefault("FFMPEG_BINARY", _ffmpeg_exe)
-warnings.filterwarnings(
-    "ignore",
-    message="Couldn't find ffmpeg or avconv - defaulting to ffmpeg, but may not work",
-    category=RuntimeWarning,
-)
-
-from pydub import AudioSegment
-
-# Garante que o pydub use o ffmpeg correto
-AudioSegment.converter = _ffmpeg_exe
-
 _SAMPLE_RATE = 44100
 _CHANNELS = 2
 _SAMPLE_WIDTH = 2  # 16-bit
 
+# Limiter da mixagem final
+_LIMITER_CEILING = 0.95      # pico maximo apos o limiter (fracao do full scale)
+_LIMITER_BLOCK = 256         # amostras por bloco de envelope (~6 ms)
+_LIMITER_RELEASE_BLOCKS = 16 # blocos para a reducao de ganho voltar (~90 ms)
+
 
 def _ffmpeg_timeout(expected_duration_s: float | None = None) -> int:
-    """Calcula timeout conservador para ffmpeg conforme duraÃ§Ã£o esperada."""
+    """Calcula timeout conservador para ffmpeg conforme duracao esperada."""
     if expected_duration_s is None or expected_duration_s <= 0:
         return 600  # fallback robusto
-    # Base alta para mÃ¡quinas mais lentas + fator por duraÃ§Ã£o do vÃ­deo
+    # Base alta para maquinas mais lentas + fator por duracao do video
     return max(600, int(expected_duration_s * 6 + 120))
 
 
-def _load_audio_ffmpeg(filepath: str) -> AudioSegment | None:
-    """Carrega arquivo de Ã¡udio usando ffmpeg direto (sem ffprobe)."""
+def _decode_sound_ffmpeg(filepath: str) -> np.ndarray | None:
+    """Decodifica arquivo de audio via ffmpeg -> float32 (amostras, 2) em [-1, 1]."""
     cmd = [
         _ffmpeg_exe,
         "-i", filepath,
@@ -62,16 +56,57 @@ def _load_audio_ffmpeg(filepath: str) -> AudioSegment | None:
         )
         if result.returncode != 0 or not result.stdout:
             return None
-        return AudioSegment(
-            data=result.stdout,
-            sample_width=_SAMPLE_WIDTH,
-            frame_rate=_SAMPLE_RATE,
-            channels=_CHANNELS,
-        )
+        pcm = np.frombuffer(result.stdout, dtype="<i2")
+        pcm = pcm[: len(pcm) - len(pcm) % _CHANNELS]
+        return (pcm.reshape(-1, _CHANNELS).astype(np.float32) / 32768.0)
     except Exception as e:
         _log.debug("ffmpeg decode falhou para %s: %s", filepath, e)
         return None
 
+
+class SoundCache:
+    """
+    Sons ja decodificados (float32 estereo), por nome de evento.
+
+    Vive o processo inteiro: um run_batch com varias lutas decodifica cada
+    arquivo uma unica vez. Nomes sem arquivo tambem ficam em cache (None).
+    """
+
+    def __init__(self, decoder=None):
+        self._decoder = decoder or _decode_sound_ffmpeg
+        self._sounds: dict[str, np.ndarray | None] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sound_name: str) -> np.ndarray | None:
+        with self._lock:
+            if sound_name in self._sounds:
+                return self._sounds[sound_name]
+        filepath = _resolve_sound_file(sound_name)
+        samples = self._decoder(filepath) if filepath else None
+        if filepath and samples is None:
+            _log.debug("Erro ao carregar %s", filepath)
+        with self._lock:
+            self._sounds[sound_name] = samples
+        return samples
+
+    def __len__(self) -> int:
+        return len(self._sounds)
+
+    def __contains__(self, sound_name: str) -> bool:
+        return sound_name in self._sounds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sounds.clear()
+
+
+_sound_cache = SoundCache()
+
+
+def get_sound_cache() -> SoundCache:
+    """Cache de sons compartilhado pelas mixagens deste processo."""
+    return _sound_cache
+
 # DiretÃ³rio de sons do jogo
 _project_root = Path(__file__).resolve().parent.parent
 SOUNDS_DIR = _project_root / "sounds"
@@ -84,7 +119,7 @@ class AudioEventCapture:
     _DEDUP_COOLDOWN = 0.15
 
     def __init__(self):
-        self.events: List[Tuple[float, str, float]] = []  # (timestamp, sound_name, volume)
+        self.events: List[Tuple[float, str, float, float]] = []  # (timestamp, sound_name, volume, pan)
         self._elapsed = 0.0
         self._originals = {}
         self._manager = None
@@ -114,7 +149,7 @@ class AudioEventCapture:
                 category = capture._manager._get_sound_category(sound_name)
                 cat_vol = capture._manager.category_volumes.get(category, 1.0)
                 final_vol = volume * cat_vol * capture._manager.sfx_volume * capture._manager.master_volume
-                capture.events.append((capture._elapsed, sound_name, final_vol))
+                capture.events.append((capture._elapsed, sound_name, final_vol, pan))
             # NÃ£o chama o original â€” mixer nÃ£o funciona em headless
 
         self._manager.play = _hooked_play
@@ -182,60 +217,111 @@ def _resolve_sound_file(sound_name: str) -> str | None:
     return None
 
 
-def mix_audio_track(events: List[Tuple[float, str, float]],
+def _gains_from_events(volumes: np.ndarray, pans: np.ndarray) -> np.ndarray:
+    """Ganho (eventos, 2) por canal, com a mesma lei de pan do AudioManager."""
+    vol = np.clip(volumes, 0.01, 1.0).astype(np.float32)
+    pan = np.clip(pans, -1.0, 1.0).astype(np.float32)
+    left = vol * (1.0 - np.maximum(pan, 0.0))
+    right = vol * (1.0 + np.minimum(pan, 0.0))
+    return np.stack([left, right], axis=1)
+
+
+def _apply_limiter(buffer: np.ndarray) -> None:
+    """
+    Limiter por blocos, in-place: reduz o ganho onde o pico passa do teto,
+    com ataque antecipado de 1 bloco e release gradual, em vez do clip
+    seco que o overlay em int16 fazia.
+    """
+    peak = float(np.max(np.abs(buffer))) if buffer.size else 0.0
+    if peak <= _LIMITER_CEILING:
+        return
+
+    n = buffer.shape[0]
+    n_blocks = -(-n // _LIMITER_BLOCK)
+    padded = np.zeros((n_blocks * _LIMITER_BLOCK, buffer.shape[1]), dtype=np.float32)
+    padded[:n] = np.abs(buffer)
+    block_peak = padded.reshape(n_blocks, -1).max(axis=1)
+
+    gain = np.minimum(1.0, _LIMITER_CEILING / np.maximum(block_peak, 1e-9))
+    # Ataque: o bloco anterior ja comeca a reduzir
+    gain[:-1] = np.minimum(gain[:-1], gain[1:])
+    # Release: o ganho sobe no maximo 1/_LIMITER_RELEASE_BLOCKS por bloco
+    step = 1.0 / _LIMITER_RELEASE_BLOCKS
+    for k in range(1, n_blocks):
+        limite = gain[k - 1] + step
+        if gain[k] > limite:
+            gain[k] = limite
+
+    # Interpola ganho por amostra (centro de cada bloco)
+    centers = (np.arange(n_blocks) + 0.5) * _LIMITER_BLOCK
+    per_sample = np.interp(np.arange(n), centers, gain).astype(np.float32)
+    # Garante o teto mesmo entre centros de bloco
+    np.minimum(per_sample, np.repeat(gain, _LIMITER_BLOCK)[:n], out=per_sample)
+    buffer *= per_sample[:, None]
+
+
+def _write_wav(path: str, buffer: np.ndarray) -> None:
+    """Escreve float32 (amostras, 2) como WAV PCM 16-bit."""
+    pcm = np.clip(buffer, -1.0, 1.0)
+    pcm = (pcm * 32767.0).astype("<i2")
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(_CHANNELS)
+        wav.setsampwidth(_SAMPLE_WIDTH)
+        wav.setframerate(_SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+
+
+def mix_audio_track(events: List[Tuple],
                     duration_s: float,
-                    output_wav: str) -> bool:
+                    output_wav: str,
+                    sound_cache: SoundCache | None = None) -> bool:
     """
-    Mixa eventos de Ã¡udio em um arquivo WAV.
+    Mixa eventos de audio em um arquivo WAV.
+
+    Cada som entra uma vez no cache (float32) e cada evento soma apenas o
+    seu trecho num buffer preallocado com a duracao da luta; o custo e
+    linear em eventos x duracao do som, nao em eventos x duracao da luta.
 
     Args:
-        events: Lista de (timestamp_s, sound_name, volume)
-        duration_s: DuraÃ§Ã£o total em segundos
-        output_wav: Caminho do WAV de saÃ­da
+        events: Lista de (timestamp_s, sound_name, volume[, pan])
+        duration_s: Duracao total em segundos
+        output_wav: Caminho do WAV de saida
+        sound_cache: Cache de sons; None usa o cache do processo
     Returns:
-        True se gerou Ã¡udio com sucesso
+        True se gerou audio com sucesso
     """
     if not events:
-        _log.warning("Nenhum evento de Ã¡udio para mixar")
+        _log.warning("Nenhum evento de audio para mixar")
         return False
 
-    # Cria pista silenciosa com duraÃ§Ã£o total
-    duration_ms = int(duration_s * 1000) + 500  # +500ms de margem
-    mixed = AudioSegment.silent(duration=duration_ms, frame_rate=44100)
+    cache = sound_cache if sound_cache is not None else _sound_cache
+
+    # Pista silenciosa com duracao total (+500ms de margem)
+    total_samples = int((duration_s + 0.5) * _SAMPLE_RATE)
+    mixed = np.zeros((total_samples, _CHANNELS), dtype=np.float32)
+
+    timestamps = np.array([e[0] for e in events], dtype=np.float64)
+    volumes = np.array([e[2] for e in events], dtype=np.float32)
+    pans = np.array([e[3] if len(e) > 3 else 0.0 for e in events], dtype=np.float32)
+    starts = (timestamps * _SAMPLE_RATE).astype(np.int64)
+    gains = _gains_from_events(volumes, pans)
 
-    # Cache de sons carregados
-    sound_cache: dict[str, AudioSegment] = {}
     sounds_found = 0
     sounds_missing = set()
-
-    for timestamp, sound_name, volume in events:
-        # Resolve arquivo
-        if sound_name not in sound_cache:
-            filepath = _resolve_sound_file(sound_name)
-            if filepath:
-                seg = _load_audio_ffmpeg(filepath)
-                if seg is None:
-                    _log.debug("Erro ao carregar %s", filepath)
-                sound_cache[sound_name] = seg
-            else:
-                sound_cache[sound_name] = None
-                if sound_name not in sounds_missing:
-                    sounds_missing.add(sound_name)
-
-        segment = sound_cache.get(sound_name)
-        if segment is None:
+    sounds_used = set()
+    for idx, event in enumerate(events):
+        sound_name = event[1]
+        samples = cache.get(sound_name)
+        if samples is None:
+            sounds_missing.add(sound_name)
             continue
-
-        # Aplica volume (pydub usa dB)
-        vol_clamped = max(0.01, min(1.0, volume))
-        db_adjustment = 20 * math.log10(vol_clamped)
-        adjusted = segment + db_adjustment
-
-        # Overlay na posiÃ§Ã£o
-        pos_ms = int(timestamp * 1000)
-        if pos_ms < duration_ms:
-            mixed = mixed.overlay(adjusted, position=pos_ms)
-            sounds_found += 1
+        start = int(starts[idx])
+        if start < 0 or start >= total_samples:
+            continue
+        end = min(total_samples, start + samples.shape[0])
+        mixed[start:end] += samples[: end - start] * gains[idx]
+        sounds_found += 1
+        sounds_used.add(sound_name)
 
     if sounds_missing:
         _log.debug("Sons sem arquivo: %s", ", ".join(sorted(sounds_missing)))
@@ -244,36 +330,47 @@ def mix_audio_track(events: List[Tuple[float, str, float]],
         _log.warning("Nenhum som encontrado nos arquivos")
         return False
 
-    _log.info("Ãudio mixado: %d eventos, %d sons Ãºnicos, %.1fs",
-              sounds_found, len(sound_cache) - len(sounds_missing), duration_s)
+    _apply_limiter(mixed)
+
+    _log.info("Audio mixado: %d eventos, %d sons unicos, %.1fs (cache: %d sons)",
+              sounds_found, len(sounds_used), duration_s, len(cache))
 
-    # Exporta WAV
-    mixed.export(output_wav, format="wav")
+    _write_wav(output_wav, mixed)
     return True
 
 
 def mux_video_audio(video_path: str, audio_path: str, output_path: str,
-                    expected_duration_s: float | None = None) -> bool:
+                    expected_duration_s: float | None = None,
+                    copy_video: bool = False) -> bool:
     """
     Combina vÃ­deo silencioso + Ã¡udio WAV â†’ vÃ­deo final com som.
     Re-encoda para H.264/AAC compatÃ­vel com Instagram Reels:
       - Codec H.264 High Profile (exigido pelo Reels)
       - Bitrate mÃ¡x 3.5 Mbps (recomendaÃ§Ã£o do Instagram)
       - yuv420p para compatibilidade mÃ¡xima de player
+
+    copy_video=True: o video ja esta em H.264 final (FFmpegPipeEncoder) e
+    o stream e apenas copiado; so o audio e encodado.
     """
+    if copy_video:
+        video_args = ["-c:v", "copy"]
+    else:
+        video_args = [
+            "-c:v", "libx264",          # H.264 â€” codec exigido pelo Reels
+            "-preset", "veryfast",      # Reduz tempo de encode sem quebrar compatibilidade
+            "-profile:v", "high",
+            "-level:v", "4.2",          # Suporta 1080p @ 60 fps
+            "-pix_fmt", "yuv420p",      # Compatibilidade mÃ¡xima de player
+            "-b:v", "3500k",            # Bitrate alvo â‰¤ 3.5 Mbps
+            "-maxrate", "3500k",        # Teto absoluto de bitrate
+            "-bufsize", "7000k",        # Buffer = 2Ã— maxrate
+        ]
     cmd = [
         _ffmpeg_exe,
         "-y",                       # Sobrescreve sem perguntar
         "-i", video_path,           # VÃ­deo de entrada (sem Ã¡udio)
         "-i", audio_path,           # Ãudio de entrada
-        "-c:v", "libx264",          # H.264 â€” codec exigido pelo Reels
-        "-preset", "veryfast",      # Reduz tempo de encode sem quebrar compatibilidade
-        "-profile:v", "high",
-        "-level:v", "4.2",          # Suporta 1080p @ 60 fps
-        "-pix_fmt", "yuv420p",      # Compatibilidade mÃ¡xima de player
-        "-b:v", "3500k",            # Bitrate alvo â‰¤ 3.5 Mbps
-        "-maxrate", "3500k",        # Teto absoluto de bitrate
-        "-bufsize", "7000k",        # Buffer = 2Ã— maxrate
+        *video_args,
         "-c:a", "aac",              # Encode Ã¡udio em AAC
         "-b:a", "192k",             # Bitrate de Ã¡udio
         "-movflags", "+faststart",  # Moov atom no inÃ­cio (streaming)
@@ -9,6 +9,7 @@ import logging
 import os
 import sys
 import time
+from functools import partial
 from pathlib import Path
 
 
@@ -57,6 +58,290 @@ def _resolver_duelo_direto_roster(fighter1_name: str, fighter2_name: str):
     return p1, a1, p2, a2
 
 
+def _plan_batch_fight(
+    idx: int,
+    num_fights: int,
+    batch_dir: Path,
+    cenarios: list[str],
+    generation_mode: str,
+    video_format: str,
+    comment: str | None,
+    encounter_mode: str,
+    template_id: str | None,
+    fighter1_name: str | None,
+    fighter2_name: str | None,
+    forced_cenario: str | None,
+) -> dict:
+    """
+    Sorteia lutadores/cenario de uma luta do batch (sempre no processo pai,
+    para a rotacao de cobertura e o RNG seguirem a mesma ordem com ou sem
+    workers). Devolve um job picklable para _record_batch_fight.
+    """
+    import random
+
+    platform = PLATFORMS[idx % len(PLATFORMS)]
+
+    _log.info("=" * 60)
+    _log.info("LUTA %d/%d -> %s", idx + 1, num_fights, platform.upper())
+    _log.info("=" * 60)
+
+    story = None
+    selecao = None
+    p1_obj = a1_obj = p2_obj = a2_obj = None
+    duelo_direto = bool(
+        encounter_mode == "duelo"
+        and str(fighter1_name or "").strip()
+        and str(fighter2_name or "").strip()
+    )
+    if encounter_mode == "duelo" and video_format == "comment_roulette":
+        story = gerar_story_roleta_status(comment, fight_index=idx)
+        c1, a1 = story["fighter1"], story["weapon1"]
+        c2, a2 = story["fighter2"], story["weapon2"]
+    elif duelo_direto:
+        p1_obj, a1_obj, p2_obj, a2_obj = _resolver_duelo_direto_roster(str(fighter1_name), str(fighter2_name))
+        c1 = a1 = c2 = a2 = None
+    elif encounter_mode == "duelo":
+        c1, a1, c2, a2 = gerar_par_de_lutadores(generation_mode=generation_mode)
+    else:
+        selecao = montar_template_selecionado(template_id or ("esquadrao_balanceado_3v3" if encounter_mode == "equipes" else "corredor_contra_horda"))
+        c1 = a1 = c2 = a2 = None
+
+    cenario = forced_cenario or random.choice(cenarios)
+    if encounter_mode == "duelo":
+        if duelo_direto:
+            nome1 = p1_obj.nome
+            nome2 = p2_obj.nome
+            classe1 = p1_obj.classe
+            classe2 = p2_obj.classe
+            gap_abs = 0.0
+            gap_rel = 0.0
+        else:
+            nome1 = c1["nome"]
+            nome2 = c2["nome"]
+            classe1 = c1["classe"]
+            classe2 = c2["classe"]
+            gap_abs, gap_rel = _gap_poder(c1, a1, c2, a2)
+    else:
+        nome1 = selecao["template"].get("team_a", {}).get("label", "Time 1")
+        nome2 = selecao["template"].get("team_b", {}).get("label", "Time 2") if encounter_mode == "equipes" else str((selecao.get("horda_config") or {}).get("label", "Horda"))
+        classe1 = "Equipe"
+        classe2 = "Equipe" if encounter_mode == "equipes" else "Horda"
+        gap_abs = 0.0
+        gap_rel = 0.0
+
+    _log.info("  %s (%s) vs %s (%s) - %s", nome1, classe1, nome2, classe2, cenario)
+    if encounter_mode == "duelo":
+        _log.info("  Balanceamento: gap_poder=%.2f (%.1f%%)", gap_abs, gap_rel * 100.0)
+
+    plat_dir = batch_dir / platform
+    plat_dir.mkdir(exist_ok=True)
+
+    if story:
+        fight_name = f"{platform}_{slugify_comment(story['comment'])}_{nome1.split()[0]}_vs_{nome2.split()[0]}"
+    else:
+        fight_name = f"{platform}_{encounter_mode}_{nome1.split()[0]}_vs_{nome2.split()[0]}"
+    fight_name = "".join(ch if ch.isalnum() or ch in "_-" else "_" for ch in fight_name)
+
+    return {
+        "index": idx,
+        "seed": random.getrandbits(32),
+        "platform": platform,
+        "encounter_mode": encounter_mode,
+        "story": story,
+        "duelo_direto": duelo_direto,
+        "fighters": (c1, a1, c2, a2),
+        "roster": (p1_obj, a1_obj, p2_obj, a2_obj),
+        "selecao": selecao,
+        "cenario": cenario,
+        "nome1": nome1,
+        "nome2": nome2,
+        "classe1": classe1,
+        "classe2": classe2,
+        "plat_dir": str(plat_dir),
+        "fight_name": fight_name,
+    }
+
+
+def _build_batch_recorder(job: dict, video_path: str):
+    encounter_mode = job["encounter_mode"]
+    story = job["story"]
+    cenario = job["cenario"]
+    c1, a1, c2, a2 = job["fighters"]
+    p1_obj, a1_obj, p2_obj, a2_obj = job["roster"]
+    selecao = job["selecao"]
+
+    if encounter_mode == "duelo" and not job["duelo_direto"]:
+        recorder = FightRecorder(
+            c1,
+            a1,
+            c2,
+            a2,
+            cenario=cenario,
+            output_path=video_path,
+            story_mode="roleta_status" if story else "classic",
+            roulette_story=story,
+        )
+    elif encounter_mode == "duelo":
+        encounter_config = build_duel_match_config(
+            p1_obj.nome,
+            p2_obj.nome,
+            cenario=cenario,
+            portrait_mode=True,
+            extra={"metadata": {"pipeline_source": "headless_target"}},
+        )
+        recorder = EncounterRecorder(
+            encounter_config,
+            extra_characters=[p1_obj, p2_obj],
+            extra_weapons=[a1_obj, a2_obj],
+            output_path=video_path,
+        )
+    else:
+        if encounter_mode == "equipes":
+            encounter_config = build_team_match_config(
+                [
+                    {
+                        "team_id": 0,
+                        "label": selecao["template"].get("team_a", {}).get("label", "Time 1"),
+                        "members": [slot["personagem"].nome for slot in selecao["team_a"]],
+                    },
+                    {
+                        "team_id": 1,
+                        "label": selecao["template"].get("team_b", {}).get("label", "Time 2"),
+                        "members": [slot["personagem"].nome for slot in selecao["team_b"]],
+                    },
+                ],
+                cenario=selecao["template"].get("cenario", cenario),
+                extra={"portrait_mode": True},
+            )
+            extra_slots = selecao["team_a"] + selecao["team_b"]
+        else:
+            encounter_config = build_horde_match_config(
+                [
+                    {
+                        "team_id": 0,
+                        "label": selecao["template"].get("team_a", {}).get("label", "Expedicao"),
+                        "members": [slot["personagem"].nome for slot in selecao["team_a"]],
+                    }
+                ],
+                selecao.get("horda_config") or {},
+                cenario=selecao["template"].get("cenario", cenario),
+                extra={"portrait_mode": True},
+            )
+            extra_slots = selecao["team_a"]
+        extra_chars = []
+        extra_weapons = []
+        char_names = set()
+        weapon_names = set()
+        for slot in extra_slots:
+            personagem = slot["personagem"]
+            arma = slot["arma"]
+            if personagem.nome not in char_names:
+                char_names.add(personagem.nome)
+                extra_chars.append(personagem)
+            if arma.nome not in weapon_names:
+                weapon_names.add(arma.nome)
+                extra_weapons.append(arma)
+        recorder = EncounterRecorder(
+            encounter_config,
+            extra_characters=extra_chars,
+            extra_weapons=extra_weapons,
+            output_path=video_path,
+        )
+    return recorder
+
+
+def _record_batch_fight(job: dict, build_recorder=_build_batch_recorder) -> dict | None:
+    """
+    Grava uma luta planejada e escreve video + metadados na pasta da
+    plataforma. Roda no processo pai (serial) ou num worker; o AppState do
+    processo so e alterado em memoria pelo recorder e restaurado ao fim.
+    build_recorder(job, video_path) monta o gravador (trocavel em testes).
+    """
+    import random
+
+    random.seed(job["seed"])
+    platform = job["platform"]
+    encounter_mode = job["encounter_mode"]
+    story = job["story"]
+    nome1, nome2 = job["nome1"], job["nome2"]
+    classe1, classe2 = job["classe1"], job["classe2"]
+    plat_dir = Path(job["plat_dir"])
+    fight_name = job["fight_name"]
+    video_path = str(plat_dir / f"{fight_name}.mp4")
+
+    try:
+        recorder = build_recorder(job, video_path)
+        recorder.record()
+    except Exception as exc:
+        _log.error("  ERRO na gravacao (%s): %s", fight_name, exc)
+        import traceback
+
+        traceback.print_exc()
+        return None
+
+    if recorder.total_frames == 0:
+        _log.warning("  Nenhum frame capturado (%s), pulando...", fight_name)
+        return None
+
+    vencedor = recorder.winner
+    _log.info(
+        "  %s | Vencedor: %s | Frames: %d | Duracao: %.1fs",
+        fight_name,
+        vencedor,
+        recorder.total_frames,
+        recorder.duration,
+    )
+
+    all_meta = (
+        generate_story_all_platforms(story, vencedor=vencedor)
+        if story
+        else (
+            generate_all_platforms(nome1, nome2, classe1, classe2, vencedor)
+            if encounter_mode == "duelo"
+            else generate_encounter_all_platforms(nome1, nome2, mode=encounter_mode, winner=vencedor)
+        )
+    )
+    meta = all_meta[platform]
+    meta_file = plat_dir / f"{fight_name}_meta.json"
+    with open(meta_file, "w", encoding="utf-8") as file:
+        json.dump(meta, file, ensure_ascii=False, indent=2)
+
+    meta_txt_file = plat_dir / f"{fight_name}_meta.txt"
+    with open(meta_txt_file, "w", encoding="utf-8") as file:
+        file.write(format_metadata_plain_text(meta))
+
+    meta_copy_file = plat_dir / f"{fight_name}_copy.txt"
+    with open(meta_copy_file, "w", encoding="utf-8") as file:
+        file.write(format_metadata_copy_text(meta, platform=platform))
+
+    meta_all_platforms_file = plat_dir / f"{fight_name}_copy_all_platforms.txt"
+    with open(meta_all_platforms_file, "w", encoding="utf-8") as file:
+        file.write(format_all_platform_copies(all_meta))
+
+    story_file = None
+    if story:
+        story_file = plat_dir / f"{fight_name}_story.json"
+        with open(story_file, "w", encoding="utf-8") as file:
+            json.dump(story, file, ensure_ascii=False, indent=2)
+
+    return {
+        "platform": platform,
+        "fighter1": {"nome": nome1, "classe": classe1},
+        "fighter2": {"nome": nome2, "classe": classe2},
+        "encounter_mode": encounter_mode,
+        "winner": vencedor,
+        "duration": recorder.duration,
+        "frames": recorder.total_frames,
+        "video": str(video_path),
+        "metadata": str(meta_file),
+        "metadata_text": str(meta_txt_file),
+        "metadata_copy": str(meta_copy_file),
+        "metadata_copy_all_platforms": str(meta_all_platforms_file),
+        "title": meta["title"],
+        "story": str(story_file) if story_file else None,
+    }
+
+
 def run_batch(
     num_fights: int | None = None,
     cenarios: list[str] | None = None,
@@ -69,11 +354,22 @@ def run_batch(
     fighter1_name: str | None = None,
     fighter2_name: str | None = None,
     forced_cenario: str | None = None,
+    workers: int = 1,
+    recorder_factory=None,
 ) -> list[dict]:
     """
     Gera um batch completo de videos, uma luta por plataforma.
+
+    workers > 1 grava as lutas em processos separados (pygame headless e
+    AppState proprios em cada um); o sorteio das lutas continua no
+    processo pai e o resultado segue a ordem das lutas.
+
+    recorder_factory(job, video_path) substitui o gravador padrao. Vai
+    junto com cada job para os workers, entao precisa ser picklable
+    (funcao ou classe de modulo): com spawn, monkeypatch no processo pai
+    nao chega aos workers.
     """
-    import random
+    from ferramentas.batch_fight_engine import BatchFightEngine
 
     set_coverage_rotation(coverage_rotation)
     if coverage_rotation:
@@ -89,219 +385,34 @@ def run_batch(
     batch_dir = Path(OUTPUT_DIR) / f"batch_{timestamp}"
     batch_dir.mkdir(parents=True, exist_ok=True)
 
-    results: list[dict] = []
-
-    for idx in range(num_fights):
-        platform = PLATFORMS[idx % len(PLATFORMS)]
-
-        _log.info("=" * 60)
-        _log.info("LUTA %d/%d -> %s", idx + 1, num_fights, platform.upper())
-        _log.info("=" * 60)
-
-        story = None
-        duelo_direto = (
-            encounter_mode == "duelo"
-            and str(fighter1_name or "").strip()
-            and str(fighter2_name or "").strip()
+    jobs = [
+        _plan_batch_fight(
+            idx,
+            num_fights,
+            batch_dir,
+            cenarios,
+            generation_mode,
+            video_format,
+            comment,
+            encounter_mode,
+            template_id,
+            fighter1_name,
+            fighter2_name,
+            forced_cenario,
         )
-        if encounter_mode == "duelo" and video_format == "comment_roulette":
-            story = gerar_story_roleta_status(comment, fight_index=idx)
-            c1, a1 = story["fighter1"], story["weapon1"]
-            c2, a2 = story["fighter2"], story["weapon2"]
-        elif duelo_direto:
-            p1_obj, a1_obj, p2_obj, a2_obj = _resolver_duelo_direto_roster(str(fighter1_name), str(fighter2_name))
-            c1 = a1 = c2 = a2 = None
-        elif encounter_mode == "duelo":
-            c1, a1, c2, a2 = gerar_par_de_lutadores(generation_mode=generation_mode)
-        else:
-            selecao = montar_template_selecionado(template_id or ("esquadrao_balanceado_3v3" if encounter_mode == "equipes" else "corredor_contra_horda"))
-            c1 = a1 = c2 = a2 = None
-
-        cenario = forced_cenario or random.choice(cenarios)
-        if encounter_mode == "duelo":
-            if duelo_direto:
-                nome1 = p1_obj.nome
-                nome2 = p2_obj.nome
-                classe1 = p1_obj.classe
-                classe2 = p2_obj.classe
-                gap_abs = 0.0
-                gap_rel = 0.0
-            else:
-                nome1 = c1["nome"]
-                nome2 = c2["nome"]
-                classe1 = c1["classe"]
-                classe2 = c2["classe"]
-                gap_abs, gap_rel = _gap_poder(c1, a1, c2, a2)
-        else:
-            nome1 = selecao["template"].get("team_a", {}).get("label", "Time 1")
-            nome2 = selecao["template"].get("team_b", {}).get("label", "Time 2") if encounter_mode == "equipes" else str((selecao.get("horda_config") or {}).get("label", "Horda"))
-            classe1 = "Equipe"
-            classe2 = "Equipe" if encounter_mode == "equipes" else "Horda"
-            gap_abs = 0.0
-            gap_rel = 0.0
-
-        _log.info("  %s (%s) vs %s (%s) - %s", nome1, classe1, nome2, classe2, cenario)
-        if encounter_mode == "duelo":
-            _log.info("  Balanceamento: gap_poder=%.2f (%.1f%%)", gap_abs, gap_rel * 100.0)
-
-        plat_dir = batch_dir / platform
-        plat_dir.mkdir(exist_ok=True)
-
-        try:
-            if story:
-                fight_name = f"{platform}_{slugify_comment(story['comment'])}_{nome1.split()[0]}_vs_{nome2.split()[0]}"
-            else:
-                fight_name = f"{platform}_{encounter_mode}_{nome1.split()[0]}_vs_{nome2.split()[0]}"
-            fight_name = "".join(ch if ch.isalnum() or ch in "_-" else "_" for ch in fight_name)
-            video_path = str(plat_dir / f"{fight_name}.mp4")
-
-            if encounter_mode == "duelo" and not duelo_direto:
-                recorder = FightRecorder(
-                    c1,
-                    a1,
-                    c2,
-                    a2,
-                    cenario=cenario,
-                    output_path=video_path,
-                    story_mode="roleta_status" if story else "classic",
-                    roulette_story=story,
-                )
-            elif encounter_mode == "duelo":
-                encounter_config = build_duel_match_config(
-                    p1_obj.nome,
-                    p2_obj.nome,
-                    cenario=cenario,
-                    portrait_mode=True,
-                    extra={"metadata": {"pipeline_source": "headless_target"}},
-                )
-                recorder = EncounterRecorder(
-                    encounter_config,
-                    extra_characters=[p1_obj, p2_obj],
-                    extra_weapons=[a1_obj, a2_obj],
-                    output_path=video_path,
-                )
-            else:
-                if encounter_mode == "equipes":
-                    encounter_config = build_team_match_config(
-                        [
-                            {
-                                "team_id": 0,
-                                "label": selecao["template"].get("team_a", {}).get("label", "Time 1"),
-                                "members": [slot["personagem"].nome for slot in selecao["team_a"]],
-                            },
-                            {
-                                "team_id": 1,
-                                "label": selecao["template"].get("team_b", {}).get("label", "Time 2"),
-                                "members": [slot["personagem"].nome for slot in selecao["team_b"]],
-                            },
-                        ],
-                        cenario=selecao["template"].get("cenario", cenario),
-                        extra={"portrait_mode": True},
-                    )
-                    extra_slots = selecao["team_a"] + selecao["team_b"]
-                else:
-                    encounter_config = build_horde_match_config(
-                        [
-                            {
-                                "team_id": 0,
-                                "label": selecao["template"].get("team_a", {}).get("label", "Expedicao"),
-                                "members": [slot["personagem"].nome for slot in selecao["team_a"]],
-                            }
-                        ],
-                        selecao.get("horda_config") or {},
-                        cenario=selecao["template"].get("cenario", cenario),
-                        extra={"portrait_mode": True},
-                    )
-                    extra_slots = selecao["team_a"]
-                extra_chars = []
-                extra_weapons = []
-                char_names = set()
-                weapon_names = set()
-                for slot in extra_slots:
-                    personagem = slot["personagem"]
-                    arma = slot["arma"]
-                    if personagem.nome not in char_names:
-                        char_names.add(personagem.nome)
-                        extra_chars.append(personagem)
-                    if arma.nome not in weapon_names:
-                        weapon_names.add(arma.nome)
-                        extra_weapons.append(arma)
-                recorder = EncounterRecorder(
-                    encounter_config,
-                    extra_characters=extra_chars,
-                    extra_weapons=extra_weapons,
-                    output_path=video_path,
-                )
-            recorder.record()
-        except Exception as exc:
-            _log.error("  ERRO na gravacao: %s", exc)
-            import traceback
-
-            traceback.print_exc()
-            continue
+        for idx in range(num_fights)
+    ]
 
-        if recorder.total_frames == 0:
-            _log.warning("  Nenhum frame capturado, pulando...")
+    results: list[dict] = []
+    engine = BatchFightEngine(workers=workers, chunksize=1)
+    record = _record_batch_fight
+    if recorder_factory is not None:
+        record = partial(_record_batch_fight, build_recorder=recorder_factory)
+    for fight_result in engine.map(record, jobs):
+        if fight_result is None:
             continue
-
-        vencedor = recorder.winner
-        _log.info(
-            "  Vencedor: %s | Frames: %d | Duracao: %.1fs",
-            vencedor,
-            recorder.total_frames,
-            recorder.duration,
-        )
-
-        all_meta = (
-            generate_story_all_platforms(story, vencedor=vencedor)
-            if story
-            else (
-                generate_all_platforms(nome1, nome2, classe1, classe2, vencedor)
-                if encounter_mode == "duelo"
-                else generate_encounter_all_platforms(nome1, nome2, mode=encounter_mode, winner=vencedor)
-            )
-        )
-        meta = all_meta[platform]
-        meta_file = plat_dir / f"{fight_name}_meta.json"
-        with open(meta_file, "w", encoding="utf-8") as file:
-            json.dump(meta, file, ensure_ascii=False, indent=2)
-
-        meta_txt_file = plat_dir / f"{fight_name}_meta.txt"
-        with open(meta_txt_file, "w", encoding="utf-8") as file:
-            file.write(format_metadata_plain_text(meta))
-
-        meta_copy_file = plat_dir / f"{fight_name}_copy.txt"
-        with open(meta_copy_file, "w", encoding="utf-8") as file:
-            file.write(format_metadata_copy_text(meta, platform=platform))
-
-        meta_all_platforms_file = plat_dir / f"{fight_name}_copy_all_platforms.txt"
-        with open(meta_all_platforms_file, "w", encoding="utf-8") as file:
-            file.write(format_all_platform_copies(all_meta))
-
-        story_file = None
-        if story:
-            story_file = plat_dir / f"{fight_name}_story.json"
-            with open(story_file, "w", encoding="utf-8") as file:
-                json.dump(story, file, ensure_ascii=False, indent=2)
-
-        fight_result = {
-            "platform": platform,
-            "fighter1": {"nome": nome1, "classe": classe1},
-            "fighter2": {"nome": nome2, "classe": classe2},
-            "encounter_mode": encounter_mode,
-            "winner": vencedor,
-            "duration": recorder.duration,
-            "frames": recorder.total_frames,
-            "video": str(video_path),
-            "metadata": str(meta_file),
-            "metadata_text": str(meta_txt_file),
-            "metadata_copy": str(meta_copy_file),
-            "metadata_copy_all_platforms": str(meta_all_platforms_file),
-            "title": meta["title"],
-            "story": str(story_file) if story_file else None,
-        }
         results.append(fight_result)
-        _log.info("  [%s] %s", platform.upper(), meta["title"])
+        _log.info("  [%s] %s", fight_result["platform"].upper(), fight_result["title"])
 
     summary = {
         "timestamp": timestamp,
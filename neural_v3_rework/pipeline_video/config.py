@@ -20,6 +20,8 @@ VIDEO_HEIGHT = 1920
 VIDEO_FPS = 60
 VIDEO_CODEC = "mp4v"  # OpenCV fourcc (H.264 via mp4v ou avc1)
 VIDEO_EXT = ".mp4"
+# "auto" usa o pipe ffmpeg quando disponivel; "opencv" forca cv2.VideoWriter + re-encode
+VIDEO_ENCODER_BACKEND = os.environ.get("NF_PIPELINE_ENCODER", "auto").strip().lower()
 MIN_FIGHT_DURATION = 60.0  # Luta deve durar no minimo 60s
 
 # === GAME RENDER ===
@@ -18,7 +18,6 @@ from pipeline_video.config import (
     FADE_OUT_DURATION,
     MIN_FIGHT_DURATION,
     OUTPUT_DIR,
-    VIDEO_CODEC,
     VIDEO_FPS,
 )
 from pipeline_video.fight_recorder import (
@@ -41,9 +40,11 @@ class _OverlayEncounterState:
         self.snapshot = _snapshot_app_state()
 
     def __enter__(self):
-        self.state._characters = list(self.snapshot["characters"]) + self.extra_chars
-        self.state._weapons = list(self.snapshot["weapons"]) + self.extra_weapons
-        self.state._match = deepcopy(self.encounter_config)
+        self.state.replace_roster_in_memory(
+            characters=list(self.snapshot["characters"]) + self.extra_chars,
+            weapons=list(self.snapshot["weapons"]) + self.extra_weapons,
+            match_config=deepcopy(self.encounter_config),
+        )
         return self
 
     def __exit__(self, exc_type, exc, tb):
@@ -127,9 +128,8 @@ class EncounterRecorder(FightRecorder):
         }
 
     def record(self) -> "EncounterRecorder":
-        import cv2
         import pygame
-        from pipeline_video.audio_mixer import AudioEventCapture, mix_audio_track, mux_video_audio, reencode_silent_video
+        from pipeline_video.audio_mixer import AudioEventCapture
         from simulacao.simulacao import Simulador
 
         _setup_headless()
@@ -155,10 +155,7 @@ class EncounterRecorder(FightRecorder):
                 render_surface = pygame.Surface((sim.screen_width, sim.screen_height))
 
                 audio_capture.start()
-                fourcc = cv2.VideoWriter_fourcc(*VIDEO_CODEC)
-                writer = cv2.VideoWriter(silent_video, fourcc, VIDEO_FPS, (1080, 1920))
-                if not writer.isOpened():
-                    raise RuntimeError(f"Falha ao abrir VideoWriter: {silent_video}")
+                writer = self._open_video_writer(silent_video)
 
                 dt = 1.0 / VIDEO_FPS
                 elapsed = 0.0
@@ -194,12 +191,8 @@ class EncounterRecorder(FightRecorder):
                     self.winner = str(sim.vencedor or "Empate")
 
                 if self.total_frames > 0:
-                    last_rgb = self._render_frame(sim, render_surface, None)
-                    for i in range(fade_frames):
-                        alpha = 1.0 - (i / max(1, fade_frames))
-                        faded = (last_rgb * alpha).astype("uint8")
-                        writer.write(cv2.cvtColor(faded, cv2.COLOR_RGB2BGR))
-                        self.total_frames += 1
+                    last_bgr = self._render_frame(sim, render_surface, None)
+                    self._write_fade_out(writer, last_bgr, fade_frames)
 
                 self.duration = prelude_elapsed + elapsed
                 self.video_file = self.output_path
@@ -214,27 +207,7 @@ class EncounterRecorder(FightRecorder):
             except Exception:
                 pass
 
-        if self.total_frames > 0 and audio_capture.events:
-            wav_path = self.output_path.replace(".mp4", "_audio.wav")
-            total_duration = self.total_frames / VIDEO_FPS
-            if mix_audio_track(audio_capture.events, total_duration, wav_path):
-                if mux_video_audio(silent_video, wav_path, self.output_path, expected_duration_s=total_duration):
-                    try:
-                        os.remove(silent_video)
-                        os.remove(wav_path)
-                    except OSError:
-                        pass
-                else:
-                    if not reencode_silent_video(silent_video, self.output_path, expected_duration_s=total_duration):
-                        os.replace(silent_video, self.output_path)
-            elif os.path.exists(silent_video):
-                if not reencode_silent_video(silent_video, self.output_path, expected_duration_s=total_duration):
-                    os.replace(silent_video, self.output_path)
-        elif os.path.exists(silent_video):
-            total_duration = self.total_frames / VIDEO_FPS if self.total_frames > 0 else None
-            from pipeline_video.audio_mixer import reencode_silent_video
-            if not reencode_silent_video(silent_video, self.output_path, expected_duration_s=total_duration):
-                os.replace(silent_video, self.output_path)
+        self._finalize_video(writer, silent_video, audio_capture.events)
 
         return self
 
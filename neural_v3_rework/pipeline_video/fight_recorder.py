@@ -6,7 +6,8 @@ Abordagem:
   2. Alimenta AppState com lutadores gerados
   3. Instancia Simulador normal (reusa toda a engine)
   4. Roda loop: update â†’ desenhar â†’ captura surface (portrait nativo)
-  5. Escreve frames direto no VideoWriter (streaming)
+  5. Escreve frames direto no encoder (pipe ffmpeg em H.264 final, ou
+     cv2.VideoWriter + re-encode quando nao ha ffmpeg)
 """
 import os, sys, math, time, logging
 import numpy as np
@@ -110,18 +111,20 @@ def _inject_match_config(char1: dict, arma1: dict, char2: dict, arma2: dict,
     p1 = _build_char(char1, a1)
     p2 = _build_char(char2, a2)
 
-    # B02 Sprint fix: usa API pÃºblica em vez de atributos privados.
-    # Substitui listas/config APENAS em memÃ³ria para nÃ£o poluir JSON global.
-    state.set_characters([p1, p2])
-    state.set_weapons([a1, a2])
-    state.set_match_config({
-        **state.match_config,
-        "p1_nome": p1.nome,
-        "p2_nome": p2.nome,
-        "cenario": cenario,
-        "portrait_mode": True,
-        "teams": None,
-    })
+    # Substitui roster/config APENAS em memoria: nao polui os JSON globais
+    # e permite varios recorders em processos paralelos (batch_runner).
+    state.replace_roster_in_memory(
+        characters=[p1, p2],
+        weapons=[a1, a2],
+        match_config={
+            **state.match_config,
+            "p1_nome": p1.nome,
+            "p2_nome": p2.nome,
+            "cenario": cenario,
+            "portrait_mode": True,
+            "teams": None,
+        },
+    )
 
 
 def _snapshot_app_state() -> dict:
@@ -147,13 +150,11 @@ def _restore_app_state(snapshot: dict) -> None:
     from dados.app_state import AppState
     if snapshot is None:
         return
-    state = AppState.get()
-    if "characters" in snapshot and snapshot["characters"] is not None:
-        state.set_characters(snapshot["characters"])
-    if "weapons" in snapshot and snapshot["weapons"] is not None:
-        state.set_weapons(snapshot["weapons"])
-    if "match" in snapshot:
-        state.set_match_config(snapshot["match"])
+    AppState.get().replace_roster_in_memory(
+        characters=snapshot.get("characters"),
+        weapons=snapshot.get("weapons"),
+        match_config=snapshot.get("match"),
+    )
 
 
 def _surface_to_numpy(surface) -> np.ndarray:
@@ -165,6 +166,44 @@ def _surface_to_numpy(surface) -> np.ndarray:
     return arr
 
 
+class _FrameCapture:
+    """
+    Captura pygame.Surface -> frame BGR (VIDEO_HEIGHT, VIDEO_WIDTH, 3).
+
+    Le o buffer da surface uma unica vez via surfarray.pixels3d (view, sem
+    copia), troca RGB->BGR e transpoe por strides, e faz o upscale direto
+    no buffer de saida preallocado. O mesmo buffer e devolvido a cada
+    frame: quem precisar guardar um frame deve copia-lo.
+    """
+
+    def __init__(self, width: int = VIDEO_WIDTH, height: int = VIDEO_HEIGHT):
+        self.width = width
+        self.height = height
+        self.buffer = np.empty((height, width, 3), dtype=np.uint8)
+
+    def capture(self, surface) -> np.ndarray:
+        import pygame
+        import cv2
+
+        pixels = None
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)   # (W, H, 3) RGB, trava a surface
+            src = pixels.transpose(1, 0, 2)[:, :, ::-1]   # (H, W, 3) BGR, so strides
+        except ValueError:
+            # Surfaces de 8/16 bits nao expoem view; cai na copia antiga
+            src = _surface_to_numpy(surface)[:, :, ::-1]
+        try:
+            if src.shape[0] == self.height and src.shape[1] == self.width:
+                np.copyto(self.buffer, src)
+            else:
+                cv2.resize(src, (self.width, self.height), dst=self.buffer,
+                           interpolation=cv2.INTER_LINEAR)
+        finally:
+            # Solta a view antes de qualquer blit posterior na surface
+            del src, pixels
+        return self.buffer
+
+
 
 
 
@@ -200,13 +239,13 @@ class FightRecorder:
         self.winner = None
         self.duration = 0.0
         self.total_frames = 0
+        self._frame_capture = None  # buffer BGR reutilizado entre frames
         self.fight_ended_at = None  # timestamp quando vencedor Ã© declarado
         self.video_file = None      # caminho do vÃ­deo gerado
 
     def record(self) -> "FightRecorder":
         """Executa a luta e grava frames direto em MP4 (streaming). Retorna self."""
         import pygame
-        import cv2
         import time as _time
 
         _setup_headless()
@@ -261,11 +300,7 @@ class FightRecorder:
             audio_capture.start()
 
             # Abre VideoWriter na resoluÃ§Ã£o HD de saÃ­da (1080Ã—1920)
-            fourcc = cv2.VideoWriter_fourcc(*VIDEO_CODEC)
-            writer = cv2.VideoWriter(silent_video, fourcc, VIDEO_FPS,
-                                     (VIDEO_WIDTH, VIDEO_HEIGHT))
-            if not writer.isOpened():
-                raise RuntimeError(f"Falha ao abrir VideoWriter: {silent_video}")
+            writer = self._open_video_writer(silent_video)
 
             dt = 1.0 / VIDEO_FPS
             elapsed = 0.0
@@ -394,13 +429,8 @@ class FightRecorder:
             # Fade out final
             if self.total_frames > 0:
                 # Captura Ãºltimo frame para fade
-                last_rgb = self._render_frame(sim, render_surface, None)
-                for i in range(fade_frames):
-                    alpha = 1.0 - (i / max(1, fade_frames))
-                    faded = (last_rgb * alpha).astype(np.uint8)
-                    bgr = cv2.cvtColor(faded, cv2.COLOR_RGB2BGR)
-                    writer.write(bgr)
-                    self.total_frames += 1
+                last_bgr = self._render_frame(sim, render_surface, None)
+                self._write_fade_out(writer, last_bgr, fade_frames)
 
             self.duration = prelude_elapsed + elapsed
             self.video_file = self.output_path
@@ -418,15 +448,43 @@ class FightRecorder:
             except Exception as _e:  # E02 Sprint 12
                 import logging as _lg; _lg.getLogger('video_pipeline').debug('pygame cleanup (nÃ£o-fatal): %s', _e)
 
-        # === PÃ“S-PROCESSAMENTO: ÃUDIO ===
-        if self.total_frames > 0 and audio_capture.events:
+        self._finalize_video(writer, silent_video, audio_capture.events)
+
+        return self
+
+    def _open_video_writer(self, silent_video: str):
+        """
+        Abre o writer de frames BGR. Com ffmpeg disponivel usa o pipe
+        (H.264 final num unico encode); senao cv2.VideoWriter + re-encode.
+        """
+        import cv2
+        from pipeline_video.video_encoder import FFmpegPipeEncoder, ffmpeg_available
+
+        if ffmpeg_available():
+            writer = FFmpegPipeEncoder(silent_video, VIDEO_WIDTH, VIDEO_HEIGHT, VIDEO_FPS)
+        else:
+            fourcc = cv2.VideoWriter_fourcc(*VIDEO_CODEC)
+            writer = cv2.VideoWriter(silent_video, fourcc, VIDEO_FPS,
+                                     (VIDEO_WIDTH, VIDEO_HEIGHT))
+        if not writer.isOpened():
+            raise RuntimeError(f"Falha ao abrir VideoWriter: {silent_video}")
+        return writer
+
+    def _finalize_video(self, writer, silent_video: str, audio_events) -> None:
+        """Mixa o audio capturado e produz self.output_path a partir do video silencioso."""
+        from pipeline_video.video_encoder import FFmpegPipeEncoder
+
+        if isinstance(writer, FFmpegPipeEncoder):
+            self._finalize_piped_video(writer, silent_video, audio_events)
+            return
+
+        if self.total_frames > 0 and audio_events:
             from pipeline_video.audio_mixer import mix_audio_track, mux_video_audio, reencode_silent_video
-            import tempfile
 
             wav_path = self.output_path.replace(".mp4", "_audio.wav")
             total_duration = self.total_frames / VIDEO_FPS
 
-            if mix_audio_track(audio_capture.events, total_duration, wav_path):
+            if mix_audio_track(audio_events, total_duration, wav_path):
                 if mux_video_audio(silent_video, wav_path, self.output_path,
                                   expected_duration_s=total_duration):
                     # Limpa arquivos temporÃ¡rios
@@ -462,7 +520,34 @@ class FightRecorder:
                 try: os.remove(silent_video)
                 except OSError: pass
 
-        return self
+    def _finalize_piped_video(self, writer, silent_video: str, audio_events) -> None:
+        """Video ja em H.264 final: so mux do audio com copia do stream, ou rename."""
+        if writer.failed:
+            _log.error("Video nao gerado: %s", writer.error)
+            return
+        if not os.path.exists(silent_video):
+            return
+        if self.total_frames > 0 and audio_events:
+            from pipeline_video.audio_mixer import mix_audio_track, mux_video_audio
+
+            wav_path = self.output_path.replace(".mp4", "_audio.wav")
+            total_duration = self.total_frames / VIDEO_FPS
+            if (mix_audio_track(audio_events, total_duration, wav_path)
+                    and mux_video_audio(silent_video, wav_path, self.output_path,
+                                        expected_duration_s=total_duration,
+                                        copy_video=True)):
+                for path in (silent_video, wav_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                return
+            _log.warning("Falha no audio - mantendo video sem som")
+            try:
+                os.remove(wav_path)
+            except OSError:
+                pass
+        os.replace(silent_video, self.output_path)
 
     def _get_intro_duration(self) -> float:
         if self.story_mode == "roleta_status" and self.roulette_story:
@@ -498,9 +583,13 @@ class FightRecorder:
         return raw_dt * getattr(sim, "time_scale", 1.0)
 
     def _render_frame(self, sim, render_surface, post_victory_progress, intro_progress=None, story_time=None) -> np.ndarray:
-        """Renderiza 1 frame â†’ numpy RGB (VIDEO_HEIGHT, VIDEO_WIDTH, 3)."""
+        """
+        Renderiza 1 frame â†’ numpy BGR (VIDEO_HEIGHT, VIDEO_WIDTH, 3).
+
+        O array devolvido e o buffer interno do recorder e e sobrescrito
+        no proximo frame.
+        """
         import pygame
-        import cv2
 
         # Redireciona rendering para nosso surface
         original_tela = sim.tela
@@ -523,24 +612,28 @@ class FightRecorder:
 
         sim.tela = original_tela
 
-        # Surface â†’ numpy (resoluÃ§Ã£o nativa 540Ã—960)
-        frame = _surface_to_numpy(render_surface)
-
-        # Upscale para resoluÃ§Ã£o HD de saÃ­da (1080Ã—1920)
-        if frame.shape[1] != VIDEO_WIDTH or frame.shape[0] != VIDEO_HEIGHT:
-            frame = cv2.resize(frame, (VIDEO_WIDTH, VIDEO_HEIGHT),
-                               interpolation=cv2.INTER_LINEAR)
-
-        return frame
+        # Surface (nativa 540x960) -> BGR 1080x1920 num unico passe, no buffer reutilizado
+        capture = getattr(self, "_frame_capture", None)
+        if capture is None:
+            capture = self._frame_capture = _FrameCapture()
+        return capture.capture(render_surface)
 
     def _write_frame(self, sim, render_surface, writer, post_victory_progress, intro_progress=None, story_time=None):
         """Renderiza + escreve 1 frame direto no VideoWriter."""
-        import cv2
-        rgb = self._render_frame(sim, render_surface, post_victory_progress, intro_progress, story_time=story_time)
-        bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+        bgr = self._render_frame(sim, render_surface, post_victory_progress, intro_progress, story_time=story_time)
         writer.write(bgr)
         self.total_frames += 1
 
+    def _write_fade_out(self, writer, last_bgr: np.ndarray, fade_frames: int):
+        """Escreve o fade para preto do ultimo frame reaproveitando um buffer."""
+        import cv2
+        faded = np.empty_like(last_bgr)
+        for i in range(fade_frames):
+            alpha = 1.0 - (i / max(1, fade_frames))
+            cv2.convertScaleAbs(last_bgr, dst=faded, alpha=alpha)
+            writer.write(faded)
+            self.total_frames += 1
+
     def _get_ui_font(self, size: int, *, bold: bool = False):
         """Seleciona uma fonte de display legivel e consistente para overlays."""
         import pygame
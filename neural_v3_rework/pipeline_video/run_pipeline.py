@@ -6,6 +6,7 @@ Uso:
     python run_pipeline.py
     python run_pipeline.py --fights 1
     python run_pipeline.py --generation-mode hybrid
+    python run_pipeline.py --fights 6 --workers 3
 """
 
 from __future__ import annotations
@@ -85,6 +86,12 @@ def main() -> None:
         action="store_true",
         help="Desativa rotacao de cobertura de atributos",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("NF_PIPELINE_WORKERS", "1")),
+        help="Processos gravando lutas em paralelo (default: 1 / NF_PIPELINE_WORKERS)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Logging detalhado")
     args = parser.parse_args()
 
@@ -104,6 +111,7 @@ def main() -> None:
         "off" if args.no_coverage_rotation else "on",
     )
     log.info("Encounter mode: %s | Template: %s", args.encounter_mode, args.template or "auto")
+    log.info("Workers: %d", max(1, args.workers))
 
     from pipeline_video.batch_runner import run_batch
 
@@ -118,6 +126,7 @@ def main() -> None:
         fighter1_name=args.fighter1,
         fighter2_name=args.fighter2,
         forced_cenario=args.cenario,
+        workers=args.workers,
     )
 
     if results:
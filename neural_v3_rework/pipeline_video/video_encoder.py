@@ -1,15 +1,26 @@
 ﻿"""
-Video Encoder â€” Converte frames numpy em arquivo MP4 usando OpenCV.
+Video Encoder â€” Converte frames numpy em arquivo MP4.
+
+  - encode_video: lista de frames RGB -> MP4 via OpenCV
+  - FFmpegPipeEncoder: frames BGR em streaming para um ffmpeg de longa
+    duracao (stdin rawvideo), ja no H.264 final, escritos por uma thread
 """
-import os, logging, time
+import os, logging, queue, shutil, subprocess, threading, time
 import numpy as np
 import cv2
 
 from pipeline_video.config import (
     VIDEO_WIDTH, VIDEO_HEIGHT, VIDEO_FPS,
-    VIDEO_CODEC, VIDEO_EXT, OUTPUT_DIR,
+    VIDEO_CODEC, VIDEO_EXT, OUTPUT_DIR, VIDEO_ENCODER_BACKEND,
 )
 
+# ffmpeg bundled via imageio-ffmpeg
+try:
+    import imageio_ffmpeg
+    _ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+except ImportError:
+    _ffmpeg_exe = "ffmpeg"
+
 _log = logging.getLogger("video_encoder")
 
 
@@ -60,3 +71,138 @@ def encode_video(frames: list[np.ndarray], filename: str = None,
 
     return filepath
 
+
+# Parametros H.264 compativeis com Instagram Reels (mesmos do mux em audio_mixer)
+H264_REELS_ARGS = [
+    "-c:v", "libx264",
+    "-preset", "veryfast",
+    "-profile:v", "high",
+    "-level:v", "4.2",
+    "-pix_fmt", "yuv420p",
+    "-b:v", "3500k",
+    "-maxrate", "3500k",
+    "-bufsize", "7000k",
+]
+
+
+def ffmpeg_available() -> bool:
+    """True se o backend ffmpeg pode ser usado (respeita NF_PIPELINE_ENCODER)."""
+    if VIDEO_ENCODER_BACKEND == "opencv":
+        return False
+    return bool(shutil.which(_ffmpeg_exe) or os.path.isfile(_ffmpeg_exe))
+
+
+class FFmpegPipeEncoder:
+    """
+    Encoder de streaming: um unico processo ffmpeg recebe frames BGR crus
+    pelo stdin e grava o MP4 ja em H.264 final - sem video intermediario
+    nem re-encode posterior. O audio, que so e mixado depois da luta,
+    entra por mux com copia do stream de video.
+
+    Mesma interface do cv2.VideoWriter (write / isOpened / release).
+    write() copia o frame para um buffer de um pool fixo e o enfileira;
+    uma thread escreve no pipe enquanto o render segue. A fila e limitada,
+    entao se o ffmpeg ficar para tras o render espera em vez de acumular
+    memoria.
+    """
+
+    def __init__(self, output_path: str, width: int = VIDEO_WIDTH,
+                 height: int = VIDEO_HEIGHT, fps: int = VIDEO_FPS,
+                 queue_size: int = 8, ffmpeg_exe: str = None):
+        self.output_path = output_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.error = None
+        self.frames_written = 0
+
+        self._free = queue.Queue()
+        for _ in range(max(1, queue_size) + 1):
+            self._free.put(np.empty((height, width, 3), dtype=np.uint8))
+        self._pending = queue.Queue(maxsize=max(1, queue_size))
+
+        cmd = [
+            ffmpeg_exe or _ffmpeg_exe,
+            "-y",
+            "-loglevel", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}",
+            "-r", str(fps),
+            "-i", "pipe:0",
+            *H264_REELS_ARGS,
+            "-an",
+            "-movflags", "+faststart",
+            output_path,
+        ]
+        try:
+            self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                          stdout=subprocess.DEVNULL,
+                                          stderr=subprocess.PIPE)
+        except OSError as e:
+            self._proc = None
+            self.error = f"ffmpeg nao pode ser iniciado: {e}"
+            _log.error(self.error)
+            return
+
+        self._thread = threading.Thread(target=self._writer_loop,
+                                        name="ffmpeg-pipe-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def isOpened(self) -> bool:
+        return self._proc is not None and not self.failed
+
+    def write(self, frame: np.ndarray) -> None:
+        """Enfileira 1 frame BGR (H, W, 3). O array pode ser reutilizado pelo chamador."""
+        if self._proc is None:
+            return
+        buf = self._free.get()
+        np.copyto(buf, frame)
+        self._pending.put(buf)
+
+    def _writer_loop(self) -> None:
+        stdin = self._proc.stdin
+        while True:
+            buf = self._pending.get()
+            if buf is None:
+                break
+            if self.error is None:
+                try:
+                    stdin.write(buf.data)
+                    self.frames_written += 1
+                except (BrokenPipeError, OSError) as e:
+                    # Continua drenando a fila para o render nao travar
+                    self.error = f"pipe do ffmpeg fechou: {e}"
+            self._free.put(buf)
+
+    def release(self, timeout: float = None) -> None:
+        """Fecha o stdin, espera o ffmpeg terminar o MP4 e registra falhas em self.error."""
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        self._pending.put(None)
+        self._thread.join()
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            self.error = self.error or "ffmpeg timeout (encode)"
+        stderr = proc.stderr.read().decode("utf-8", "replace") if proc.stderr else ""
+        if proc.stderr:
+            proc.stderr.close()
+        if proc.returncode != 0 and self.error is None:
+            self.error = f"ffmpeg saiu com codigo {proc.returncode}"
+        if self.error:
+            _log.error("Encode via pipe falhou (%s): %s", self.error, stderr[-500:])
+        else:
+            _log.info("Video H.264 gerado via pipe: %s (%d frames)",
+                      self.output_path, self.frames_written)
@@ -9,15 +9,16 @@ V1:
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, deque
 from copy import deepcopy
 from pathlib import Path
 import json
 import math
-import random
 
 from modelos import Arma, Personagem
+from nucleo.contexto import rng_do_contexto
 from nucleo.lutador import Lutador
+from simulacao.sim_effects import TAM_RASTRO_ARMA
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -46,7 +47,7 @@ class MonsterBrain:
         self.monster_data = monster_data
         self._base_brain = base_brain
         self.acao_atual = "APROXIMAR"
-        self.dir_circular = random.choice([-1, 1])
+        self.dir_circular = rng_do_contexto(getattr(lutador, "contexto", None), "spawn").choice([-1, 1])
         self.tracos = []
         self.medo = 0.0
         self.ritmo_combate = 1.0
@@ -207,7 +208,7 @@ class HordeWaveManager:
             lore=f"Monstro de horda: {monster.get('id', 'desconhecido')}",
         )
         personagem.arma_obj = arma
-        lutador = Lutador(personagem, 0, 0, team_id=self.team_id)
+        lutador = Lutador(personagem, 0, 0, team_id=self.team_id, contexto=getattr(self.sim, "contexto", None))
         lutador.brain = MonsterBrain(lutador, monster, lutador.brain)
         lutador.is_monster = True
         lutador.monster_id = monster.get("id")
@@ -223,7 +224,7 @@ class HordeWaveManager:
         lutador.pos[1] = spawn_y
         self.sim.fighters.append(lutador)
         self.sim.teams.setdefault(lutador.team_id, []).append(lutador)
-        self.sim.rastros[lutador] = []
+        self.sim.rastros[lutador] = deque(maxlen=TAM_RASTRO_ARMA)
         self.sim.vida_visual[lutador] = lutador.vida_max
         self.sim._prev_z[lutador] = 0
         self.sim._prev_acao_ai[lutador] = ""
@@ -250,14 +251,15 @@ class HordeWaveManager:
         altura = float(getattr(arena, "altura", 20.0))
         margem_x = max(1.5, largura * 0.42)
         margem_y = max(1.5, altura * 0.42)
-        borda = random.choice(("esquerda", "direita", "topo", "base"))
+        rng = rng_do_contexto(getattr(self.sim, "contexto", None), "spawn")
+        borda = rng.choice(("esquerda", "direita", "topo", "base"))
         if borda == "esquerda":
-            return cx - margem_x, cy + random.uniform(-margem_y, margem_y)
+            return cx - margem_x, cy + rng.uniform(-margem_y, margem_y)
         if borda == "direita":
-            return cx + margem_x, cy + random.uniform(-margem_y, margem_y)
+            return cx + margem_x, cy + rng.uniform(-margem_y, margem_y)
         if borda == "topo":
-            return cx + random.uniform(-margem_x, margem_x), cy - margem_y
-        return cx + random.uniform(-margem_x, margem_x), cy + margem_y
+            return cx + rng.uniform(-margem_x, margem_x), cy - margem_y
+        return cx + rng.uniform(-margem_x, margem_x), cy + margem_y
 
     def _players_alive(self) -> list[Lutador]:
         return [
@@ -19,6 +19,7 @@ from utilitarios.config import (
     COR_UI_BG, COR_TEXTO_TITULO, COR_TEXTO_INFO,
     BUDGET_PARTICULAS_CLASH, BUDGET_PARTICULAS_CLASH_MAGICO,  # A04 Sprint 9
 )
+from utilitarios.rng import rng_vfx
 from efeitos import (Particula, FloatingText, Decal, Shockwave, Camera, EncantamentoEffect,
                      ImpactFlash, MagicClash, BlockEffect, DashTrail, HitSpark,
                      MovementAnimationManager, MovementType,  # v8.0 Movement Animations
@@ -29,10 +30,17 @@ from nucleo.entities import Lutador
 from nucleo.physics import colisao_linha_circulo, intersect_line_circle, colisao_linha_linha, normalizar_angulo
 from nucleo.hitbox import sistema_hitbox, verificar_hit, get_debug_visual, atualizar_debug, DEBUG_VISUAL
 from nucleo.arena import Arena, ARENAS, get_arena, set_arena  # v9.0 Sistema de Arena
+from nucleo.contexto import hitbox_do_contexto, broadphase_do_contexto
+from nucleo.broadphase import GradePontos
 from ia import CombatChoreographer  # Sistema de Coreografia v5.0
 from nucleo.game_feel import GameFeelManager, HitStopManager  # Sistema de Game Feel v8.0
 
 
+# Broad-phase: folga (m) alem dos alcances calculados, para o movimento
+# dentro do frame e os empurroes das iteracoes de fisica
+MARGEM_BROADPHASE = 0.5
+
+
 @dataclass
 class AttackImpactVector:
     dx_px: int
@@ -346,7 +354,7 @@ class SimuladorCombat:
         return True
 
     def _confirmar_hit_ataque_melee(self, atacante, defensor):
-        acertou, _ = verificar_hit(atacante, defensor)
+        acertou, _ = verificar_hit(atacante, defensor, hitbox_do_contexto(getattr(self, "contexto", None)))
         self._registrar_tentativa_ataque_stats(atacante)
         if not acertou:
             return False
@@ -436,12 +444,12 @@ class SimuladorCombat:
     def _aplicar_feedback_visual_super_armor(self, vetor_impacto):
         self.textos.append(FloatingText(vetor_impacto.dx_px, vetor_impacto.dy_px - 60, "ARMOR!", (255, 200, 50), 22))
         for _ in range(8):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(3, 8)
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(3, 8)
             self.particulas.append(Particula(
                 vetor_impacto.dx_px, vetor_impacto.dy_px, (255, 200, 100),
                 math.cos(ang) * vel, math.sin(ang) * vel,
-                random.randint(4, 8), 0.4
+                rng_vfx.randint(4, 8), 0.4
             ))
 
     def _calcular_progresso_animacao_defensiva(self, defensor):
@@ -875,8 +883,34 @@ class SimuladorCombat:
                     continue
                 yield atacante, defensor
 
+    def _grade_combate(self):
+        return broadphase_do_contexto(getattr(self, "contexto", None))
+
+    def _alcance_clash(self, lutador) -> float:
+        """Distancia (m) da ponta da arma ou da borda do escudo ao centro."""
+        alcance = 0.0
+        linha = lutador.get_pos_ponteira_arma()
+        if linha:
+            cx, cy = lutador.pos[0] * PPM, lutador.pos[1] * PPM
+            alcance = max(math.hypot(px - cx, py - cy) for px, py in linha)
+        info = lutador.get_escudo_info()
+        if info:
+            alcance = max(alcance, info[1])
+        return alcance / PPM
+
+    def _iterar_pares_clash(self, fighters):
+        grade = self._grade_combate()
+        if grade is None:
+            yield from self._iterar_pares_lutadores(fighters)
+            return
+        alcance_max = max((self._alcance_clash(f) for f in fighters if not f.morto and f.dados.arma_obj), default=0.0)
+        if alcance_max <= 0:
+            return
+        # Duas armas so se cruzam se os centros estao a ate a soma dos alcances
+        yield from grade.pares(alcance_max * 2 + MARGEM_BROADPHASE)
+
     def _processar_clashes_combate(self, fighters):
-        for a, b in self._iterar_pares_lutadores(fighters):
+        for a, b in self._iterar_pares_clash(fighters):
             if a.morto or b.morto:
                 continue
             if not a.dados.arma_obj or not b.dados.arma_obj:
@@ -888,8 +922,29 @@ class SimuladorCombat:
         self.ativar_slow_motion()
         self.vencedor = self._determinar_vencedor_por_morte(defensor) if hasattr(self, '_determinar_vencedor_por_morte') else atacante.dados.nome
 
+    def _alvos_ao_alcance(self, grade, atacante):
+        """ids dos lutadores que a hitbox do atacante pode alcancar neste frame."""
+        hitbox = hitbox_do_contexto(getattr(self, "contexto", None)).calcular_hitbox_arma(atacante)
+        if not hitbox:
+            return set()
+        cx, cy = hitbox.centro
+        alcance_px = math.hypot(cx - atacante.pos[0] * PPM, cy - atacante.pos[1] * PPM) + hitbox.alcance
+        # Mesma folga de raio do alvo usada em _colisao_lamina_arco (1.2x)
+        raio = alcance_px / PPM + grade.raio_max * 1.2 + MARGEM_BROADPHASE
+        return {id(f) for f in grade.vizinhos(atacante.pos[0], atacante.pos[1], raio, excluir=atacante)}
+
     def _processar_ataques_combate(self, fighters):
+        grade = self._grade_combate()
+        ao_alcance = {}
         for atacante, defensor in self._iterar_ataques_validos(fighters):
+            if grade is not None:
+                if atacante not in ao_alcance:
+                    ao_alcance[atacante] = self._alvos_ao_alcance(grade, atacante)
+                if id(defensor) not in ao_alcance[atacante]:
+                    # Longe demais para a hitbox: so conta a tentativa, como checar_ataque
+                    if self._pode_iniciar_ataque_melee(atacante, defensor, atacante.dados.arma_obj):
+                        self._registrar_tentativa_ataque_stats(atacante)
+                    continue
             morreu = self.checar_ataque(atacante, defensor)
             if morreu:
                 self._finalizar_morte_em_colisoes(atacante, defensor)
@@ -939,11 +994,11 @@ class SimuladorCombat:
         _slots = max(0, 600 - len(self.particulas))
         _n_clash = min(BUDGET_PARTICULAS_CLASH, _slots)
         for _ in range(_n_clash):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(80, 180)
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(80, 180)
             vx = math.cos(ang) * vel / 60
             vy = math.sin(ang) * vel / 60
-            self.particulas.append(Particula(contexto.mx, contexto.my, AMARELO_FAISCA, vx, vy, random.randint(3, 7), 0.5))
+            self.particulas.append(Particula(contexto.mx, contexto.my, AMARELO_FAISCA, vx, vy, rng_vfx.randint(3, 7), 0.5))
 
     def _aplicar_vfx_clash(self, contexto):
         self.magic_clashes.append(MagicClash(contexto.mx, contexto.my, contexto.cor1, contexto.cor2, tamanho=1.2))
@@ -1053,10 +1108,10 @@ class SimuladorCombat:
         contexto.p2.vel[0] += contexto.nx * fator_repulsao
         contexto.p2.vel[1] += contexto.ny * fator_repulsao
 
-    def _resolver_iteracao_fisica_corpos(self, vivos, fator_repulsao):
+    def _resolver_iteracao_fisica_corpos(self, vivos, fator_repulsao, pares=None):
         houve_colisao = False
 
-        for p1, p2 in self._iterar_pares_lutadores(vivos):
+        for p1, p2 in pares if pares is not None else self._iterar_pares_lutadores(vivos):
             contexto = self._criar_contexto_colisao_corpos(p1, p2)
             if not contexto:
                 continue
@@ -1068,8 +1123,16 @@ class SimuladorCombat:
         return houve_colisao
 
     def _executar_passes_fisica_corpos(self, vivos, fator_repulsao, max_iteracoes=3):
+        pares = None
+        grade = self._grade_combate()
+        if grade is not None:
+            # Posicoes mudaram desde o inicio do frame (IA, limites da arena)
+            grade.reindexar()
+            # soma de raio_fisico (tamanho/4) nunca passa de raio_max (tamanho/2)
+            pares = grade.pares(grade.raio_max + MARGEM_BROADPHASE)
+        extra = (pares,) if pares is not None else ()
         for _ in range(max_iteracoes):
-            if not self._resolver_iteracao_fisica_corpos(vivos, fator_repulsao):
+            if not self._resolver_iteracao_fisica_corpos(vivos, fator_repulsao, *extra):
                 break
 
 
@@ -1167,13 +1230,13 @@ class SimuladorCombat:
         _slots = max(0, 600 - len(self.particulas))
         _n_magico = min(BUDGET_PARTICULAS_CLASH_MAGICO, _slots)
         for _ in range(_n_magico):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(80, 200)
-            cor = random.choice([contexto.cor1, contexto.cor2])
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(80, 200)
+            cor = rng_vfx.choice([contexto.cor1, contexto.cor2])
             self.particulas.append(Particula(
                 contexto.mx_px, contexto.my_px, cor,
                 math.cos(ang) * vel / 60, math.sin(ang) * vel / 60,
-                random.randint(4, 8), 0.4
+                rng_vfx.randint(4, 8), 0.4
             ))
 
     
@@ -1208,7 +1271,7 @@ class SimuladorCombat:
             my_px=my * PPM,
             cor1=cor1,
             cor2=cor2,
-            texto=random.choice(textos_clash),
+            texto=rng_vfx.choice(textos_clash),
         )
 
     def _aplicar_vfx_sword_clash(self, contexto):
@@ -1229,17 +1292,17 @@ class SimuladorCombat:
 
     def _emitir_particulas_sword_clash(self, contexto):
         for _ in range(40):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(100, 250)
-            cor = random.choice([AMARELO_FAISCA, BRANCO, contexto.cor1, contexto.cor2, (255, 200, 100)])
+            ang = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(100, 250)
+            cor = rng_vfx.choice([AMARELO_FAISCA, BRANCO, contexto.cor1, contexto.cor2, (255, 200, 100)])
             self.particulas.append(Particula(
                 contexto.mx_px, contexto.my_px, cor,
                 math.cos(ang) * vel / 60, math.sin(ang) * vel / 60,
-                random.randint(3, 7), random.uniform(0.3, 0.6)
+                rng_vfx.randint(3, 7), rng_vfx.uniform(0.3, 0.6)
             ))
 
     def _aplicar_hit_spark_sword_clash(self, contexto):
-        direcao_faiscas = random.uniform(0, math.pi * 2)
+        direcao_faiscas = rng_vfx.uniform(0, math.pi * 2)
         self.hit_sparks.append(HitSpark(contexto.mx_px, contexto.my_px, AMARELO_FAISCA, direcao_faiscas, 1.5))
 
     
@@ -1302,8 +1365,47 @@ class SimuladorCombat:
                 if self._projeteis_colidem_para_clash(contexto):
                     self._executar_clash_magico(contexto.proj1, contexto.proj2)
     
+    def _coletar_fontes_clash_por_time(self, fighters):
+        """(fontes, times): projeteis ativos e orbes disparando de cada lutador, na ordem dos lutadores."""
+        por_dono = {}
+        for proj in getattr(self, 'projeteis', []):
+            if getattr(proj, 'ativo', True):
+                por_dono.setdefault(id(getattr(proj, 'dono', None)), []).append(proj)
+        fontes = []
+        times = []
+        for lutador in fighters:
+            grupo = por_dono.get(id(lutador), []) + self._coletar_orbes_disparando(lutador)
+            fontes.extend(grupo)
+            times.extend([getattr(lutador, 'team_id', id(lutador))] * len(grupo))
+        return fontes, times
+
+    def _processar_clash_projeteis_multitime(self, fighters):
+        """
+        Clash entre fontes de times diferentes, para qualquer numero de
+        times. A grade de pontos so devolve pares ao alcance; com dois
+        lutadores a ordem dos pares e a mesma de grupo_p1 x grupo_p2.
+        """
+        fontes, times = self._coletar_fontes_clash_por_time(fighters)
+        if len(set(times)) < 2:
+            return
+        grade = GradePontos(fontes)
+        for i, j in grade.pares(grade.raio_max * 2 + 0.3):
+            if times[i] == times[j]:
+                continue
+            proj1, proj2 = fontes[i], fontes[j]
+            if not self._projeteis_ativos_para_clash(proj1, proj2):
+                continue
+            contexto = self._criar_contexto_clash_projeteis(proj1, proj2)
+            if self._projeteis_colidem_para_clash(contexto):
+                self._executar_clash_magico(contexto.proj1, contexto.proj2)
+
     def _verificar_clash_projeteis(self):
         """Verifica colisÃ£o entre projÃ©teis de diferentes donos"""
+        fighters = getattr(self, 'fighters', None)
+        if fighters:
+            self._processar_clash_projeteis_multitime(fighters)
+            return
+
         p1 = getattr(self, 'p1', None)
         p2 = getattr(self, 'p2', None)
         if not p1 or not p2:
@@ -1502,8 +1604,8 @@ class SimuladorCombat:
 
     def _emitir_particulas_bloqueio(self, contexto):
         for _ in range(12):
-            vx = math.cos(contexto.ang_impacto + random.uniform(-0.5, 0.5)) * random.uniform(3, 8)
-            vy = math.sin(contexto.ang_impacto + random.uniform(-0.5, 0.5)) * random.uniform(3, 8)
+            vx = math.cos(contexto.ang_impacto + rng_vfx.uniform(-0.5, 0.5)) * rng_vfx.uniform(3, 8)
+            vy = math.sin(contexto.ang_impacto + rng_vfx.uniform(-0.5, 0.5)) * rng_vfx.uniform(3, 8)
             self.particulas.append(Particula(contexto.proj_x_px, contexto.proj_y_px, AMARELO_FAISCA, vx, vy, 3, 0.3))
 
     def _registrar_esquiva_stats(self, desviador):
@@ -1513,7 +1615,7 @@ class SimuladorCombat:
     def _criar_contexto_visual_desvio_dash(self, desviador):
         trilha_posicoes = []
         if hasattr(desviador, 'pos_historico') and len(desviador.pos_historico) > 2:
-            trilha_posicoes = [(p[0] * PPM, p[1] * PPM) for p in desviador.pos_historico[-8:]]
+            trilha_posicoes = [(p[0] * PPM, p[1] * PPM) for p in list(desviador.pos_historico)[-8:]]
 
         return DashDodgeVisualContext(
             pos_x_px=desviador.pos[0] * PPM,
@@ -4,7 +4,6 @@ import logging
 _log = logging.getLogger("simulacao")  # QC-02
 import json
 import math
-import random
 import sys
 import os
 
@@ -17,6 +16,7 @@ from utilitarios.config import (
     AZUL_MANA, COR_CORPO, COR_P1, COR_P2, COR_FUNDO, COR_GRID,
     COR_UI_BG, COR_TEXTO_TITULO, COR_TEXTO_INFO,
 )
+from utilitarios.rng import rng_vfx
 from efeitos import (Particula, FloatingText, Decal, Shockwave, Camera, EncantamentoEffect,
                      ImpactFlash, MagicClash, BlockEffect, DashTrail, HitSpark,
                      MovementAnimationManager, MovementType,  # v8.0 Movement Animations
@@ -31,6 +31,9 @@ from ia import CombatChoreographer  # Sistema de Coreografia v5.0
 from nucleo.game_feel import GameFeelManager, HitStopManager  # Sistema de Game Feel v8.0
 
 
+TAM_RASTRO_ARMA = 10  # pontos do rastro da lamina por lutador
+
+
 class SimuladorEffects:
     """Mixin de efeitos visuais: partÃ­culas, trails, colisÃµes, slow motion."""
 
@@ -51,7 +54,7 @@ class SimuladorEffects:
         - Limiar de efeitos visuais reduzido de 5 â†’ 2 (mais responsivo)
         """
         # Limiar mÃ­nimo para processar a colisÃ£o (muito leve = deslizamento)
-        if intensidade_colisao < 2:
+        if intensidade_colisao < 2 or self.modo_headless:
             return
         
         # === COOLDOWN DE SOM POR LUTADOR ===
@@ -114,17 +117,17 @@ class SimuladorEffects:
         
         num_particulas = int(5 + intensidade * 10)
         for _ in range(num_particulas):
-            angulo = random.uniform(0, math.pi * 2)
-            vel = random.uniform(30, 80) * intensidade
+            angulo = rng_vfx.uniform(0, math.pi * 2)
+            vel = rng_vfx.uniform(30, 80) * intensidade
             # Particula(x, y, cor, vel_x, vel_y, tamanho, vida_util)
             self.particulas.append(Particula(
-                x_px + random.uniform(-15, 15),
-                y_px + random.uniform(-15, 15),
+                x_px + rng_vfx.uniform(-15, 15),
+                y_px + rng_vfx.uniform(-15, 15),
                 cor_parede,
                 math.cos(angulo) * vel,
                 math.sin(angulo) * vel,
-                random.uniform(3, 6),
-                random.uniform(0.2, 0.5)
+                rng_vfx.uniform(3, 6),
+                rng_vfx.uniform(0.2, 0.5)
             ))
         
         # Shake da cÃ¢mera proporcional Ã  intensidade (v15.0: reduzido)
@@ -234,6 +237,8 @@ class SimuladorEffects:
 
     def _spawn_particulas_efeito(self, x, y, efeito):
         """Spawna partÃ­culas especÃ­ficas do efeito - v2.0 COLOSSAL"""
+        if self.modo_headless:
+            return
         cores_part = {
             # Fogo
             "QUEIMAR": (255, 100, 0),
@@ -298,10 +303,10 @@ class SimuladorEffects:
                 qtd = 18
             
             for _ in range(qtd):
-                vx = random.uniform(-8, 8)
-                vy = random.uniform(-8, 8)
-                tamanho = random.randint(3, 7)
-                vida = random.uniform(0.4, 0.8)
+                vx = rng_vfx.uniform(-8, 8)
+                vy = rng_vfx.uniform(-8, 8)
+                tamanho = rng_vfx.randint(3, 7)
+                vida = rng_vfx.uniform(0.4, 0.8)
                 self.particulas.append(Particula(x, y, cor, vx, vy, tamanho, vida))
 
     
@@ -405,7 +410,7 @@ class SimuladorEffects:
             vel_magnitude = math.hypot(lutador.vel[0], lutador.vel[1])
             if vel_magnitude > 12.0 and z_atual <= 0.1 and self.movement_anims:
                 # Correndo rÃ¡pido no chÃ£o
-                if random.random() < 0.15:  # NÃ£o spammar efeitos
+                if rng_vfx.random() < 0.15:  # NÃ£o spammar efeitos
                     direcao = math.atan2(lutador.vel[1], lutador.vel[0])
                     self.movement_anims.criar_sprint_effect(lutador, direcao)
             
@@ -456,20 +461,25 @@ class SimuladorEffects:
 
 
     def atualizar_rastros(self):
+        if self.modo_headless:
+            return
         for p in [self.p1, self.p2]:
-            if p.morto: self.rastros[p] = []; continue
+            # Ring buffer fixo por lutador: limpa/reaproveita em vez de recriar a lista
+            rastro = self.rastros[p]
+            if p.morto: rastro.clear(); continue
             if p.atacando and p.dados.arma_obj and "Reta" in p.dados.arma_obj.tipo:
                 coords = p.get_pos_ponteira_arma()
-                if coords: self.rastros[p].append((coords[1], coords[0]))
-            else: self.rastros[p] = []
-            if len(self.rastros[p]) > 10: self.rastros[p].pop(0)
+                if coords: rastro.append((coords[1], coords[0]))
+            else: rastro.clear()
 
 
     def spawn_particulas(self, x, y, dir_x, dir_y, cor, qtd):
+        if self.modo_headless:
+            return
         for _ in range(qtd):
-            vx = dir_x * random.uniform(2, 12) + random.uniform(-4, 4)
-            vy = dir_y * random.uniform(2, 12) + random.uniform(-4, 4)
-            self.particulas.append(Particula(x*PPM, y*PPM, cor, vx, vy, random.randint(3, 8)))
+            vx = dir_x * rng_vfx.uniform(2, 12) + rng_vfx.uniform(-4, 4)
+            vy = dir_y * rng_vfx.uniform(2, 12) + rng_vfx.uniform(-4, 4)
+            self.particulas.append(Particula(x*PPM, y*PPM, cor, vx, vy, rng_vfx.randint(3, 8)))
 
 
     def ativar_slow_motion(self):
@@ -20,7 +20,8 @@ from utilitarios.config import (
     COR_UI_BG, COR_TEXTO_TITULO, COR_TEXTO_INFO,
 )
 from utilitarios.estado_espectador import resolver_badges_estado, resolver_destaque_cinematico
-from efeitos import (Particula, FloatingText, Decal, Shockwave, Camera, EncantamentoEffect,
+from utilitarios.frame_profiler import FrameProfiler
+from efeitos import (Particula, ParticleSystem, FloatingText, Decal, Shockwave, Camera, EncantamentoEffect,
                      ImpactFlash, MagicClash, BlockEffect, DashTrail, HitSpark,
                      MovementAnimationManager, MovementType,  # v8.0 Movement Animations
                      AttackAnimationManager, calcular_knockback_com_forca, get_impact_tier,  # v8.0 Attack Animations
@@ -32,6 +33,8 @@ from nucleo.armas import inferir_familia, resolver_subtipo_orbital
 from nucleo.physics import colisao_linha_circulo, intersect_line_circle, colisao_linha_linha, normalizar_angulo
 from nucleo.hitbox import sistema_hitbox, verificar_hit, get_debug_visual, atualizar_debug, DEBUG_VISUAL
 from nucleo.arena import Arena, ARENAS, get_arena, set_arena  # v9.0 Sistema de Arena
+from nucleo.contexto import hitbox_do_contexto
+from simulacao.surface_pool import SurfacePool, SpriteAtlas
 
 # v13.0: Paleta de cores por time para rendering multi-fighter
 CORES_TIME_RENDER = [
@@ -414,21 +417,19 @@ class SimuladorRenderer:
             cls._font_cache[key] = pygame.font.SysFont(name, size, bold=bold)
         return cls._font_cache[key]
 
-    # â”€â”€ SURFACE CACHE (A01) â”€â”€â”€ evita alocar pygame.Surface(SRCALPHA) todo frame
-    # Chave: (width, height, flags). fill() limpa sem realocar memÃ³ria.
-    _surface_cache: dict = {}
+    # -- SURFACE POOL (A01) --- evita alocar pygame.Surface(SRCALPHA) todo frame
+    # Buckets de tamanho num LRU com teto de memoria (ver simulacao/surface_pool.py).
+    _surface_pool = SurfacePool()
+    # Glows/aneis ja desenhados por (cor, raio, alpha) quantizados
+    _sprite_atlas = SpriteAtlas()
+    # Instancia inativa para quem nao passou pelos defaults do Simulador;
+    # _initialize_runtime_service_refs cria uma por Simulador
+    profiler = FrameProfiler()
 
     @classmethod
     def _get_surface(cls, width: int, height: int, flags: int = 0) -> "pygame.Surface":
-        """Retorna Surface cacheada e limpa (fill transparente). Usar apenas na thread pygame."""
-        key = (width, height, flags)
-        surf = cls._surface_cache.get(key)
-        if surf is None:
-            surf = pygame.Surface((width, height), flags)
-            cls._surface_cache[key] = surf
-        else:
-            surf.fill((0, 0, 0, 0))
-        return surf
+        """Retorna Surface do pool, limpa (fill transparente). Usar apenas na thread pygame."""
+        return cls._surface_pool.get(width, height, flags)
 
     def _cor_com_alpha(self, cor, alpha):
         rgb = tuple(int(max(0, min(255, c))) for c in cor[:3])
@@ -665,17 +666,9 @@ class SimuladorRenderer:
 
     def _desenhar_glow_circular(self, x, y, raio, cor, alpha, layers=4):
         raio = int(max(2, raio))
-        for idx in range(layers, 0, -1):
-            layer_r = int(raio * (0.45 + idx / layers))
-            layer_alpha = alpha * (idx / layers) * 0.32
-            surf = self._get_surface(layer_r * 2 + 6, layer_r * 2 + 6, pygame.SRCALPHA)
-            pygame.draw.circle(
-                surf,
-                self._cor_com_alpha(cor, layer_alpha),
-                (layer_r + 3, layer_r + 3),
-                layer_r,
-            )
-            self.tela.blit(surf, (int(x) - layer_r - 3, int(y) - layer_r - 3))
+        sprite = self._sprite_atlas.glow(raio, cor, alpha, layers)
+        meio = sprite.get_width() // 2
+        self.tela.blit(sprite, (int(x) - meio, int(y) - meio))
 
     def _desenhar_sigilo_magico(self, x, y, raio, paleta, tempo, intensidade=1.0):
         raio = int(max(6, raio))
@@ -1461,15 +1454,11 @@ class SimuladorRenderer:
             phase = (contexto.pulse_time * (1.5 + i * 0.45) + i * 0.21) % 1.0
             ring_r = int(contexto.ar * (0.25 + phase * 0.75))
             if 4 < ring_r < contexto.ar:
-                ring = self._get_surface(ring_r * 2 + 8, ring_r * 2 + 8, pygame.SRCALPHA)
-                pygame.draw.circle(
-                    ring,
-                    self._cor_com_alpha(contexto.paleta["spark"], (130 if contexto.ativo else 95) * (1.0 - phase)),
-                    (ring_r + 4, ring_r + 4),
-                    ring_r,
-                    2,
+                ring = self._sprite_atlas.anel(
+                    ring_r, contexto.paleta["spark"], (130 if contexto.ativo else 95) * (1.0 - phase), 2
                 )
-                self.tela.blit(ring, (contexto.ax - ring_r - 4, contexto.ay - ring_r - 4))
+                meio = ring.get_width() // 2
+                self.tela.blit(ring, (contexto.ax - meio, contexto.ay - meio))
 
     def _desenhar_marcadores_area_magica(self, contexto):
         marker_count = max(6, contexto.perfil["marcas"] + (2 if contexto.ativo and contexto.cataclismo else 0))
@@ -2539,7 +2528,12 @@ class SimuladorRenderer:
                 self._desenhar_beam_magico(beam, contexto.pulse_time)
 
     def _desenhar_particulas_frame(self, contexto):
-        for p in getattr(self, 'particulas', ()):
+        particulas = getattr(self, 'particulas', ())
+        if isinstance(particulas, ParticleSystem):
+            # Pool NumPy: um unico blits() com sprites cacheados
+            particulas.draw(self.tela, self.cam)
+            return
+        for p in particulas:
             sx, sy = self.cam.converter(p.x, p.y); tam = self.cam.converter_tam(p.tamanho)
             # v15.0: PartÃ­culas com glow melhorado
             life_alpha = max(0, min(255, int(255 * max(0, p.vida))))
@@ -2773,24 +2767,64 @@ class SimuladorRenderer:
         if self.show_analysis: self.desenhar_analise()
 
     def desenhar(self):
-        contexto = self._criar_contexto_render_frame()
-        self._desenhar_fundo_frame(contexto)
-        self._desenhar_camadas_magicas_frame(contexto)
-        self._desenhar_particulas_frame(contexto)
-        self._desenhar_invocacoes_traps_frame(contexto)
-        self._desenhar_lutadores_frame(contexto)
-        self._desenhar_projeteis_frame(contexto)
-        self._desenhar_orbes_frame(contexto)
-        self._desenhar_efeitos_frame(contexto)
-        self._desenhar_interface_frame(contexto)
+        self.profiler.medir("desenhar", self._desenhar_fases)
+        if getattr(self, "show_profiler", False):
+            self._desenhar_overlay_profiler()
+
+    def _desenhar_fases(self):
+        medir = self.profiler.medir
+        contexto = medir("desenhar/contexto", self._criar_contexto_render_frame)
+        medir("desenhar/fundo", self._desenhar_fundo_frame, contexto)
+        medir("desenhar/camadas_magicas", self._desenhar_camadas_magicas_frame, contexto)
+        medir("desenhar/particulas", self._desenhar_particulas_frame, contexto)
+        medir("desenhar/invocacoes_traps", self._desenhar_invocacoes_traps_frame, contexto)
+        medir("desenhar/lutadores", self._desenhar_lutadores_frame, contexto)
+        medir("desenhar/projeteis", self._desenhar_projeteis_frame, contexto)
+        medir("desenhar/orbes", self._desenhar_orbes_frame, contexto)
+        medir("desenhar/efeitos", self._desenhar_efeitos_frame, contexto)
+        medir("desenhar/interface", self._desenhar_interface_frame, contexto)
+
+    def _desenhar_overlay_profiler(self):
+        """Tabela p50/p95/max por fase (F3); refeita a cada 0.5 s."""
+        agora = pygame.time.get_ticks()
+        cache = getattr(self, "_overlay_profiler_cache", None)
+        if cache is None or agora - cache[0] >= 500:
+            stats = self.profiler.stats()
+            # Totais primeiro, depois o resto pelo p95
+            nomes = [n for n in ("update", "desenhar") if n in stats]
+            nomes += sorted((n for n in stats if n not in ("update", "desenhar")),
+                            key=lambda n: -stats[n]["p95_ms"])[:18]
+            fonte = self._get_font("Consolas", 13)
+            linhas = ["%-26s %6s %6s %6s" % ("fase (ms)", "p50", "p95", "max")]
+            linhas += [
+                "%-26s %6.2f %6.2f %6.2f" % (n[:26], stats[n]["p50_ms"], stats[n]["p95_ms"], stats[n]["max_ms"])
+                for n in nomes
+            ]
+            painel = pygame.Surface((300, 8 + 16 * len(linhas)), pygame.SRCALPHA)
+            painel.fill((6, 10, 16, 200))
+            for i, texto in enumerate(linhas):
+                cor = (255, 220, 120) if i == 0 else (210, 225, 235)
+                painel.blit(fonte.render(texto, True, cor), (8, 4 + 16 * i))
+            cache = self._overlay_profiler_cache = (agora, painel)
+        self.tela.blit(cache[1], (10, self.screen_height - cache[1].get_height() - 10))
 
 
     def desenhar_grid(self):
         start_x = int((-self.cam.x * self.cam.zoom) % (50 * self.cam.zoom))
         start_y = int((-self.cam.y * self.cam.zoom) % (50 * self.cam.zoom))
         step = int(50 * self.cam.zoom)
-        for x in range(start_x, self.screen_width, step): pygame.draw.line(self.tela, COR_GRID, (x, 0), (x, self.screen_height))
-        for y in range(start_y, self.screen_height, step): pygame.draw.line(self.tela, COR_GRID, (0, y), (self.screen_width, y))
+        # As linhas so dependem do passo: desenha uma vez (uma celula a mais
+        # em cada eixo) e a cada frame so desloca o blit
+        chave = (step, self.screen_width, self.screen_height)
+        cache = getattr(self, "_grid_cache", None)
+        if cache is None or cache[0] != chave:
+            grid = pygame.Surface((self.screen_width + step, self.screen_height + step))
+            grid.fill(COR_FUNDO)
+            for x in range(0, grid.get_width(), step): pygame.draw.line(grid, COR_GRID, (x, 0), (x, grid.get_height()))
+            for y in range(0, grid.get_height(), step): pygame.draw.line(grid, COR_GRID, (0, y), (grid.get_width(), y))
+            grid.set_colorkey(COR_FUNDO, pygame.RLEACCEL)
+            cache = self._grid_cache = (chave, grid)
+        self.tela.blit(cache[1], (start_x - step, start_y - step))
 
     def _desenhar_overlay_horda(self):
         manager = getattr(self, "horde_manager", None)
@@ -4935,7 +4969,7 @@ class SimuladorRenderer:
         if getattr(lutador, "morto", False):
             return None
 
-        hitbox = sistema_hitbox.calcular_hitbox_arma(lutador)
+        hitbox = hitbox_do_contexto(getattr(self, "contexto", None)).calcular_hitbox_arma(lutador)
         if not hitbox:
             return None
 
@@ -5050,7 +5084,7 @@ class SimuladorRenderer:
 
     def desenhar_hitbox_debug(self):
         """Desenha visualizaÃ§Ã£o de debug das hitboxes"""
-        _ = get_debug_visual()
+        _ = get_debug_visual(hitbox_do_contexto(getattr(self, "contexto", None)))
         fonte = self._get_font("Arial", 10)
 
         for lutador in self.fighters:
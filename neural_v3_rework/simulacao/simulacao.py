@@ -1,10 +1,10 @@
 ﻿import pygame
 import logging
 _log = logging.getLogger("simulacao")  # QC-02
+from collections import deque
 from dataclasses import dataclass
 import json
 import math
-import random
 import sys
 import os
 
@@ -17,7 +17,7 @@ from utilitarios.config import (
     AZUL_MANA, COR_CORPO, COR_P1, COR_P2, COR_FUNDO, COR_GRID,
     COR_UI_BG, COR_TEXTO_TITULO, COR_TEXTO_INFO,
 )
-from efeitos import (Particula, FloatingText, Decal, Shockwave, Camera, EncantamentoEffect,
+from efeitos import (Particula, ParticleSystem, FloatingText, Decal, Shockwave, Camera, CameraHeadless, EncantamentoEffect,
                      ImpactFlash, MagicClash, BlockEffect, DashTrail, HitSpark,
                      MovementAnimationManager, MovementType,  # v8.0 Movement Animations
                      AttackAnimationManager, calcular_knockback_com_forca, get_impact_tier,  # v8.0 Attack Animations
@@ -27,16 +27,20 @@ from nucleo.entities import Lutador
 from nucleo.physics import colisao_linha_circulo, intersect_line_circle, colisao_linha_linha, normalizar_angulo
 from nucleo.hitbox import sistema_hitbox, verificar_hit, get_debug_visual, atualizar_debug, DEBUG_VISUAL
 from nucleo.arena import Arena, ARENAS, get_arena, set_arena  # v9.0 Sistema de Arena
+from nucleo.contexto import ContextoSimulacao, hitbox_do_contexto, team_manager_do_contexto, broadphase_do_contexto
+from nucleo.broadphase import GradeEspacial, GradePontos
 from ia import CombatChoreographer  # Sistema de Coreografia v5.0
 from nucleo.game_feel import GameFeelManager, HitStopManager  # Sistema de Game Feel v8.0
 from utilitarios.estado_espectador import resolver_destaque_cinematico
 from utilitarios.encounter_config import normalize_match_config
+from utilitarios.frame_profiler import FrameProfiler
+from utilitarios.rng import RNGPartida, rng_vfx
 from simulacao.horde_runtime import HordeWaveManager
 
 # â”€â”€ Mixin imports â”€â”€
 from simulacao.sim_renderer import SimuladorRenderer
 from simulacao.sim_combat import SimuladorCombat
-from simulacao.sim_effects import SimuladorEffects
+from simulacao.sim_effects import SimuladorEffects, TAM_RASTRO_ARMA
 
 
 @dataclass(frozen=True)
@@ -66,6 +70,19 @@ class ProjectileDamageProfile:
 
 class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
 
+    # Modo headless: sem display, fontes, camera real, VFX, particulas ou audio.
+    # Construido via Simulador.headless(); o loop e dirigido por update(dt).
+    modo_headless = False
+    _match_config_override = None
+
+    # Capacidade do pool de particulas (antes: corte em particulas[-600:])
+    MAX_PARTICULAS = 600
+
+    # Hitbox, arena e coordenadores de time desta luta (recriado a cada
+    # recarregar_tudo). None = instancias globais legadas.
+    contexto = None
+    # RNGPartida da luta (_activate_match_rng). None = random do processo.
+    rng = None
 
     def executar(self):
         """Alias legado para entrypoints que ainda chamam executar()."""
@@ -73,6 +90,8 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
 
 
     def run(self):
+        if self.modo_headless:
+            raise RuntimeError("Simulador headless nao possui loop de display; use update(dt)")
         self._slow_mo_ended = False  # Flag para tocar som de vitÃ³ria uma vez
         while self.rodando:
             try:
@@ -160,6 +179,8 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
             efeito.update(dt * 0.3)
 
     def _prepare_frame_update(self, dt: float) -> FrameUpdateContext:
+        if self.modo_headless:
+            return self._resolve_runtime_frame_dt(dt)
         self._update_runtime_camera_and_debug(dt)
         paused_frame = self._prepare_paused_frame(dt)
         if paused_frame:
@@ -169,7 +190,7 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
 
     def _update_runtime_camera_and_debug(self, dt: float) -> None:
         self.cam.atualizar(dt, self.p1, self.p2, fighters=self.fighters)
-        atualizar_debug(dt)
+        atualizar_debug(dt, hitbox_do_contexto(self.contexto))
 
     def _prepare_paused_frame(self, dt: float):
         if self.paused:
@@ -326,16 +347,53 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         self._initialize_runtime_state_defaults()
         self.recarregar_tudo()
 
+    @classmethod
+    def headless(cls, match_config=None):
+        """
+        Constroi um Simulador apenas com o estado de resolucao de combate.
+
+        Nao chama pygame.init()/display.set_mode nem carrega fontes, audio,
+        VFX de magia, animacoes de movimento/ataque ou particulas. A camera
+        e uma CameraHeadless (limites da arena, sem tracking). Para balance
+        e harness: o chamador avanca a luta com update(dt).
+
+        Com a mesma match_config["seed"] a luta se repete bit a bit. O
+        random do processo so carrega o stream da luta durante a montagem e
+        cada update(); o chamador pode usar random entre frames. Coreografia,
+        game feel e o rng_vfx sao singletons do processo: a reproducao exata
+        pede uma luta por processo, avancada sem intercalar com outra.
+
+        Args:
+            match_config: config da partida; se None, usa AppState.match_config.
+        """
+        sim = cls.__new__(cls)
+        sim.modo_headless = True
+        sim._match_config_override = dict(match_config) if match_config else None
+        sim._bootstrap_headless_runtime()
+        sim._configure_headless_display_runtime()
+        sim._initialize_runtime_state_defaults()
+        sim.recarregar_tudo()
+        return sim
+
     def _bootstrap_pygame_runtime(self) -> None:
         pygame.init()
 
         # Limpa caches de classe que contÃªm objetos pygame invalidados por pygame.quit()
         SimuladorRenderer._font_cache.clear()
 
-        # Reseta sistema de hitbox global (impede referÃªncias a lutadores antigos)
-        from nucleo.hitbox import sistema_hitbox
-        sistema_hitbox.ultimo_ataque_info.clear()
-        sistema_hitbox.hits_registrados = []
+    def _bootstrap_headless_runtime(self) -> None:
+        # Lutador consulta AudioManager/MagicVFXManager direto: instala
+        # versoes mudas/desativadas antes de montar os lutadores.
+        AudioManager.install_silent()
+        MagicVFXManager.desativar()
+
+    def _configure_headless_display_runtime(self) -> None:
+        self.portrait_mode = False
+        self.screen_width = LARGURA
+        self.screen_height = ALTURA
+        self.tela = None
+        self.clock = None
+        self.rodando = True
 
     def _configure_display_runtime(self) -> None:
         # Carrega config primeiro para saber o modo de tela
@@ -362,8 +420,9 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         self._initialize_runtime_service_refs()
 
     def _initialize_runtime_effect_state(self) -> None:
-        self.cam = Camera(self.screen_width, self.screen_height)
-        self.particulas = [] 
+        camera_cls = CameraHeadless if self.modo_headless else Camera
+        self.cam = camera_cls(self.screen_width, self.screen_height)
+        self.particulas = self._novo_pool_particulas()
         self.decals = [] 
         self.textos = [] 
         self.shockwaves = [] 
@@ -381,6 +440,7 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         self.show_hud = True
         self.show_analysis = False
         self.show_hitbox_debug = DEBUG_VISUAL  # Toggle com tecla H
+        self.show_profiler = False  # Toggle com F3 (liga o FrameProfiler junto)
         self.time_scale = 1.0
         self.slow_mo_timer = 0.0
         self.hit_stop_timer = 0.0 
@@ -440,6 +500,9 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         # === SISTEMA DE ÃUDIO v10.0 ===
         self.audio = None
 
+        # Tempos por fase/IA (desligado ate F3 ou profiler.ativar())
+        self.profiler = FrameProfiler()
+
     def _ativar_direcao_cinematica(self, perfil):
         if not isinstance(perfil, dict):
             return
@@ -684,6 +747,7 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
             pygame.K_TAB: lambda: setattr(self, "show_analysis", not self.show_analysis),
             pygame.K_t: lambda: setattr(self, "time_scale", 0.2 if self.time_scale == 1.0 else 1.0),
             pygame.K_f: lambda: setattr(self, "time_scale", 3.0 if self.time_scale == 1.0 else 1.0),
+            pygame.K_F3: self._alternar_profiler,
         }
         action = toggle_actions.get(key)
         if not action:
@@ -692,6 +756,13 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         action()
         return True
 
+    def _alternar_profiler(self) -> None:
+        self.show_profiler = not self.show_profiler
+        if self.show_profiler:
+            self.profiler.ativar()
+        else:
+            self.profiler.desativar()
+
     def _handle_runtime_camera_key(self, key) -> None:
         camera_modes = {
             pygame.K_1: "P1",
@@ -741,12 +812,24 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         except Exception as e:
             # B05: era _log.debug â€” agora visÃ­vel em produÃ§Ã£o
             _log.exception("Erro ao inicializar arena/audio: %s", e)
+        finally:
+            # A montagem rodou no stream da luta (ativar); devolve o random
+            # do processo ate o primeiro update()
+            if self.rng is not None:
+                self.rng.suspender()
 
     def _reload_match_payload(self) -> None:
+        # Contexto novo por luta: hitbox/arena/times nao vazam da luta anterior
+        self.contexto = ContextoSimulacao()
+        self.contexto.profiler = self.profiler
         self.p1, self.p2, self.cenario, _ = self.carregar_luta_dados()
 
+    def _novo_pool_particulas(self):
+        # Headless descarta as particulas no fim do frame: lista simples basta
+        return [] if self.modo_headless else ParticleSystem(self.MAX_PARTICULAS)
+
     def _reset_runtime_state_for_reload(self) -> None:
-        self.particulas = []
+        self.particulas = self._novo_pool_particulas()
         self.decals = []
         self.textos = []
         self.shockwaves = []
@@ -779,7 +862,7 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
                 self.teams[team_id] = []
             self.teams[team_id].append(lutador)
 
-        self.rastros = {lutador: [] for lutador in self.fighters}
+        self.rastros = {lutador: deque(maxlen=TAM_RASTRO_ARMA) for lutador in self.fighters}
         self.vida_visual = {}
         for lutador in self.fighters:
             if lutador:
@@ -796,11 +879,8 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         if self.p1 and self.p2:
             self.choreographer.registrar_lutadores(self.p1, self.p2)
 
-        from ia.team_ai import TeamCoordinatorManager
-
-        TeamCoordinatorManager.reset()
         if self.modo_multi and self.teams and len(self.teams) >= 2:
-            TeamCoordinatorManager.get().initialize(self.fighters, self.teams)
+            team_manager_do_contexto(self.contexto).initialize(self.fighters, self.teams)
 
         GameFeelManager.reset()
         self.game_feel = GameFeelManager.get_instance()
@@ -808,6 +888,11 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         if self.p1 and self.p2:
             self.game_feel.registrar_lutadores(self.p1, self.p2)
 
+        if self.modo_headless:
+            self.movement_anims = None
+            self.attack_anims = None
+            return
+
         MovementAnimationManager.reset()
         self.movement_anims = MovementAnimationManager.get_instance()
         self.movement_anims.set_ppm(PPM)
@@ -820,7 +905,10 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         cenario_nome = getattr(self, 'cenario', 'Arena') or 'Arena'
         if self.modo_multi and cenario_nome == 'Arena':
             cenario_nome = 'Coliseu'
-        self.arena = set_arena(cenario_nome)
+        if self.contexto is not None:
+            self.arena = self.contexto.definir_arena(cenario_nome)
+        else:
+            self.arena = set_arena(cenario_nome)
 
         self.cam.set_arena_bounds(
             self.arena.centro_x,
@@ -840,8 +928,11 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         self._prev_z = {lutador: 0 for lutador in self.fighters}
         self._prev_acao_ai = {lutador: '' for lutador in self.fighters}
 
-        AudioManager.reset()
-        self.audio = AudioManager.get_instance()
+        if self.modo_headless:
+            self.audio = AudioManager.install_silent()
+        else:
+            AudioManager.reset()
+            self.audio = AudioManager.get_instance()
         self._prev_stagger = {lutador: False for lutador in self.fighters}
         self._prev_dash = {lutador: 0 for lutador in self.fighters}
 
@@ -867,6 +958,11 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
             self.horde_manager = HordeWaveManager(self, self.encounter_config.get("horda_config") or {})
             self.horde_manager.start()
 
+        if self.modo_headless:
+            MagicVFXManager.desativar()
+            self.magic_vfx = None
+            return
+
         MagicVFXManager.reset()
         self.magic_vfx = MagicVFXManager.get_instance()
         self.audio.play_special("arena_start", 0.8)
@@ -894,7 +990,10 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         from dados.app_state import AppState
 
         state = AppState.get()
-        config = normalize_match_config(state.match_config)
+        raw_config = self._match_config_override
+        if raw_config is None:
+            raw_config = state.match_config
+        config = normalize_match_config(raw_config)
         teams_config = config.get("teams") or []
         has_duel = bool(config.get("p1_nome") and config.get("p2_nome"))
         has_teams = bool(teams_config)
@@ -907,6 +1006,15 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         self.modo_partida = config.get("modo_partida", "duelo")
         self.campaign_context = dict(config.get("campaign_context") or {})
         self.objective_config = dict(config.get("objective_config") or {})
+        self._activate_match_rng(config.get("seed"))
+
+    def _activate_match_rng(self, seed) -> None:
+        # Antes de montar lutadores e IA: personalidade e spawns ja saem da seed
+        self.rng = RNGPartida(seed)
+        self.rng.ativar()
+        self.seed = self.rng.seed
+        self.contexto.rng = self.rng
+        _log.info("[simulacao] seed da partida: %d", self.seed)
 
     def _create_match_character_resolver(self, state):
         todos = state.characters
@@ -937,7 +1045,7 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
             for nome in team_cfg.get("members", []):
                 dados = montar(nome)
                 if dados:
-                    all_fighters.append(Lutador(dados, 0, 0, team_id=tid))
+                    all_fighters.append(Lutador(dados, 0, 0, team_id=tid, contexto=self.contexto))
 
         if not all_fighters:
             return None
@@ -953,8 +1061,8 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         return l1, l2
 
     def _build_duel_match_payload(self, config, montar):
-        l1 = Lutador(montar(config["p1_nome"]), 5.0, 8.0, team_id=0)
-        l2 = Lutador(montar(config["p2_nome"]), 19.0, 8.0, team_id=1)
+        l1 = Lutador(montar(config["p1_nome"]), 5.0, 8.0, team_id=0, contexto=self.contexto)
+        l2 = Lutador(montar(config["p2_nome"]), 19.0, 8.0, team_id=1, contexto=self.contexto)
         self.fighters = [l1, l2]
         self.modo_partida = "duelo"
         self.modo_multi = False
@@ -974,25 +1082,36 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
 
 
     def update(self, dt):
-        frame = self._prepare_frame_update(dt)
+        if self.rng is None:
+            self.profiler.medir("update", self._update_fases, dt)
+            return
+        with self.rng.em_combate():
+            self.profiler.medir("update", self._update_fases, dt)
+
+    def _update_fases(self, dt):
+        medir = self.profiler.medir
+        frame = medir("update/preparar", self._prepare_frame_update, dt)
         if frame.early_exit:
             return
 
-        self._collect_pending_runtime_objects()
-        self._update_runtime_effects(frame.dt)
-        self._update_magic_vfx_runtime(frame.dt)
-        self._update_projectile_phase(frame.dt)
-        self._update_orb_phase(frame.dt)
-        self._update_area_phase(frame.dt)
-        self._update_beam_phase(frame.dt)
-        self._update_summon_phase(frame.dt)
-        self._update_trap_phase(frame.dt)
-        self._update_transformation_phase(frame.dt)
-        self._update_channel_phase(frame.dt)
-        self._update_active_match_state(frame.dt)
-        self._update_post_frame_systems(frame.dt)
+        medir("update/pendentes", self._collect_pending_runtime_objects)
+        if not self.modo_headless:
+            medir("update/efeitos", self._update_runtime_effects, frame.dt)
+            medir("update/vfx_magia", self._update_magic_vfx_runtime, frame.dt)
+        medir("update/projeteis", self._update_projectile_phase, frame.dt)
+        medir("update/orbes", self._update_orb_phase, frame.dt)
+        medir("update/areas", self._update_area_phase, frame.dt)
+        medir("update/beams", self._update_beam_phase, frame.dt)
+        medir("update/summons", self._update_summon_phase, frame.dt)
+        medir("update/traps", self._update_trap_phase, frame.dt)
+        medir("update/transformacoes", self._update_transformation_phase, frame.dt)
+        medir("update/canalizacoes", self._update_channel_phase, frame.dt)
+        medir("update/partida", self._update_active_match_state, frame.dt)
+        medir("update/pos_frame", self._update_post_frame_systems, frame.dt)
 
     def _update_projectile_phase(self, dt):
+        # Projeteis, orbes e areas consultam a grade com as posicoes deste frame
+        self._reconstruir_broadphase()
         self._process_projectile_clash_phase()
         novos_projeteis = self._run_projectile_updates(dt)
         self._finalize_projectile_phase(novos_projeteis)
@@ -1588,7 +1707,13 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
             self._apply_area_collision_hit(area, alvo, dx, dy, dist)
 
     def _iter_area_collision_targets(self, area):
-        for alvo in self.fighters:
+        grade = broadphase_do_contexto(getattr(self, 'contexto', None))
+        if grade is not None:
+            # raio_fisico (tamanho/4) nunca passa de raio_max (tamanho/2)
+            candidatos = grade.vizinhos(area.x, area.y, area.raio_atual + grade.raio_max)
+        else:
+            candidatos = [alvo for alvo in self.fighters if not alvo.morto]
+        for alvo in candidatos:
             if alvo == area.dono or alvo in area.alvos_atingidos:
                 continue
             dx = alvo.pos[0] - area.x
@@ -1854,6 +1979,9 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         dist = math.hypot(dx, dy) or 1
         lutador.pos[0] = trap.x + (dx / dist) * (trap.largura / 2 + 0.5)
         lutador.pos[1] = trap.y + (dy / dist) * (trap.altura / 2 + 0.5)
+        grade = broadphase_do_contexto(self.contexto)
+        if grade is not None:
+            grade.mover(lutador)
         return dx, dy, dist
 
     def _resolve_trigger_trap_contact(self, trap, lutador) -> None:
@@ -1912,13 +2040,34 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         self.textos.append(FloatingText(trap.x * PPM, trap.y * PPM - 50, "TRAP!", (255, 200, 100), 22))
 
     def _process_projectile_vs_trap_phase(self) -> None:
-        for proj in self.projeteis:
-            self._process_single_projectile_vs_traps(proj)
+        candidatos = self._projectile_trap_candidates()
+        if candidatos is None:
+            for proj in self.projeteis:
+                self._process_single_projectile_vs_traps(proj)
+            return
+        for proj, traps in candidatos:
+            self._process_single_projectile_vs_traps(proj, traps)
+
+    def _projectile_trap_candidates(self):
+        """(projetil, traps que o alcancam) na ordem de self.projeteis e self.traps."""
+        traps = getattr(self, 'traps', None)
+        if not traps or not self.projeteis:
+            return None
+        grade = GradePontos(self.projeteis)
+        por_projetil = {}
+        for trap in traps:
+            if trap.bloqueia_movimento:
+                raio = math.hypot(trap.largura / 2, trap.altura / 2)
+            else:
+                raio = trap.raio_trigger
+            for idx in grade.proximos(trap.x, trap.y, raio):
+                por_projetil.setdefault(idx, []).append(trap)
+        return [(self.projeteis[idx], por_projetil[idx]) for idx in sorted(por_projetil)]
 
-    def _process_single_projectile_vs_traps(self, proj) -> None:
+    def _process_single_projectile_vs_traps(self, proj, traps=None) -> None:
         if not proj.ativo:
             return
-        for trap in self.traps:
+        for trap in self.traps if traps is None else traps:
             if self._resolve_projectile_vs_single_trap(proj, trap):
                 return
 
@@ -2116,11 +2265,12 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
 
     def _update_match_fighter_runtime(self, dt: float) -> None:
         self._aplicar_pressao_ritmo(dt)
+        self._reconstruir_broadphase()
 
         if self.modo_multi:
-            from ia.team_ai import TeamCoordinatorManager
-            TeamCoordinatorManager.get().update(dt, self.fighters)
+            team_manager_do_contexto(self.contexto).update(dt, self.fighters)
 
+        grade = broadphase_do_contexto(self.contexto)
         for lutador in self.fighters:
             if not lutador.morto:
                 inimigo = self._encontrar_inimigo_mais_proximo(lutador)
@@ -2128,6 +2278,9 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
                     lutador.update(dt, inimigo, todos_lutadores=self.fighters)
                 else:
                     lutador.update(dt, None, todos_lutadores=self.fighters)
+                if grade is not None:
+                    # Teleporte/dash podem passar da FOLGA da grade
+                    grade.mover(lutador)
 
         self._atualizar_aliases_principais()
         self._atualizar_direcao_cinematica(dt)
@@ -2175,31 +2328,44 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         return atual + (alvo - atual) * 5 * dt
 
     def _finalize_match_motion_events(self) -> None:
+        if self.modo_headless:
+            return
         self._detectar_eventos_movimento()
 
     def _update_post_frame_systems(self, dt: float) -> None:
+        if self.modo_headless:
+            self._discard_headless_visual_effects()
+            return
+
         if self.movement_anims:
             self.movement_anims.update(dt)
 
         if self.attack_anims:
             self.attack_anims.update(dt)
 
-        max_particulas = 600
-        if len(self.particulas) > max_particulas:
-            self.particulas = self.particulas[-max_particulas:]
-
-        alive_particulas = []
-        for particula in self.particulas:
-            particula.atualizar(dt)
-            if particula.vida <= 0:
-                if particula.cor == VERMELHO_SANGUE and random.random() < 0.3:
-                    self.decals.append(Decal(particula.x, particula.y, particula.tamanho * 2, SANGUE_ESCURO))
-            else:
-                alive_particulas.append(particula)
-        self.particulas = alive_particulas
+        # ParticleSystem ja limita em MAX_PARTICULAS (recicla as mais antigas)
+        particulas = self.particulas
+        mortas = particulas.update(dt)
+        if len(mortas):
+            sangue = mortas[particulas.cor_idx[mortas] == particulas.indice_cor(VERMELHO_SANGUE)]
+            for i in sangue:
+                if rng_vfx.random() < 0.3:
+                    self.decals.append(Decal(float(particulas.x[i]), float(particulas.y[i]),
+                                             float(particulas.tamanho[i]) * 2, SANGUE_ESCURO))
         if len(self.decals) > 100:
             self.decals.pop(0)
 
+    def _discard_headless_visual_effects(self) -> None:
+        # Sem render, efeitos visuais criados pelo combate sao descartados
+        # no fim do frame em vez de atualizados.
+        for attr in (
+            'particulas', 'decals', 'textos', 'shockwaves', 'impact_flashes',
+            'magic_clashes', 'block_effects', 'dash_trails', 'hit_sparks',
+        ):
+            efeitos = getattr(self, attr, None)
+            if efeitos:
+                efeitos.clear()
+
     def _flush_match_stats(self):
         """
         B01: Persiste o stats_collector no BattleDB imediatamente.
@@ -2349,15 +2515,15 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
 
     def _spawn_arena_rain_particles(self) -> None:
         for _ in range(3):
-            rx = random.uniform(0, self.arena.largura) * PPM
-            vy = random.uniform(8, 14) * PPM
+            rx = rng_vfx.uniform(0, self.arena.largura) * PPM
+            vy = rng_vfx.uniform(8, 14) * PPM
             self.particulas.append(Particula(rx, 0, (150, 180, 220), 0, vy, 1, 0.4))
 
     def _spawn_arena_dust_particles(self) -> None:
         for _ in range(2):
-            rx = random.uniform(0, self.arena.largura) * PPM
+            rx = rng_vfx.uniform(0, self.arena.largura) * PPM
             ry = (self.arena.altura - 0.5) * PPM
-            vx = random.uniform(-2, 2) * PPM
+            vx = rng_vfx.uniform(-2, 2) * PPM
             self.particulas.append(Particula(rx, ry, (180, 160, 120), vx, -1, 2, 0.6))
 
     def _registrar_kill(self, morto, killer_nome_fallback):
@@ -2436,6 +2602,9 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
         
         Friendly fire ON: retorna qualquer lutador, incluindo aliados.
         """
+        grade = broadphase_do_contexto(getattr(self, 'contexto', None))
+        if grade is not None:
+            return grade.mais_proximo(x, y, excluir=dono)
         melhor = None
         melhor_dist = float('inf')
         for f in self.fighters:
@@ -2447,8 +2616,17 @@ class Simulador(SimuladorRenderer, SimuladorCombat, SimuladorEffects):
                 melhor = f
         return melhor
     
+    def _reconstruir_broadphase(self) -> None:
+        """Grade espacial do frame: alvo, fisica, combate e IA consultam ela."""
+        contexto = getattr(self, 'contexto', None)
+        if contexto is not None:
+            contexto.broadphase = GradeEspacial(self.fighters)
+
     def _encontrar_inimigo_mais_proximo(self, lutador):
         """Encontra o inimigo vivo mais prÃ³ximo (time diferente)."""
+        grade = broadphase_do_contexto(self.contexto)
+        if grade is not None:
+            return grade.inimigo_mais_proximo(lutador)
         melhor = None
         melhor_dist = float('inf')
         for f in self.fighters:
@@ -0,0 +1,177 @@
+"""
+NEURAL FIGHTS - Pool de Surfaces e Atlas de Sprites
+===================================================
+SurfacePool substitui o dict sem limite do SimuladorRenderer: as surfaces
+temporarias sao agrupadas por bucket de tamanho (um bucket serve varios
+raios proximos), ficam num LRU com teto de memoria e contam hits/misses.
+O chamador recebe uma subsurface do tamanho exato pedido, ja limpa.
+
+SpriteAtlas guarda glows e aneis ja desenhados por (cor, raio, alpha)
+quantizados, entao cada glow custa um unico blit em vez de N fills +
+draws + blits por camada. O alpha pedido dentro do bucket e aplicado
+com set_alpha no blit.
+
+Uso apenas na thread do pygame.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+SURFACE_POOL_MAX_BYTES = 48 * 1024 * 1024
+SPRITE_ATLAS_MAX_BYTES = 48 * 1024 * 1024
+
+# Quantizacao do atlas: 32 niveis por canal de cor, 16 buckets de alpha
+_COR_PASSO = 8
+_ALPHA_PASSO = 16
+
+
+def _bucket(n: int) -> int:
+    """Arredonda n para cima: passo 8 ate 64, depois ~1/8 da potencia de 2."""
+    n = max(1, int(n))
+    passo = max(8, 1 << max(0, n.bit_length() - 3))
+    return (n + passo - 1) // passo * passo
+
+
+def _bucket_raio(raio: int) -> int:
+    """Raio do sprite: exato ate 16, depois erro de no maximo ~6%."""
+    raio = max(1, int(raio))
+    if raio <= 16:
+        return raio
+    passo = 1 << (raio.bit_length() - 4)
+    return (raio + passo // 2) // passo * passo
+
+
+def _quantizar(valor: float, passo: int) -> int:
+    valor = int(max(0, min(255, valor)))
+    return min(255, valor // passo * passo + passo // 2)
+
+
+def _bucket_alpha(alpha: float) -> tuple:
+    """(alpha do sprite, set_alpha do blit): bucket acima e fator <= 255."""
+    alpha = max(0.0, min(255.0, float(alpha)))
+    base = min(255, (int(alpha) // _ALPHA_PASSO + 1) * _ALPHA_PASSO)
+    return base, int(round(255 * alpha / base))
+
+
+class _LRUBytes:
+    """OrderedDict com teto em bytes e contadores de uso."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = int(max_bytes)
+        self._itens: OrderedDict = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def _buscar(self, key):
+        surf = self._itens.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self._itens.move_to_end(key)
+        self.hits += 1
+        return surf
+
+    def _guardar(self, key, surf: "pygame.Surface") -> None:
+        self._itens[key] = surf
+        self.bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        # Nunca descarta a surface recem-criada, mesmo se ela sozinha passar do teto
+        while self.bytes > self.max_bytes and len(self._itens) > 1:
+            _, velha = self._itens.popitem(last=False)
+            self.bytes -= velha.get_width() * velha.get_height() * velha.get_bytesize()
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "itens": len(self._itens),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._itens.clear()
+        self.bytes = 0
+
+
+class SurfacePool(_LRUBytes):
+    """Surfaces de rascunho reaproveitadas por bucket de tamanho."""
+
+    def __init__(self, max_bytes: int = SURFACE_POOL_MAX_BYTES):
+        super().__init__(max_bytes)
+
+    def get(self, width: int, height: int, flags: int = 0) -> "pygame.Surface":
+        """Subsurface (width, height) limpa (transparente em SRCALPHA)."""
+        width, height = int(width), int(height)
+        if width <= 0 or height <= 0:
+            # Fora do pool (e com o mesmo erro de antes para tamanho negativo)
+            return pygame.Surface((width, height), flags)
+        key = (_bucket(width), _bucket(height), flags)
+        base = self._buscar(key)
+        if base is None:
+            base = pygame.Surface(key[:2], flags)
+            self._guardar(key, base)
+            return base.subsurface((0, 0, width, height))
+        surf = base.subsurface((0, 0, width, height))
+        surf.fill((0, 0, 0, 0))
+        return surf
+
+
+class SpriteAtlas(_LRUBytes):
+    """Glows e aneis pre-renderizados, prontos para um blit."""
+
+    def __init__(self, max_bytes: int = SPRITE_ATLAS_MAX_BYTES):
+        super().__init__(max_bytes)
+
+    def glow(self, raio: int, cor, alpha: float, layers: int = 4) -> "pygame.Surface":
+        """
+        Circulos concentricos (mesmas camadas de _desenhar_glow_circular)
+        ja compostos; o centro do sprite e o centro do glow. Como todas as
+        camadas tem a mesma cor, o alpha de cada anel e 1 - prod(1 - a_i)
+        das camadas que o cobrem, igual a empilhar os blits na tela.
+        """
+        raio = _bucket_raio(raio)
+        rgb = tuple(_quantizar(c, _COR_PASSO) for c in cor[:3])
+        base, fator = _bucket_alpha(alpha)
+        layers = max(1, int(layers))
+        key = ("glow", raio, rgb, base, layers)
+        sprite = self._buscar(key)
+        if sprite is None:
+            r_max = int(raio * 1.45)
+            lado = r_max * 2 + 6
+            sprite = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            centro = (lado // 2, lado // 2)
+            transparencia = 1.0
+            for idx in range(layers, 0, -1):
+                layer_r = int(raio * (0.45 + idx / layers))
+                transparencia *= 1.0 - min(255, int(base * (idx / layers) * 0.32)) / 255.0
+                pygame.draw.circle(sprite, (*rgb, int(round(255 * (1.0 - transparencia)))), centro, layer_r)
+            self._guardar(key, sprite)
+        sprite.set_alpha(fator)
+        return sprite
+
+    def anel(self, raio: int, cor, alpha: float, largura: int = 2) -> "pygame.Surface":
+        """Contorno circular; o centro do sprite e o centro do anel."""
+        raio = _bucket_raio(raio)
+        rgb = tuple(_quantizar(c, _COR_PASSO) for c in cor[:3])
+        base, fator = _bucket_alpha(alpha)
+        largura = max(1, int(largura))
+        key = ("anel", raio, rgb, base, largura)
+        sprite = self._buscar(key)
+        if sprite is None:
+            lado = raio * 2 + 8
+            sprite = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*rgb, base), (lado // 2, lado // 2), raio, largura)
+            self._guardar(key, sprite)
+        sprite.set_alpha(fator)
+        return sprite
@@ -21,6 +21,7 @@ from simulacao.sim_combat import (
     SimuladorCombat,
 )
 from utilitarios.config import AMARELO_FAISCA, BRANCO, PPM
+from utilitarios.rng import rng_vfx
 
 
 def _make_fighter(nome, weapon_type="Espada Reta", family=None, team_id=0, x=0.0, y=0.0):
@@ -340,6 +341,43 @@ def test_brain_multi_awareness_collects_entities_and_derived_flags():
     assert awareness["melhor_alvo"] is enemy_a
 
 
+def test_brain_multi_awareness_sees_far_enemies_without_a_configured_radius():
+    from nucleo.broadphase import GradeEspacial
+
+    observer = _make_fighter("Observer", team_id=0, x=0.0, y=0.0)
+    near = _make_fighter("Near", team_id=1, x=4.0, y=0.0)
+    far = _make_fighter("Far", team_id=1, x=45.0, y=0.0)
+    todos = [observer, near, far]
+
+    for contexto in (None, SimpleNamespace(broadphase=GradeEspacial(todos))):
+        observer.contexto = contexto
+        observer.brain._atualizar_multi_awareness(0.016, near, todos)
+        inimigos = {i["lutador"]: i for i in observer.brain.multi_awareness["inimigos"]}
+        assert set(inimigos) == {near, far}
+        assert inimigos[far]["ameaca"] > 0
+
+
+def test_brain_multi_awareness_radius_matches_with_and_without_broadphase(monkeypatch):
+    from ia import brain as brain_mod
+    from nucleo.broadphase import GradeEspacial
+
+    monkeypatch.setattr(brain_mod, "AI_RAIO_CONSCIENCIA_MULTI", 20.0)
+    observer = _make_fighter("Observer", team_id=0, x=0.0, y=0.0)
+    near = _make_fighter("Near", team_id=1, x=4.0, y=0.0)
+    far = _make_fighter("Far", team_id=1, x=25.0, y=0.0)
+    todos = [observer, near, far]
+
+    observer.brain._atualizar_multi_awareness(0.016, near, todos)
+    sem_grade = dict(observer.brain.multi_awareness)
+    observer.contexto = SimpleNamespace(broadphase=GradeEspacial(todos))
+    observer.brain._atualizar_multi_awareness(0.016, near, todos)
+    com_grade = observer.brain.multi_awareness
+
+    for awareness in (sem_grade, com_grade):
+        assert [i["lutador"] for i in awareness["inimigos"]] == [near]
+        assert awareness["num_inimigos_vivos"] == 2
+
+
 def test_brain_multi_awareness_falls_back_to_principal_target_without_enemies():
     observer = _make_fighter("Observer", team_id=0, x=0.0, y=0.0)
     ally = _make_fighter("Ally", team_id=0, x=1.5, y=0.0)
@@ -2285,7 +2323,7 @@ def test_combat_helper_cria_contexto_sword_clash_com_defaults_e_pixels(monkeypat
     p1 = SimpleNamespace(pos=[2.0, 4.0], dados=SimpleNamespace(cor=(10, 20, 30)))
     p2 = SimpleNamespace(pos=[4.0, 6.0], dados=SimpleNamespace())
 
-    monkeypatch.setattr("random.choice", lambda options: "CLANG!")
+    monkeypatch.setattr(rng_vfx, "choice", lambda options: "CLANG!")
 
     contexto = sim._criar_contexto_sword_clash(p1, p2)
 
@@ -2386,6 +2424,25 @@ def test_combat_helper_verifica_clash_projeteis_orquestra_grupos_dos_donos():
     assert calls == [([proj1, sim.p1.buffer_orbes[0]], [proj2, sim.p2.buffer_orbes[0]])]
 
 
+def test_combat_helper_clash_projeteis_entre_todos_os_times():
+    sim = _make_combat_harness()
+    a, aliado_a, b, c = (SimpleNamespace(team_id=t, buffer_orbes=[]) for t in (0, 0, 1, 2))
+    sim.fighters = [a, aliado_a, b, c]
+    proj_a = SimpleNamespace(dono=a, ativo=True, x=0.0, y=0.0, raio=0.2)
+    proj_aliado = SimpleNamespace(dono=aliado_a, ativo=True, x=0.1, y=0.0, raio=0.2)
+    proj_c = SimpleNamespace(dono=c, ativo=True, x=10.2, y=0.0, raio=0.2)
+    proj_b = SimpleNamespace(dono=b, ativo=True, x=10.0, y=0.0, raio=0.2)
+    proj_longe = SimpleNamespace(dono=b, ativo=True, x=30.0, y=0.0, raio=0.2)
+    sim.projeteis = [proj_c, proj_b, proj_a, proj_longe, proj_aliado]
+    calls = []
+
+    sim._executar_clash_magico = lambda p1, p2: calls.append((p1, p2))
+
+    sim._verificar_clash_projeteis()
+
+    assert calls == [(proj_b, proj_c)]
+
+
 def test_combat_helper_detecta_bloqueio_escudo_orbital_retorna_posicao():
     sim = _make_combat_harness()
     proj = SimpleNamespace(x=2.2, y=2.0, raio=0.2)
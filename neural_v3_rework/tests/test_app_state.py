@@ -0,0 +1,153 @@
+import os
+
+import pytest
+
+from dados import app_state as app_state_module
+from dados.app_state import AppState
+from dados.battle_db import BattleDB
+from modelos.characters import Personagem
+from modelos.weapons import Arma
+
+
+def _char(nome, god_id=None):
+    return Personagem(nome, 1.7, 5.0, 5.0, "", 0, 10, 10, 10, "Guerreiro (Força Bruta)", "Agressivo", god_id)
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    for attr, nome in (
+        ("FILE_CHARS", "personagens.json"),
+        ("FILE_WEAPONS", "armas.json"),
+        ("FILE_MATCH", "match_config.json"),
+        ("FILE_TOURNAMENT", "tournament_state.json"),
+        ("FILE_GODS", "gods.json"),
+    ):
+        monkeypatch.setattr(app_state_module, attr, str(tmp_path / nome))
+    db = BattleDB(str(tmp_path / "battle_log.db"))
+    monkeypatch.setattr(BattleDB, "_instance", db)
+    AppState.reset()
+    yield AppState.get()
+    AppState.reset()
+    db.close()
+
+
+def test_character_indexes_follow_every_mutation(state):
+    state.set_characters([_char("A", "g1"), _char("B"), _char("C", "g1")])
+    assert state.get_character("B").nome == "B"
+    assert [p.nome for p in state.get_characters_by_god("g1")] == ["A", "C"]
+
+    state.add_character(_char("D", "g2"))
+    state.update_character(1, _char("B2", "g2"))
+    assert state.get_character("B") is None and state.has_character("B2")
+    assert [p.nome for p in state.get_characters_by_god("g2")] == ["D", "B2"]
+
+    state.delete_character_by_name("A")
+    state.set_character_god("C", "g2")
+    assert state.character_names() == ["B2", "C", "D"]
+    assert state.get_characters_by_god("g1") == []
+    assert {p.nome for p in state.get_characters_by_god("g2")} == {"B2", "C", "D"}
+
+
+def test_duplicate_names_resolve_to_first_remaining_entry(state):
+    primeiro, segundo = _char("Dup"), _char("Dup")
+    state.set_characters([primeiro, segundo])
+    assert state.get_character("Dup") is primeiro
+
+    state.delete_character(0)
+    assert state.get_character("Dup") is segundo
+
+
+def test_weapon_indexes_and_in_memory_overlay(state):
+    state.set_weapons([Arma.from_dict({"nome": "Espada"})])
+    state.add_weapon(Arma.from_dict({"nome": "Arco"}))
+    state.update_weapon(0, Arma.from_dict({"nome": "Lanca"}))
+    assert state.weapon_names() == ["Lanca", "Arco"]
+    assert not state.has_weapon("Espada") and state.get_weapon("Arco").nome == "Arco"
+
+    extra = _char("Convidado")
+    state.replace_roster_in_memory(characters=state.characters + [extra])
+    assert state.get_character("Convidado") is extra
+    assert not os.path.exists(app_state_module.FILE_CHARS)
+
+
+def test_batch_defers_saves_and_coalesces_notifications(state):
+    eventos = []
+    state.subscribe("any", lambda event, data: eventos.append(event))
+
+    with state.batch():
+        state.record_fight_result("A", "B", 3.0, True)
+        state.record_fight_result("B", "A", 9.0, False)
+        state.update_tournament(name="Copa")
+        assert eventos == []
+        assert state.has_pending_writes
+        assert not os.path.exists(app_state_module.FILE_TOURNAMENT)
+
+    assert not state.has_pending_writes
+    assert eventos.count("tournament_changed") == 1
+    with open(app_state_module.FILE_TOURNAMENT, encoding="utf-8") as f:
+        conteudo = f.read()
+    assert "\n" not in conteudo and '"total_fights":2' in conteudo
+
+
+def test_batch_commits_fights_in_one_transaction(state, monkeypatch):
+    db = BattleDB.get()
+    lotes = []
+    original = db.commit_fights
+    monkeypatch.setattr(db, "commit_fights", lambda rs: lotes.append(len(rs)) or original(rs))
+    monkeypatch.setattr(db, "commit_fight", lambda r: pytest.fail("commit_fight dentro de batch()"))
+
+    with state.batch():
+        assert state.record_fight_result("A", "B", 3.0, True) is None
+        state.record_fight_result("B", "A", 9.0, False)
+        assert db.count_matches() == 0
+
+    assert lotes == [2]
+    assert db.count_matches() == 2
+    assert state._last_match_id == db.get_match_history(limit=1)[0]["id"]
+
+
+def test_write_behind_coalesces_until_flush(state):
+    state.enable_write_behind(interval=3600)
+    state.update_match_config(cenario="Dojo")
+    state.add_weapon(Arma.from_dict({"nome": "Arco"}))
+    assert not os.path.exists(app_state_module.FILE_MATCH)
+
+    state.flush()
+    assert os.path.exists(app_state_module.FILE_MATCH)
+    assert os.path.exists(app_state_module.FILE_WEAPONS)
+
+    state.update_match_config(cenario="Floresta")
+    state.disable_write_behind()
+    assert not state.has_pending_writes
+    AppState.reset()
+    assert AppState.get().match_config["cenario"] == "Floresta"
+
+
+def test_flush_if_due_writes_idle_state_after_the_deadline(state):
+    state.enable_write_behind(interval=3600)
+    state.update_match_config(cenario="Dojo")
+    state.flush_if_due()
+    assert not os.path.exists(app_state_module.FILE_MATCH)
+
+    state._flush_deadline = 0.0
+    state.flush_if_due()
+    assert os.path.exists(app_state_module.FILE_MATCH)
+    assert not state.has_pending_writes
+    state.disable_write_behind()
+
+
+def test_record_fight_result_commits_pending_stats_with_the_match(state):
+    from dados.match_stats import MatchStatsCollector
+
+    collector = MatchStatsCollector()
+    collector.register("A")
+    collector.register("B")
+    collector.record_hit("A", "B", damage=12.0)
+    state.pending_stats_collector = collector
+
+    match_id = state.record_fight_result("A", "B", 4.0, True)
+
+    db = BattleDB.get()
+    assert state.pending_stats_collector is None
+    assert db.get_match(match_id)["winner"] == "A"
+    assert len(db.get_events(match_id)) == len(collector.get_events()) > 0
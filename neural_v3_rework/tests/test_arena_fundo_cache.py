@@ -0,0 +1,70 @@
+import os
+from dataclasses import replace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from efeitos.camera import Camera
+from nucleo.arena import FUNDO_ZOOM_PASSO, criar_arena
+
+
+pygame.init()
+
+
+def _camera(arena, zoom):
+    cam = Camera(1200, 800)
+    cam.set_arena_bounds(arena.centro_x, arena.centro_y, arena.largura, arena.altura)
+    cam.zoom = zoom
+    return cam
+
+
+def _desenho_direto(arena, tela, cam):
+    arena._desenhar_chao(tela, cam)
+    arena._desenhar_obstaculos(tela, cam)
+    if arena.config.tem_paredes:
+        arena._desenhar_paredes(tela, cam)
+
+
+def test_fundo_em_cache_reproduz_o_desenho_direto():
+    for nome in ("Arena", "Coliseu", "Templo", "Castelo"):
+        arena = criar_arena(nome)
+        # Zoom exato de um bucket: so sobram diferencas de arredondamento
+        cam = _camera(arena, round(np.exp(-50 * FUNDO_ZOOM_PASSO), 12))
+        direto = pygame.Surface((1200, 800))
+        cache = pygame.Surface((1200, 800))
+        direto.fill((5, 5, 5))
+        cache.fill((5, 5, 5))
+
+        _desenho_direto(arena, direto, cam)
+        arena.desenhar(cache, cam)
+
+        diff = np.any(pygame.surfarray.pixels3d(direto) != pygame.surfarray.pixels3d(cache), axis=2)
+        assert diff.mean() < 0.02, nome
+
+
+def test_fundo_reaproveitado_ao_mover_camera_e_refeito_ao_danificar():
+    arena = criar_arena("Cyberpunk")
+    # Copias: os Obstaculo do ArenaConfig sao compartilhados entre arenas
+    arena.obstaculos = [replace(o) for o in arena.obstaculos]
+    cam = _camera(arena, 1.0)
+    tela = pygame.Surface((1200, 800))
+
+    arena.desenhar(tela, cam)
+    fundo = arena._fundo_cache[1]
+    cam.x += 40
+    cam.zoom *= 1.001
+    arena.desenhar(tela, cam)
+    assert arena._fundo_cache[1] is fundo
+
+    obs = next(o for o in arena.obstaculos if o.destrutivel)
+    arena.danificar_obstaculo(obs, 1)
+    arena.desenhar(tela, cam)
+    assert arena._fundo_cache[1] is not fundo
+
+    # Zoom em outro bucket tambem refaz
+    fundo = arena._fundo_cache[1]
+    cam.zoom *= 1.2
+    arena.desenhar(tela, cam)
+    assert arena._fundo_cache[1] is not fundo
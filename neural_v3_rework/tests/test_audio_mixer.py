@@ -0,0 +1,53 @@
+import wave
+
+import numpy as np
+
+from pipeline_video.audio_mixer import SoundCache, _SAMPLE_RATE, mix_audio_track
+
+
+def _counting_cache(samples):
+    decoded = []
+
+    def decoder(filepath):
+        decoded.append(filepath)
+        return samples
+
+    return SoundCache(decoder=decoder), decoded
+
+
+def _read_wav(path):
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getnchannels() == 2 and wav.getframerate() == _SAMPLE_RATE
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    return pcm.reshape(-1, 2).astype(np.float32) / 32767.0
+
+
+def test_mix_places_events_with_gain_and_pan_and_decodes_each_sound_once(tmp_path):
+    cache, decoded = _counting_cache(np.full((100, 2), 0.5, dtype=np.float32))
+    events = [
+        (0.0, "arena_start", 1.0),
+        (1.0, "arena_start", 0.5, 1.0),   # pan total para a direita
+        (1.5, "som_que_nao_existe", 1.0),
+    ]
+
+    assert mix_audio_track(events, 2.0, str(tmp_path / "a.wav"), sound_cache=cache)
+    assert mix_audio_track(events, 2.0, str(tmp_path / "b.wav"), sound_cache=cache)
+
+    mixed = _read_wav(tmp_path / "a.wav")
+    assert mixed.shape[0] == int(2.5 * _SAMPLE_RATE)
+    assert np.allclose(mixed[10], [0.5, 0.5], atol=1e-3)
+    assert np.allclose(mixed[_SAMPLE_RATE + 10], [0.0, 0.25], atol=1e-3)
+    assert np.allclose(mixed[500], [0.0, 0.0])
+    assert len(decoded) == 1
+    assert "som_que_nao_existe" in cache
+
+
+def test_limiter_keeps_stacked_events_below_full_scale(tmp_path):
+    cache, _ = _counting_cache(np.full((4000, 2), 0.8, dtype=np.float32))
+    events = [(0.05, "arena_start", 1.0)] * 6
+
+    assert mix_audio_track(events, 0.5, str(tmp_path / "alto.wav"), sound_cache=cache)
+
+    mixed = _read_wav(tmp_path / "alto.wav")
+    assert np.max(np.abs(mixed)) <= 0.951
+    assert np.max(np.abs(mixed)) > 0.9
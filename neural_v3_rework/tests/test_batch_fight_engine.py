@@ -0,0 +1,56 @@
+from dados.app_state import AppState
+from ferramentas import batch_fight_engine
+from ferramentas.batch_fight_engine import (
+    BatchFightEngine,
+    FightOutcome,
+    derive_fight_seed,
+    run_fight_job,
+)
+
+
+def test_derive_fight_seed_is_stable_and_varies_per_index():
+    assert derive_fight_seed(42, 0) == derive_fight_seed(42, 0)
+    assert derive_fight_seed(42, 0) != derive_fight_seed(42, 1)
+    assert derive_fight_seed(42, 0) != derive_fight_seed(43, 0)
+
+
+def test_build_matchup_jobs_covers_every_fight_with_its_matchup_index():
+    engine = BatchFightEngine(workers=1, seed_base=3)
+
+    jobs = engine.build_matchup_jobs([("A", "B"), ("C", "D")], fights_per_matchup=4)
+
+    assert [job.index for job in jobs] == list(range(8))
+    assert [job.matchup_index for job in jobs] == [0] * 4 + [1] * 4
+    assert all({job.p1_nome, job.p2_nome} == {"A", "B"} for job in jobs[:4])
+    assert all(job.seed == derive_fight_seed(3, job.index) for job in jobs)
+    assert jobs == engine.build_matchup_jobs([("A", "B"), ("C", "D")], fights_per_matchup=4)
+
+
+def test_run_matchups_merges_outcomes_into_matchup_stats(monkeypatch):
+    def fake_job(job):
+        winner = job.p1_nome if job.matchup_index == 0 else None
+        return FightOutcome(job.index, job.matchup_index, winner, 10)
+
+    monkeypatch.setattr(batch_fight_engine, "run_fight_job", fake_job)
+    progress = []
+
+    stats = BatchFightEngine(workers=1).run_matchups(
+        [("A", "B"), ("C", "D")],
+        fights_per_matchup=3,
+        on_progress=lambda done, total, ms: progress.append((done, total)),
+    )
+
+    assert stats[0].total == 3 and stats[0].draws == 0
+    assert stats[1].draws == 3
+    assert progress[-1] == (6, 6)
+
+
+def test_parallel_workers_reproduce_serial_results():
+    nomes = AppState.get().character_names()[:2]
+    pairs = [(nomes[0], nomes[1])]
+
+    serial = BatchFightEngine(workers=1, seed_base=11, max_frames=45)
+    paralelo = BatchFightEngine(workers=2, seed_base=11, max_frames=45, chunksize=1)
+    jobs = serial.build_matchup_jobs(pairs, fights_per_matchup=2)
+
+    assert list(serial.map(run_fight_job, jobs)) == list(paralelo.map(run_fight_job, jobs))
@@ -0,0 +1,71 @@
+import json
+import random
+
+from dados.app_state import AppState
+from pipeline_video import batch_runner, fight_recorder
+
+
+class _FakeRecorder:
+    def __init__(self, job):
+        self.job = job
+        self.total_frames = 0
+        self.duration = 0.0
+        self.winner = None
+
+    def record(self):
+        # Sorteia com o RNG global: so reproduz se o job semear o processo
+        self.total_frames = random.randint(60, 600)
+        self.duration = self.total_frames / 60.0
+        self.winner = random.choice([self.job["nome1"], self.job["nome2"]])
+        return self
+
+
+def _fake_recorder(job, video_path):
+    return _FakeRecorder(job)
+
+
+def _run(monkeypatch, tmp_path, workers):
+    monkeypatch.setattr(batch_runner, "OUTPUT_DIR", tmp_path / f"w{workers}")
+    random.seed(21)
+    # Factory explicita (picklable): chega aos workers tambem com spawn
+    return batch_runner.run_batch(
+        num_fights=3, video_format="classic", workers=workers, recorder_factory=_fake_recorder
+    )
+
+
+def test_run_batch_parallel_matches_serial_and_writes_metadata(monkeypatch, tmp_path):
+    serial = _run(monkeypatch, tmp_path, workers=1)
+    paralelo = _run(monkeypatch, tmp_path, workers=2)
+
+    def _chave(r):
+        return (r["platform"], r["fighter1"]["nome"], r["winner"], r["frames"], r["title"])
+
+    assert [r["platform"] for r in serial] == batch_runner.PLATFORMS[:3]
+    assert [_chave(r) for r in serial] == [_chave(r) for r in paralelo]
+    for result in paralelo:
+        with open(result["metadata"], encoding="utf-8") as fh:
+            assert json.load(fh)["title"] == result["title"]
+    summary = next((tmp_path / "w2").glob("batch_*/batch_summary.json"))
+    assert json.loads(summary.read_text(encoding="utf-8"))["num_fights"] == 3
+
+
+def test_recorder_overlay_restores_app_state_without_saving(monkeypatch):
+    state = AppState.get()
+    antes = fight_recorder._snapshot_app_state()
+    saves = []
+    monkeypatch.setattr(state, "_save_characters", lambda: saves.append("characters"))
+    monkeypatch.setattr(state, "_save_match", lambda: saves.append("match"))
+
+    fight_recorder._inject_match_config(
+        {"nome": "Teste Um"}, {"nome": "Arma Um"},
+        {"nome": "Teste Dois"}, {"nome": "Arma Dois"},
+        cenario="Dojo",
+    )
+    assert state.character_names() == ["Teste Um", "Teste Dois"]
+    assert state.match_config["cenario"] == "Dojo"
+
+    fight_recorder._restore_app_state(antes)
+
+    assert saves == []
+    assert state.character_names() == [c.nome for c in antes["characters"]]
+    assert state.match_config == antes["match"]
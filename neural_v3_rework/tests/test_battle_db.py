@@ -257,6 +257,44 @@ def test_weapon_matchups_query():
     print("  OK  T15: Weapon matchups aggregation")
 
 
+def test_commit_fight_single_transaction():
+    from dados.battle_db import FightResult
+    db = get_test_db()
+    mid = db.commit_fight(FightResult(
+        "Caleb", "Bjorn", duration=12.0, ko=True, arena="Dojo",
+        winner_class="Guerreiro", loser_class="Mago",
+        events=[(10, "hit", {"damage": 5}), (20, "kill", {})],
+    ))
+    match = db.get_match(mid)
+    assert match["ko_type"] == "KO" and match["p1_class"] == "Guerreiro"
+    assert match["p1_elo_before"] == 1600.0 and match["p1_elo_after"] > 1600.0
+    w = db.get_character_stats("Caleb")
+    l = db.get_character_stats("Bjorn")
+    assert w["wins"] == 1 and w["elo"] == match["p1_elo_after"]
+    assert l["losses"] == 1 and l["elo"] == match["p2_elo_after"]
+    assert [e["event_type"] for e in db.get_events(mid)] == ["hit", "kill"]
+    db.close()
+    print("  OK  T16: commit_fight single transaction")
+
+
+def test_commit_fights_bulk_chains_elo():
+    from dados.battle_db import FightResult
+    db = get_test_db()
+    ids = db.commit_fights([
+        FightResult("A", "B", duration=5.0),
+        FightResult("A", "B", duration=5.0),
+        FightResult("B", "A", duration=30.0, ko=False),
+    ])
+    assert len(ids) == 3
+    second = db.get_match(ids[1])
+    first = db.get_match(ids[0])
+    assert second["p1_elo_before"] == first["p1_elo_after"]
+    assert db.get_character_stats("A")["matches_played"] == 3
+    assert db.get_match(ids[2])["ko_type"] == "TIMEOUT"
+    db.close()
+    print("  OK  T17: commit_fights bulk ELO chaining")
+
+
 if __name__ == "__main__":
     tests = [
         test_schema_creation,
@@ -274,6 +312,8 @@ if __name__ == "__main__":
         test_concurrent_access,
         test_class_winrates_query,
         test_weapon_matchups_query,
+        test_commit_fight_single_transaction,
+        test_commit_fights_bulk_chains_elo,
     ]
 
     passed = 0
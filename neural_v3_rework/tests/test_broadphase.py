@@ -0,0 +1,119 @@
+import math
+import random
+from types import SimpleNamespace
+
+from nucleo.broadphase import GradeEspacial, GradePontos
+
+
+def _lutadores(n, seed, lado=30.0, times=3):
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            pos=[rng.uniform(0, lado), rng.uniform(0, lado)],
+            morto=rng.random() < 0.15,
+            team_id=rng.randrange(times),
+            dados=SimpleNamespace(tamanho=rng.uniform(1.2, 2.4)),
+        )
+        for _ in range(n)
+    ]
+
+
+def _dist(a, b):
+    return math.hypot(a.pos[0] - b.pos[0], a.pos[1] - b.pos[1])
+
+
+def test_inimigo_mais_proximo_igual_a_varredura_linear():
+    for seed in range(30):
+        lutadores = _lutadores(40, seed)
+        grade = GradeEspacial(lutadores)
+        for f in lutadores:
+            inimigos = [o for o in lutadores if o is not f and not o.morto and o.team_id != f.team_id]
+            esperado = min(inimigos, key=lambda o: _dist(f, o)) if inimigos else None
+            assert grade.inimigo_mais_proximo(f) is esperado
+
+
+def test_pares_e_vizinhos_iguais_a_forca_bruta_e_na_ordem_da_lista():
+    lutadores = _lutadores(60, 7)
+    grade = GradeEspacial(lutadores)
+    vivos = [f for f in lutadores if not f.morto]
+
+    esperado = [
+        (a, b)
+        for i, a in enumerate(vivos)
+        for b in vivos[i + 1:]
+        if _dist(a, b) <= 4.0
+    ]
+    assert grade.pares(4.0) == esperado
+
+    centro = lutadores[0]
+    assert grade.vizinhos(centro.pos[0], centro.pos[1], 6.0, excluir=centro) == [
+        f for f in vivos if f is not centro and _dist(f, centro) <= 6.0
+    ]
+
+
+def test_reindexar_acompanha_movimento_e_mortes():
+    lutadores = _lutadores(10, 3, times=2)
+    for f in lutadores:
+        f.morto = False
+    grade = GradeEspacial(lutadores)
+    assert grade.contar_vivos() == 10
+
+    lutadores[0].morto = True
+    lutadores[1].pos = [200.0, 200.0]
+    grade.reindexar()
+
+    assert len(grade) == 9
+    assert grade.vizinhos(200.0, 200.0, 0.5) == [lutadores[1]]
+    assert all(lutadores[0] not in par for par in grade.pares(50.0))
+    assert grade.contar_vivos(excluir_time=lutadores[2].team_id) == sum(
+        1 for f in lutadores if not f.morto and f.team_id != lutadores[2].team_id
+    )
+
+
+def test_mais_proximo_inclui_lutadores_adicionados_depois_da_indexacao():
+    lutadores = _lutadores(25, 11)
+    grade = GradeEspacial(lutadores)
+    novo = SimpleNamespace(pos=[5.0, 5.0], morto=False, team_id=9, dados=SimpleNamespace(tamanho=1.8))
+    lutadores.append(novo)
+
+    for x, y in [(5.2, 5.1), (0.0, 0.0), (29.0, 12.0), (-40.0, 80.0)]:
+        vivos = [f for f in lutadores if not f.morto]
+        esperado = min(vivos, key=lambda f: math.hypot(f.pos[0] - x, f.pos[1] - y))
+        assert grade.mais_proximo(x, y) is esperado
+    assert novo in grade.vizinhos(5.0, 5.0, 0.1)
+
+
+def test_grade_pontos_pares_iguais_a_forca_bruta():
+    rng = random.Random(5)
+    itens = [SimpleNamespace(x=rng.uniform(0, 20), y=rng.uniform(0, 20)) for _ in range(80)]
+    grade = GradePontos(itens)
+
+    esperado = [
+        (i, j)
+        for i in range(len(itens))
+        for j in range(i + 1, len(itens))
+        if math.hypot(itens[i].x - itens[j].x, itens[i].y - itens[j].y) <= 1.5
+    ]
+    assert grade.pares(1.5) == esperado
+    assert grade.proximos(10.0, 10.0, 3.0) == [
+        i for i, p in enumerate(itens) if math.hypot(p.x - 10.0, p.y - 10.0) <= 3.0
+    ]
+
+
+def test_mover_acompanha_teleporte_entre_consultas():
+    def lutador(x, y, time):
+        return SimpleNamespace(pos=[x, y], morto=False, team_id=time, dados=SimpleNamespace(tamanho=1.8))
+
+    atacante = lutador(0.0, 0.0, 0)
+    aliado = lutador(25.0, 30.0, 0)
+    alvo = lutador(30.0, 30.0, 1)
+    lutadores = [atacante, aliado, alvo] + [lutador(5.0 + i, 2.0, 1) for i in range(5)]
+    grade = GradeEspacial(lutadores)
+
+    # Teleporte do combat_mixin: 1.2 m do alvo, do outro lado da arena
+    atacante.pos = [alvo.pos[0] - 1.2, alvo.pos[1]]
+    grade.mover(atacante)
+
+    assert grade.inimigo_mais_proximo(alvo) is atacante
+    assert grade.vizinhos(alvo.pos[0], alvo.pos[1], 1.5, excluir=alvo) == [atacante]
+    assert grade.inimigo_mais_proximo(atacante) is alvo
@@ -0,0 +1,63 @@
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest
+
+from utilitarios.frame_profiler import FrameProfiler
+
+
+def test_ring_buffer_keeps_last_samples_and_reports_percentiles():
+    prof = FrameProfiler(capacidade=100, ativo=True)
+    for i in range(250):
+        prof.registrar("fase", 0.0, (i % 100 + 1) / 1000.0)
+
+    s = prof.stats()["fase"]
+    assert s["n"] == 100
+    assert s["max_ms"] == pytest.approx(100.0)
+    assert s["p50_ms"] == pytest.approx(50.5)
+    assert s["p95_ms"] == pytest.approx(95.05)
+
+
+def test_inactive_profiler_only_calls_through():
+    prof = FrameProfiler()
+    assert prof.medir("x", lambda a, b=0: a + b, 2, b=3) == 5
+    assert prof.stats() == {}
+
+
+def test_trace_nests_phases_into_folded_stacks(tmp_path):
+    prof = FrameProfiler(ativo=True, trace=True)
+    prof.registrar("update/ia", 1.002, 1.005)
+    prof.registrar("update", 1.000, 1.010)
+    prof.registrar("desenhar", 1.010, 1.014)
+
+    assert prof.pilhas_folded() == {"update": 7000, "update;update/ia": 3000, "desenhar": 4000}
+
+    caminho = tmp_path / "trace.json"
+    prof.salvar_trace(str(caminho))
+    eventos = json.loads(caminho.read_text())["traceEvents"]
+    assert {e["name"] for e in eventos} == {"update", "update/ia", "desenhar"}
+    assert all(e["ph"] == "X" and e["dur"] > 0 for e in eventos)
+
+
+def test_headless_simulation_records_phases_and_ai_per_fighter():
+    from dados.app_state import AppState
+    from efeitos.audio import AudioManager
+    from efeitos.magic_vfx import MagicVFXManager
+    from simulacao.simulacao import Simulador
+
+    nomes = AppState.get().character_names()[:2]
+    try:
+        sim = Simulador.headless({"p1_nome": nomes[0], "p2_nome": nomes[1], "cenario": "Arena"})
+        sim.profiler.ativar()
+        for _ in range(20):
+            sim.update(1.0 / 60.0)
+    finally:
+        MagicVFXManager.reset()
+        AudioManager.reset()
+
+    stats = sim.profiler.stats()
+    assert stats["update"]["n"] == 20
+    assert {"update/projeteis", "update/partida", "update/pos_frame"} <= set(stats)
+    assert sum(1 for nome in stats if nome.startswith("ia/")) == 2
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 from simulacao.horde_runtime import HordeWaveManager
+from simulacao.sim_effects import TAM_RASTRO_ARMA
 
 
 class _DummyCollector:
@@ -45,3 +46,4 @@ def test_horde_wave_manager_spawns_monsters_and_tracks_summary():
     assert manager.total_spawned >= 2
     assert len(sim.fighters) >= 3
     assert manager.export_summary()["wave_atual"] == 1
+    assert sim.rastros and all(r.maxlen == TAM_RASTRO_ARMA for r in sim.rastros.values())
@@ -0,0 +1,60 @@
+import pytest
+
+from modelos import Arma, Personagem
+from nucleo.entities import Lutador
+from nucleo.lutador.status_timers import TIMERS_STATUS, tick_cooldowns_skills, tick_timers_status
+
+
+def _lutador():
+    arma = Arma(nome="Espada de Teste", tipo="Espada Reta", dano=8, peso=2, velocidade_ataque=1.0)
+    dados = Personagem(nome="Teste", tamanho=1.5, forca=5.0, mana=5.0, classe="Guerreiro")
+    dados.recalcular_com_arma(arma)
+    return Lutador(dados, 0.0, 0.0)
+
+
+def test_todos_os_timers_da_tabela_existem_no_lutador():
+    lutador = _lutador()
+    assert all(lutador.__dict__.get(attr) == 0.0 for attr, _ in TIMERS_STATUS)
+
+
+def test_callbacks_so_disparam_no_frame_em_que_o_timer_expira():
+    lutador = _lutador()
+    lutador.fraco_timer = 0.15
+    lutador.dano_reduzido = 0.5
+    lutador.slow_timer = 0.05
+    lutador.slow_fator = 0.4
+    lutador.bomba_relogio_timer = 0.05
+    lutador.bomba_relogio_dano = 10.0
+    vida = lutador.vida
+
+    tick_timers_status(lutador, 0.1)
+
+    assert lutador.slow_fator == 1.0
+    assert lutador.dano_reduzido == 0.5
+    assert lutador.fraco_timer == pytest.approx(0.05)
+    assert lutador.vida == pytest.approx(vida - 10.0)
+    assert lutador.flash_timer == pytest.approx(0.3)
+    assert lutador.stun_timer == 0.0
+
+    lutador.slow_fator = 0.7
+    tick_timers_status(lutador, 0.1)
+
+    assert lutador.dano_reduzido == 1.0
+    assert lutador.slow_fator == 0.7
+    assert lutador.vida == pytest.approx(vida - 10.0)
+
+
+def test_cooldowns_de_skills_param_no_zero_ou_abaixo():
+    cds = {"Bola de Fogo": 1.0, "Cura": 0.0, "Raio": 0.05}
+    tick_cooldowns_skills(cds, 0.1)
+    assert cds == pytest.approx({"Bola de Fogo": 0.9, "Cura": 0.0, "Raio": -0.05})
+
+
+def test_historico_de_posicao_e_um_ring_buffer_de_tamanho_fixo():
+    lutador = _lutador()
+    for i in range(40):
+        lutador.pos = [float(i), 0.0]
+        lutador.update(1 / 60, None)
+    assert len(lutador.pos_historico) == 15
+    assert lutador.pos_historico[0][0] == 25.0
+    assert lutador.pos_historico[-1][0] == 39.0
@@ -0,0 +1,108 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from efeitos.camera import Camera
+from efeitos.particles import HitSpark, Particula, ParticleSystem
+from utilitarios.rng import rng_vfx
+
+
+pygame.init()
+
+
+def test_particle_system_update_matches_particula_and_reuses_freed_slots():
+    pool = ParticleSystem(capacidade=8)
+    ref = [Particula(10.0, 20.0, (200, 0, 0), 30.0, -15.0, 6.0, 0.5),
+           Particula(50.0, 60.0, (0, 0, 255), -5.0, 40.0, 3.0, 0.2)]
+    for p in ref:
+        pool.append(p)
+
+    mortas = []
+    for _ in range(3):
+        mortas.extend(pool.update(0.1))
+        for p in ref:
+            p.atualizar(0.1)
+
+    assert mortas == [1]
+    assert len(pool) == 1
+    assert pool.x[0] == ref[0].x and pool.y[0] == ref[0].y
+    assert pool.tamanho[0] == ref[0].tamanho
+    # O slot liberado e o primeiro a ser reaproveitado
+    pool.emit(0.0, 0.0, (0, 0, 255), 0.0, 0.0, 2.0)
+    assert pool.vivo[1] and len(pool) == 2
+
+
+def test_particle_system_recycles_oldest_when_full_and_emits_batches():
+    pool = ParticleSystem(capacidade=4)
+    pool.emit_many(np.arange(3.0), 0.0, (255, 255, 0), 0.0, 0.0, 2.0, 1.0)
+    pool.emit_many(np.arange(3.0, 6.0), 0.0, (255, 255, 0), 0.0, 0.0, 2.0, 1.0)
+
+    assert len(pool) == 4
+    assert sorted(pool.x[pool.vivo]) == [2.0, 3.0, 4.0, 5.0]
+    assert pool.cores == [(255, 255, 0)]
+
+    pool.clear()
+    assert len(pool) == 0 and not pool
+
+
+def test_particle_system_draw_blits_visible_particles():
+    tela = pygame.Surface((200, 200))
+    cam = Camera(200, 200)
+    cam.x, cam.y = 100, 100
+    pool = ParticleSystem(capacidade=16)
+    pool.emit(100.0, 100.0, (255, 80, 0), 0.0, 0.0, 6.0, 1.0)
+    pool.emit(40.0, 40.0, (0, 200, 255), 0.0, 0.0, 0.5, 1.0)
+
+    pool.draw(tela, cam)
+
+    assert tela.get_at(cam.converter(100.0, 100.0))[:3] != (0, 0, 0)
+    assert tela.get_at(cam.converter(40.0, 40.0))[:3] == (0, 200, 255)
+
+
+def test_hit_spark_columns_follow_the_per_spark_rules():
+    rng_vfx.seed(5)
+    spark = HitSpark(100.0, 100.0, (255, 200, 0), 0.0, 1.0)
+    assert len(spark.sx) == 15
+    vy0 = spark.vy.copy()
+    vida0 = spark.svida.copy()
+
+    spark.update(0.05)
+    spark.update(0.05)
+
+    vivas = vida0 - 0.1 > 0
+    assert len(spark.sx) == int(vivas.sum())
+    assert np.allclose(spark.vy, vy0[vivas] + 10.0)
+    tela = pygame.Surface((300, 300))
+    spark.draw(tela, Camera(300, 300))
+
+
+def test_particula_e_hitspark_sem_dict_por_instancia():
+    rng_vfx.seed(3)
+    for obj in (Particula(0.0, 0.0, (255, 0, 0), 1.0, 1.0, 4.0), HitSpark(0.0, 0.0, (255, 255, 0), 0.0)):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_hit_spark_glow_does_not_erase_cores_drawn_before_it():
+    rng_vfx.seed(11)
+    spark = HitSpark(150.0, 150.0, (255, 0, 0), 0.0, 1.0)
+    # Duas faiscas do mesmo impacto: uma para a direita, outra para baixo
+    spark.sx = np.array([150.0, 150.0])
+    spark.sy = np.array([150.0, 150.0])
+    spark.vx = np.array([100.0, 0.0])
+    spark.vy = np.array([0.0, 100.0])
+    spark.comprimento = np.array([20.0, 20.0])
+    spark.svida = np.array([0.2, 0.2])
+    spark.smax_vida = spark.svida.copy()
+    spark.largura = np.array([1.0, 1.0])
+    tela = pygame.Surface((300, 300))
+    cam = Camera(300, 300)
+    cam.x, cam.y = 150, 150
+    spark.draw(tela, cam)
+
+    # O glow vermelho da segunda cobre o core branco da primeira
+    x, y = cam.converter(150.0, 150.0)
+    r, g, b, _ = tela.get_at((x + 1, y))
+    assert g > 100 and b > 100
@@ -110,3 +110,27 @@ def test_story_intro_overlay_draws_comment_roulette_sequence():
     alpha = pygame.surfarray.array_alpha(surface)
     assert pixels.sum() > 0
     assert alpha.sum() > 0
+
+
+def test_frame_capture_writes_bgr_upscale_into_reused_buffer():
+    import cv2
+    from pipeline_video.fight_recorder import _FrameCapture, _surface_to_numpy
+
+    surface = pygame.Surface((54, 96))
+    surface.fill((20, 40, 60))
+    pygame.draw.rect(surface, (255, 0, 0), pygame.Rect(4, 8, 20, 30))
+    capture = _FrameCapture(108, 192)
+
+    frame = capture.capture(surface)
+    expected = cv2.cvtColor(
+        cv2.resize(_surface_to_numpy(surface), (108, 192), interpolation=cv2.INTER_LINEAR),
+        cv2.COLOR_RGB2BGR,
+    )
+
+    assert frame.shape == (192, 108, 3)
+    assert np.array_equal(frame, expected)
+    assert not surface.get_locked()
+
+    surface.fill((0, 0, 255))
+    assert capture.capture(surface) is frame
+    assert tuple(frame[100, 50]) == (255, 0, 0)
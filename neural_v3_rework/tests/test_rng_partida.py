@@ -0,0 +1,101 @@
+import os
+import random
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from nucleo.contexto import rng_do_contexto
+from utilitarios.rng import RNGPartida, derivar_semente, rng_vfx
+
+
+def test_streams_derivados_da_seed_sao_estaveis_e_independentes():
+    a, b = RNGPartida(42), RNGPartida(42)
+    assert a.semente("ia") == b.semente("ia") == derivar_semente(42, "ia")
+    assert a.semente("ia") != a.semente("spawn")
+    assert [a.ia.random() for _ in range(5)] == [b.ia.random() for _ in range(5)]
+    assert a.stream("combate") is random
+    assert a.stream("vfx") is rng_vfx
+
+
+def test_ativar_semeia_combate_e_vfx_sem_acoplar_os_dois():
+    rng = RNGPartida(7)
+    rng.ativar()
+    combate = [random.random() for _ in range(3)]
+
+    rng.ativar()
+    rng_vfx.random()  # efeito visual extra nao mexe no stream de combate
+    assert [random.random() for _ in range(3)] == combate
+
+
+def test_rng_do_contexto_cai_no_modulo_random_sem_partida():
+    assert rng_do_contexto(None, "ia") is random
+    assert rng_do_contexto(SimpleNamespace(rng=None), "spawn") is random
+    partida = RNGPartida(3)
+    assert rng_do_contexto(SimpleNamespace(rng=partida), "spawn") is partida.spawn
+
+
+def test_em_combate_isola_o_random_de_fora_da_luta():
+    rng = RNGPartida(9)
+    random.seed(1)
+    esperado = random.Random(1).random()
+    rng.ativar()
+    rng.suspender()
+    assert random.random() == esperado
+
+    with rng.em_combate():
+        luta = [random.random() for _ in range(3)]
+    random.random()
+    with rng.em_combate():
+        luta.append(random.random())
+
+    rng.ativar()
+    rng.suspender()
+    with rng.em_combate():
+        assert [random.random() for _ in range(4)] == luta
+
+
+def _rodar_duelo(config, frames=240, entre_frames=None):
+    from efeitos.audio import AudioManager
+    from efeitos.magic_vfx import MagicVFXManager
+    from simulacao.simulacao import Simulador
+
+    try:
+        sim = Simulador.headless(config)
+        trilha = []
+        for _ in range(frames):
+            sim.update(1.0 / 60.0)
+            if entre_frames:
+                entre_frames()
+            trilha.append(tuple((f.vida, f.mana, f.pos[0], f.pos[1], f.brain.acao_atual) for f in sim.fighters))
+    finally:
+        MagicVFXManager.reset()
+        AudioManager.reset()
+    return sim, trilha
+
+
+def test_mesma_seed_reproduz_a_luta_headless():
+    from dados.app_state import AppState
+
+    nomes = AppState.get().character_names()[:2]
+    config = {"p1_nome": nomes[0], "p2_nome": nomes[1], "cenario": "Arena", "seed": 1234}
+
+    sim, trilha = _rodar_duelo(config)
+    random.random()
+    _, repetida = _rodar_duelo(config)
+
+    assert sim.seed == 1234
+    assert sim.contexto.rng.seed == 1234
+    assert repetida == trilha
+
+
+def test_random_fora_da_luta_entre_frames_nao_muda_o_replay():
+    from dados.app_state import AppState
+
+    nomes = AppState.get().character_names()[:2]
+    config = {"p1_nome": nomes[0], "p2_nome": nomes[1], "cenario": "Arena", "seed": 77}
+
+    _, trilha = _rodar_duelo(config)
+    # UI/torneio consumindo random entre os frames de outra luta
+    _, com_ruido = _rodar_duelo(config, entre_frames=lambda: random.random())
+
+    assert com_ruido == trilha
@@ -2,6 +2,7 @@ from types import SimpleNamespace
 
 import pygame
 
+from efeitos.particles import ParticleSystem
 from simulacao.simulacao import FrameUpdateContext, Simulador
 
 
@@ -405,18 +406,18 @@ def test_update_post_frame_systems_updates_animators_and_caps_particles():
     sim.movement_anims = SimpleNamespace(update=lambda dt: movement_calls.append(dt))
     sim.attack_anims = SimpleNamespace(update=lambda dt: attack_calls.append(dt))
     sim.decals = []
-    sim.particulas = [_EffectStub() for _ in range(605)]
-    for particula in sim.particulas:
-        particula.cor = (0, 0, 0)
-        particula.tamanho = 1.0
-        particula.x = 0.0
-        particula.y = 0.0
+    sim.particulas = ParticleSystem(Simulador.MAX_PARTICULAS)
+    for i in range(605):
+        sim.particulas.emit(float(i), 0.0, (0, 0, 0), 0.0, 0.0, 1.0, 1.0)
 
     sim._update_post_frame_systems(0.2)
 
     assert movement_calls == [0.2]
     assert attack_calls == [0.2]
     assert len(sim.particulas) == 600
+    # As 5 mais antigas foram recicladas
+    vivas = sim.particulas.x[sim.particulas.vivo]
+    assert vivas.min() == 5.0 and vivas.max() == 604.0
 
 
 def test_update_runs_runtime_phases_in_order():
@@ -504,6 +505,123 @@ def test_update_short_circuits_before_runtime_phases_when_prepare_frame_exits():
     assert calls == ["prepare"]
 
 
+def test_update_headless_skips_visual_effect_phases():
+    sim = Simulador.__new__(Simulador)
+    sim.modo_headless = True
+    calls = []
+
+    def record(name, return_value=None):
+        def _inner(*args, **kwargs):
+            calls.append(name)
+            return return_value
+        return _inner
+
+    sim._prepare_frame_update = record(
+        "prepare",
+        FrameUpdateContext(dt=0.25, dt_efetivo=0.25, early_exit=False, reason=""),
+    )
+    sim._collect_pending_runtime_objects = record("collect")
+    sim._update_runtime_effects = record("effects")
+    sim._update_magic_vfx_runtime = record("magic_vfx")
+    sim._update_projectile_phase = record("projectiles")
+    sim._update_orb_phase = record("orbs")
+    sim._update_area_phase = record("areas")
+    sim._update_beam_phase = record("beams")
+    sim._update_summon_phase = record("summons")
+    sim._update_trap_phase = record("traps")
+    sim._update_transformation_phase = record("transformations")
+    sim._update_channel_phase = record("channels")
+    sim._update_active_match_state = record("active_match")
+    sim._update_post_frame_systems = record("post_frame")
+
+    sim.update(0.25)
+
+    assert "effects" not in calls
+    assert "magic_vfx" not in calls
+    assert calls[0] == "prepare"
+    assert calls[-1] == "post_frame"
+
+
+def test_update_post_frame_systems_headless_discards_visual_effects():
+    sim = Simulador.__new__(Simulador)
+    sim.modo_headless = True
+    sim.movement_anims = None
+    sim.attack_anims = None
+    sim.particulas = [_EffectStub() for _ in range(3)]
+    sim.decals = [object()]
+    sim.textos = [_EffectStub()]
+    sim.hit_sparks = [_EffectStub()]
+
+    sim._update_post_frame_systems(0.2)
+
+    assert sim.particulas == []
+    assert sim.decals == []
+    assert sim.textos == []
+    assert sim.hit_sparks == []
+
+
+def test_headless_constructor_skips_display_audio_and_vfx():
+    from dados.app_state import AppState
+    from efeitos import CameraHeadless
+    from efeitos.audio import AudioManager
+    from efeitos.magic_vfx import MagicVFXManager
+
+    nomes = AppState.get().character_names()[:2]
+    display_ja_ativo = pygame.display.get_init()
+    try:
+        sim = Simulador.headless({"p1_nome": nomes[0], "p2_nome": nomes[1], "cenario": "Arena"})
+
+        assert sim.modo_headless is True
+        assert sim.tela is None
+        assert pygame.display.get_init() == display_ja_ativo
+        assert isinstance(sim.cam, CameraHeadless)
+        assert sim.audio.enabled is False
+        assert sim.magic_vfx is None
+        assert MagicVFXManager.get_instance() is None
+        assert sim.movement_anims is None and sim.attack_anims is None
+        assert {sim.p1.dados.nome, sim.p2.dados.nome} == set(nomes)
+
+        for _ in range(30):
+            sim.update(1.0 / 60.0)
+        assert sim.particulas == []
+    finally:
+        MagicVFXManager.reset()
+        AudioManager.reset()
+
+
+def test_interleaved_simulations_keep_their_own_context():
+    from dados.app_state import AppState
+    from efeitos.audio import AudioManager
+    from efeitos.magic_vfx import MagicVFXManager
+    from nucleo import arena as arena_module
+    from nucleo.hitbox import sistema_hitbox
+
+    nomes = AppState.get().character_names()[:2]
+    arena_global = arena_module._arena_atual
+    try:
+        sim_a = Simulador.headless({"p1_nome": nomes[0], "p2_nome": nomes[1], "cenario": "Dojo"})
+        sim_b = Simulador.headless({"p1_nome": nomes[1], "p2_nome": nomes[0], "cenario": "Floresta"})
+
+        assert sim_a.contexto is not sim_b.contexto
+        assert sim_a.contexto.hitbox is not sim_b.contexto.hitbox is not sistema_hitbox
+        assert sim_a.arena is sim_a.contexto.arena and sim_b.arena is sim_b.contexto.arena
+        assert sim_a.arena.config.nome != sim_b.arena.config.nome
+        assert arena_module._arena_atual is arena_global
+        assert sim_a.p1.contexto is sim_a.contexto and sim_b.p2.contexto is sim_b.contexto
+        assert sim_a.p1.brain._arena_runtime() is sim_a.arena
+        assert sim_b.p1.brain._team_manager_runtime() is sim_b.contexto.team_manager
+
+        for _ in range(20):
+            sim_a.update(1.0 / 60.0)
+            sim_b.update(1.0 / 60.0)
+
+        assert set(sim_a.contexto.hitbox.ultimo_ataque_info) <= set(nomes)
+        assert sim_a.p1.brain._arena_runtime() is sim_a.arena
+    finally:
+        MagicVFXManager.reset()
+        AudioManager.reset()
+
+
 def test_recarregar_tudo_runs_reload_pipeline_in_order():
     sim = Simulador.__new__(Simulador)
     calls = []
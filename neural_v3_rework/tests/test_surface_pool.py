@@ -0,0 +1,62 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from simulacao.surface_pool import SpriteAtlas, SurfacePool
+
+
+pygame.init()
+
+
+def _glow_em_camadas(tela, x, y, raio, cor, alpha, layers=4):
+    """Versao antiga de _desenhar_glow_circular: um blit por camada."""
+    for idx in range(layers, 0, -1):
+        layer_r = int(raio * (0.45 + idx / layers))
+        surf = pygame.Surface((layer_r * 2 + 6, layer_r * 2 + 6), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*cor, int(alpha * (idx / layers) * 0.32)), (layer_r + 3, layer_r + 3), layer_r)
+        tela.blit(surf, (x - layer_r - 3, y - layer_r - 3))
+
+
+def test_surface_pool_reuses_size_buckets_and_returns_clean_exact_surfaces():
+    pool = SurfacePool()
+
+    a = pool.get(30, 30, pygame.SRCALPHA)
+    a.fill((255, 0, 0, 255))
+    b = pool.get(31, 29, pygame.SRCALPHA)
+
+    assert b.get_size() == (31, 29)
+    assert b.get_at((5, 5)) == (0, 0, 0, 0)
+    assert (pool.hits, pool.misses, len(pool)) == (1, 1, 1)
+
+
+def test_surface_pool_evicts_least_recently_used_over_memory_cap():
+    pool = SurfacePool(max_bytes=3 * 64 * 64 * 4)
+    for lado in (32, 48, 64, 32, 96):
+        pool.get(lado, lado, pygame.SRCALPHA)
+
+    # 32 foi reusado antes do 96 entrar: saem 48 e 64, os menos recentes
+    assert list(pool._itens) == [(32, 32, pygame.SRCALPHA), (96, 96, pygame.SRCALPHA)]
+    assert pool.stats()["evictions"] == 2
+    assert pool.bytes <= pool.max_bytes
+
+
+def test_sprite_atlas_glow_matches_layered_blits_and_is_reused():
+    atlas = SpriteAtlas()
+    cor = (255, 120, 40)
+    antes = pygame.Surface((120, 120))
+    depois = pygame.Surface((120, 120))
+    antes.fill((30, 40, 50))
+    depois.fill((30, 40, 50))
+
+    _glow_em_camadas(antes, 60, 60, 16, cor, 200)
+    sprite = atlas.glow(16, cor, 200)
+    meio = sprite.get_width() // 2
+    depois.blit(sprite, (60 - meio, 60 - meio))
+
+    diff = np.abs(pygame.surfarray.array3d(antes).astype(int) - pygame.surfarray.array3d(depois))
+    assert diff.max() <= 8
+    assert atlas.glow(16, cor, 196) is sprite
+    assert atlas.stats()["hits"] == 1
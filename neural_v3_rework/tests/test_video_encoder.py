@@ -0,0 +1,47 @@
+import sys
+
+import numpy as np
+
+from pipeline_video.video_encoder import FFmpegPipeEncoder
+
+
+def _fake_ffmpeg(tmp_path, exit_code=0):
+    """Executavel que grava o stdin no ultimo argumento, como o ffmpeg faria com o MP4."""
+    script = tmp_path / "fake_ffmpeg"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import shutil, sys\n"
+        "with open(sys.argv[-1], 'wb') as out:\n"
+        "    shutil.copyfileobj(sys.stdin.buffer, out)\n"
+        f"sys.exit({exit_code})\n"
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_pipe_encoder_streams_frames_in_order_and_copies_reused_buffers(tmp_path):
+    output = tmp_path / "luta.mp4"
+    encoder = FFmpegPipeEncoder(str(output), width=4, height=2, fps=60,
+                                queue_size=2, ffmpeg_exe=_fake_ffmpeg(tmp_path))
+    assert encoder.isOpened()
+
+    frame = np.zeros((2, 4, 3), dtype=np.uint8)
+    for value in range(10):
+        frame[:] = value          # mesmo buffer reaproveitado, como o _FrameCapture
+        encoder.write(frame)
+    encoder.release()
+
+    raw = np.frombuffer(output.read_bytes(), dtype=np.uint8).reshape(10, 2, 4, 3)
+    assert not encoder.failed
+    assert encoder.frames_written == 10
+    assert [int(f[0, 0, 0]) for f in raw] == list(range(10))
+
+
+def test_pipe_encoder_reports_ffmpeg_failure(tmp_path):
+    encoder = FFmpegPipeEncoder(str(tmp_path / "x.mp4"), width=2, height=2,
+                                ffmpeg_exe=_fake_ffmpeg(tmp_path, exit_code=1))
+    encoder.write(np.zeros((2, 2, 3), dtype=np.uint8))
+    encoder.release()
+
+    assert encoder.failed
+    assert not encoder.isOpened()
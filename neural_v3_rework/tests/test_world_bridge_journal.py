@@ -0,0 +1,132 @@
+import json
+
+from dados import world_bridge
+from dados.world_bridge import JOURNAL_FILE, WorldBridge
+from world_map_pygame import data_loader, live_sync
+from world_map_pygame.live_sync import LiveSync
+
+
+def _bridge(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_bridge, "_WORLDMAP_DATA", str(tmp_path))
+    monkeypatch.setattr(world_bridge, "WORLDMAP_AVAILABLE", True)
+    (tmp_path / "world_state.json").write_text(json.dumps({
+        "zone_ownership": {"z1": None, "z2": None, "z3": "rival"},
+        "world_events": [],
+    }), encoding="utf-8")
+    (tmp_path / "gods.json").write_text(json.dumps({"gods": [
+        {"god_id": "rival", "god_name": "Rival", "follower_count": 0},
+    ]}), encoding="utf-8")
+    bridge = WorldBridge.__new__(WorldBridge)
+    bridge._init()
+    monkeypatch.setattr(bridge, "_get_god_id", lambda name: name.lower())
+    monkeypatch.setattr(bridge, "_notify_app_state", lambda *a: None)
+    return bridge
+
+
+def test_fight_results_append_to_journal_and_compact(tmp_path, monkeypatch):
+    bridge = _bridge(tmp_path, monkeypatch)
+    snapshot = (tmp_path / "world_state.json").read_text(encoding="utf-8")
+
+    first = bridge.on_fight_result("Ares", "Zeus")
+    second = bridge.on_fight_result("Ares", "Zeus")
+
+    lines = (tmp_path / JOURNAL_FILE).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(l)["seq"] for l in lines] == [1, 2]
+    assert (tmp_path / "world_state.json").read_text(encoding="utf-8") == snapshot
+    assert {first.zone_id, second.zone_id} == {"z1", "z2"}
+    assert bridge.get_territory_count("ares") == 2
+    assert bridge.get_god("ares").follower_count == 2
+    assert len(bridge.get_recent_events()) == 2
+
+    assert bridge.compact() is True
+    assert (tmp_path / JOURNAL_FILE).read_text(encoding="utf-8") == ""
+    ws = json.loads((tmp_path / "world_state.json").read_text(encoding="utf-8"))
+    assert ws["_meta"]["journal_seq"] == 2
+    assert ws["zone_ownership"]["z1"] == ws["zone_ownership"]["z2"] == "ares"
+
+    # Uma instancia nova enxerga o mesmo estado a partir dos snapshots
+    fresh = WorldBridge.__new__(WorldBridge)
+    fresh._init()
+    assert fresh.get_territory_count("ares") == 2
+    assert fresh.get_god("ares").follower_count == 2
+
+
+def test_live_sync_receives_only_new_journal_entries(tmp_path, monkeypatch):
+    bridge = _bridge(tmp_path, monkeypatch)
+    monkeypatch.setattr(data_loader, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(live_sync, "DATA_DIR", str(tmp_path))
+    received = []
+    sync = LiveSync(on_journal=lambda entries: received.append([e["seq"] for e in entries]))
+
+    bridge.on_fight_result("Ares", "Zeus")
+    sync.poll()
+    bridge.on_fight_result("Rival", "Ares")
+    sync.poll()
+    sync.poll()
+
+    assert received == [[1], [2]]
+
+
+def test_map_load_replays_journal_ops_not_yet_compacted(tmp_path, monkeypatch):
+    bridge = _bridge(tmp_path, monkeypatch)
+    monkeypatch.setattr(data_loader, "DATA_DIR", str(tmp_path))
+
+    bridge.create_god("Ares", "Guerra", "fogo")
+    bridge.on_fight_result("Ares", "Zeus")
+
+    gods, seq = data_loader.load_current_gods()
+    by_id = {g["god_id"]: g for g in gods["gods"]}
+    assert seq == 2
+    assert "ares" in by_id
+    assert by_id["ares"]["follower_count"] == 1
+
+
+def test_live_sync_catches_up_on_entries_compacted_between_polls(tmp_path, monkeypatch):
+    bridge = _bridge(tmp_path, monkeypatch)
+    monkeypatch.setattr(data_loader, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(live_sync, "DATA_DIR", str(tmp_path))
+    received = []
+    sync = LiveSync(on_journal=received.extend)
+
+    bridge.on_fight_result("Ares", "Zeus")
+    sync.poll()
+    bridge.create_god("Ares", "Guerra", "fogo")
+    bridge.on_fight_result("Ares", "Zeus")
+    bridge.on_fight_result("Rival", "Ares")
+    assert bridge.compact()
+    sync.poll()
+
+    first, catch_up = received
+    assert first["seq"] == 1
+    assert catch_up["seq"] == 4
+    events = [op["event"] for op in catch_up["ops"] if op["op"] == "event"]
+    assert len(events) == 2
+    gods = {op["god"]["god_id"]: op["god"] for op in catch_up["ops"] if op["op"] == "god_update"}
+    assert gods["ares"]["follower_count"] == 2
+    assert gods["rival"]["follower_count"] == 1
+
+    bridge.on_fight_result("Ares", "Zeus")
+    sync.poll()
+    assert received[-1]["seq"] == 5
+
+
+def test_live_sync_detects_a_seq_gap_in_the_journal(tmp_path, monkeypatch):
+    bridge = _bridge(tmp_path, monkeypatch)
+    monkeypatch.setattr(data_loader, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(live_sync, "DATA_DIR", str(tmp_path))
+    received = []
+    sync = LiveSync(on_journal=received.extend)
+
+    bridge.on_fight_result("Ares", "Zeus")
+    sync.poll()
+    bridge.on_fight_result("Rival", "Ares")
+    assert bridge.compact()
+    bridge.on_fight_result("Ares", "Zeus")
+    # Snapshot rewrite not noticed (same mtime tick): the seq gap gives it away
+    sync._last_mt = float("inf")
+    sync.poll()
+
+    # Catch-up gods already include entry 3 (unfolded journal), hence its seq
+    assert [e["seq"] for e in received] == [1, 3, 3]
+    assert [op["op"] for op in received[1]["ops"]].count("event") == 1
+    assert [op["op"] for op in received[2]["ops"]].count("event") == 1
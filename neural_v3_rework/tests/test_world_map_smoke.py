@@ -3,11 +3,15 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 import numpy as np
+import pytest
 
-from world_map_pygame import data_loader
+from world_map_pygame import data_loader, terrain
+from world_map_pygame.config import MAP_H, MAP_W
 from world_map_pygame.history import WorldHistory
+from world_map_pygame.influence import InfluenceMap
 from world_map_pygame.synergy import SynergyEngine
 from world_map_pygame.tools import MaterialLayer
+from world_map_pygame.units import UnitSystem
 
 
 def test_world_map_data_loader_roundtrip(tmp_path, monkeypatch) -> None:
@@ -47,3 +51,119 @@ def test_synergy_engine_weather_affects_units() -> None:
     assert unit.hp < 100.0
     assert unit._weather_spd < 1.0
     assert unit._weather_atk < 1.0
+
+
+def test_unit_index_queries_match_linear_scan() -> None:
+    system = UnitSystem()
+    rng = np.random.RandomState(7)
+    for gid in ("god_a", "god_b", None):
+        for x, y in rng.uniform(0, 200, size=(150, 2)):
+            system.spawn("warrior", float(x), float(y), gid)
+    system.units[3].alive = False
+
+    index = system.index()
+    for cx, cy, radius in ((50.0, 60.0, 9.0), (0.0, 0.0, 15.0), (120.0, 33.0, 4.0)):
+        brute = [
+            i for i, u in enumerate(system.units)
+            if u.alive and (u.x - cx) ** 2 + (u.y - cy) ** 2 <= radius * radius
+        ]
+        assert index.query_radius(cx, cy, radius).tolist() == brute
+        near = [u for u in system.units
+                if u.alive and abs(u.x - cx) <= 2 and abs(u.y - cy) <= 2]
+        assert system.get_at(cx, cy) == near
+
+    assert all(u.god_id == "god_b" for u in system.get_god_units("god_b"))
+    assert len(system.get_god_units("god_b")) == 150
+
+
+def test_synergy_tick_buffs_allies_and_attacks_first_enemy_building() -> None:
+    from world_map_pygame.civilizations import Building, CivilizationSystem
+
+    system = UnitSystem()
+    system.spawn("warrior", 10, 10, "god_a")
+    system.spawn("warrior", 12, 10, "god_b")
+    ally, enemy = system.units
+    ally.x, ally.y = 11.5, 10.5
+    enemy.x, enemy.y = 12.5, 10.0
+    ally._morale = 0.5
+    civs = CivilizationSystem()
+    barracks = Building("barracks", 11, 10, "god_a")
+    wall = Building("wall", 12, 11, "god_a")
+    civs.buildings.extend([barracks, wall])
+    world = SimpleNamespace(
+        units=system,
+        civilizations=civs,
+        weather=SimpleNamespace(zones=[], season="autumn"),
+        materials=MaterialLayer(),
+        biome_map=np.zeros((MAP_H, MAP_W), dtype=np.uint8),
+        biome_names=["grassland"],
+    )
+
+    SynergyEngine().tick(0.5, world, reset=True)
+
+    assert ally._building_atk == 1.2 and ally._building_def == 1.4
+    assert ally._morale == 1.0
+    assert enemy._building_atk == 1.0
+    # Only the first enemy building in list order takes the hit
+    assert barracks.hp < barracks.max_hp
+    assert wall.hp == wall.max_hp
+
+
+def test_influence_incremental_updates_match_full_recalculation() -> None:
+    land = np.ones((MAP_H, MAP_W), dtype=bool)
+    land[:, :300] = False
+    strongholds = [
+        {"god_id": "god_a", "x": 200, "y": 150, "strength": 1.0, "radius": 60},
+        {"god_id": "god_b", "x": 240, "y": 170, "strength": 0.8, "radius": 50},
+        {"god_id": "god_a", "x": 900, "y": 500, "strength": 0.7, "radius": 80},
+    ]
+    incremental = InfluenceMap(["god_a", "god_b"], land)
+    incremental.set_strongholds(strongholds[:2])
+    version = incremental._version
+
+    incremental.add_stronghold(strongholds[2])
+    incremental.update_stronghold(strongholds[1], x=260, strength=1.2)
+    incremental.remove_stronghold(strongholds[0])
+
+    full = InfluenceMap(["god_a", "god_b"], land)
+    full.set_strongholds(strongholds[1:])
+    assert np.array_equal(incremental.layers.to_dense(), full.layers.to_dense())
+    assert np.array_equal(incremental.dominant_god, full.dominant_god)
+    assert np.array_equal(incremental.dominant_strength, full.dominant_strength)
+    for god_id, idx in incremental.god_index.items():
+        expected = int(np.sum(incremental.dominant_god == idx))
+        assert incremental.get_god_territory_count(god_id) == expected > 0
+    # Only the tiles under the two remaining strongholds stay allocated
+    assert incremental.layers.nbytes < 2 * MAP_W * MAP_H
+
+    rects = incremental.dirty_since(version)
+    assert (820, 420, 981, 581) in rects
+    assert all(x1 <= 400 and y1 <= 300 for x0, y0, x1, y1 in rects if x0 < 300)
+    assert incremental.dirty_since(incremental._version) == []
+    assert incremental.dirty_since(version - 1) is None
+
+
+def test_load_terrain_reuses_cached_layers(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(terrain, "TERRAIN_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(terrain, "MAP_W", 96)
+    monkeypatch.setattr(terrain, "MAP_H", 60)
+    generated = terrain.load_terrain(seed=7)
+    assert generated["base_colors"].shape == (60, 96, 3)
+    assert np.array_equal(generated["land_mask"],
+                          terrain.build_land_mask(generated["biome_map"], generated["biome_names"]))
+
+    def _no_generation(*args, **kwargs):
+        raise AssertionError("terrain regenerated despite cache")
+
+    monkeypatch.setattr(terrain, "generate_terrain", _no_generation)
+    cached = terrain.load_terrain(seed=7)
+    assert cached["biome_names"] == generated["biome_names"]
+    for name in ("heightmap", "moisture", "temperature", "biome_map", "land_mask", "base_colors"):
+        assert isinstance(cached[name], np.memmap)
+        assert np.array_equal(cached[name], generated[name])
+    # Copy-on-write: editing the loaded map leaves the cache intact
+    cached["heightmap"][:] = 0
+    assert np.array_equal(terrain.load_terrain(seed=7)["heightmap"], generated["heightmap"])
+    # Another seed is a different cache entry
+    with pytest.raises(AssertionError):
+        terrain.load_terrain(seed=8)
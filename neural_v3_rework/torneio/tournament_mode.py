@@ -702,36 +702,43 @@ class TournamentRunner:
         print("  ðŸŽ® INICIANDO TORNEIO AUTOMÃTICO")
         print("=" * 70)
         
-        while self.tournament.state != TournamentState.FINISHED:
-            match = self.tournament.get_current_match()
+        # Lutas em sequencia: grava tournament_state.json de forma coalescida
+        app_state = AppState.get()
+        app_state.enable_write_behind()
+        try:
+            while self.tournament.state != TournamentState.FINISHED:
+                match = self.tournament.get_current_match()
             
-            if not match:
-                break
+                if not match:
+                    break
             
-            if match.fighter1_name.startswith("BYE") or match.fighter2_name.startswith("BYE"):
-                # BYE jÃ¡ processado
-                continue
+                if match.fighter1_name.startswith("BYE") or match.fighter2_name.startswith("BYE"):
+                    # BYE jÃ¡ processado
+                    continue
             
-            print(f"\nâš”ï¸  LUTA: {match.fighter1_name} vs {match.fighter2_name}")
+                print(f"\nâš”ï¸  LUTA: {match.fighter1_name} vs {match.fighter2_name}")
             
-            # Executa a luta
-            result = self.run_single_match(match)
+                # Executa a luta
+                result = self.run_single_match(match)
             
-            if result["success"]:
-                winner = result["winner"]
-                self.tournament.record_match_result(
-                    winner_name=winner,
-                    duration=result["duration"],
-                    ko_type=result["ko_type"]
-                )
-                print(f"   ðŸ† Vencedor: {winner} ({result['ko_type']} em {result['duration']:.1f}s)")
-            else:
-                # Decide aleatoriamente em caso de erro
-                winner = random.choice([match.fighter1_name, match.fighter2_name])
-                self.tournament.record_match_result(winner_name=winner, ko_type="DecisÃ£o")
-                print(f"   ðŸ† Vencedor (decisÃ£o): {winner}")
+                if result["success"]:
+                    winner = result["winner"]
+                    self.tournament.record_match_result(
+                        winner_name=winner,
+                        duration=result["duration"],
+                        ko_type=result["ko_type"]
+                    )
+                    print(f"   ðŸ† Vencedor: {winner} ({result['ko_type']} em {result['duration']:.1f}s)")
+                else:
+                    # Decide aleatoriamente em caso de erro
+                    winner = random.choice([match.fighter1_name, match.fighter2_name])
+                    self.tournament.record_match_result(winner_name=winner, ko_type="DecisÃ£o")
+                    print(f"   ðŸ† Vencedor (decisÃ£o): {winner}")
             
-            time.sleep(delay_between_fights)
+                time.sleep(delay_between_fights)
+                app_state.flush_if_due()
+        finally:
+            app_state.disable_write_behind()
         
         print("\n" + self.tournament.get_bracket_display())
         self.tournament.save_state()
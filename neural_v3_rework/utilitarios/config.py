@@ -43,6 +43,7 @@ AI_HP_EXECUTE      = 0.20   # Inimigo abaixo disto ativa Execute Mode
 AI_DIST_ATAQUE_IMINENTE = 3.5   # (metros) Distância máxima para considerar ataque iminente
 AI_DIST_PAREDE_CRITICA  = 2.0   # (metros) Distância de parede para considerar "encurralado"
 AI_DIST_PAREDE_AVISO    = 3.0   # (metros) Inicia detecção de parede
+AI_RAIO_CONSCIENCIA_MULTI = None # (metros) Corte opcional da consciência multi-combatente; None = arena inteira
 
 # --- Intervalos de Atualização ---
 AI_INTERVALO_ESPACIAL       = 0.20  # (segundos) Frequência de atualização da consciência espacial
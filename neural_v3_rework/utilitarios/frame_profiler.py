@@ -0,0 +1,203 @@
+"""
+NEURAL FIGHTS - Profiler de Frame
+=================================
+Mede as fases de Simulador.update, as fases de SimuladorRenderer.desenhar
+e cada chamada de AIBrain.processar. Cada nome medido tem um ring buffer
+(array('d'), tamanho fixo) com as ultimas amostras, de onde saem p50/p95/max.
+
+Com trace ligado, cada intervalo tambem vira um evento "X" do formato
+Chrome Trace (abre em chrome://tracing, Perfetto e speedscope, que
+desenham o flamegraph a partir do aninhamento por tempo); salvar_folded()
+gera as pilhas no formato do flamegraph.pl.
+
+Desligado (padrao), medir() so chama a funcao. Ligado, custa dois
+perf_counter() e uma escrita no buffer por fase.
+
+Uso headless:
+    sim = Simulador.headless(config)
+    sim.profiler.ativar(trace=True)
+    for _ in range(600):
+        sim.update(1 / 60)
+    print(sim.profiler.stats())
+    sim.profiler.salvar_trace("trace.json")
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+AMOSTRAS_PADRAO = 600          # 10 s a 60 FPS
+MAX_EVENTOS_TRACE = 500_000    # ~20 min de luta headless com 2 lutadores
+
+
+class _RingBuffer:
+    """Ultimas N duracoes (segundos) de um nome medido."""
+
+    __slots__ = ("valores", "pos", "qtd")
+
+    def __init__(self, capacidade: int):
+        self.valores = array('d', bytes(8 * capacidade))
+        self.pos = 0
+        self.qtd = 0
+
+    def adicionar(self, valor: float) -> None:
+        self.valores[self.pos] = valor
+        self.pos += 1
+        if self.pos == len(self.valores):
+            self.pos = 0
+        if self.qtd < len(self.valores):
+            self.qtd += 1
+
+    def amostras(self) -> array:
+        return self.valores[:self.qtd]
+
+
+def _percentil(ordenadas: Sequence[float], q: float) -> float:
+    """Percentil q (0-100) com interpolacao linear, como numpy.percentile."""
+    pos = (len(ordenadas) - 1) * q / 100.0
+    baixo = math.floor(pos)
+    alto = min(baixo + 1, len(ordenadas) - 1)
+    return ordenadas[baixo] + (ordenadas[alto] - ordenadas[baixo]) * (pos - baixo)
+
+
+class FrameProfiler:
+    """Tempos por fase em ring buffers, com trace opcional."""
+
+    def __init__(self, capacidade: int = AMOSTRAS_PADRAO, ativo: bool = False, trace: bool = False):
+        self.capacidade = max(1, int(capacidade))
+        self.ativo = ativo
+        self.trace = trace
+        self._buffers: Dict[str, _RingBuffer] = {}
+        self._eventos: List[Tuple[str, float, float]] = []
+        self.eventos_descartados = 0
+        self._origem = time.perf_counter()
+
+    # -- controle -------------------------------------------------------------
+
+    def ativar(self, trace: Optional[bool] = None) -> None:
+        self.ativo = True
+        if trace is not None:
+            self.trace = trace
+
+    def desativar(self) -> None:
+        self.ativo = False
+
+    def limpar(self) -> None:
+        """Zera buffers e trace (mantem ativo/trace)."""
+        self._buffers.clear()
+        self._eventos.clear()
+        self.eventos_descartados = 0
+        self._origem = time.perf_counter()
+
+    # -- medicao --------------------------------------------------------------
+
+    def medir(self, nome: str, fn, *args, **kwargs):
+        """Chama fn(*args, **kwargs) e, se ativo, registra a duracao em nome."""
+        if not self.ativo:
+            return fn(*args, **kwargs)
+        inicio = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.registrar(nome, inicio, time.perf_counter())
+
+    def registrar(self, nome: str, inicio: float, fim: float) -> None:
+        """Registra um intervalo medido por fora (perf_counter)."""
+        buf = self._buffers.get(nome)
+        if buf is None:
+            buf = self._buffers[nome] = _RingBuffer(self.capacidade)
+        buf.adicionar(fim - inicio)
+        if self.trace:
+            if len(self._eventos) < MAX_EVENTOS_TRACE:
+                self._eventos.append((nome, inicio, fim))
+            else:
+                self.eventos_descartados += 1
+
+    # -- leitura --------------------------------------------------------------
+
+    def nomes(self) -> List[str]:
+        return list(self._buffers)
+
+    def stats(self) -> Dict[str, dict]:
+        """{nome: {n, p50_ms, p95_ms, max_ms, media_ms}} das amostras no buffer."""
+        resultado = {}
+        for nome, buf in self._buffers.items():
+            amostras = sorted(buf.amostras())
+            if not amostras:
+                continue
+            resultado[nome] = {
+                "n": len(amostras),
+                "p50_ms": _percentil(amostras, 50) * 1000.0,
+                "p95_ms": _percentil(amostras, 95) * 1000.0,
+                "max_ms": amostras[-1] * 1000.0,
+                "media_ms": math.fsum(amostras) / len(amostras) * 1000.0,
+            }
+        return resultado
+
+    def eventos_trace(self) -> List[dict]:
+        """Eventos no formato Chrome Trace (ts/dur em microssegundos)."""
+        origem = self._origem
+        return [
+            {
+                "name": nome,
+                "cat": nome.split("/", 1)[0],
+                "ph": "X",
+                "ts": round((inicio - origem) * 1e6, 3),
+                "dur": round((fim - inicio) * 1e6, 3),
+                "pid": 0,
+                "tid": 0,
+            }
+            for nome, inicio, fim in self._eventos
+        ]
+
+    def salvar_trace(self, caminho: str) -> None:
+        """Grava o trace JSON (Chrome Trace Event Format) e as stats."""
+        dados = {
+            "traceEvents": self.eventos_trace(),
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "stats": self.stats(),
+                "eventos_descartados": self.eventos_descartados,
+            },
+        }
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(dados, f)
+
+    def pilhas_folded(self) -> Dict[str, int]:
+        """
+        Tempo proprio (microssegundos) por pilha "pai;filho", reconstruida
+        pelo aninhamento dos intervalos.
+        """
+        pilhas: Dict[str, int] = {}
+        # Pai antes do filho: inicio crescente, mais longo primeiro no empate
+        eventos = sorted(self._eventos, key=lambda e: (e[1], -e[2]))
+        abertos: list = []  # [nome, fim, tempo dos filhos, inicio]
+
+        def fechar(item, caminho):
+            proprio = (item[1] - item[3]) - item[2]
+            chave = ";".join(caminho)
+            pilhas[chave] = pilhas.get(chave, 0) + max(0, round(proprio * 1e6))
+
+        for nome, inicio, fim in eventos:
+            while abertos and abertos[-1][1] <= inicio:
+                item = abertos.pop()
+                fechar(item, [a[0] for a in abertos] + [item[0]])
+                if abertos:
+                    abertos[-1][2] += item[1] - item[3]
+            abertos.append([nome, fim, 0.0, inicio])
+        while abertos:
+            item = abertos.pop()
+            fechar(item, [a[0] for a in abertos] + [item[0]])
+            if abertos:
+                abertos[-1][2] += item[1] - item[3]
+        return pilhas
+
+    def salvar_folded(self, caminho: str) -> None:
+        """Grava as pilhas no formato de entrada do flamegraph.pl."""
+        with open(caminho, "w", encoding="utf-8") as f:
+            for pilha, micros in sorted(self.pilhas_folded().items()):
+                f.write(f"{pilha} {micros}\n")
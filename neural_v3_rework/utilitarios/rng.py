@@ -0,0 +1,117 @@
+"""
+NEURAL FIGHTS - RNG da Partida
+==============================
+Streams de numeros aleatorios de uma luta, todos derivados de uma seed
+unica (match_config["seed"]). Com a mesma seed a luta headless se repete
+bit a bit: da para cachear o resultado e re-rodar um outlier de
+balanceamento ou um replay.
+
+Streams:
+    combate  o proprio modulo random (fisica, dano, skills e as decisoes
+             da IA que chamam random.* direto). ativar() o re-semeia e
+             em_combate() troca o estado do processo pelo da luta.
+    ia       pool por frame do AIBrain (_rand_pool / _rand).
+    spawn    posicao de spawn e deriva dos monstros da horda.
+    vfx      rng_vfx: particulas, animacoes, textos flutuantes, shake de
+             camera e variacao de audio.
+
+Visual e audio tem stream proprio porque rodam ou nao conforme o modo
+(janela, headless, VFX de magia desligado) e mudam a cada ajuste
+cosmetico; se consumissem o stream de combate, a mesma seed daria lutas
+diferentes.
+
+O stream de combate mora no modulo random, mas so durante a luta: o
+Simulador roda cada update() dentro de em_combate(), que guarda o estado
+da luta na saida e devolve o random de quem estava antes. UI, torneio e
+previews podem usar random entre frames sem mudar a luta. Os singletons
+do Simulador (coreografia, game feel) e o rng_vfx continuam do processo:
+a reproducao exata pede uma luta ativa por processo, que e como o batch
+engine roda (um worker por luta). ia e spawn ficam no RNGPartida do
+ContextoSimulacao.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Stream visual compartilhado pelos modulos de efeitos (re-semeado por ativar())
+rng_vfx = random.Random()
+
+
+def derivar_semente(seed: int, nome: str) -> int:
+    """Seed estavel de um stream (independe de PYTHONHASHSEED)."""
+    return random.Random(f"{seed}:{nome}").getrandbits(32)
+
+
+class RNGPartida:
+    """Seed da luta e os streams nomeados derivados dela."""
+
+    def __init__(self, seed: Optional[int] = None):
+        # Sem seed fixa, sorteia do random global: random.seed(x) antes de
+        # montar o Simulador continua reproduzindo a luta (ferramentas antigas)
+        self.seed = int(seed) if seed is not None else random.getrandbits(32)
+        self._streams: Dict[str, random.Random] = {}
+        # Estado do random de fora da luta enquanto ela esta ativa, e o da
+        # luta enquanto ela esta suspensa
+        self._fora: Optional[tuple] = None
+        self._estado: Optional[tuple] = None
+
+    def semente(self, nome: str) -> int:
+        return derivar_semente(self.seed, nome)
+
+    def stream(self, nome: str):
+        """random.Random do stream; "combate" e o modulo random."""
+        if nome == "combate":
+            return random
+        if nome == "vfx":
+            return rng_vfx
+        rng = self._streams.get(nome)
+        if rng is None:
+            rng = self._streams[nome] = random.Random(self.semente(nome))
+        return rng
+
+    @property
+    def ia(self) -> random.Random:
+        return self.stream("ia")
+
+    @property
+    def spawn(self) -> random.Random:
+        return self.stream("spawn")
+
+    def ativar(self) -> None:
+        """Re-semeia os streams do processo (combate e vfx) e entra na luta."""
+        self._fora = random.getstate()
+        random.seed(self.semente("combate"))
+        rng_vfx.seed(self.semente("vfx"))
+
+    def suspender(self) -> None:
+        """Guarda o stream de combate e devolve o random de fora da luta."""
+        if self._fora is None:
+            return
+        self._estado = random.getstate()
+        random.setstate(self._fora)
+        self._fora = None
+
+    def retomar(self) -> None:
+        """Volta ao stream de combate de onde suspender() parou."""
+        if self._fora is not None:
+            return
+        if self._estado is None:
+            self.ativar()
+            return
+        self._fora = random.getstate()
+        random.setstate(self._estado)
+
+    @contextmanager
+    def em_combate(self):
+        """Roda o bloco no stream de combate (reentrante)."""
+        if self._fora is not None:
+            yield
+            return
+        self.retomar()
+        try:
+            yield
+        finally:
+            self.suspender()
@@ -10,6 +10,9 @@ ROOT_DIR    = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR    = os.path.join(ROOT_DIR, "data")
 NEURAL_DIR  = os.path.join(os.path.dirname(ROOT_DIR), "neural_v3_rework")
 
+# ─── Live Sync ─────────────────────────────────────────────────────────────────
+LIVE_SYNC_TIMEOUT = 2.0   # s between checks when no wake-up datagram arrives
+
 # ─── Screen (defaults — overridden at runtime by SCR) ──────────────────────────
 SCREEN_W = 1280
 SCREEN_H = 900
@@ -56,6 +59,11 @@ TERRAIN_PERSISTENCE = 0.50
 TERRAIN_LACUNARITY  = 2.0
 TEMPERATURE_SEED    = 201
 
+# Generated layers are cached per seed/parameter set and memory-mapped on
+# later launches; bump the version whenever generate_terrain's output changes.
+TERRAIN_CACHE_DIR     = os.path.join(DATA_DIR, "terrain_cache")
+TERRAIN_CACHE_VERSION = 1
+
 # ─── Biome Colors — 22 biomes ─────────────────────────────────────────────────
 BIOME_COLORS = {
     'deep_ocean':     (15,  18,  50),
@@ -108,6 +116,8 @@ INFLUENCE_DEFAULT_RADIUS  = 70
 INFLUENCE_MIN_THRESHOLD   = 0.05
 INFLUENCE_TINT_STRENGTH   = 0.35
 INFLUENCE_WATER_FACTOR    = 0.15
+INFLUENCE_TILE            = CHUNK_SIZE   # sparse layer tile edge (matches render chunks)
+INFLUENCE_LAYER_DTYPE     = 'float32'    # 'float16' halves tile memory, loses precision
 
 # ─── God Colors ───────────────────────────────────────────────────────────────
 GOD_COLORS = {
@@ -167,6 +177,8 @@ RESOURCE_TYPES      = ['food', 'wood', 'stone', 'iron', 'gold', 'mana']
 
 # ─── Units ────────────────────────────────────────────────────────────────────
 UNIT_SPEED          = 2.0      # tiles per second
+UNIT_GRID_CELL      = CHUNK_SIZE // 4   # spatial-hash cell (4×4 cells per chunk)
+UNIT_GRID_PAD       = 2.0      # query slack for units that moved since the grid was built
 
 # ─── Army & War System ────────────────────────────────────────────────────────
 ARMY_MIN_SIZE       = 3
@@ -2,6 +2,7 @@
 World Map — Data Loader
 JSON I/O helpers for world state, gods, and game integration.
 """
+import importlib.util
 import json, os
 try:
     from .config import DATA_DIR, NEURAL_DIR
@@ -52,3 +53,99 @@ def save_gods(data):
 def load_game_gods():
     """Load god definitions from the combat game."""
     return _load(os.path.join(NEURAL_DIR, "data", "gods.json"), {"gods": {}})
+
+
+# ── World journal (written by neural_v3_rework/dados/world_bridge.py) ─────────
+# One JSON object per line: {"seq": N, "ts": "...", "ops": [{"op": ...}, ...]}.
+# world_state.json["_meta"]["journal_seq"] is the last seq already folded
+# into the snapshot; compaction replaces the journal with an empty file.
+JOURNAL_FILE   = "world_journal.jsonl"
+SYNC_PORT_FILE = "live_sync.port"
+
+
+def journal_stat():
+    """(inode, size) of the journal, or (None, 0) if it doesn't exist."""
+    try:
+        st = os.stat(os.path.join(DATA_DIR, JOURNAL_FILE))
+    except OSError:
+        return None, 0
+    return st.st_ino, st.st_size
+
+def read_journal(offset=0):
+    """
+    Journal entries from byte ``offset`` on, as (entries, new_offset).
+    A trailing line still being written is left for the next read.
+    """
+    try:
+        with open(os.path.join(DATA_DIR, JOURNAL_FILE), 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return [], offset
+    end = data.rfind(b"\n") + 1
+    entries = []
+    for line in data[:end].splitlines():
+        try:
+            entries.append(json.loads(line))
+        except ValueError as e:
+            print(f"[DataLoader] bad journal line skipped: {e}")
+    return entries, offset + end
+
+_apply_ops = None
+
+
+def journal_op_applier():
+    """
+    The bridge's own op-apply function (_apply_journal_ops in
+    neural_v3_rework/dados/world_bridge.py), so the map folds journal ops
+    exactly like the writer does. Loaded by file path: the bridge module
+    only needs the stdlib, while its ``dados`` package pulls in the whole
+    combat game. None if the combat game is not installed next to the map.
+    """
+    global _apply_ops
+    if _apply_ops is None:
+        path = os.path.join(NEURAL_DIR, "dados", "world_bridge.py")
+        try:
+            spec = importlib.util.spec_from_file_location("_world_bridge_ops", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _apply_ops = module._apply_journal_ops
+        except (OSError, ImportError, AttributeError) as e:
+            print(f"[DataLoader] journal replay unavailable: {e}")
+            return None
+    return _apply_ops
+
+def load_current_gods():
+    """
+    gods.json plus the journal entries not yet folded into it, as
+    (gods_data, seq): seq is the last journal seq the result includes.
+    """
+    gds = load_gods()
+    seq = gds.get("_meta", {}).get("journal_seq", 0)
+    apply_ops = journal_op_applier()
+    if apply_ops is None:
+        return gds, seq
+    entries, _ = read_journal(0)
+    for entry in entries:
+        eseq = entry.get("seq", 0)
+        if eseq > seq:
+            apply_ops(None, gds, entry.get("ops", []))
+            seq = eseq
+    return gds, seq
+
+def write_sync_port(port):
+    """Publish the UDP port LiveSync listens on for journal wake-ups."""
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(os.path.join(DATA_DIR, SYNC_PORT_FILE), 'w', encoding='utf-8') as f:
+            f.write(str(port))
+        return True
+    except OSError as e:
+        print(f"[DataLoader] write error {SYNC_PORT_FILE}: {e}")
+        return False
+
+def clear_sync_port():
+    try:
+        os.remove(os.path.join(DATA_DIR, SYNC_PORT_FILE))
+    except OSError:
+        pass
@@ -2,22 +2,113 @@
 World Map — Freeform Influence System  (v6.0 Optimised)
 Each god's strongholds radiate influence; no hard borders.
 Uses sparse computation: only computes within stronghold radius (130× faster for big maps).
+Layers are stored as sparse tiles: only tiles a stronghold reaches are allocated.
 """
 import numpy as np
 try:
     from .config import (
         MAP_W, MAP_H,
         INFLUENCE_DEFAULT_RADIUS, INFLUENCE_MIN_THRESHOLD,
-        INFLUENCE_WATER_FACTOR,
+        INFLUENCE_WATER_FACTOR, INFLUENCE_TILE, INFLUENCE_LAYER_DTYPE,
     )
 except ImportError:  # pragma: no cover - direct script fallback
     from config import (
         MAP_W, MAP_H,
         INFLUENCE_DEFAULT_RADIUS, INFLUENCE_MIN_THRESHOLD,
-        INFLUENCE_WATER_FACTOR,
+        INFLUENCE_WATER_FACTOR, INFLUENCE_TILE, INFLUENCE_LAYER_DTYPE,
     )
 
 
+# Dirty-rect log length: a reader further behind than this redraws everything
+_DIRTY_LOG_LEN = 64
+
+
+class InfluenceTiles:
+    """
+    Sparse per-god influence layers, stored as TILE×TILE blocks.
+
+    Only tiles some stronghold actually reaches are allocated; everything
+    else reads as zero. ``tiles[god, y0:y1, x0:x1]`` returns a dense
+    float32 window, like the old (num_gods, MAP_H, MAP_W) array did.
+    """
+
+    def __init__(self, num_gods, tile=INFLUENCE_TILE, dtype=INFLUENCE_LAYER_DTYPE):
+        self.num_gods = num_gods
+        self.tile     = tile
+        self.dtype    = np.dtype(dtype)
+        self.shape    = (num_gods, MAP_H, MAP_W)
+        self._tiles   = {}    # (ty, tx) → {god_index: ndarray(tile, tile)}
+
+    def pieces(self, x0, y0, x1, y1):
+        """Yield (tile key, tile-local slices, map slices) covering a rect."""
+        t = self.tile
+        for ty in range(y0 // t, (y1 - 1) // t + 1):
+            oy = ty * t
+            a0, a1 = max(y0, oy), min(y1, oy + t)
+            for tx in range(x0 // t, (x1 - 1) // t + 1):
+                ox = tx * t
+                b0, b1 = max(x0, ox), min(x1, ox + t)
+                yield ((ty, tx),
+                       (slice(a0 - oy, a1 - oy), slice(b0 - ox, b1 - ox)),
+                       (slice(a0, a1), slice(b0, b1)))
+
+    def block(self, key):
+        """{god_index: tile array} allocated at a tile key (may be empty)."""
+        return self._tiles.get(key, {})
+
+    def add(self, god, x0, y0, values):
+        """Add a dense window whose top-left tile is (x0, y0)."""
+        h, w = values.shape
+        for key, local, glob in self.pieces(x0, y0, x0 + w, y0 + h):
+            block = self._tiles.setdefault(key, {})
+            arr = block.get(god)
+            if arr is None:
+                arr = block[god] = np.zeros((self.tile, self.tile), self.dtype)
+            arr[local] += values[glob[0].start - y0:glob[0].stop - y0,
+                                 glob[1].start - x0:glob[1].stop - x0]
+
+    def clear(self, god, x0, y0, x1, y1):
+        """Zero one god inside a rect, freeing tiles that become empty."""
+        for key, local, _ in self.pieces(x0, y0, x1, y1):
+            block = self._tiles.get(key)
+            if not block or god not in block:
+                continue
+            arr = block[god]
+            arr[local] = 0
+            if not arr.any():
+                del block[god]
+                if not block:
+                    del self._tiles[key]
+
+    def clear_all(self):
+        self._tiles.clear()
+
+    def read(self, god, x0, y0, x1, y1):
+        out = np.zeros((y1 - y0, x1 - x0), dtype=np.float32)
+        for key, local, glob in self.pieces(x0, y0, x1, y1):
+            arr = self._tiles.get(key, {}).get(god)
+            if arr is not None:
+                out[glob[0].start - y0:glob[0].stop - y0,
+                    glob[1].start - x0:glob[1].stop - x0] = arr[local]
+        return out
+
+    def __getitem__(self, key):
+        god, ys, xs = key
+        y0, y1, _ = ys.indices(MAP_H)
+        x0, x1, _ = xs.indices(MAP_W)
+        return self.read(god, x0, y0, x1, y1)
+
+    def to_dense(self):
+        out = np.zeros(self.shape, dtype=np.float32)
+        for god in range(self.num_gods):
+            out[god] = self.read(god, 0, 0, MAP_W, MAP_H)
+        return out
+
+    @property
+    def nbytes(self):
+        return sum(arr.nbytes for block in self._tiles.values() for arr in block.values())
+
+
 class InfluenceMap:
     """Per-god influence layers + dominant-territory computation."""
 
@@ -27,15 +118,20 @@ class InfluenceMap:
         self.land_mask = land_mask
         self.num_gods  = len(god_ids)
 
-        # Per-god influence: (num_gods, MAP_H, MAP_W)
-        self.layers = np.zeros((self.num_gods, MAP_H, MAP_W), dtype=np.float32)
+        # Per-god influence, sparse tiles over (num_gods, MAP_H, MAP_W)
+        self.layers = InfluenceTiles(self.num_gods)
 
         # Computed dominance
         self.dominant_god      = np.full((MAP_H, MAP_W), -1, dtype=np.int8)
         self.dominant_strength = np.zeros((MAP_H, MAP_W), dtype=np.float32)
+        # Tiles owned per god, kept in step with dominant_god
+        self._territory        = np.zeros(self.num_gods, dtype=np.int64)
 
         self.strongholds = []
         self._version    = 0
+        # (version, (x0, y0, x1, y1)) per changed tile rect; rect None = whole map
+        self._dirty       = []
+        self._dirty_floor = 0    # newest version whose rects were trimmed
 
     # ── public ─────────────────────────────────────────────────────────────
     def set_strongholds(self, strongholds):
@@ -44,7 +140,65 @@ class InfluenceMap:
 
     def add_stronghold(self, sh):
         self.strongholds.append(sh)
-        self._recalculate()
+        # Appended last, so adding its splat matches a full recalculation
+        rect = self._splat(sh)
+        if rect:
+            self._update_dominance(rect)
+            self._bump(rect)
+
+    def remove_stronghold(self, sh):
+        """Remove a stronghold, recomputing only its god layer inside its box."""
+        try:
+            self.strongholds.remove(sh)
+        except ValueError:
+            return False
+        rect = self._bbox(sh)
+        if rect:
+            self._rebuild_window(self.god_index[sh['god_id']], rect)
+            self._update_dominance(rect)
+            self._bump(rect)
+        return True
+
+    def update_stronghold(self, sh, **changes):
+        """
+        Move / re-strength / re-radius / re-assign a stronghold in place
+        (e.g. update_stronghold(sh, x=10, y=20, strength=0.5)).
+        Only the old and new boxes of the affected god layers are rebuilt.
+        """
+        old_rect = self._bbox(sh)
+        old_god = self.god_index.get(sh.get('god_id', ''))
+        sh.update(changes)
+        new_rect = self._bbox(sh)
+        new_god = self.god_index.get(sh.get('god_id', ''))
+
+        rects = [r for r in (old_rect, new_rect) if r]
+        if old_rect:
+            self._rebuild_window(old_god, old_rect)
+        if new_rect:
+            self._rebuild_window(new_god, new_rect)
+        for rect in rects:
+            self._update_dominance(rect)
+        if rects:
+            self._bump(*rects)
+
+    def dirty_since(self, version):
+        """
+        Tile rects (x0, y0, x1, y1) changed after ``version``, or None when
+        the whole map must be treated as dirty (full recalculation, or the
+        reader fell further behind than the log keeps).
+        """
+        if version == self._version:
+            return []
+        if version < self._dirty_floor:
+            return None
+        rects = []
+        for ver, rect in self._dirty:
+            if ver <= version:
+                continue
+            if rect is None:
+                return None
+            rects.append(rect)
+        return rects
 
     def get_dominant_at(self, x, y):
         """Return (god_id | None, strength) at tile (x, y)."""
@@ -58,43 +212,99 @@ class InfluenceMap:
         idx = self.god_index.get(god_id)
         if idx is None:
             return 0
-        return int(np.sum(self.dominant_god == idx))
+        return int(self._territory[idx])
 
     # ── internal (SPARSE — only compute within stronghold radius) ──────────
-    def _recalculate(self):
-        self.layers.fill(0)
+    def _bbox(self, sh):
+        """Tile box (x0, y0, x1, y1) a stronghold can influence, or None."""
+        if sh.get('god_id', '') not in self.god_index:
+            return None
+        sx, sy = sh['x'], sh['y']
+        radius = sh.get('radius', INFLUENCE_DEFAULT_RADIUS)
+        x0 = max(0, sx - radius)
+        y0 = max(0, sy - radius)
+        x1 = min(MAP_W, sx + radius + 1)
+        y1 = min(MAP_H, sy + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1, y1)
+
+    def _splat(self, sh, clip=None):
+        """Add a stronghold's influence to its god layer (inside ``clip``)."""
+        rect = self._bbox(sh)
+        if rect is None:
+            return None
+        x0, y0, x1, y1 = rect
+        if clip is not None:
+            x0, y0 = max(x0, clip[0]), max(y0, clip[1])
+            x1, y1 = min(x1, clip[2]), min(y1, clip[3])
+            if x0 >= x1 or y0 >= y1:
+                return None
+        idx      = self.god_index[sh['god_id']]
+        sx, sy   = sh['x'], sh['y']
+        strength = sh.get('strength', 1.0)
+        radius   = sh.get('radius', INFLUENCE_DEFAULT_RADIUS)
 
+        yy, xx = np.mgrid[y0:y1, x0:x1]
+        dist = np.sqrt((xx - sx) ** 2 + (yy - sy) ** 2).astype(np.float32)
+        inf  = strength * np.clip(1.0 - dist / radius, 0, 1)
+        self.layers.add(idx, x0, y0, inf)
+        return (x0, y0, x1, y1)
+
+    def _rebuild_window(self, god, rect):
+        """Re-splat one god layer inside rect, in stronghold order."""
+        x0, y0, x1, y1 = rect
+        self.layers.clear(god, x0, y0, x1, y1)
         for sh in self.strongholds:
-            god_id = sh.get('god_id', '')
-            if god_id not in self.god_index:
+            if self.god_index.get(sh.get('god_id', '')) == god:
+                self._splat(sh, rect)
+
+    def _update_dominance(self, rect):
+        """Recompute dominance inside rect, one tile at a time."""
+        n = self.num_gods
+        for key, local, glob in self.layers.pieces(*rect):
+            old = self.dominant_god[glob]
+            owned = old[old >= 0]
+            if owned.size:
+                self._territory -= np.bincount(owned, minlength=n)
+
+            block = self.layers.block(key)
+            if not block:
+                self.dominant_god[glob] = -1
+                self.dominant_strength[glob] = 0
                 continue
-            idx      = self.god_index[god_id]
-            sx, sy   = sh['x'], sh['y']
-            strength = sh.get('strength', 1.0)
-            radius   = sh.get('radius', INFLUENCE_DEFAULT_RADIUS)
-
-            # Only compute within bounding box of radius
-            y0 = max(0, sy - radius)
-            y1 = min(MAP_H, sy + radius + 1)
-            x0 = max(0, sx - radius)
-            x1 = min(MAP_W, sx + radius + 1)
-
-            yy, xx = np.mgrid[y0:y1, x0:x1]
-            dist = np.sqrt((xx - sx) ** 2 + (yy - sy) ** 2).astype(np.float32)
-            inf  = strength * np.clip(1.0 - dist / radius, 0, 1)
-            self.layers[idx, y0:y1, x0:x1] += inf
-
-        # Dominance
-        max_inf = np.max(self.layers, axis=0)
-        argmax  = np.argmax(self.layers, axis=0)
-
-        self.dominant_god = np.where(
-            max_inf >= INFLUENCE_MIN_THRESHOLD, argmax, -1
-        ).astype(np.int8)
-
-        # Strength (reduced on water)
-        self.dominant_strength = np.where(
-            self.land_mask, max_inf, max_inf * INFLUENCE_WATER_FACTOR
-        )
+            gods = sorted(block)
+            stack = np.stack([block[g][local] for g in gods]).astype(np.float32, copy=False)
+            max_inf = np.max(stack, axis=0)
+            if len(gods) < n:
+                max_inf = np.maximum(max_inf, 0)   # gods without a tile here are 0
+            dom = np.where(max_inf >= INFLUENCE_MIN_THRESHOLD,
+                           np.asarray(gods)[np.argmax(stack, axis=0)], -1)
+
+            self.dominant_god[glob] = dom
+            owned = dom[dom >= 0]
+            if owned.size:
+                self._territory += np.bincount(owned, minlength=n)
 
+            # Strength (reduced on water)
+            self.dominant_strength[glob] = np.where(
+                self.land_mask[glob], max_inf, max_inf * INFLUENCE_WATER_FACTOR
+            )
+
+    def _bump(self, *rects):
         self._version += 1
+        for rect in rects:
+            self._dirty.append((self._version, rect))
+        cut = len(self._dirty) - _DIRTY_LOG_LEN
+        if cut > 0:
+            self._dirty_floor = self._dirty[cut - 1][0]
+            del self._dirty[:cut]
+
+    def _recalculate(self):
+        self.layers.clear_all()
+
+        for sh in self.strongholds:
+            self._splat(sh)
+
+        self._update_dominance((0, 0, MAP_W, MAP_H))
+        self._bump(None)
@@ -1,23 +1,41 @@
 """
 World Map — Live Sync
-File-watcher that detects changes from the combat game.
+Follows changes made by the combat game.
+
+Fight results arrive as entries in the append-only world journal
+(data_loader.read_journal): only the new lines are read and handed to
+``on_journal``, so a map update costs as much as the change. The combat
+side wakes this thread with a UDP datagram on the port published in
+SYNC_PORT_FILE; LIVE_SYNC_TIMEOUT is only the fallback check interval.
+A rewritten world_state.json snapshot (compaction, or another writer) is
+still reloaded whole through ``on_state_changed``. If a compaction folded
+entries this map never read, ``on_journal`` first gets one catch-up entry
+rebuilt from the snapshots: zone claims, current gods and the world
+events newer than the last one delivered.
 """
-import os, threading, time
+import os, socket, threading, time
 try:
-    from .config import DATA_DIR
+    from .config import DATA_DIR, LIVE_SYNC_TIMEOUT
     from . import data_loader
 except ImportError:  # pragma: no cover - direct script fallback
-    from config import DATA_DIR
+    from config import DATA_DIR, LIVE_SYNC_TIMEOUT
     import data_loader
 
 
 class LiveSync:
-    def __init__(self, on_state_changed=None):
+    def __init__(self, on_state_changed=None, on_journal=None):
         self.on_state_changed = on_state_changed
+        self.on_journal = on_journal
         self._running   = False
         self._thread    = None
         self._last_mt   = 0
         self._path      = os.path.join(DATA_DIR, "world_state.json")
+        self._sock      = None
+        # Journal read position and last applied seq
+        self._journal_ino = None
+        self._offset    = 0
+        self._seq       = 0
+        self._last_event_ts = ""
 
     def start(self):
         if self._running:
@@ -25,35 +43,136 @@ class LiveSync:
         self._running = True
         if os.path.exists(self._path):
             self._last_mt = os.path.getmtime(self._path)
+        # Entries newer than the snapshot are replayed on the first poll
+        st = data_loader.load_world_state()
+        self._seq = self._snapshot_seq(st)
+        self._last_event_ts = self._newest_event_ts((st or {}).get("world_events", []))
+        self._open_wakeup()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
         print("[LiveSync] watching for combat-game updates…")
 
     def stop(self):
         self._running = False
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.sendto(b"stop", sock.getsockname())
+            except OSError:
+                pass
         if self._thread:
             self._thread.join(timeout=2)
+        if sock is not None:
+            sock.close()
+            self._sock = None
+            data_loader.clear_sync_port()
+
+    def poll(self):
+        """Apply a reloaded snapshot and/or new journal entries, if any."""
+        self._check_snapshot()
+        self._check_journal()
+
+    # ── internal ───────────────────────────────────────────────────────────
+    @staticmethod
+    def _snapshot_seq(state):
+        return (state or {}).get("_meta", {}).get("journal_seq", 0)
+
+    @staticmethod
+    def _newest_event_ts(events):
+        return max((e.get("timestamp", "") for e in events), default="")
+
+    def _deliver(self, entries):
+        for entry in entries:
+            events = [op["event"] for op in entry.get("ops", []) if op.get("op") == "event"]
+            self._last_event_ts = max(self._last_event_ts, self._newest_event_ts(events))
+        if self.on_journal:
+            self.on_journal(entries)
+
+    def _catch_up_entry(self, state):
+        """
+        Stand-in for journal entries a compaction folded before they were
+        read: the ops that bring a reader to the snapshots' state.
+        """
+        gods, gods_seq = data_loader.load_current_gods()
+        ops = [{"op": "zone_claim", "zone_id": zone, "god_id": god}
+               for zone, god in state.get("zone_ownership", {}).items() if god]
+        ops += [{"op": "god_update", "god": god} for god in gods.get("gods", [])]
+        ops += [{"op": "event", "event": evt} for evt in state.get("world_events", [])
+                if evt.get("timestamp", "") > self._last_event_ts]
+        # Labelled with the newest seq the gods reflect, so a reader skips
+        # the god ops of journal entries it then receives up to that seq
+        return {"seq": max(gods_seq, self._snapshot_seq(state)), "ops": ops}
+
+    def _open_wakeup(self):
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(("127.0.0.1", 0))
+            sock.settimeout(LIVE_SYNC_TIMEOUT)
+        except OSError as e:
+            print(f"[LiveSync] no wake-up socket ({e}); checking every {LIVE_SYNC_TIMEOUT}s")
+            return
+        self._sock = sock
+        data_loader.write_sync_port(sock.getsockname()[1])
+
+    def _wait(self):
+        if self._sock is None:
+            time.sleep(LIVE_SYNC_TIMEOUT)
+            return
+        try:
+            self._sock.recvfrom(64)
+        except socket.timeout:
+            pass
+        except OSError:
+            time.sleep(LIVE_SYNC_TIMEOUT)
 
     def _loop(self):
         while self._running:
             try:
-                if os.path.exists(self._path):
-                    mt = os.path.getmtime(self._path)
-                    if mt > self._last_mt:
-                        self._last_mt = mt
-                        # Retry once on JSON decode error (file may be mid-write)
-                        for attempt in range(2):
-                            try:
-                                st = data_loader.load_world_state()
-                                break
-                            except (ValueError, KeyError):
-                                if attempt == 0:
-                                    time.sleep(0.1)
-                                    continue
-                                raise
-                        if self.on_state_changed and st:
-                            self.on_state_changed(st)
-                        print("[LiveSync] state reloaded.")
+                self.poll()
             except Exception as e:
                 print(f"[LiveSync] error: {e}")
-            time.sleep(1.0)
+            self._wait()
+
+    def _check_snapshot(self, force=False):
+        if not os.path.exists(self._path):
+            return
+        mt = os.path.getmtime(self._path)
+        if mt <= self._last_mt and not force:
+            return
+        self._last_mt = mt
+        # Retry once on JSON decode error (file may be mid-write)
+        for attempt in range(2):
+            try:
+                st = data_loader.load_world_state()
+                break
+            except (ValueError, KeyError):
+                if attempt == 0:
+                    time.sleep(0.1)
+                    continue
+                raise
+        if st and self._snapshot_seq(st) > self._seq:
+            # Compacted before this map read those entries
+            self._deliver([self._catch_up_entry(st)])
+            self._seq = self._snapshot_seq(st)
+        if self.on_state_changed and st:
+            self.on_state_changed(st)
+        print("[LiveSync] state reloaded.")
+
+    def _check_journal(self):
+        ino, size = data_loader.journal_stat()
+        if ino != self._journal_ino or size < self._offset:
+            # New or compacted journal: read it from the start
+            self._journal_ino = ino
+            self._offset = 0
+        if size == self._offset:
+            return
+        entries, self._offset = data_loader.read_journal(self._offset)
+        fresh = [e for e in entries if e.get("seq", 0) > self._seq]
+        if fresh and fresh[0].get("seq", 0) > self._seq + 1:
+            # The entries in between were compacted away: catch up first
+            self._check_snapshot(force=True)
+            fresh = [e for e in fresh if e.get("seq", 0) > self._seq]
+        if not fresh:
+            return
+        self._seq = fresh[-1]["seq"]
+        self._deliver(fresh)
@@ -19,7 +19,7 @@ import pygame
 
 try:
     from .config import *  # noqa: F403
-    from .terrain import generate_terrain, is_land
+    from .terrain import load_terrain, build_land_mask, is_land
     from .influence import InfluenceMap
     from .camera import Camera
     from .renderer import Renderer
@@ -28,7 +28,8 @@ try:
     from .ui import WorldBoxUI
     from .tools import ToolState, MaterialLayer, apply_tool, MATERIALS, MAT_NAMES
     from .events import EventLog
-    from .data_loader import load_world_state, save_world_state, load_gods, save_gods
+    from .data_loader import (load_world_state, save_world_state, load_current_gods, save_gods,
+                                   journal_op_applier)
     from .live_sync import LiveSync
     from .civilizations import CivilizationSystem
     from .units import UnitSystem
@@ -37,7 +38,7 @@ try:
     from .history import WorldHistory
 except ImportError:  # pragma: no cover - direct script fallback
     from config import *  # noqa: F403
-    from terrain import generate_terrain, is_land
+    from terrain import load_terrain, build_land_mask, is_land
     from influence import InfluenceMap
     from camera import Camera
     from renderer import Renderer
@@ -46,7 +47,8 @@ except ImportError:  # pragma: no cover - direct script fallback
     from ui import WorldBoxUI
     from tools import ToolState, MaterialLayer, apply_tool, MATERIALS, MAT_NAMES
     from events import EventLog
-    from data_loader import load_world_state, save_world_state, load_gods, save_gods
+    from data_loader import (load_world_state, save_world_state, load_current_gods, save_gods,
+                                  journal_op_applier)
     from live_sync import LiveSync
     from civilizations import CivilizationSystem
     from units import UnitSystem
@@ -155,15 +157,13 @@ class WorldMap:
         self.clock   = pygame.time.Clock()
         self.running = True
 
-        # ── terrain (now returns 5 values with temperature) ────────────────
+        # ── terrain (cached on disk per seed, see terrain.load_terrain) ────
         print("[WorldMap] generating terrain…")
-        self.terrain_data = generate_terrain()
+        terrain = load_terrain()
+        self.terrain_data = tuple(terrain[k] for k in
+                                  ('heightmap', 'moisture', 'temperature', 'biome_map', 'biome_names'))
         self.heightmap, self.moisture, self.temperature, self.biome_map, self.biome_names = self.terrain_data
-
-        self.land_mask = np.zeros((MAP_H, MAP_W), dtype=bool)
-        for i, name in enumerate(self.biome_names):
-            if name not in ('deep_ocean', 'ocean', 'shallow_water'):
-                self.land_mask |= (self.biome_map == i)
+        self.land_mask = terrain['land_mask']
 
         # ── material layer ─────────────────────────────────────────────────
         self.materials = MaterialLayer()
@@ -194,7 +194,8 @@ class WorldMap:
         self.camera     = Camera()
         self.renderer   = Renderer(self.screen,
                                    (self.heightmap, self.moisture, self.biome_map, self.biome_names),
-                                   self.influence, self.materials)
+                                   self.influence, self.materials,
+                                   base_colors=terrain['base_colors'])
         self.structures = StructureRenderer()
         self.particles  = ParticleSystem()
         self.ui         = WorldBoxUI(self.tool_state, self.gods)
@@ -210,7 +211,9 @@ class WorldMap:
         self._refresh_standings()
 
         # ── live sync ──────────────────────────────────────────────────────
-        self.live_sync = LiveSync(on_state_changed=self._on_sync)
+        self._last_sync_event = None
+        self.live_sync = LiveSync(on_state_changed=self._on_sync,
+                                  on_journal=self._on_journal)
         self.live_sync.start()
 
         # ── simulation timers ──────────────────────────────────────────────
@@ -226,7 +229,9 @@ class WorldMap:
 
     # ── helpers ────────────────────────────────────────────────────────────
     def _init_gods(self):
-        gd = load_gods()
+        # Gods the combat game added since the last compaction live only in
+        # the journal until it is folded into gods.json
+        gd, self._gods_seq = load_current_gods()
         if gd.get("gods"):
             self.gods = gd["gods"]
         else:
@@ -337,17 +342,39 @@ class WorldMap:
         self.ui.set_standings(st)
 
     def _on_sync(self, new_state):
-        if new_state.get("strongholds"):
-            self.strongholds = new_state["strongholds"]
+        sh = new_state.get("strongholds")
+        if sh and sh != self.strongholds:
+            self.strongholds = sh
             self.influence.set_strongholds(self.strongholds)
             self.renderer.mark_influence_dirty()
             self._refresh_standings()
         evts = new_state.get("world_events", [])
         if evts:
-            desc = EventLog.format(evts[-1])
-            self.event_log.add(evts[-1].get("type", "unknown"), desc,
-                               evts[-1].get("god_id"))
-            self.ui.add_event(desc)
+            self._log_sync_event(evts[-1])
+
+    def _on_journal(self, entries):
+        """Combat-side deltas: god follower/lore updates and world events."""
+        apply_ops = journal_op_applier()
+        for entry in entries:
+            ops = entry.get("ops", [])
+            if apply_ops is not None and entry.get("seq", 0) > self._gods_seq:
+                # Influence and history are sized to the gods loaded at
+                # startup: a god added mid-session shows up on the next start
+                apply_ops(None, {"gods": self.gods},
+                          [op for op in ops if op.get("op") != "god_add"])
+                self._gods_seq = entry["seq"]
+            for op in ops:
+                if op.get("op") == "event":
+                    self._log_sync_event(op["event"])
+
+    def _log_sync_event(self, evt):
+        # A compacted snapshot repeats the last event the journal delivered
+        if evt == self._last_sync_event:
+            return
+        self._last_sync_event = evt
+        desc = EventLog.format(evt)
+        self.event_log.add(evt.get("type", "unknown"), desc, evt.get("god_id"))
+        self.ui.add_event(desc)
 
     def _reclassify_biomes(self):
         """Re-run biome classification after terrain edits."""
@@ -417,10 +444,7 @@ class WorldMap:
         self.renderer.terrain_colors = self.renderer._build_base_colors()
         self.renderer.mark_influence_dirty()
 
-        self.land_mask[:] = False
-        for i, name in enumerate(bn):
-            if name not in ('deep_ocean', 'ocean', 'shallow_water'):
-                self.land_mask |= (bm == i)
+        self.land_mask[:] = build_land_mask(bm, bn)
 
     def _event_log_fn(self, text):
         self.event_log.add("tool_action", text)
@@ -564,7 +588,9 @@ class WorldMap:
             world=self,
         )
         if changed:
-            self.renderer.mark_influence_dirty()
+            # Influence edits reach the chunk cache as dirty rects and
+            # terrain edits go through _reclassify_biomes, so no full
+            # invalidate here
             self._refresh_standings()
 
     # ── update ─────────────────────────────────────────────────────────────
@@ -599,12 +625,7 @@ class WorldMap:
             # ── UNIVERSAL SYNERGY ENGINE ───────────────────────────────
             self._synergy_accum += dt * speed
             if self._synergy_accum >= 0.2:  # 5 synergy ticks per second
-                try:
-                    from .synergy import SynergyEngine as SE
-                except ImportError:  # pragma: no cover - direct script fallback
-                    from synergy import SynergyEngine as SE
-                SE.reset_tick_modifiers(self)
-                self.synergy.tick(self._synergy_accum, self)
+                self.synergy.tick(self._synergy_accum, self, reset=True)
                 self._synergy_accum = 0.0
 
             # Civilization simulation (now with season + world ref)
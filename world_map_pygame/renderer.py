@@ -9,21 +9,23 @@ import numpy as np
 try:
     from .config import (
         MAP_W, MAP_H, TOPBAR_H, SCR,
-        BIOME_COLORS, GOD_COLORS,
+        GOD_COLORS,
         INFLUENCE_TINT_STRENGTH, INFLUENCE_WATER_FACTOR,
         MINIMAP_W, MINIMAP_H, MINIMAP_MARGIN,
         CHUNK_SIZE,
     )
     from .tools import MATERIALS, MAT_NAMES, MAT_INDEX
+    from .terrain import build_base_colors
 except ImportError:  # pragma: no cover - direct script fallback
     from config import (
         MAP_W, MAP_H, TOPBAR_H, SCR,
-        BIOME_COLORS, GOD_COLORS,
+        GOD_COLORS,
         INFLUENCE_TINT_STRENGTH, INFLUENCE_WATER_FACTOR,
         MINIMAP_W, MINIMAP_H, MINIMAP_MARGIN,
         CHUNK_SIZE,
     )
     from tools import MATERIALS, MAT_NAMES, MAT_INDEX
+    from terrain import build_base_colors
 
 # Pre-compute material colour LUT: (num_materials, 3)
 _MAT_COLOR_LUT = np.zeros((len(MAT_NAMES), 3), dtype=np.uint8)
@@ -51,8 +53,9 @@ class _ChunkCache:
 
         # Pre-rendered surfaces: (cx, cy) → pygame.Surface (CHUNK×CHUNK)
         self._surfaces = {}
-        # Version tracking per chunk
-        self._inf_ver = {}    # (cx,cy) → int
+        # Version tracking: influence changes arrive as dirty rects,
+        # materials still use a per-chunk version
+        self._inf_seen = influence._version
         self._mat_ver = {}    # (cx,cy) → int
         # Animation tick (forces fire chunks to flicker)
         self._anim_tick = 0
@@ -64,12 +67,12 @@ class _ChunkCache:
     def get(self, cx, cy):
         """Get chunk surface, rebuilding if stale."""
         key = (cx, cy)
-        inf_ver = self.influence._version
+        if self.influence._version != self._inf_seen:
+            self._sync_influence()
         mat_ver = self.material_layer._version if self.material_layer else -1
 
         need_rebuild = (
             key not in self._surfaces
-            or self._inf_ver.get(key, -1) != inf_ver
             or self._mat_ver.get(key, -1) != mat_ver
         )
 
@@ -90,15 +93,23 @@ class _ChunkCache:
 
         if need_rebuild:
             self._build(cx, cy)
-            self._inf_ver[key] = inf_ver
             self._mat_ver[key] = mat_ver
 
         return self._surfaces[key]
 
+    def _sync_influence(self):
+        """Drop only the chunks under influence rects changed since last sync."""
+        rects = self.influence.dirty_since(self._inf_seen)
+        if rects is None:
+            self.invalidate_all()
+        else:
+            for x0, y0, x1, y1 in rects:
+                self.invalidate_region(x0, y0, x1, y1)
+        self._inf_seen = self.influence._version
+
     def invalidate_all(self):
         """Force full rebuild (e.g. biome reclassification)."""
         self._surfaces.clear()
-        self._inf_ver.clear()
         self._mat_ver.clear()
 
     def invalidate_region(self, x0, y0, x1, y1):
@@ -110,7 +121,6 @@ class _ChunkCache:
         for cy in range(cy0, cy1 + 1):
             for cx in range(cx0, cx1 + 1):
                 self._surfaces.pop((cx, cy), None)
-                self._inf_ver.pop((cx, cy), None)
                 self._mat_ver.pop((cx, cy), None)
 
     # ── internal build ─────────────────────────────────────────────────────
@@ -182,14 +192,17 @@ class _ChunkCache:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class Renderer:
-    def __init__(self, screen, terrain_data, influence_map, material_layer=None):
+    def __init__(self, screen, terrain_data, influence_map, material_layer=None,
+                 base_colors=None):
         self.screen = screen
         self.heightmap, self.moisture, self.biome_map, self.biome_names = terrain_data
         self.influence = influence_map
         self.material_layer = material_layer
 
         # Pre-build base terrain colours: (MAP_H, MAP_W, 3) uint8
-        self.terrain_colors = self._build_base_colors()
+        # (load_terrain hands over its cached copy)
+        self.terrain_colors = (base_colors if base_colors is not None
+                               else self._build_base_colors())
 
         # Per-tile colour noise for pixel-art texture
         rng = np.random.RandomState(999)
@@ -211,12 +224,7 @@ class Renderer:
 
     # ── base terrain colours ───────────────────────────────────────────────
     def _build_base_colors(self):
-        colors = np.zeros((MAP_H, MAP_W, 3), dtype=np.uint8)
-        for i, name in enumerate(self.biome_names):
-            mask = self.biome_map == i
-            r, g, b = BIOME_COLORS.get(name, (128, 128, 128))
-            colors[mask] = [r, g, b]
-        return colors
+        return build_base_colors(self.biome_map, self.biome_names)
 
     # ── dirty flag ─────────────────────────────────────────────────────────
     def mark_influence_dirty(self):
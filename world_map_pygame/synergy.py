@@ -5,6 +5,7 @@ Central orchestration for ALL cross-system interactions.
 """
 import numpy as np
 import math
+import operator
 import random
 try:
     from .config import (
@@ -12,12 +13,14 @@ try:
         TEMP_COLD, TEMP_COOL, TEMP_WARM, TEMP_HOT,
         SEASONS,
     )
+    from .units import UnitGrid
 except ImportError:  # pragma: no cover - direct script fallback
     from config import (
         MAP_W, MAP_H, UNIT_TYPES, UNIT_SPEED,
         TEMP_COLD, TEMP_COOL, TEMP_WARM, TEMP_HOT,
         SEASONS,
     )
+    from units import UnitGrid
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # INTERACTION DATA TABLES
@@ -140,6 +143,14 @@ BIOME_UNIT_EFFECTS = {
     'corrupted':     {'spd_mult': 0.70, 'hp_tick': -2,  'def_mult': 0.7},
 }
 
+# Largest speed-up the modifiers above can give a unit: weather only ever
+# lowers _weather_spd, material and biome set theirs (bless is 1.1).
+# UnitSystem pads its per-tick index by it.
+MAX_UNIT_SPD_MULT = (
+    max([1.0] + [e.get('spd_mult', 1.0) for e in MATERIAL_UNIT_EFFECTS.values()])
+    * max([1.0] + [e.get('spd_mult', 1.0) for e in BIOME_UNIT_EFFECTS.values()])
+)
+
 # Units with special biome interactions
 UNIT_BIOME_BONUS = {
     ('dragon', 'volcano'):       {'atk_mult': 1.5, 'hp_regen': 5},
@@ -279,6 +290,125 @@ COMBAT_TYPE_ADVANTAGE = {
     ('dragon', 'titan'):      0.9,   # Even match  
 }
 
+# ── Unit → Building damage multipliers ────────────────────────────────────────
+BUILDING_DAMAGE_MULT = {
+    'siege':  3.0,    # Siege units wreck buildings
+    'dragon': 1.5,
+    'mage':   1.2,
+}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# UNIT COLUMNS — structure-of-arrays view used by the synergy passes
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_UNIT_MODIFIERS = ('_weather_spd', '_weather_atk', '_mat_spd', '_mat_atk',
+                   '_biome_spd', '_biome_def', '_biome_atk',
+                   '_building_atk', '_building_def', '_morale')
+_UNIT_FIELDS = ('alive', 'x', 'y', 'hp', 'max_hp', 'atk', 'utype', 'god_id') + _UNIT_MODIFIERS
+_UNIT_DEFAULTS = (False, 0.0, 0.0, 0.0, math.inf, 0.0, None, None) + (1.0,) * len(_UNIT_MODIFIERS)
+_read_unit = operator.attrgetter(*_UNIT_FIELDS)
+
+
+class _UnitColumns:
+    """
+    Per-tick NumPy copy of the unit list (hp, position, type/god codes and
+    the synergy modifiers), so each pass works on whole arrays instead of
+    looping zones × units in Python.
+
+    Unit objects stay authoritative for the rest of the simulation:
+    flush() writes back only the rows whose hp or modifiers changed.
+    """
+
+    def __init__(self, units, reset=False):
+        self.units = units
+        n = len(units)
+        self.n = n
+        try:
+            rows = [_read_unit(u) for u in units]
+        except AttributeError:
+            # Bare unit objects (tools, tests) lacking some synergy slots
+            rows = [tuple(getattr(u, f, d) for f, d in zip(_UNIT_FIELDS, _UNIT_DEFAULTS))
+                    for u in units]
+        cols = list(zip(*rows)) if rows else [()] * len(_UNIT_FIELDS)
+
+        self.alive = np.array(cols[0], dtype=bool)
+        self.x = np.array(cols[1], dtype=np.float64)
+        self.y = np.array(cols[2], dtype=np.float64)
+        self.hp = np.array(cols[3], dtype=np.float64)
+        self.max_hp = np.array(cols[4], dtype=np.float64)
+        self.atk = np.array(cols[5], dtype=np.float64)
+        self.type_codes = {}
+        self.tcode = np.fromiter(
+            (self.type_codes.setdefault(t, len(self.type_codes)) for t in cols[6]), np.int32, n)
+        self.types = list(self.type_codes)
+        self.god_codes = {}
+        self.god = np.fromiter(
+            (self.god_codes.setdefault(g, len(self.god_codes)) for g in cols[7]), np.int32, n)
+        # int(u.x) truncates toward zero, like astype on the truncated value
+        self.ix = np.trunc(self.x).astype(np.int64)
+        self.iy = np.trunc(self.y).astype(np.int64)
+
+        self.hp0 = self.hp.copy()
+        self.mod0 = {name: np.array(col, dtype=np.float64)
+                     for name, col in zip(_UNIT_MODIFIERS, cols[8:])}
+        self.mod = {name: (np.ones(n) if reset else col.copy())
+                    for name, col in self.mod0.items()}
+        self._grid = None
+
+    @property
+    def grid(self):
+        if self._grid is None:
+            self._grid = UnitGrid(self.x, self.y)
+        return self._grid
+
+    def type_lut(self, fn, dtype=np.float64):
+        """Array indexed by type code holding fn(utype)."""
+        return np.array([fn(t) for t in self.types], dtype=dtype)
+
+    def within(self, cx, cy, radius):
+        """Indices of alive units with squared distance <= radius² from (cx, cy)."""
+        idx = self.grid.query_rect(cx - radius, cy - radius, cx + radius, cy + radius)
+        dx = self.x[idx] - cx
+        dy = self.y[idx] - cy
+        return idx[self.alive[idx] & (dx * dx + dy * dy <= radius * radius)]
+
+    def on_map(self, w=MAP_W, h=MAP_H):
+        """Indices of alive units whose tile (int(x), int(y)) lies in [0, w) × [0, h)."""
+        ix, iy = self.ix, self.iy
+        return np.flatnonzero(self.alive & (ix >= 0) & (ix < w) & (iy >= 0) & (iy < h))
+
+    def adjust_hp(self, idx, delta):
+        """hp = min(max_hp, hp + delta) for the given units."""
+        self.hp[idx] = np.minimum(self.max_hp[idx], self.hp[idx] + delta)
+
+    def flush(self):
+        units = self.units
+        hp = self.hp
+        for i in np.flatnonzero(hp != self.hp0).tolist():
+            units[i].hp = float(hp[i])
+
+        dirty = np.zeros(self.n, dtype=bool)
+        for name in _UNIT_MODIFIERS:
+            dirty |= self.mod[name] != self.mod0[name]
+        idx = np.flatnonzero(dirty & self.alive)
+        if idx.size == 0:
+            return
+        values = [(name, self.mod[name][idx].tolist()) for name in _UNIT_MODIFIERS]
+        for row, i in enumerate(idx.tolist()):
+            u = units[i]
+            for name, col in values:
+                setattr(u, name, col[row])
+
+
+def _disk_window(cx, cy, radius):
+    """(slices, mask) of the map tiles within radius of (cx, cy)."""
+    y0, y1 = max(0, cy - radius), min(MAP_H, cy + radius + 1)
+    x0, x1 = max(0, cx - radius), min(MAP_W, cx + radius + 1)
+    yy, xx = np.ogrid[y0:y1, x0:x1]
+    mask = (xx - cx) ** 2 + (yy - cy) ** 2 <= radius * radius
+    return (slice(y0, y1), slice(x0, x1)), mask
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SYNERGY ENGINE — Orchestrates all cross-system interactions
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -289,70 +419,87 @@ class SynergyEngine:
     def __init__(self):
         self._rng = np.random.RandomState(500)
         self._tick_count = 0
+        self._cols = None
+        self._luts = {}
 
-    def tick(self, dt, world):
+    def tick(self, dt, world, reset=False):
         """
         Main synergy tick — called from main.py update loop.
         `world` object must have: weather, units, civilizations, materials,
         heightmap, moisture, biome_map, biome_names, land_mask, influence, temperature.
+
+        The unit passes share one _UnitColumns for the whole tick. With
+        reset=True every per-tick modifier starts from 1.0 (what
+        reset_tick_modifiers does, without walking the unit objects).
         """
         self._tick_count += 1
         changed = False
 
-        changed |= self._weather_affects_units(dt, world)
-        changed |= self._weather_affects_buildings(dt, world)
-        changed |= self._material_affects_units(dt, world)
-        changed |= self._material_affects_buildings(dt, world)
-        changed |= self._biome_affects_units(dt, world)
-        changed |= self._season_affects_world(dt, world)
-        changed |= self._units_emit_materials(dt, world)
-        changed |= self._buildings_affect_environment(dt, world)
-        changed |= self._buildings_buff_units(dt, world)
-        changed |= self._units_attack_buildings(dt, world)
+        if reset:
+            for b in world.civilizations.active_buildings:
+                b._weather_prod = 1.0
+                b._mat_prod = 1.0
+        self._cols = _UnitColumns(world.units.units, reset=reset)
+        try:
+            changed |= self._weather_affects_units(dt, world)
+            changed |= self._weather_affects_buildings(dt, world)
+            changed |= self._material_affects_units(dt, world)
+            changed |= self._material_affects_buildings(dt, world)
+            changed |= self._biome_affects_units(dt, world)
+            changed |= self._season_affects_world(dt, world)
+            changed |= self._units_emit_materials(dt, world)
+            changed |= self._buildings_affect_environment(dt, world)
+            changed |= self._buildings_buff_units(dt, world)
+            changed |= self._units_attack_buildings(dt, world)
+            self._cols.flush()
+        finally:
+            self._cols = None
 
         return changed
 
+    def _unit_columns(self, world):
+        """Columns of the running tick, or fresh ones for a standalone pass."""
+        if self._cols is not None:
+            return self._cols
+        return _UnitColumns(world.units.units)
+
+    def _flush_standalone(self, cols):
+        if cols is not self._cols:
+            cols.flush()
+
     # ── Weather → Units ────────────────────────────────────────────────────
     def _weather_affects_units(self, dt, world):
         changed = False
-        weather = world.weather
-        units = world.units
+        cols = self._unit_columns(world)
+        weather_spd = cols.mod['_weather_spd']
+        weather_atk = cols.mod['_weather_atk']
 
-        for zone in weather.zones:
+        for zone in world.weather.zones:
             effects = WEATHER_UNIT_EFFECTS.get(zone.wtype)
             if not effects:
                 continue
 
-            r2 = zone.radius * zone.radius
-            for u in units.units:
-                if not u.alive:
-                    continue
-                dx = u.x - zone.x
-                dy = u.y - zone.y
-                if dx * dx + dy * dy > r2:
-                    continue
-
-                # Check immunity
-                immunities = UNIT_WEATHER_IMMUNITY.get(u.utype, set())
-                if zone.wtype in immunities:
-                    continue
-
-                # Apply HP damage
-                hp_tick = effects.get('hp_tick', 0)
-                if hp_tick != 0:
-                    u.hp += hp_tick * dt
-                    changed = True
+            idx = cols.within(zone.x, zone.y, zone.radius)
+            if idx.size == 0:
+                continue
+            # Drop immune unit types
+            immune = cols.type_lut(
+                lambda t: zone.wtype in UNIT_WEATHER_IMMUNITY.get(t, ()), bool)
+            idx = idx[~immune[cols.tcode[idx]]]
+            if idx.size == 0:
+                continue
 
-                # Speed modifier applied during movement (stored as weather_spd_mult)
-                if not hasattr(u, '_weather_spd'):
-                    u._weather_spd = 1.0
-                u._weather_spd = min(u._weather_spd, effects.get('spd_mult', 1.0))
+            # Apply HP damage
+            hp_tick = effects.get('hp_tick', 0)
+            if hp_tick != 0:
+                cols.hp[idx] += hp_tick * dt
+                changed = True
 
-                # Attack modifier
-                if not hasattr(u, '_weather_atk'):
-                    u._weather_atk = 1.0
-                u._weather_atk = min(u._weather_atk, effects.get('atk_mult', 1.0))
+            # Speed/attack modifiers (strongest zone wins)
+            weather_spd[idx] = np.minimum(weather_spd[idx], effects.get('spd_mult', 1.0))
+            weather_atk[idx] = np.minimum(weather_atk[idx], effects.get('atk_mult', 1.0))
 
+        self._flush_standalone(cols)
         return changed
 
     # ── Weather → Buildings ────────────────────────────────────────────────
@@ -413,54 +560,81 @@ class SynergyEngine:
         return changed
 
     # ── Materials → Units ──────────────────────────────────────────────────
-    def _material_affects_units(self, dt, world):
-        changed = False
-        materials = world.materials
-        units = world.units
-
-        for u in units.units:
-            if not u.alive:
-                continue
-            ix, iy = int(u.x), int(u.y)
-            if not (0 <= ix < MAP_W and 0 <= iy < MAP_H):
-                continue
-
-            mat_name = materials.get_at(ix, iy)
-            if mat_name == 'none':
-                continue
-
-            # Check special interactions first
-            special = MATERIAL_UNIT_SPECIAL.get((mat_name, u.utype))
-            if special:
-                hp = special.get('hp_tick', 0)
-                if hp != 0:
-                    u.hp = min(u.max_hp, u.hp + hp * dt)
-                    changed = True
-                if 'atk_mult' in special:
-                    if not hasattr(u, '_mat_atk'):
-                        u._mat_atk = 1.0
-                    u._mat_atk = max(u._mat_atk, special['atk_mult'])
-                continue  # Special overrides generic
-
-            # Check immunity
-            immunities = UNIT_MATERIAL_IMMUNITY.get(u.utype, set())
-            if mat_name in immunities:
-                continue
-
-            effects = MATERIAL_UNIT_EFFECTS.get(mat_name)
-            if not effects:
+    def _material_unit_luts(self, types):
+        """(material index × unit type) tables for _material_affects_units."""
+        key = ('material', tuple(types))
+        luts = self._luts.get(key)
+        if luts is not None:
+            return luts
+        try:
+            from .tools import MAT_NAMES
+        except ImportError:  # pragma: no cover - direct script fallback
+            from tools import MAT_NAMES
+        shape = (len(MAT_NAMES), len(types))
+        special = np.zeros(shape, dtype=bool)
+        special_hp = np.zeros(shape)
+        special_atk = np.full(shape, -np.inf)
+        generic = np.zeros(shape, dtype=bool)
+        generic_hp = np.zeros(len(MAT_NAMES))
+        generic_spd = np.ones(len(MAT_NAMES))
+        for mi, name in enumerate(MAT_NAMES):
+            if name == 'none':
                 continue
+            effects = MATERIAL_UNIT_EFFECTS.get(name)
+            if effects:
+                generic_hp[mi] = effects.get('hp_tick', 0)
+                generic_spd[mi] = effects.get('spd_mult', 1.0)
+            for ti, utype in enumerate(types):
+                sp = MATERIAL_UNIT_SPECIAL.get((name, utype))
+                if sp:
+                    # Special overrides generic
+                    special[mi, ti] = True
+                    special_hp[mi, ti] = sp.get('hp_tick', 0)
+                    if 'atk_mult' in sp:
+                        special_atk[mi, ti] = sp['atk_mult']
+                elif effects and name not in UNIT_MATERIAL_IMMUNITY.get(utype, ()):
+                    generic[mi, ti] = True
+        luts = (special, special_hp, special_atk, generic, generic_hp, generic_spd)
+        self._luts[key] = luts
+        return luts
 
-            hp_tick = effects.get('hp_tick', 0)
-            if hp_tick != 0:
-                u.hp = min(u.max_hp, u.hp + hp_tick * dt)
+    def _material_affects_units(self, dt, world):
+        changed = False
+        cols = self._unit_columns(world)
+        mat = world.materials.mat
+        idx = cols.on_map(min(MAP_W, mat.shape[1]), min(MAP_H, mat.shape[0]))
+        if idx.size == 0:
+            self._flush_standalone(cols)
+            return changed
+
+        special, special_hp, special_atk, generic, generic_hp, generic_spd = \
+            self._material_unit_luts(cols.types)
+        m = mat[cols.iy[idx], cols.ix[idx]]
+        t = cols.tcode[idx]
+
+        sel = special[m, t]
+        if sel.any():
+            si, sm, st = idx[sel], m[sel], t[sel]
+            hp = special_hp[sm, st]
+            hit = hp != 0
+            if hit.any():
+                cols.adjust_hp(si[hit], hp[hit] * dt)
                 changed = True
+            mat_atk = cols.mod['_mat_atk']
+            mat_atk[si] = np.maximum(mat_atk[si], special_atk[sm, st])
+
+        sel = generic[m, t]
+        if sel.any():
+            gi, gm = idx[sel], m[sel]
+            hp = generic_hp[gm]
+            hit = hp != 0
+            if hit.any():
+                cols.adjust_hp(gi[hit], hp[hit] * dt)
+                changed = True
+            mat_spd = cols.mod['_mat_spd']
+            mat_spd[gi] = np.minimum(mat_spd[gi], generic_spd[gm])
 
-            # Speed modifier
-            if not hasattr(u, '_mat_spd'):
-                u._mat_spd = 1.0
-            u._mat_spd = min(u._mat_spd, effects.get('spd_mult', 1.0))
-
+        self._flush_standalone(cols)
         return changed
 
     # ── Materials → Buildings ──────────────────────────────────────────────
@@ -513,50 +687,74 @@ class SynergyEngine:
         return changed
 
     # ── Biome → Units ──────────────────────────────────────────────────────
-    def _biome_affects_units(self, dt, world):
-        changed = False
-        for u in world.units.units:
-            if not u.alive:
-                continue
-            ix, iy = int(u.x), int(u.y)
-            if not (0 <= ix < MAP_W and 0 <= iy < MAP_H):
-                continue
-
-            biome = world.biome_names[world.biome_map[iy, ix]]
-
-            # Generic biome effects
+    def _biome_unit_luts(self, biome_names, types):
+        """(biome index × unit type) tables for _biome_affects_units."""
+        key = ('biome', tuple(biome_names), tuple(types))
+        luts = self._luts.get(key)
+        if luts is not None:
+            return luts
+        shape = (len(biome_names), len(types))
+        hp_tick = np.zeros(len(biome_names))
+        spd = np.ones(len(biome_names))
+        defense = np.ones(len(biome_names))
+        skip = np.zeros(shape, dtype=bool)
+        bonus = np.zeros(shape, dtype=bool)
+        bonus_regen = np.zeros(shape)
+        bonus_atk = np.ones(shape)
+        for bi, biome in enumerate(biome_names):
             effects = BIOME_UNIT_EFFECTS.get(biome, {})
+            hp_tick[bi] = effects.get('hp_tick', 0)
+            spd[bi] = effects.get('spd_mult', 1.0)
+            defense[bi] = effects.get('def_mult', 1.0)
+            for ti, utype in enumerate(types):
+                # Water check - dragons and spirits can fly
+                if biome in ('deep_ocean', 'ocean') and utype in ('dragon', 'spirit'):
+                    skip[bi, ti] = True
+                b = UNIT_BIOME_BONUS.get((utype, biome))
+                if b:
+                    bonus[bi, ti] = True
+                    bonus_regen[bi, ti] = b.get('hp_regen', 0)
+                    bonus_atk[bi, ti] = b.get('atk_mult', 1.0)
+        luts = (hp_tick, spd, defense, skip, bonus, bonus_regen, bonus_atk)
+        self._luts[key] = luts
+        return luts
 
-            # Water check - dragons and spirits can fly
-            if biome in ('deep_ocean', 'ocean') and u.utype in ('dragon', 'spirit'):
-                continue
-
-            hp_tick = effects.get('hp_tick', 0)
-            if hp_tick != 0:
-                u.hp = min(u.max_hp, u.hp + hp_tick * dt)
+    def _biome_affects_units(self, dt, world):
+        changed = False
+        cols = self._unit_columns(world)
+        idx = cols.on_map()
+        if idx.size == 0:
+            self._flush_standalone(cols)
+            return changed
+
+        hp_tick, spd, defense, skip, bonus, bonus_regen, bonus_atk = \
+            self._biome_unit_luts(world.biome_names, cols.types)
+        b = world.biome_map[cols.iy[idx], cols.ix[idx]]
+        t = cols.tcode[idx]
+        keep = ~skip[b, t]
+        idx, b, t = idx[keep], b[keep], t[keep]
+
+        # Generic biome effects
+        hp = hp_tick[b]
+        hit = hp != 0
+        if hit.any():
+            cols.adjust_hp(idx[hit], hp[hit] * dt)
+            changed = True
+        cols.mod['_biome_spd'][idx] = spd[b]
+        cols.mod['_biome_def'][idx] = defense[b]
+
+        # Special unit-biome bonuses
+        sel = bonus[b, t]
+        if sel.any():
+            bi, bb, bt = idx[sel], b[sel], t[sel]
+            regen = bonus_regen[bb, bt]
+            hit = regen > 0
+            if hit.any():
+                cols.adjust_hp(bi[hit], regen[hit] * dt)
                 changed = True
+            cols.mod['_biome_atk'][bi] = bonus_atk[bb, bt]
 
-            # Biome speed stored
-            if not hasattr(u, '_biome_spd'):
-                u._biome_spd = 1.0
-            u._biome_spd = effects.get('spd_mult', 1.0)
-
-            # Biome defense stored
-            if not hasattr(u, '_biome_def'):
-                u._biome_def = 1.0
-            u._biome_def = effects.get('def_mult', 1.0)
-
-            # Special unit-biome bonuses
-            bonus = UNIT_BIOME_BONUS.get((u.utype, biome))
-            if bonus:
-                hp_regen = bonus.get('hp_regen', 0)
-                if hp_regen > 0:
-                    u.hp = min(u.max_hp, u.hp + hp_regen * dt)
-                    changed = True
-                if not hasattr(u, '_biome_atk'):
-                    u._biome_atk = 1.0
-                u._biome_atk = bonus.get('atk_mult', 1.0)
-
+        self._flush_standalone(cols)
         return changed
 
     # ── Season → Global effects ────────────────────────────────────────────
@@ -568,10 +766,9 @@ class SynergyEngine:
         # Seasonal healing/damage to all units
         unit_heal = effects.get('unit_heal', 0)
         if unit_heal != 0:
-            for u in world.units.units:
-                if not u.alive:
-                    continue
-                u.hp = min(u.max_hp, u.hp + unit_heal * dt)
+            cols = self._unit_columns(world)
+            cols.adjust_hp(np.flatnonzero(cols.alive), unit_heal * dt)
+            self._flush_standalone(cols)
             changed = True
 
         return changed
@@ -584,27 +781,30 @@ class SynergyEngine:
             from tools import MAT_INDEX
         changed = False
         materials = world.materials
-
-        for u in world.units.units:
-            if not u.alive:
-                continue
-            emission = UNIT_MATERIAL_EMISSIONS.get(u.utype)
-            if not emission:
-                continue
-
-            if self._rng.random() < emission['chance']:
-                ix, iy = int(u.x), int(u.y)
-                # Place material on a random adjacent tile
-                ox = self._rng.randint(-2, 3)
-                oy = self._rng.randint(-2, 3)
-                tx, ty = ix + ox, iy + oy
-                if 0 <= tx < MAP_W and 0 <= ty < MAP_H:
-                    if materials.mat[ty, tx] == 0:
-                        mi = MAT_INDEX.get(emission['material'], 0)
-                        if mi:
-                            materials.mat[ty, tx] = mi
-                            materials.life[ty, tx] = emission.get('life', 0)
-                            changed = True
+        cols = self._unit_columns(world)
+
+        chance = cols.type_lut(
+            lambda t: UNIT_MATERIAL_EMISSIONS.get(t, {}).get('chance', 0.0))
+        idx = np.flatnonzero(cols.alive & (chance[cols.tcode] > 0))
+        if idx.size == 0:
+            return changed
+
+        # One roll per emitting unit, drawn in bulk
+        rolls = self._rng.random_sample(idx.size)
+        for i in idx[rolls < chance[cols.tcode[idx]]].tolist():
+            emission = UNIT_MATERIAL_EMISSIONS[cols.types[cols.tcode[i]]]
+            ix, iy = int(cols.ix[i]), int(cols.iy[i])
+            # Place material on a random adjacent tile
+            ox = self._rng.randint(-2, 3)
+            oy = self._rng.randint(-2, 3)
+            tx, ty = ix + ox, iy + oy
+            if 0 <= tx < MAP_W and 0 <= ty < MAP_H:
+                if materials.mat[ty, tx] == 0:
+                    mi = MAT_INDEX.get(emission['material'], 0)
+                    if mi:
+                        materials.mat[ty, tx] = mi
+                        materials.life[ty, tx] = emission.get('life', 0)
+                        changed = True
 
         return changed
 
@@ -629,23 +829,17 @@ class SynergyEngine:
             # Farm moisture boost
             if 'moisture_boost' in effects:
                 boost = effects['moisture_boost'] * b.level
-                for dy in range(-radius, radius + 1):
-                    for dx in range(-radius, radius + 1):
-                        nx, ny = bx + dx, by + dy
-                        if 0 <= nx < MAP_W and 0 <= ny < MAP_H:
-                            if dx * dx + dy * dy <= radius * radius:
-                                world.moisture[ny, nx] = min(1.0, world.moisture[ny, nx] + boost * dt)
+                win, mask = _disk_window(bx, by, radius)
+                area = world.moisture[win]
+                area[mask] = np.minimum(1.0, area[mask] + boost * dt)
                 changed = True
 
             # Mine elevation reduce
             if 'elevation_reduce' in effects:
                 red = effects['elevation_reduce'] * b.level
-                for dy in range(-radius, radius + 1):
-                    for dx in range(-radius, radius + 1):
-                        nx, ny = bx + dx, by + dy
-                        if 0 <= nx < MAP_W and 0 <= ny < MAP_H:
-                            if dx * dx + dy * dy <= radius * radius:
-                                world.heightmap[ny, nx] = max(0, world.heightmap[ny, nx] - red * dt)
+                win, mask = _disk_window(bx, by, radius)
+                area = world.heightmap[win]
+                area[mask] = np.maximum(0, area[mask] - red * dt)
                 changed = True
 
             # Temple bless spread
@@ -698,108 +892,90 @@ class SynergyEngine:
     def _buildings_buff_units(self, dt, world):
         changed = False
         civs = world.civilizations
-        units = world.units
+        cols = self._unit_columns(world)
+        building_atk = cols.mod['_building_atk']
+        building_def = cols.mod['_building_def']
+        morale = cols.mod['_morale']
 
         for b in civs.active_buildings:
             aura = BUILDING_UNIT_AURA.get(b.btype)
             if not aura:
                 continue
+            # Only buff same-team units
+            god = cols.god_codes.get(b.god_id)
+            if god is None:
+                continue
 
-            radius = aura.get('radius', 8)
-            r2 = radius * radius
-
-            for u in units.units:
-                if not u.alive:
-                    continue
-                # Only buff same-team units
-                if u.god_id != b.god_id:
-                    continue
-
-                dx = u.x - b.x
-                dy = u.y - b.y
-                if dx * dx + dy * dy > r2:
-                    continue
-
-                # Healing
-                heal = aura.get('heal_per_tick', 0)
-                if heal > 0:
-                    u.hp = min(u.max_hp, u.hp + heal * dt)
-                    changed = True
+            idx = cols.within(b.x, b.y, aura.get('radius', 8))
+            idx = idx[cols.god[idx] == god]
+            if idx.size == 0:
+                continue
 
-                # Siege/golem repair (workshop)
-                if u.utype == 'siege' and 'siege_repair' in aura:
-                    u.hp = min(u.max_hp, u.hp + aura['siege_repair'] * dt)
-                    changed = True
-                if u.utype == 'golem' and 'golem_repair' in aura:
-                    u.hp = min(u.max_hp, u.hp + aura['golem_repair'] * dt)
-                    changed = True
+            # Healing
+            heal = aura.get('heal_per_tick', 0)
+            if heal > 0:
+                cols.adjust_hp(idx, heal * dt)
+                changed = True
 
-                # Attack buff
-                if not hasattr(u, '_building_atk'):
-                    u._building_atk = 1.0
-                atk_buff = aura.get('atk_buff', 1.0)
-                u._building_atk = max(u._building_atk, atk_buff)
+            # Siege/golem repair (workshop)
+            for utype, key in (('siege', 'siege_repair'), ('golem', 'golem_repair')):
+                if key in aura:
+                    rep = idx[cols.tcode[idx] == cols.type_codes.get(utype, -1)]
+                    if rep.size:
+                        cols.adjust_hp(rep, aura[key] * dt)
+                        changed = True
 
-                # Defense buff
-                if not hasattr(u, '_building_def'):
-                    u._building_def = 1.0
-                def_buff = aura.get('def_buff', 1.0)
-                u._building_def = max(u._building_def, def_buff)
+            # Attack / defense buffs
+            building_atk[idx] = np.maximum(building_atk[idx], aura.get('atk_buff', 1.0))
+            building_def[idx] = np.maximum(building_def[idx], aura.get('def_buff', 1.0))
 
-                # Undead bonus from graveyard
-                if u.utype == 'undead' and 'undead_buff' in aura:
-                    u._building_atk = max(u._building_atk, aura['undead_buff'])
+            # Undead bonus from graveyard
+            if 'undead_buff' in aura:
+                und = idx[cols.tcode[idx] == cols.type_codes.get('undead', -1)]
+                building_atk[und] = np.maximum(building_atk[und], aura['undead_buff'])
 
-                # Morale
-                if not hasattr(u, '_morale'):
-                    u._morale = 1.0
-                morale = aura.get('morale', 1.0)
-                u._morale = max(u._morale, morale)
+            # Morale
+            morale[idx] = np.maximum(morale[idx], aura.get('morale', 1.0))
 
+        self._flush_standalone(cols)
         return changed
 
     # ── Units → Buildings (attack enemy buildings) ─────────────────────────
     def _units_attack_buildings(self, dt, world):
         changed = False
-        units = world.units
         civs = world.civilizations
+        cols = self._unit_columns(world)
+
+        # Settlers don't attack; every other unit hits at most one building
+        # per tick: the first enemy building (list order) within 4 tiles
+        free = cols.alive & (cols.atk > 0) & (cols.tcode != cols.type_codes.get('settler', -1))
+        if not free.any():
+            return changed
+        dmg_mult = cols.type_lut(lambda t: BUILDING_DAMAGE_MULT.get(t, 1.0))
 
-        for u in units.units:
-            if not u.alive or u.atk <= 0:
+        for b in civs.buildings:
+            if b is None:
                 continue
-            if u.utype == 'settler':
-                continue  # Settlers don't attack
-
-            ix, iy = int(u.x), int(u.y)
-
-            # Check nearby enemy buildings
-            nearby = civs.get_nearby(ix, iy, 4)
-            for b in nearby:
-                if b.god_id == u.god_id:
-                    continue  # Same team
-
-                # Unit attacks building
-                dmg = u.atk * dt * 0.5  # Half damage to buildings
-                # Siege units do double damage to buildings
-                if u.utype == 'siege':
-                    dmg *= 3.0
-                # Dragons do 1.5x to buildings
-                elif u.utype == 'dragon':
-                    dmg *= 1.5
-                # Mages do 1.2x to buildings
-                elif u.utype == 'mage':
-                    dmg *= 1.2
-
-                b.hp -= dmg
-                changed = True
+            idx = cols.grid.query_rect(b.x - 5, b.y - 5, b.x + 5, b.y + 5)
+            idx = idx[free[idx]]
+            idx = idx[(np.abs(cols.ix[idx] - b.x) <= 4)
+                      & (np.abs(cols.iy[idx] - b.y) <= 4)
+                      & (cols.god[idx] != cols.god_codes.get(b.god_id, -1))]
+            if idx.size == 0:
+                continue
+            free[idx] = False
 
-                # Building fights back (garrison defense)
-                if hasattr(b, 'population') and b.population > 0:
-                    garrison_dmg = b.population * 0.1 * dt
-                    u.hp -= garrison_dmg
+            dmg = cols.atk[idx] * dt * 0.5  # Half damage to buildings
+            dmg *= dmg_mult[cols.tcode[idx]]
+            for d in dmg.tolist():
+                b.hp -= d
+            changed = True
 
-                break  # Only attack one building per tick
+            # Building fights back (garrison defense)
+            if hasattr(b, 'population') and b.population > 0:
+                cols.hp[idx] -= b.population * 0.1 * dt
 
+        self._flush_standalone(cols)
         return changed
 
     # ── Calculate effective unit stats ─────────────────────────────────────
@@ -904,7 +1080,8 @@ class SynergyEngine:
     @staticmethod
     def reset_tick_modifiers(world):
         """Reset per-tick synergy modifiers before next synergy tick.
-        Called at the START of each synergy tick so modifiers are recalculated fresh."""
+        tick(dt, world, reset=True) does the same on its unit columns; this
+        object-walking version is kept for callers that run passes by hand."""
         for u in world.units.units:
             if not u.alive:
                 continue
@@ -2,7 +2,11 @@
 World Map — Procedural Terrain Generator  (v4.0 MEGA UPDATE)
 Generates heightmap + moisture + temperature via layered noise (fBm).
 Classifies 22 biomes including tropical, tundra, taiga, volcano, crystal, corrupted.
+load_terrain() caches the generated layers on disk, keyed by seed and
+generation parameters, so later launches only memory-map them.
 """
+import hashlib, json, os, shutil
+
 import numpy as np
 from scipy.ndimage import zoom as _zoom
 
@@ -11,6 +15,7 @@ try:
         MAP_W, MAP_H,
         TERRAIN_SEED, MOISTURE_SEED, TEMPERATURE_SEED,
         TERRAIN_OCTAVES, TERRAIN_PERSISTENCE, TERRAIN_LACUNARITY,
+        TERRAIN_CACHE_DIR, TERRAIN_CACHE_VERSION,
         BIOME_COLORS,
         ELEV_DEEP_OCEAN, ELEV_OCEAN, ELEV_SHALLOW, ELEV_BEACH,
         ELEV_LOWLAND, ELEV_HIGHLAND, ELEV_MOUNTAIN, ELEV_PEAK,
@@ -22,6 +27,7 @@ except ImportError:  # pragma: no cover - direct script fallback
         MAP_W, MAP_H,
         TERRAIN_SEED, MOISTURE_SEED, TEMPERATURE_SEED,
         TERRAIN_OCTAVES, TERRAIN_PERSISTENCE, TERRAIN_LACUNARITY,
+        TERRAIN_CACHE_DIR, TERRAIN_CACHE_VERSION,
         BIOME_COLORS,
         ELEV_DEEP_OCEAN, ELEV_OCEAN, ELEV_SHALLOW, ELEV_BEACH,
         ELEV_LOWLAND, ELEV_HIGHLAND, ELEV_MOUNTAIN, ELEV_PEAK,
@@ -220,6 +226,111 @@ def _generate_temperature(w, h, seed, heightmap):
     return temperature
 
 
+WATER_BIOMES = ('deep_ocean', 'ocean', 'shallow_water')
+
+
 def is_land(biome_idx, biome_names):
     """True if the biome index represents land (not water)."""
-    return biome_names[biome_idx] not in ('deep_ocean', 'ocean', 'shallow_water')
+    return biome_names[biome_idx] not in WATER_BIOMES
+
+
+def build_land_mask(biome_map, biome_names):
+    """(H, W) bool — True on every non-water tile."""
+    land = np.array([n not in WATER_BIOMES for n in biome_names], dtype=bool)
+    return land[biome_map]
+
+
+def build_base_colors(biome_map, biome_names):
+    """(H, W, 3) uint8 flat biome colours (before noise / influence tint)."""
+    lut = np.array([BIOME_COLORS.get(n, (128, 128, 128)) for n in biome_names],
+                   dtype=np.uint8)
+    return lut[biome_map]
+
+
+# ───────────────────────────────────────────────────────────────────────────────
+# On-disk cache
+# ───────────────────────────────────────────────────────────────────────────────
+
+_CACHE_LAYERS = ('heightmap', 'moisture', 'temperature', 'biome_map',
+                 'land_mask', 'base_colors')
+
+
+def _cache_key(seed):
+    """Digest of everything generate_terrain's output depends on."""
+    params = (
+        TERRAIN_CACHE_VERSION, seed, MAP_W, MAP_H,
+        TERRAIN_SEED, MOISTURE_SEED, TEMPERATURE_SEED,
+        TERRAIN_OCTAVES, TERRAIN_PERSISTENCE, TERRAIN_LACUNARITY,
+        ELEV_DEEP_OCEAN, ELEV_OCEAN, ELEV_SHALLOW, ELEV_BEACH,
+        ELEV_LOWLAND, ELEV_HIGHLAND, ELEV_MOUNTAIN, ELEV_PEAK,
+        MOIST_DRY, MOIST_MED, MOIST_WET,
+        TEMP_COLD, TEMP_COOL, TEMP_WARM, TEMP_HOT,
+        sorted(BIOME_COLORS.items()), list(BIOME_COLORS),
+    )
+    return hashlib.sha1(repr(params).encode('utf-8')).hexdigest()[:16]
+
+
+def _load_cached(path):
+    try:
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != TERRAIN_CACHE_VERSION:
+            return None
+        # Copy-on-write: terrain tools edit the heightmap in place, the
+        # cache file itself is never touched
+        layers = {name: np.load(os.path.join(path, name + '.npy'), mmap_mode='c')
+                  for name in _CACHE_LAYERS}
+    except (OSError, ValueError, KeyError):
+        return None
+    if layers['heightmap'].shape != (MAP_H, MAP_W):
+        return None
+    layers['biome_names'] = meta['biome_names']
+    return layers
+
+
+def _save_cached(path, layers):
+    tmp = path + '.tmp'
+    try:
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        for name in _CACHE_LAYERS:
+            np.save(os.path.join(tmp, name + '.npy'), layers[name])
+        # meta.json last: a layer directory without it is never loaded
+        with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'version': TERRAIN_CACHE_VERSION,
+                       'biome_names': layers['biome_names']}, f)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"  [terrain] cache write failed: {e}")
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load_terrain(seed=None, use_cache=True):
+    """
+    generate_terrain() plus the derived layers, through the on-disk cache.
+
+    Returns a dict with heightmap, moisture, temperature, biome_map,
+    biome_names, land_mask (H, W bool) and base_colors (H, W, 3 uint8).
+    Cached arrays are copy-on-write memory maps.
+    """
+    path = os.path.join(TERRAIN_CACHE_DIR, _cache_key(seed))
+    if use_cache:
+        layers = _load_cached(path)
+        if layers is not None:
+            print("  terrain loaded from cache.")
+            return layers
+
+    heightmap, moisture, temperature, bm, biome_names = generate_terrain(seed)
+    layers = {
+        'heightmap':   heightmap,
+        'moisture':    moisture,
+        'temperature': temperature,
+        'biome_map':   bm,
+        'biome_names': biome_names,
+        'land_mask':   build_land_mask(bm, biome_names),
+        'base_colors': build_base_colors(bm, biome_names),
+    }
+    if use_cache:
+        _save_cached(path, layers)
+    return layers
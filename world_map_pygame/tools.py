@@ -816,8 +816,7 @@ def apply_tool(tool_state, tx, ty, heightmap, moisture, biome_map, biome_names,
                      if abs(s['x'] - tx) <= r and abs(s['y'] - ty) <= r]
         for s in to_remove:
             strongholds.remove(s)
-        if to_remove:
-            influence.set_strongholds(strongholds)
+            influence.remove_stronghold(s)
         return bool(to_remove)
     if tid == 'gift':
         if world and hasattr(world, 'civilizations'):
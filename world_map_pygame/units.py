@@ -10,11 +10,13 @@ try:
     from .config import (
         MAP_W, MAP_H, UNIT_TYPES, UNIT_SPEED, GOD_COLORS,
         ARMY_MIN_SIZE, ARMY_MERGE_RADIUS, PATROL_RADIUS, RAID_RANGE,
+        UNIT_GRID_CELL, UNIT_GRID_PAD,
     )
 except ImportError:  # pragma: no cover - direct script fallback
     from config import (
         MAP_W, MAP_H, UNIT_TYPES, UNIT_SPEED, GOD_COLORS,
         ARMY_MIN_SIZE, ARMY_MERGE_RADIUS, PATROL_RADIUS, RAID_RANGE,
+        UNIT_GRID_CELL, UNIT_GRID_PAD,
     )
 
 
@@ -131,6 +133,108 @@ class Army:
         self.morale    = 1.0
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# UnitIndex — structure-of-arrays snapshot + uniform-grid spatial hash
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_MAX_UNIT_SPD = max(info.get('spd', UNIT_SPEED) for info in UNIT_TYPES.values())
+# Movement one unit can make in a single simulate() tick, in multiples of
+# effective_speed * dt: army march (1.3) + own state move (1.0, or 1.2
+# retreating) + scout flee (1.5) = 3.8 worst case. effective_speed itself
+# can exceed the base spd by synergy.MAX_UNIT_SPD_MULT (bless), which
+# simulate() multiplies in. 6 leaves headroom for new impulses so the
+# per-tick index pad never under-covers a moving unit.
+_MAX_MOVE_STEPS_PER_TICK = 6.0
+_STATE_CODES = {'idle': 0, 'moving': 1, 'fighting': 2, 'retreating': 3, 'dead': 4}
+
+
+class UnitGrid:
+    """
+    Uniform grid over point arrays (x, y).
+
+    Points are sorted by grid cell so every cell is one contiguous slice of
+    ``order`` and an area query only touches the cells it overlaps instead
+    of scanning every point.
+    """
+
+    def __init__(self, x, y, cell=UNIT_GRID_CELL):
+        self.cell = cell
+        self.cols = (MAP_W + cell - 1) // cell
+        self.rows = (MAP_H + cell - 1) // cell
+        self.n = len(x)
+        cx = np.clip((x // cell).astype(np.int32), 0, self.cols - 1)
+        cy = np.clip((y // cell).astype(np.int32), 0, self.rows - 1)
+        keys = cy * self.cols + cx
+        self.order = np.argsort(keys, kind='stable').astype(np.int32)
+        self.starts = np.searchsorted(keys[self.order],
+                                      np.arange(self.cols * self.rows + 1))
+
+    def query_rect(self, x0, y0, x1, y1):
+        """Indices (ascending, i.e. list order) of points whose cell overlaps the rect."""
+        if self.n == 0:
+            return self.order[:0]
+        c0 = max(0, int(x0 // self.cell))
+        c1 = min(self.cols - 1, int(x1 // self.cell))
+        r0 = max(0, int(y0 // self.cell))
+        r1 = min(self.rows - 1, int(y1 // self.cell))
+        if c0 > c1 or r0 > r1:
+            return self.order[:0]
+        parts = []
+        for row in range(r0, r1 + 1):
+            base = row * self.cols
+            parts.append(self.order[self.starts[base + c0]:self.starts[base + c1 + 1]])
+        # parts are views into self.order: sort a copy, never in place
+        return np.sort(np.concatenate(parts))
+
+
+class UnitIndex(UnitGrid):
+    """
+    Structure-of-arrays view of a unit list, bucketed into a UnitGrid.
+
+    Columns (x, y, hp, god, utype, state, attack_cd, alive) are NumPy arrays
+    aligned with ``units``; ``god`` and ``utype`` are integer codes
+    (``god_codes`` / ``type_codes``). The index is a snapshot: callers
+    re-check live ``Unit`` attributes on the candidates it returns.
+    """
+
+    def __init__(self, units, cell=UNIT_GRID_CELL, pad=UNIT_GRID_PAD):
+        self.units = units
+        self.pad = pad
+        n = len(units)
+
+        self.god_codes = {}
+        self.type_codes = {}
+        for u in units:
+            if u.god_id not in self.god_codes:
+                self.god_codes[u.god_id] = len(self.god_codes)
+            if u.utype not in self.type_codes:
+                self.type_codes[u.utype] = len(self.type_codes)
+
+        self.x = np.fromiter((u.x for u in units), np.float64, n)
+        self.y = np.fromiter((u.y for u in units), np.float64, n)
+        self.hp = np.fromiter((u.hp for u in units), np.float64, n)
+        self.god = np.fromiter((self.god_codes[u.god_id] for u in units), np.int32, n)
+        self.utype = np.fromiter((self.type_codes[u.utype] for u in units), np.int16, n)
+        self.state = np.fromiter((_STATE_CODES.get(u.state, 0) for u in units), np.int8, n)
+        self.attack_cd = np.fromiter((u._attack_cd for u in units), np.float32, n)
+        self.alive = np.fromiter((u.alive for u in units), bool, n)
+        super().__init__(self.x, self.y, cell)
+
+    def query_radius(self, x, y, radius):
+        """Indices of alive units within ``radius`` of (x, y) at snapshot time."""
+        idx = self.query_rect(x - radius, y - radius, x + radius, y + radius)
+        dx = self.x[idx] - x
+        dy = self.y[idx] - y
+        keep = (dx * dx + dy * dy <= radius * radius) & self.alive[idx]
+        return idx[keep]
+
+    def candidates(self, x, y, radius):
+        """Units that may be within ``radius`` of (x, y), padded for in-tick motion."""
+        r = radius + self.pad
+        units = self.units
+        return [units[i] for i in self.query_rect(x - r, y - r, x + r, y + r).tolist()]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Unit System (v6.0 with Army AI)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -145,6 +249,8 @@ class UnitSystem:
         self._rng = np.random.RandomState(200)
         self._next_army_id = 0
         self._army_check_accum = 0.0
+        self._index = None
+        self._index_version = -1
 
     # ── spawn ──────────────────────────────────────────────────────────────
     def spawn(self, utype, x, y, god_id=None, count=1):
@@ -157,7 +263,7 @@ class UnitSystem:
         self._version += 1
 
     def kill_in_area(self, cx, cy, radius):
-        for u in self.units:
+        for u in self.index().candidates(cx, cy, radius):
             if not u.alive:
                 continue
             if abs(u.x - cx) <= radius and abs(u.y - cy) <= radius:
@@ -181,7 +287,7 @@ class UnitSystem:
 
         # Recruit nearby free units
         recruited = 0
-        for u in self.units:
+        for u in self.index().candidates(x, y, ARMY_MERGE_RADIUS * 2):
             if (u.alive and u.god_id == god_id and u.army_id == -1
                     and u.role == 'free' and u.atk > 0):
                 dist = math.hypot(u.x - x, u.y - y)
@@ -204,23 +310,25 @@ class UnitSystem:
             if u.alive and u.army_id == -1 and u.role == 'free' and u.atk > 0:
                 god_free[u.god_id].append(u)
 
+        index = self.index()
         for god_id, free_units in god_free.items():
             if len(free_units) < ARMY_MIN_SIZE:
                 continue
 
-            # Simple clustering: find dense groups
+            # Simple clustering: find dense groups (neighbours via the grid)
+            pool = {id(u) for u in free_units}
             checked = set()
-            for i, u in enumerate(free_units):
-                if i in checked:
+            for u in free_units:
+                if id(u) in checked:
                     continue
                 cluster = [u]
-                checked.add(i)
-                for j, other in enumerate(free_units):
-                    if j in checked:
+                checked.add(id(u))
+                for other in index.candidates(u.x, u.y, ARMY_MERGE_RADIUS):
+                    if id(other) in checked or id(other) not in pool:
                         continue
                     if math.hypot(other.x - u.x, other.y - u.y) < ARMY_MERGE_RADIUS:
                         cluster.append(other)
-                        checked.add(j)
+                        checked.add(id(other))
 
                 if len(cluster) >= ARMY_MIN_SIZE:
                     cx = sum(c.x for c in cluster) / len(cluster)
@@ -247,9 +355,13 @@ class UnitSystem:
         """Update army objectives and movement."""
         dead_armies = []
 
+        by_army = {}
+        for u in self.units:
+            if u.alive and u.army_id >= 0:
+                by_army.setdefault(u.army_id, []).append(u)
+
         for army in self.armies:
-            members = [u for u in self.units
-                       if u.alive and u.army_id == army.army_id]
+            members = by_army.get(army.army_id, [])
             army.strength = len(members)
 
             if army.strength == 0:
@@ -288,13 +400,14 @@ class UnitSystem:
                         god_id=army.god_id)
 
         # Remove dead/empty armies
-        for army in dead_armies:
+        if dead_armies:
+            dead_ids = {army.army_id for army in dead_armies}
             # Free surviving members
             for u in self.units:
-                if u.army_id == army.army_id:
+                if u.army_id in dead_ids:
                     u.army_id = -1
                     u.role = 'free'
-            self.armies.remove(army)
+            self.armies = [a for a in self.armies if a.army_id not in dead_ids]
 
     def _army_patrol(self, army, members, cx, cy, world, dt):
         """Army patrols territory borders."""
@@ -420,7 +533,7 @@ class UnitSystem:
 
     def _army_check_enemies(self, army, members, cx, cy, world):
         """Check for enemies near army and engage."""
-        for u in self.units:
+        for u in self.index().candidates(cx, cy, 20):
             if not u.alive or u.god_id == army.god_id:
                 continue
             if abs(u.x - cx) > 20 or abs(u.y - cy) > 20:
@@ -438,18 +551,26 @@ class UnitSystem:
                  influence=None, material_layer=None, world=None):
         """Update all units: move, fight, army AI, die."""
         try:
-            from .synergy import COMBAT_TYPE_ADVANTAGE
+            from .synergy import COMBAT_TYPE_ADVANTAGE, MAX_UNIT_SPD_MULT
         except ImportError:  # pragma: no cover - direct script fallback
-            from synergy import COMBAT_TYPE_ADVANTAGE
+            from synergy import COMBAT_TYPE_ADVANTAGE, MAX_UNIT_SPD_MULT
         changed = False
 
+        # Fresh SoA/grid snapshot for every neighbour query of this tick;
+        # the pad covers how far units can still move before it is rebuilt
+        pad = UNIT_GRID_PAD + _MAX_MOVE_STEPS_PER_TICK * _MAX_UNIT_SPD * MAX_UNIT_SPD_MULT * dt
+        self._rebuild_index(pad=pad)
+
         # Army auto-formation check (every 2 seconds)
         self._army_check_accum += dt
         if self._army_check_accum >= 2.0 and world:
             self._auto_form_armies(world)
             self._update_armies(dt, world)
             self._army_check_accum = 0.0
+            # Armies just marched: re-snapshot their positions
+            self._rebuild_index(pad=pad)
 
+        index = self._index
         for u in self.units:
             if not u.alive:
                 continue
@@ -502,7 +623,7 @@ class UnitSystem:
 
                 # Healers seek injured friendlies
                 if u.utype == 'healer' and self._rng.random() < 0.1:
-                    for other in self.units:
+                    for other in index.candidates(u.x, u.y, 20):
                         if (other.alive and other.god_id == u.god_id
                                 and other is not u and other.hp < other.max_hp * 0.7):
                             d = math.hypot(other.x - u.x, other.y - u.y)
@@ -571,7 +692,7 @@ class UnitSystem:
             # ── Combat (all units, including army members) ─────────────
             # Scouts and settlers avoid combat — they flee instead
             if u.utype in ('scout', 'settler') and u.state in ('idle', 'moving'):
-                for other in self.units:
+                for other in index.candidates(u.x, u.y, 8):
                     if (other.alive and other.god_id != u.god_id
                             and abs(other.x - u.x) < 8 and abs(other.y - u.y) < 8):
                         # Flee away from enemy
@@ -602,7 +723,7 @@ class UnitSystem:
                 best_target = None
                 best_dist2 = combat_range * combat_range + 1
 
-                for other in self.units:
+                for other in index.candidates(u.x, u.y, combat_range):
                     if not other.alive or other is u:
                         continue
                     if other.god_id == u.god_id:
@@ -686,10 +807,32 @@ class UnitSystem:
     def _cleanup(self):
         self.units = [u for u in self.units if u.alive]
 
+    # ── spatial index ──────────────────────────────────────────────────────
+    def _rebuild_index(self, pad=UNIT_GRID_PAD):
+        self._index = UnitIndex(self.units, pad=pad)
+        self._index_version = self._version
+        return self._index
+
+    def index(self):
+        """
+        UnitIndex for the current unit list, rebuilt lazily when the list
+        is replaced or the system version changed (spawns, deaths, and
+        ticks that report a change). Movement alone does not bump the
+        version, so cached positions can trail the live ones by one tick;
+        simulate() rebuilds the index every tick with a pad that covers a
+        tick of movement, which keeps candidates() a superset. Callers
+        still check exact distances against u.x/u.y.
+        """
+        idx = self._index
+        if (idx is None or idx.units is not self.units
+                or self._index_version != self._version):
+            idx = self._rebuild_index()
+        return idx
+
     # ── queries ────────────────────────────────────────────────────────────
     def get_at(self, x, y, radius=2):
         result = []
-        for u in self.units:
+        for u in self.index().candidates(x, y, radius):
             if not u.alive:
                 continue
             if abs(u.x - x) <= radius and abs(u.y - y) <= radius:
@@ -697,23 +840,26 @@ class UnitSystem:
         return result
 
     def get_god_units(self, god_id):
-        return [u for u in self.units if u.alive and u.god_id == god_id]
+        idx = self.index()
+        code = idx.god_codes.get(god_id)
+        if code is None:
+            return []
+        units = idx.units
+        return [units[i] for i in np.flatnonzero(idx.god == code).tolist()
+                if units[i].alive]
 
     @property
     def count(self):
         return len([u for u in self.units if u.alive])
 
     def get_type_count(self, utype=None, god_id=None):
-        total = 0
-        for u in self.units:
-            if not u.alive:
-                continue
-            if utype and u.utype != utype:
-                continue
-            if god_id and u.god_id != god_id:
-                continue
-            total += 1
-        return total
+        idx = self.index()
+        mask = idx.alive.copy()
+        if utype:
+            mask &= idx.utype == idx.type_codes.get(utype, -1)
+        if god_id:
+            mask &= idx.god == idx.god_codes.get(god_id, -1)
+        return int(np.count_nonzero(mask))
 
     def get_army_count(self, god_id=None):
         if god_id: